@@ -236,78 +236,89 @@ Adds new transitions to the :class:`~kivy.animation.AnimationTransition` class:
 
 import kivy.animation
 
-from kivymd.utils.cubic_bezier import CubicBezier
+from kivymd.utils.cubic_bezier import CubicBezier, EasingTable, get_easing_table
+
+_emphasized_start = CubicBezier(0.05, 0, 0.133333, 0.06).t
+_emphasized_end = CubicBezier(0.208333, 0.82, 0.25, 1).t
+
+
+# Equivalent to path(
+#     M 0,0 C 0.05,
+#     0,
+#     0.133333,
+#     0.06,
+#     0.166666,
+#     0.4 C 0.208333,
+#     0.82,
+#     0.25,
+#     1,
+#     1,
+#     1
+# )
+def _easing_emphasized(t: float) -> float:
+    if t < 0.4:
+        # Normalize t: maps [0, 0.4] to [0, 1].
+        t_norm = t / 0.4
+        # First segment: (0.05, 0) to (0.1333, 0.06).
+        return _emphasized_start(t_norm) * 0.4
+    else:
+        # Normalize t: maps [0.4, 1.0] to [0, 1].
+        t_norm = (t - 0.4) / 0.6
+        # Second segment: (0.2083, 0.82) to (0.25, 1).
+        # We start at 0.4 (the end of the last segment) and move toward 1.0.
+        return 0.4 + _emphasized_end(t_norm) * 0.6
 
 
 class MDAnimationTransition(kivy.animation.AnimationTransition):
-    """KivyMD's equivalent of kivy's `AnimationTransition`."""
+    """
+    KivyMD's equivalent of kivy's `AnimationTransition`.
+
+    The Material Design transitions are
+    :class:`~kivymd.utils.cubic_bezier.EasingTable` objects: the curves are
+    sampled once and interpolated, so they are as cheap as the polynomial
+    transitions of Kivy.
+    """
 
-    easing_standard = CubicBezier(0.4, 0.0, 0.2, 1.0).t
+    easing_standard = get_easing_table(0.4, 0.0, 0.2, 1.0)
     """
     Material Design standard easing transition.
 
     :data:`easing_standard` is a :class:`~typing.Callable` and defaults to
-    ``CubicBezier(0.4, 0.0, 0.2, 1.0).t``.
+    ``get_easing_table(0.4, 0.0, 0.2, 1.0)``.
     """
 
-    easing_decelerated = CubicBezier(0.0, 0.0, 0.2, 1.0).t
+    easing_decelerated = get_easing_table(0.0, 0.0, 0.2, 1.0)
     """
     Material Design standard easing transition.
 
     :data:`easing_decelerated` is a :class:`~typing.Callable` and defaults to
-    ``CubicBezier(0.0, 0.0, 0.2, 1.0).t``.
+    ``get_easing_table(0.0, 0.0, 0.2, 1.0)``.
     """
 
-    easing_accelerated = CubicBezier(0.4, 0.0, 1.0, 1.0).t
+    easing_accelerated = get_easing_table(0.4, 0.0, 1.0, 1.0)
     """
     Material Design standard easing transition.
 
     :data:`easing_accelerated` is a :class:`~typing.Callable` and defaults to
-    ``CubicBezier(0.4, 0.0, 1.0, 1.0).t``.
+    ``get_easing_table(0.4, 0.0, 1.0, 1.0)``.
     """
 
-    easing_linear = CubicBezier(0.0, 0.0, 1.0, 1.0).t
+    easing_linear = get_easing_table(0.0, 0.0, 1.0, 1.0)
     """
     Material Design standard easing transition.
 
     :data:`easing_linear` is a :class:`~typing.Callable` and defaults to
-    ``CubicBezier(0.0, 0.0, 1.0, 1.0).t``.
+    ``get_easing_table(0.0, 0.0, 1.0, 1.0)``.
     """
 
-    # Equivalent to path(
-    #     M 0,0 C 0.05,
-    #     0,
-    #     0.133333,
-    #     0.06,
-    #     0.166666,
-    #     0.4 C 0.208333,
-    #     0.82,
-    #     0.25,
-    #     1,
-    #     1,
-    #     1
-    # )
-    def easing_emphasized(t: float):
-        """
-        Material Design emphasized easing transition.
-
-        :param t:
-            Animation progress in the range ``0`` to ``1``.
-        :returns:
-            Interpolated animation progress.
-        """
-
-        if t < 0.4:
-            # Normalize t: maps [0, 0.4] to [0, 1].
-            t_norm = t / 0.4
-            # First segment: (0.05, 0) to (0.1333, 0.06).
-            return CubicBezier(0.05, 0, 0.133333, 0.06).t(t_norm) * 0.4
-        else:
-            # Normalize t: maps [0.4, 1.0] to [0, 1].
-            t_norm = (t - 0.4) / 0.6
-            # Second segment: (0.2083, 0.82) to (0.25, 1).
-            # We start at 0.4 (the end of the last segment) and move toward 1.0.
-            return 0.4 + CubicBezier(0.208333, 0.82, 0.25, 1).t(t_norm) * 0.6
+    easing_emphasized = EasingTable(_easing_emphasized)
+    """
+    Material Design emphasized easing transition.
+
+    :data:`easing_emphasized` is a :class:`~typing.Callable` that takes the
+    animation progress in the range ``0`` to ``1`` and returns the
+    interpolated animation progress.
+    """
 
 
 # Monkey patch kivy's animation module.
@@ -104,6 +104,36 @@ class FpsMonitoring:
 
         Clock.schedule_once(add_monitor)
 
+    def frame_profiler_start(
+        self, anchor: str = "top", max_frames: int = 300
+    ) -> None:
+        """
+        Starts the :data:`~kivymd.utils.frame_profiler.frame_profiler` and
+        adds its overlay to the main application window.
+
+        .. versionadded:: 2.0.0
+
+        :type anchor: str;
+        :param anchor: anchor of the overlay ('top' or 'bottom');
+        :type max_frames: int;
+        :param max_frames: number of the last frames kept by the profiler;
+        """
+
+        def add_overlay(*args):
+            from kivy.core.window import Window
+
+            from kivymd.utils.frame_profiler import (
+                FrameProfilerOverlay,
+                frame_profiler,
+            )
+
+            frame_profiler.max_frames = max_frames
+            overlay = FrameProfilerOverlay(anchor=anchor)
+            overlay.start()
+            Window.add_widget(overlay)
+
+        Clock.schedule_once(add_overlay)
+
 
 class MDApp(App, FpsMonitoring):
     """
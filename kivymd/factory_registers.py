@@ -86,6 +86,9 @@ register("MDListItemLeadingIcon", module="kivymd.uix.list")
 register("MDListItemTrailingIcon", module="kivymd.uix.list")
 register("MDListItemTrailingCheckbox", module="kivymd.uix.list")
 register("MDListItemTertiaryText", module="kivymd.uix.list")
+register("MDRecycleList", module="kivymd.uix.list")
+register("MDRecycleListItem", module="kivymd.uix.list")
+register("MDRecycleListLayout", module="kivymd.uix.list")
 register("HoverBehavior", module="kivymd.uix.behaviors.hover_behavior")
 register("StateFocusBehavior", module="kivymd.uix.behaviors.focus_behavior")
 register("MagicBehavior", module="kivymd.uix.behaviors.magic_behavior")
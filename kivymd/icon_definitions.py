@@ -101,12 +101,8 @@ To preview the icons and their names, you can use the following application:
                         )
 
                     self.ids.rv.data = []
-                    for name_icon in md_icons.keys():
-                        if search:
-                            if text in name_icon:
-                                add_icon_item(name_icon)
-                        else:
-                            add_icon_item(name_icon)
+                    for name_icon in md_icons.search(text) if search else md_icons:
+                        add_icon_item(name_icon)
 
 
             class MainApp(MDApp):
@@ -173,12 +169,8 @@ To preview the icons and their names, you can use the following application:
                         )
 
                     self.get_ids().rv.data = []
-                    for name_icon in md_icons.keys():
-                        if search:
-                            if text in name_icon:
-                                add_icon_item(name_icon)
-                        else:
-                            add_icon_item(name_icon)
+                    for name_icon in md_icons.search(text) if search else md_icons:
+                        add_icon_item(name_icon)
 
 
             class MainApp(MDApp):
@@ -238,7458 +230,260 @@ To preview the icons and their names, you can use the following application:
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/m3-icons-previous.gif
     :align: center
 
+
+Icon registry
+-------------
+
+.. versionadded:: 2.0.0
+
+:data:`md_icons` is an :class:`IconRegistry` with the interface of a
+read-only `dict`. The names and the code points of the icons are stored in
+the compact `materialdesignicons.bin` table next to the font file, which is
+read on the first access to :data:`md_icons`.
+
+Use :meth:`IconRegistry.search` to find icons by a part of the name:
+
+.. code-block:: python
+
+    from kivymd.icon_definitions import md_icons
+
+    md_icons.search("arrow-left", limit=3)
+
+.. code-block:: bash
+
+    ['arrow-left', 'arrow-left-bold', 'arrow-left-box']
 """
 
-md_icons = {
-    "ab-testing": "\U000f01c9",
-    "abacus": "\U000f16e0",
-    "abjad-arabic": "\U000f1328",
-    "abjad-hebrew": "\U000f1329",
-    "abugida-devanagari": "\U000f132a",
-    "abugida-thai": "\U000f132b",
-    "access-point": "\U000f0003",
-    "access-point-check": "\U000f1538",
-    "access-point-minus": "\U000f1539",
-    "access-point-network": "\U000f0002",
-    "access-point-network-off": "\U000f0be1",
-    "access-point-off": "\U000f1511",
-    "access-point-plus": "\U000f153a",
-    "access-point-remove": "\U000f153b",
-    "account": "\U000f0004",
-    "account-alert": "\U000f0005",
-    "account-alert-outline": "\U000f0b50",
-    "account-arrow-down": "\U000f1868",
-    "account-arrow-down-outline": "\U000f1869",
-    "account-arrow-left": "\U000f0b51",
-    "account-arrow-left-outline": "\U000f0b52",
-    "account-arrow-right": "\U000f0b53",
-    "account-arrow-right-outline": "\U000f0b54",
-    "account-arrow-up": "\U000f1867",
-    "account-arrow-up-outline": "\U000f186a",
-    "account-badge": "\U000f1b0a",
-    "account-badge-outline": "\U000f1b0b",
-    "account-box": "\U000f0006",
-    "account-box-edit-outline": "\U000f1cc8",
-    "account-box-minus-outline": "\U000f1cc9",
-    "account-box-multiple": "\U000f0934",
-    "account-box-multiple-outline": "\U000f100a",
-    "account-box-outline": "\U000f0007",
-    "account-box-plus-outline": "\U000f1cca",
-    "account-cancel": "\U000f12df",
-    "account-cancel-outline": "\U000f12e0",
-    "account-card": "\U000f1ba4",
-    "account-card-outline": "\U000f1ba5",
-    "account-cash": "\U000f1097",
-    "account-cash-outline": "\U000f1098",
-    "account-check": "\U000f0008",
-    "account-check-outline": "\U000f0be2",
-    "account-child": "\U000f0a89",
-    "account-child-circle": "\U000f0a8a",
-    "account-child-outline": "\U000f10c8",
-    "account-circle": "\U000f0009",
-    "account-circle-outline": "\U000f0b55",
-    "account-clock": "\U000f0b56",
-    "account-clock-outline": "\U000f0b57",
-    "account-cog": "\U000f1370",
-    "account-cog-outline": "\U000f1371",
-    "account-convert": "\U000f000a",
-    "account-convert-outline": "\U000f1301",
-    "account-cowboy-hat": "\U000f0e9b",
-    "account-cowboy-hat-outline": "\U000f17f3",
-    "account-credit-card": "\U000f1ba6",
-    "account-credit-card-outline": "\U000f1ba7",
-    "account-details": "\U000f0631",
-    "account-details-outline": "\U000f1372",
-    "account-edit": "\U000f06bc",
-    "account-edit-outline": "\U000f0ffb",
-    "account-eye": "\U000f0420",
-    "account-eye-outline": "\U000f127b",
-    "account-file": "\U000f1ca7",
-    "account-file-outline": "\U000f1ca8",
-    "account-file-text": "\U000f1ca9",
-    "account-file-text-outline": "\U000f1caa",
-    "account-filter": "\U000f0936",
-    "account-filter-outline": "\U000f0f9d",
-    "account-group": "\U000f0849",
-    "account-group-outline": "\U000f0b58",
-    "account-hard-hat": "\U000f05b5",
-    "account-hard-hat-outline": "\U000f1a1f",
-    "account-heart": "\U000f0899",
-    "account-heart-outline": "\U000f0be3",
-    "account-injury": "\U000f1815",
-    "account-injury-outline": "\U000f1816",
-    "account-key": "\U000f000b",
-    "account-key-outline": "\U000f0be4",
-    "account-lock": "\U000f115e",
-    "account-lock-open": "\U000f1960",
-    "account-lock-open-outline": "\U000f1961",
-    "account-lock-outline": "\U000f115f",
-    "account-minus": "\U000f000d",
-    "account-minus-outline": "\U000f0aec",
-    "account-multiple": "\U000f000e",
-    "account-multiple-check": "\U000f08c5",
-    "account-multiple-check-outline": "\U000f11fe",
-    "account-multiple-minus": "\U000f05d3",
-    "account-multiple-minus-outline": "\U000f0be5",
-    "account-multiple-outline": "\U000f000f",
-    "account-multiple-plus": "\U000f0010",
-    "account-multiple-plus-outline": "\U000f0800",
-    "account-multiple-remove": "\U000f120a",
-    "account-multiple-remove-outline": "\U000f120b",
-    "account-music": "\U000f0803",
-    "account-music-outline": "\U000f0ce9",
-    "account-network": "\U000f0011",
-    "account-network-off": "\U000f1af1",
-    "account-network-off-outline": "\U000f1af2",
-    "account-network-outline": "\U000f0be6",
-    "account-off": "\U000f0012",
-    "account-off-outline": "\U000f0be7",
-    "account-outline": "\U000f0013",
-    "account-plus": "\U000f0014",
-    "account-plus-outline": "\U000f0801",
-    "account-question": "\U000f0b59",
-    "account-question-outline": "\U000f0b5a",
-    "account-reactivate": "\U000f152b",
-    "account-reactivate-outline": "\U000f152c",
-    "account-remove": "\U000f0015",
-    "account-remove-outline": "\U000f0aed",
-    "account-school": "\U000f1a20",
-    "account-school-outline": "\U000f1a21",
-    "account-search": "\U000f0016",
-    "account-search-outline": "\U000f0935",
-    "account-settings": "\U000f0630",
-    "account-settings-outline": "\U000f10c9",
-    "account-star": "\U000f0017",
-    "account-star-outline": "\U000f0be8",
-    "account-supervisor": "\U000f0a8b",
-    "account-supervisor-circle": "\U000f0a8c",
-    "account-supervisor-circle-outline": "\U000f14ec",
-    "account-supervisor-outline": "\U000f112d",
-    "account-switch": "\U000f0019",
-    "account-switch-outline": "\U000f04cb",
-    "account-sync": "\U000f191b",
-    "account-sync-outline": "\U000f191c",
-    "account-tag": "\U000f1c1b",
-    "account-tag-outline": "\U000f1c1c",
-    "account-tie": "\U000f0ce3",
-    "account-tie-hat": "\U000f1898",
-    "account-tie-hat-outline": "\U000f1899",
-    "account-tie-outline": "\U000f10ca",
-    "account-tie-voice": "\U000f1308",
-    "account-tie-voice-off": "\U000f130a",
-    "account-tie-voice-off-outline": "\U000f130b",
-    "account-tie-voice-outline": "\U000f1309",
-    "account-tie-woman": "\U000f1a8c",
-    "account-voice": "\U000f05cb",
-    "account-voice-off": "\U000f0ed4",
-    "account-wrench": "\U000f189a",
-    "account-wrench-outline": "\U000f189b",
-    "adjust": "\U000f001a",
-    "advertisements": "\U000f192a",
-    "advertisements-off": "\U000f192b",
-    "air-conditioner": "\U000f001b",
-    "air-filter": "\U000f0d43",
-    "air-horn": "\U000f0dac",
-    "air-humidifier": "\U000f1099",
-    "air-humidifier-off": "\U000f1466",
-    "air-purifier": "\U000f0d44",
-    "air-purifier-off": "\U000f1b57",
-    "airbag": "\U000f0be9",
-    "airballoon": "\U000f001c",
-    "airballoon-outline": "\U000f100b",
-    "airplane": "\U000f001d",
-    "airplane-alert": "\U000f187a",
-    "airplane-check": "\U000f187b",
-    "airplane-clock": "\U000f187c",
-    "airplane-cog": "\U000f187d",
-    "airplane-edit": "\U000f187e",
-    "airplane-landing": "\U000f05d4",
-    "airplane-marker": "\U000f187f",
-    "airplane-minus": "\U000f1880",
-    "airplane-off": "\U000f001e",
-    "airplane-plus": "\U000f1881",
-    "airplane-remove": "\U000f1882",
-    "airplane-search": "\U000f1883",
-    "airplane-settings": "\U000f1884",
-    "airplane-takeoff": "\U000f05d5",
-    "airport": "\U000f084b",
-    "alarm": "\U000f0020",
-    "alarm-bell": "\U000f078e",
-    "alarm-check": "\U000f0021",
-    "alarm-light": "\U000f078f",
-    "alarm-light-off": "\U000f171e",
-    "alarm-light-off-outline": "\U000f171f",
-    "alarm-light-outline": "\U000f0bea",
-    "alarm-multiple": "\U000f0022",
-    "alarm-note": "\U000f0e71",
-    "alarm-note-off": "\U000f0e72",
-    "alarm-off": "\U000f0023",
-    "alarm-panel": "\U000f15c4",
-    "alarm-panel-outline": "\U000f15c5",
-    "alarm-plus": "\U000f0024",
-    "alarm-snooze": "\U000f068e",
-    "album": "\U000f0025",
-    "alert": "\U000f0026",
-    "alert-box": "\U000f0027",
-    "alert-box-outline": "\U000f0ce4",
-    "alert-circle": "\U000f0028",
-    "alert-circle-check": "\U000f11ed",
-    "alert-circle-check-outline": "\U000f11ee",
-    "alert-circle-outline": "\U000f05d6",
-    "alert-decagram": "\U000f06bd",
-    "alert-decagram-outline": "\U000f0ce5",
-    "alert-minus": "\U000f14bb",
-    "alert-minus-outline": "\U000f14be",
-    "alert-octagon": "\U000f0029",
-    "alert-octagon-outline": "\U000f0ce6",
-    "alert-octagram": "\U000f0767",
-    "alert-octagram-outline": "\U000f0ce7",
-    "alert-outline": "\U000f002a",
-    "alert-plus": "\U000f14ba",
-    "alert-plus-outline": "\U000f14bd",
-    "alert-remove": "\U000f14bc",
-    "alert-remove-outline": "\U000f14bf",
-    "alert-rhombus": "\U000f11ce",
-    "alert-rhombus-outline": "\U000f11cf",
-    "alien": "\U000f089a",
-    "alien-outline": "\U000f10cb",
-    "align-horizontal-center": "\U000f11c3",
-    "align-horizontal-distribute": "\U000f1962",
-    "align-horizontal-left": "\U000f11c2",
-    "align-horizontal-right": "\U000f11c4",
-    "align-vertical-bottom": "\U000f11c5",
-    "align-vertical-center": "\U000f11c6",
-    "align-vertical-distribute": "\U000f1963",
-    "align-vertical-top": "\U000f11c7",
-    "all-inclusive": "\U000f06be",
-    "all-inclusive-box": "\U000f188d",
-    "all-inclusive-box-outline": "\U000f188e",
-    "allergy": "\U000f1258",
-    "alpha": "\U000f002b",
-    "alpha-a": "\U000f0aee",
-    "alpha-a-box": "\U000f0b08",
-    "alpha-a-box-outline": "\U000f0beb",
-    "alpha-a-circle": "\U000f0bec",
-    "alpha-a-circle-outline": "\U000f0bed",
-    "alpha-b": "\U000f0aef",
-    "alpha-b-box": "\U000f0b09",
-    "alpha-b-box-outline": "\U000f0bee",
-    "alpha-b-circle": "\U000f0bef",
-    "alpha-b-circle-outline": "\U000f0bf0",
-    "alpha-c": "\U000f0af0",
-    "alpha-c-box": "\U000f0b0a",
-    "alpha-c-box-outline": "\U000f0bf1",
-    "alpha-c-circle": "\U000f0bf2",
-    "alpha-c-circle-outline": "\U000f0bf3",
-    "alpha-d": "\U000f0af1",
-    "alpha-d-box": "\U000f0b0b",
-    "alpha-d-box-outline": "\U000f0bf4",
-    "alpha-d-circle": "\U000f0bf5",
-    "alpha-d-circle-outline": "\U000f0bf6",
-    "alpha-e": "\U000f0af2",
-    "alpha-e-box": "\U000f0b0c",
-    "alpha-e-box-outline": "\U000f0bf7",
-    "alpha-e-circle": "\U000f0bf8",
-    "alpha-e-circle-outline": "\U000f0bf9",
-    "alpha-f": "\U000f0af3",
-    "alpha-f-box": "\U000f0b0d",
-    "alpha-f-box-outline": "\U000f0bfa",
-    "alpha-f-circle": "\U000f0bfb",
-    "alpha-f-circle-outline": "\U000f0bfc",
-    "alpha-g": "\U000f0af4",
-    "alpha-g-box": "\U000f0b0e",
-    "alpha-g-box-outline": "\U000f0bfd",
-    "alpha-g-circle": "\U000f0bfe",
-    "alpha-g-circle-outline": "\U000f0bff",
-    "alpha-h": "\U000f0af5",
-    "alpha-h-box": "\U000f0b0f",
-    "alpha-h-box-outline": "\U000f0c00",
-    "alpha-h-circle": "\U000f0c01",
-    "alpha-h-circle-outline": "\U000f0c02",
-    "alpha-i": "\U000f0af6",
-    "alpha-i-box": "\U000f0b10",
-    "alpha-i-box-outline": "\U000f0c03",
-    "alpha-i-circle": "\U000f0c04",
-    "alpha-i-circle-outline": "\U000f0c05",
-    "alpha-j": "\U000f0af7",
-    "alpha-j-box": "\U000f0b11",
-    "alpha-j-box-outline": "\U000f0c06",
-    "alpha-j-circle": "\U000f0c07",
-    "alpha-j-circle-outline": "\U000f0c08",
-    "alpha-k": "\U000f0af8",
-    "alpha-k-box": "\U000f0b12",
-    "alpha-k-box-outline": "\U000f0c09",
-    "alpha-k-circle": "\U000f0c0a",
-    "alpha-k-circle-outline": "\U000f0c0b",
-    "alpha-l": "\U000f0af9",
-    "alpha-l-box": "\U000f0b13",
-    "alpha-l-box-outline": "\U000f0c0c",
-    "alpha-l-circle": "\U000f0c0d",
-    "alpha-l-circle-outline": "\U000f0c0e",
-    "alpha-m": "\U000f0afa",
-    "alpha-m-box": "\U000f0b14",
-    "alpha-m-box-outline": "\U000f0c0f",
-    "alpha-m-circle": "\U000f0c10",
-    "alpha-m-circle-outline": "\U000f0c11",
-    "alpha-n": "\U000f0afb",
-    "alpha-n-box": "\U000f0b15",
-    "alpha-n-box-outline": "\U000f0c12",
-    "alpha-n-circle": "\U000f0c13",
-    "alpha-n-circle-outline": "\U000f0c14",
-    "alpha-o": "\U000f0afc",
-    "alpha-o-box": "\U000f0b16",
-    "alpha-o-box-outline": "\U000f0c15",
-    "alpha-o-circle": "\U000f0c16",
-    "alpha-o-circle-outline": "\U000f0c17",
-    "alpha-p": "\U000f0afd",
-    "alpha-p-box": "\U000f0b17",
-    "alpha-p-box-outline": "\U000f0c18",
-    "alpha-p-circle": "\U000f0c19",
-    "alpha-p-circle-outline": "\U000f0c1a",
-    "alpha-q": "\U000f0afe",
-    "alpha-q-box": "\U000f0b18",
-    "alpha-q-box-outline": "\U000f0c1b",
-    "alpha-q-circle": "\U000f0c1c",
-    "alpha-q-circle-outline": "\U000f0c1d",
-    "alpha-r": "\U000f0aff",
-    "alpha-r-box": "\U000f0b19",
-    "alpha-r-box-outline": "\U000f0c1e",
-    "alpha-r-circle": "\U000f0c1f",
-    "alpha-r-circle-outline": "\U000f0c20",
-    "alpha-s": "\U000f0b00",
-    "alpha-s-box": "\U000f0b1a",
-    "alpha-s-box-outline": "\U000f0c21",
-    "alpha-s-circle": "\U000f0c22",
-    "alpha-s-circle-outline": "\U000f0c23",
-    "alpha-t": "\U000f0b01",
-    "alpha-t-box": "\U000f0b1b",
-    "alpha-t-box-outline": "\U000f0c24",
-    "alpha-t-circle": "\U000f0c25",
-    "alpha-t-circle-outline": "\U000f0c26",
-    "alpha-u": "\U000f0b02",
-    "alpha-u-box": "\U000f0b1c",
-    "alpha-u-box-outline": "\U000f0c27",
-    "alpha-u-circle": "\U000f0c28",
-    "alpha-u-circle-outline": "\U000f0c29",
-    "alpha-v": "\U000f0b03",
-    "alpha-v-box": "\U000f0b1d",
-    "alpha-v-box-outline": "\U000f0c2a",
-    "alpha-v-circle": "\U000f0c2b",
-    "alpha-v-circle-outline": "\U000f0c2c",
-    "alpha-w": "\U000f0b04",
-    "alpha-w-box": "\U000f0b1e",
-    "alpha-w-box-outline": "\U000f0c2d",
-    "alpha-w-circle": "\U000f0c2e",
-    "alpha-w-circle-outline": "\U000f0c2f",
-    "alpha-x": "\U000f0b05",
-    "alpha-x-box": "\U000f0b1f",
-    "alpha-x-box-outline": "\U000f0c30",
-    "alpha-x-circle": "\U000f0c31",
-    "alpha-x-circle-outline": "\U000f0c32",
-    "alpha-y": "\U000f0b06",
-    "alpha-y-box": "\U000f0b20",
-    "alpha-y-box-outline": "\U000f0c33",
-    "alpha-y-circle": "\U000f0c34",
-    "alpha-y-circle-outline": "\U000f0c35",
-    "alpha-z": "\U000f0b07",
-    "alpha-z-box": "\U000f0b21",
-    "alpha-z-box-outline": "\U000f0c36",
-    "alpha-z-circle": "\U000f0c37",
-    "alpha-z-circle-outline": "\U000f0c38",
-    "alphabet-aurebesh": "\U000f132c",
-    "alphabet-cyrillic": "\U000f132d",
-    "alphabet-greek": "\U000f132e",
-    "alphabet-latin": "\U000f132f",
-    "alphabet-piqad": "\U000f1330",
-    "alphabet-tengwar": "\U000f1337",
-    "alphabetical": "\U000f002c",
-    "alphabetical-off": "\U000f100c",
-    "alphabetical-variant": "\U000f100d",
-    "alphabetical-variant-off": "\U000f100e",
-    "altimeter": "\U000f05d7",
-    "ambulance": "\U000f002f",
-    "ammunition": "\U000f0ce8",
-    "ampersand": "\U000f0a8d",
-    "amplifier": "\U000f0030",
-    "amplifier-off": "\U000f11b5",
-    "anchor": "\U000f0031",
-    "android": "\U000f0032",
-    "android-studio": "\U000f0034",
-    "angle-acute": "\U000f0937",
-    "angle-obtuse": "\U000f0938",
-    "angle-right": "\U000f0939",
-    "angular": "\U000f06b2",
-    "angularjs": "\U000f06bf",
-    "animation": "\U000f05d8",
-    "animation-outline": "\U000f0a8f",
-    "animation-play": "\U000f093a",
-    "animation-play-outline": "\U000f0a90",
-    "ansible": "\U000f109a",
-    "antenna": "\U000f1119",
-    "anvil": "\U000f089b",
-    "apache-kafka": "\U000f100f",
-    "api": "\U000f109b",
-    "api-off": "\U000f1257",
-    "apple": "\U000f0035",
-    "apple-finder": "\U000f0036",
-    "apple-icloud": "\U000f0038",
-    "apple-ios": "\U000f0037",
-    "apple-keyboard-caps": "\U000f0632",
-    "apple-keyboard-command": "\U000f0633",
-    "apple-keyboard-control": "\U000f0634",
-    "apple-keyboard-option": "\U000f0635",
-    "apple-keyboard-shift": "\U000f0636",
-    "apple-safari": "\U000f0039",
-    "application": "\U000f08c6",
-    "application-array": "\U000f10f5",
-    "application-array-outline": "\U000f10f6",
-    "application-braces": "\U000f10f7",
-    "application-braces-outline": "\U000f10f8",
-    "application-brackets": "\U000f0c8b",
-    "application-brackets-outline": "\U000f0c8c",
-    "application-cog": "\U000f0675",
-    "application-cog-outline": "\U000f1577",
-    "application-edit": "\U000f00ae",
-    "application-edit-outline": "\U000f0619",
-    "application-export": "\U000f0dad",
-    "application-import": "\U000f0dae",
-    "application-outline": "\U000f0614",
-    "application-parentheses": "\U000f10f9",
-    "application-parentheses-outline": "\U000f10fa",
-    "application-settings": "\U000f0b60",
-    "application-settings-outline": "\U000f1555",
-    "application-variable": "\U000f10fb",
-    "application-variable-outline": "\U000f10fc",
-    "approximately-equal": "\U000f0f9e",
-    "approximately-equal-box": "\U000f0f9f",
-    "apps": "\U000f003b",
-    "apps-box": "\U000f0d46",
-    "arch": "\U000f08c7",
-    "archive": "\U000f003c",
-    "archive-alert": "\U000f14fd",
-    "archive-alert-outline": "\U000f14fe",
-    "archive-arrow-down": "\U000f1259",
-    "archive-arrow-down-outline": "\U000f125a",
-    "archive-arrow-up": "\U000f125b",
-    "archive-arrow-up-outline": "\U000f125c",
-    "archive-cancel": "\U000f174b",
-    "archive-cancel-outline": "\U000f174c",
-    "archive-check": "\U000f174d",
-    "archive-check-outline": "\U000f174e",
-    "archive-clock": "\U000f174f",
-    "archive-clock-outline": "\U000f1750",
-    "archive-cog": "\U000f1751",
-    "archive-cog-outline": "\U000f1752",
-    "archive-edit": "\U000f1753",
-    "archive-edit-outline": "\U000f1754",
-    "archive-eye": "\U000f1755",
-    "archive-eye-outline": "\U000f1756",
-    "archive-lock": "\U000f1757",
-    "archive-lock-open": "\U000f1758",
-    "archive-lock-open-outline": "\U000f1759",
-    "archive-lock-outline": "\U000f175a",
-    "archive-marker": "\U000f175b",
-    "archive-marker-outline": "\U000f175c",
-    "archive-minus": "\U000f175d",
-    "archive-minus-outline": "\U000f175e",
-    "archive-music": "\U000f175f",
-    "archive-music-outline": "\U000f1760",
-    "archive-off": "\U000f1761",
-    "archive-off-outline": "\U000f1762",
-    "archive-outline": "\U000f120e",
-    "archive-plus": "\U000f1763",
-    "archive-plus-outline": "\U000f1764",
-    "archive-refresh": "\U000f1765",
-    "archive-refresh-outline": "\U000f1766",
-    "archive-remove": "\U000f1767",
-    "archive-remove-outline": "\U000f1768",
-    "archive-search": "\U000f1769",
-    "archive-search-outline": "\U000f176a",
-    "archive-settings": "\U000f176b",
-    "archive-settings-outline": "\U000f176c",
-    "archive-star": "\U000f176d",
-    "archive-star-outline": "\U000f176e",
-    "archive-sync": "\U000f176f",
-    "archive-sync-outline": "\U000f1770",
-    "arm-flex": "\U000f0fd7",
-    "arm-flex-outline": "\U000f0fd6",
-    "arrange-bring-forward": "\U000f003d",
-    "arrange-bring-to-front": "\U000f003e",
-    "arrange-send-backward": "\U000f003f",
-    "arrange-send-to-back": "\U000f0040",
-    "arrow-all": "\U000f0041",
-    "arrow-bottom-left": "\U000f0042",
-    "arrow-bottom-left-bold-box": "\U000f1964",
-    "arrow-bottom-left-bold-box-outline": "\U000f1965",
-    "arrow-bottom-left-bold-outline": "\U000f09b7",
-    "arrow-bottom-left-thick": "\U000f09b8",
-    "arrow-bottom-left-thin": "\U000f19b6",
-    "arrow-bottom-left-thin-circle-outline": "\U000f1596",
-    "arrow-bottom-right": "\U000f0043",
-    "arrow-bottom-right-bold-box": "\U000f1966",
-    "arrow-bottom-right-bold-box-outline": "\U000f1967",
-    "arrow-bottom-right-bold-outline": "\U000f09b9",
-    "arrow-bottom-right-thick": "\U000f09ba",
-    "arrow-bottom-right-thin": "\U000f19b7",
-    "arrow-bottom-right-thin-circle-outline": "\U000f1595",
-    "arrow-collapse": "\U000f0615",
-    "arrow-collapse-all": "\U000f0044",
-    "arrow-collapse-down": "\U000f0792",
-    "arrow-collapse-horizontal": "\U000f084c",
-    "arrow-collapse-left": "\U000f0793",
-    "arrow-collapse-right": "\U000f0794",
-    "arrow-collapse-up": "\U000f0795",
-    "arrow-collapse-vertical": "\U000f084d",
-    "arrow-decision": "\U000f09bb",
-    "arrow-decision-auto": "\U000f09bc",
-    "arrow-decision-auto-outline": "\U000f09bd",
-    "arrow-decision-outline": "\U000f09be",
-    "arrow-down": "\U000f0045",
-    "arrow-down-bold": "\U000f072e",
-    "arrow-down-bold-box": "\U000f072f",
-    "arrow-down-bold-box-outline": "\U000f0730",
-    "arrow-down-bold-circle": "\U000f0047",
-    "arrow-down-bold-circle-outline": "\U000f0048",
-    "arrow-down-bold-hexagon-outline": "\U000f0049",
-    "arrow-down-bold-outline": "\U000f09bf",
-    "arrow-down-box": "\U000f06c0",
-    "arrow-down-circle": "\U000f0cdb",
-    "arrow-down-circle-outline": "\U000f0cdc",
-    "arrow-down-drop-circle": "\U000f004a",
-    "arrow-down-drop-circle-outline": "\U000f004b",
-    "arrow-down-left": "\U000f17a1",
-    "arrow-down-left-bold": "\U000f17a2",
-    "arrow-down-right": "\U000f17a3",
-    "arrow-down-right-bold": "\U000f17a4",
-    "arrow-down-thick": "\U000f0046",
-    "arrow-down-thin": "\U000f19b3",
-    "arrow-down-thin-circle-outline": "\U000f1599",
-    "arrow-expand": "\U000f0616",
-    "arrow-expand-all": "\U000f004c",
-    "arrow-expand-down": "\U000f0796",
-    "arrow-expand-horizontal": "\U000f084e",
-    "arrow-expand-left": "\U000f0797",
-    "arrow-expand-right": "\U000f0798",
-    "arrow-expand-up": "\U000f0799",
-    "arrow-expand-vertical": "\U000f084f",
-    "arrow-horizontal-lock": "\U000f115b",
-    "arrow-left": "\U000f004d",
-    "arrow-left-bold": "\U000f0731",
-    "arrow-left-bold-box": "\U000f0732",
-    "arrow-left-bold-box-outline": "\U000f0733",
-    "arrow-left-bold-circle": "\U000f004f",
-    "arrow-left-bold-circle-outline": "\U000f0050",
-    "arrow-left-bold-hexagon-outline": "\U000f0051",
-    "arrow-left-bold-outline": "\U000f09c0",
-    "arrow-left-bottom": "\U000f17a5",
-    "arrow-left-bottom-bold": "\U000f17a6",
-    "arrow-left-box": "\U000f06c1",
-    "arrow-left-circle": "\U000f0cdd",
-    "arrow-left-circle-outline": "\U000f0cde",
-    "arrow-left-drop-circle": "\U000f0052",
-    "arrow-left-drop-circle-outline": "\U000f0053",
-    "arrow-left-right": "\U000f0e73",
-    "arrow-left-right-bold": "\U000f0e74",
-    "arrow-left-right-bold-outline": "\U000f09c1",
-    "arrow-left-thick": "\U000f004e",
-    "arrow-left-thin": "\U000f19b1",
-    "arrow-left-thin-circle-outline": "\U000f159a",
-    "arrow-left-top": "\U000f17a7",
-    "arrow-left-top-bold": "\U000f17a8",
-    "arrow-oscillating": "\U000f1c91",
-    "arrow-oscillating-off": "\U000f1c92",
-    "arrow-projectile": "\U000f1840",
-    "arrow-projectile-multiple": "\U000f183f",
-    "arrow-right": "\U000f0054",
-    "arrow-right-bold": "\U000f0734",
-    "arrow-right-bold-box": "\U000f0735",
-    "arrow-right-bold-box-outline": "\U000f0736",
-    "arrow-right-bold-circle": "\U000f0056",
-    "arrow-right-bold-circle-outline": "\U000f0057",
-    "arrow-right-bold-hexagon-outline": "\U000f0058",
-    "arrow-right-bold-outline": "\U000f09c2",
-    "arrow-right-bottom": "\U000f17a9",
-    "arrow-right-bottom-bold": "\U000f17aa",
-    "arrow-right-box": "\U000f06c2",
-    "arrow-right-circle": "\U000f0cdf",
-    "arrow-right-circle-outline": "\U000f0ce0",
-    "arrow-right-drop-circle": "\U000f0059",
-    "arrow-right-drop-circle-outline": "\U000f005a",
-    "arrow-right-thick": "\U000f0055",
-    "arrow-right-thin": "\U000f19b0",
-    "arrow-right-thin-circle-outline": "\U000f1598",
-    "arrow-right-top": "\U000f17ab",
-    "arrow-right-top-bold": "\U000f17ac",
-    "arrow-split-horizontal": "\U000f093b",
-    "arrow-split-vertical": "\U000f093c",
-    "arrow-top-left": "\U000f005b",
-    "arrow-top-left-bold-box": "\U000f1968",
-    "arrow-top-left-bold-box-outline": "\U000f1969",
-    "arrow-top-left-bold-outline": "\U000f09c3",
-    "arrow-top-left-bottom-right": "\U000f0e75",
-    "arrow-top-left-bottom-right-bold": "\U000f0e76",
-    "arrow-top-left-thick": "\U000f09c4",
-    "arrow-top-left-thin": "\U000f19b5",
-    "arrow-top-left-thin-circle-outline": "\U000f1593",
-    "arrow-top-right": "\U000f005c",
-    "arrow-top-right-bold-box": "\U000f196a",
-    "arrow-top-right-bold-box-outline": "\U000f196b",
-    "arrow-top-right-bold-outline": "\U000f09c5",
-    "arrow-top-right-bottom-left": "\U000f0e77",
-    "arrow-top-right-bottom-left-bold": "\U000f0e78",
-    "arrow-top-right-thick": "\U000f09c6",
-    "arrow-top-right-thin": "\U000f19b4",
-    "arrow-top-right-thin-circle-outline": "\U000f1594",
-    "arrow-u-down-left": "\U000f17ad",
-    "arrow-u-down-left-bold": "\U000f17ae",
-    "arrow-u-down-right": "\U000f17af",
-    "arrow-u-down-right-bold": "\U000f17b0",
-    "arrow-u-left-bottom": "\U000f17b1",
-    "arrow-u-left-bottom-bold": "\U000f17b2",
-    "arrow-u-left-top": "\U000f17b3",
-    "arrow-u-left-top-bold": "\U000f17b4",
-    "arrow-u-right-bottom": "\U000f17b5",
-    "arrow-u-right-bottom-bold": "\U000f17b6",
-    "arrow-u-right-top": "\U000f17b7",
-    "arrow-u-right-top-bold": "\U000f17b8",
-    "arrow-u-up-left": "\U000f17b9",
-    "arrow-u-up-left-bold": "\U000f17ba",
-    "arrow-u-up-right": "\U000f17bb",
-    "arrow-u-up-right-bold": "\U000f17bc",
-    "arrow-up": "\U000f005d",
-    "arrow-up-bold": "\U000f0737",
-    "arrow-up-bold-box": "\U000f0738",
-    "arrow-up-bold-box-outline": "\U000f0739",
-    "arrow-up-bold-circle": "\U000f005f",
-    "arrow-up-bold-circle-outline": "\U000f0060",
-    "arrow-up-bold-hexagon-outline": "\U000f0061",
-    "arrow-up-bold-outline": "\U000f09c7",
-    "arrow-up-box": "\U000f06c3",
-    "arrow-up-circle": "\U000f0ce1",
-    "arrow-up-circle-outline": "\U000f0ce2",
-    "arrow-up-down": "\U000f0e79",
-    "arrow-up-down-bold": "\U000f0e7a",
-    "arrow-up-down-bold-outline": "\U000f09c8",
-    "arrow-up-drop-circle": "\U000f0062",
-    "arrow-up-drop-circle-outline": "\U000f0063",
-    "arrow-up-left": "\U000f17bd",
-    "arrow-up-left-bold": "\U000f17be",
-    "arrow-up-right": "\U000f17bf",
-    "arrow-up-right-bold": "\U000f17c0",
-    "arrow-up-thick": "\U000f005e",
-    "arrow-up-thin": "\U000f19b2",
-    "arrow-up-thin-circle-outline": "\U000f1597",
-    "arrow-vertical-lock": "\U000f115c",
-    "artboard": "\U000f1b9a",
-    "artstation": "\U000f0b5b",
-    "aspect-ratio": "\U000f0a24",
-    "assistant": "\U000f0064",
-    "asterisk": "\U000f06c4",
-    "asterisk-circle-outline": "\U000f1a27",
-    "at": "\U000f0065",
-    "atlassian": "\U000f0804",
-    "atm": "\U000f0d47",
-    "atom": "\U000f0768",
-    "atom-variant": "\U000f0e7b",
-    "attachment": "\U000f0066",
-    "attachment-check": "\U000f1ac1",
-    "attachment-lock": "\U000f19c4",
-    "attachment-minus": "\U000f1ac2",
-    "attachment-off": "\U000f1ac3",
-    "attachment-plus": "\U000f1ac4",
-    "attachment-remove": "\U000f1ac5",
-    "atv": "\U000f1b70",
-    "audio-input-rca": "\U000f186b",
-    "audio-input-stereo-minijack": "\U000f186c",
-    "audio-input-xlr": "\U000f186d",
-    "audio-video": "\U000f093d",
-    "audio-video-off": "\U000f11b6",
-    "augmented-reality": "\U000f0850",
-    "aurora": "\U000f1bb9",
-    "auto-download": "\U000f137e",
-    "auto-fix": "\U000f0068",
-    "auto-mode": "\U000f1c20",
-    "auto-upload": "\U000f0069",
-    "autorenew": "\U000f006a",
-    "autorenew-off": "\U000f19e7",
-    "av-timer": "\U000f006b",
-    "awning": "\U000f1b87",
-    "awning-outline": "\U000f1b88",
-    "aws": "\U000f0e0f",
-    "axe": "\U000f08c8",
-    "axe-battle": "\U000f1842",
-    "axis": "\U000f0d48",
-    "axis-arrow": "\U000f0d49",
-    "axis-arrow-info": "\U000f140e",
-    "axis-arrow-lock": "\U000f0d4a",
-    "axis-lock": "\U000f0d4b",
-    "axis-x-arrow": "\U000f0d4c",
-    "axis-x-arrow-lock": "\U000f0d4d",
-    "axis-x-rotate-clockwise": "\U000f0d4e",
-    "axis-x-rotate-counterclockwise": "\U000f0d4f",
-    "axis-x-y-arrow-lock": "\U000f0d50",
-    "axis-y-arrow": "\U000f0d51",
-    "axis-y-arrow-lock": "\U000f0d52",
-    "axis-y-rotate-clockwise": "\U000f0d53",
-    "axis-y-rotate-counterclockwise": "\U000f0d54",
-    "axis-z-arrow": "\U000f0d55",
-    "axis-z-arrow-lock": "\U000f0d56",
-    "axis-z-rotate-clockwise": "\U000f0d57",
-    "axis-z-rotate-counterclockwise": "\U000f0d58",
-    "babel": "\U000f0a25",
-    "baby": "\U000f006c",
-    "baby-bottle": "\U000f0f39",
-    "baby-bottle-outline": "\U000f0f3a",
-    "baby-buggy": "\U000f13e0",
-    "baby-buggy-off": "\U000f1af3",
-    "baby-carriage": "\U000f068f",
-    "baby-carriage-off": "\U000f0fa0",
-    "baby-face": "\U000f0e7c",
-    "baby-face-outline": "\U000f0e7d",
-    "backburger": "\U000f006d",
-    "backspace": "\U000f006e",
-    "backspace-outline": "\U000f0b5c",
-    "backspace-reverse": "\U000f0e7e",
-    "backspace-reverse-outline": "\U000f0e7f",
-    "backup-restore": "\U000f006f",
-    "bacteria": "\U000f0ed5",
-    "bacteria-outline": "\U000f0ed6",
-    "badge-account": "\U000f0da7",
-    "badge-account-alert": "\U000f0da8",
-    "badge-account-alert-outline": "\U000f0da9",
-    "badge-account-horizontal": "\U000f0e0d",
-    "badge-account-horizontal-outline": "\U000f0e0e",
-    "badge-account-outline": "\U000f0daa",
-    "badminton": "\U000f0851",
-    "bag-carry-on": "\U000f0f3b",
-    "bag-carry-on-check": "\U000f0d65",
-    "bag-carry-on-off": "\U000f0f3c",
-    "bag-checked": "\U000f0f3d",
-    "bag-personal": "\U000f0e10",
-    "bag-personal-off": "\U000f0e11",
-    "bag-personal-off-outline": "\U000f0e12",
-    "bag-personal-outline": "\U000f0e13",
-    "bag-personal-plus": "\U000f1ca4",
-    "bag-personal-plus-outline": "\U000f1ca5",
-    "bag-personal-tag": "\U000f1b0c",
-    "bag-personal-tag-outline": "\U000f1b0d",
-    "bag-suitcase": "\U000f158b",
-    "bag-suitcase-off": "\U000f158d",
-    "bag-suitcase-off-outline": "\U000f158e",
-    "bag-suitcase-outline": "\U000f158c",
-    "baguette": "\U000f0f3e",
-    "balcony": "\U000f1817",
-    "balloon": "\U000f0a26",
-    "ballot": "\U000f09c9",
-    "ballot-outline": "\U000f09ca",
-    "ballot-recount": "\U000f0c39",
-    "ballot-recount-outline": "\U000f0c3a",
-    "bandage": "\U000f0daf",
-    "bank": "\U000f0070",
-    "bank-check": "\U000f1655",
-    "bank-circle": "\U000f1c03",
-    "bank-circle-outline": "\U000f1c04",
-    "bank-minus": "\U000f0db0",
-    "bank-off": "\U000f1656",
-    "bank-off-outline": "\U000f1657",
-    "bank-outline": "\U000f0e80",
-    "bank-plus": "\U000f0db1",
-    "bank-remove": "\U000f0db2",
-    "bank-transfer": "\U000f0a27",
-    "bank-transfer-in": "\U000f0a28",
-    "bank-transfer-out": "\U000f0a29",
-    "barcode": "\U000f0071",
-    "barcode-off": "\U000f1236",
-    "barcode-scan": "\U000f0072",
-    "barley": "\U000f0073",
-    "barley-off": "\U000f0b5d",
-    "barn": "\U000f0b5e",
-    "barrel": "\U000f0074",
-    "barrel-outline": "\U000f1a28",
-    "baseball": "\U000f0852",
-    "baseball-bat": "\U000f0853",
-    "baseball-diamond": "\U000f15ec",
-    "baseball-diamond-outline": "\U000f15ed",
-    "baseball-outline": "\U000f1c5a",
-    "bash": "\U000f1183",
-    "basket": "\U000f0076",
-    "basket-check": "\U000f18e5",
-    "basket-check-outline": "\U000f18e6",
-    "basket-fill": "\U000f0077",
-    "basket-minus": "\U000f1523",
-    "basket-minus-outline": "\U000f1524",
-    "basket-off": "\U000f1525",
-    "basket-off-outline": "\U000f1526",
-    "basket-outline": "\U000f1181",
-    "basket-plus": "\U000f1527",
-    "basket-plus-outline": "\U000f1528",
-    "basket-remove": "\U000f1529",
-    "basket-remove-outline": "\U000f152a",
-    "basket-unfill": "\U000f0078",
-    "basketball": "\U000f0806",
-    "basketball-hoop": "\U000f0c3b",
-    "basketball-hoop-outline": "\U000f0c3c",
-    "bat": "\U000f0b5f",
-    "bathtub": "\U000f1818",
-    "bathtub-outline": "\U000f1819",
-    "battery": "\U000f0079",
-    "battery-10": "\U000f007a",
-    "battery-10-bluetooth": "\U000f093e",
-    "battery-20": "\U000f007b",
-    "battery-20-bluetooth": "\U000f093f",
-    "battery-30": "\U000f007c",
-    "battery-30-bluetooth": "\U000f0940",
-    "battery-40": "\U000f007d",
-    "battery-40-bluetooth": "\U000f0941",
-    "battery-50": "\U000f007e",
-    "battery-50-bluetooth": "\U000f0942",
-    "battery-60": "\U000f007f",
-    "battery-60-bluetooth": "\U000f0943",
-    "battery-70": "\U000f0080",
-    "battery-70-bluetooth": "\U000f0944",
-    "battery-80": "\U000f0081",
-    "battery-80-bluetooth": "\U000f0945",
-    "battery-90": "\U000f0082",
-    "battery-90-bluetooth": "\U000f0946",
-    "battery-alert": "\U000f0083",
-    "battery-alert-bluetooth": "\U000f0947",
-    "battery-alert-variant": "\U000f10cc",
-    "battery-alert-variant-outline": "\U000f10cd",
-    "battery-arrow-down": "\U000f17de",
-    "battery-arrow-down-outline": "\U000f17df",
-    "battery-arrow-up": "\U000f17e0",
-    "battery-arrow-up-outline": "\U000f17e1",
-    "battery-bluetooth": "\U000f0948",
-    "battery-bluetooth-variant": "\U000f0949",
-    "battery-charging": "\U000f0084",
-    "battery-charging-10": "\U000f089c",
-    "battery-charging-100": "\U000f0085",
-    "battery-charging-20": "\U000f0086",
-    "battery-charging-30": "\U000f0087",
-    "battery-charging-40": "\U000f0088",
-    "battery-charging-50": "\U000f089d",
-    "battery-charging-60": "\U000f0089",
-    "battery-charging-70": "\U000f089e",
-    "battery-charging-80": "\U000f008a",
-    "battery-charging-90": "\U000f008b",
-    "battery-charging-high": "\U000f12a6",
-    "battery-charging-low": "\U000f12a4",
-    "battery-charging-medium": "\U000f12a5",
-    "battery-charging-outline": "\U000f089f",
-    "battery-charging-wireless": "\U000f0807",
-    "battery-charging-wireless-10": "\U000f0808",
-    "battery-charging-wireless-20": "\U000f0809",
-    "battery-charging-wireless-30": "\U000f080a",
-    "battery-charging-wireless-40": "\U000f080b",
-    "battery-charging-wireless-50": "\U000f080c",
-    "battery-charging-wireless-60": "\U000f080d",
-    "battery-charging-wireless-70": "\U000f080e",
-    "battery-charging-wireless-80": "\U000f080f",
-    "battery-charging-wireless-90": "\U000f0810",
-    "battery-charging-wireless-alert": "\U000f0811",
-    "battery-charging-wireless-outline": "\U000f0812",
-    "battery-check": "\U000f17e2",
-    "battery-check-outline": "\U000f17e3",
-    "battery-clock": "\U000f19e5",
-    "battery-clock-outline": "\U000f19e6",
-    "battery-heart": "\U000f120f",
-    "battery-heart-outline": "\U000f1210",
-    "battery-heart-variant": "\U000f1211",
-    "battery-high": "\U000f12a3",
-    "battery-lock": "\U000f179c",
-    "battery-lock-open": "\U000f179d",
-    "battery-low": "\U000f12a1",
-    "battery-medium": "\U000f12a2",
-    "battery-minus": "\U000f17e4",
-    "battery-minus-outline": "\U000f17e5",
-    "battery-minus-variant": "\U000f008c",
-    "battery-negative": "\U000f008d",
-    "battery-off": "\U000f125d",
-    "battery-off-outline": "\U000f125e",
-    "battery-outline": "\U000f008e",
-    "battery-plus": "\U000f17e6",
-    "battery-plus-outline": "\U000f17e7",
-    "battery-plus-variant": "\U000f008f",
-    "battery-positive": "\U000f0090",
-    "battery-remove": "\U000f17e8",
-    "battery-remove-outline": "\U000f17e9",
-    "battery-sync": "\U000f1834",
-    "battery-sync-outline": "\U000f1835",
-    "battery-unknown": "\U000f0091",
-    "battery-unknown-bluetooth": "\U000f094a",
-    "beach": "\U000f0092",
-    "beaker": "\U000f0cea",
-    "beaker-alert": "\U000f1229",
-    "beaker-alert-outline": "\U000f122a",
-    "beaker-check": "\U000f122b",
-    "beaker-check-outline": "\U000f122c",
-    "beaker-minus": "\U000f122d",
-    "beaker-minus-outline": "\U000f122e",
-    "beaker-outline": "\U000f0690",
-    "beaker-plus": "\U000f122f",
-    "beaker-plus-outline": "\U000f1230",
-    "beaker-question": "\U000f1231",
-    "beaker-question-outline": "\U000f1232",
-    "beaker-remove": "\U000f1233",
-    "beaker-remove-outline": "\U000f1234",
-    "bed": "\U000f02e3",
-    "bed-clock": "\U000f1b94",
-    "bed-double": "\U000f0fd4",
-    "bed-double-outline": "\U000f0fd3",
-    "bed-empty": "\U000f08a0",
-    "bed-king": "\U000f0fd2",
-    "bed-king-outline": "\U000f0fd1",
-    "bed-outline": "\U000f0099",
-    "bed-queen": "\U000f0fd0",
-    "bed-queen-outline": "\U000f0fdb",
-    "bed-single": "\U000f106d",
-    "bed-single-outline": "\U000f106e",
-    "bee": "\U000f0fa1",
-    "bee-flower": "\U000f0fa2",
-    "beehive-off-outline": "\U000f13ed",
-    "beehive-outline": "\U000f10ce",
-    "beekeeper": "\U000f14e2",
-    "beer": "\U000f0098",
-    "beer-outline": "\U000f130c",
-    "bell": "\U000f009a",
-    "bell-alert": "\U000f0d59",
-    "bell-alert-outline": "\U000f0e81",
-    "bell-badge": "\U000f116b",
-    "bell-badge-outline": "\U000f0178",
-    "bell-cancel": "\U000f13e7",
-    "bell-cancel-outline": "\U000f13e8",
-    "bell-check": "\U000f11e5",
-    "bell-check-outline": "\U000f11e6",
-    "bell-circle": "\U000f0d5a",
-    "bell-circle-outline": "\U000f0d5b",
-    "bell-cog": "\U000f1a29",
-    "bell-cog-outline": "\U000f1a2a",
-    "bell-minus": "\U000f13e9",
-    "bell-minus-outline": "\U000f13ea",
-    "bell-off": "\U000f009b",
-    "bell-off-outline": "\U000f0a91",
-    "bell-outline": "\U000f009c",
-    "bell-plus": "\U000f009d",
-    "bell-plus-outline": "\U000f0a92",
-    "bell-remove": "\U000f13eb",
-    "bell-remove-outline": "\U000f13ec",
-    "bell-ring": "\U000f009e",
-    "bell-ring-outline": "\U000f009f",
-    "bell-sleep": "\U000f00a0",
-    "bell-sleep-outline": "\U000f0a93",
-    "bench": "\U000f1c21",
-    "bench-back": "\U000f1c22",
-    "beta": "\U000f00a1",
-    "betamax": "\U000f09cb",
-    "biathlon": "\U000f0e14",
-    "bicycle": "\U000f109c",
-    "bicycle-basket": "\U000f1235",
-    "bicycle-cargo": "\U000f189c",
-    "bicycle-electric": "\U000f15b4",
-    "bicycle-penny-farthing": "\U000f15e9",
-    "bike": "\U000f00a3",
-    "bike-fast": "\U000f111f",
-    "bike-pedal": "\U000f1c23",
-    "bike-pedal-clipless": "\U000f1c24",
-    "bike-pedal-mountain": "\U000f1c25",
-    "billboard": "\U000f1010",
-    "billiards": "\U000f0b61",
-    "billiards-rack": "\U000f0b62",
-    "binoculars": "\U000f00a5",
-    "bio": "\U000f00a6",
-    "biohazard": "\U000f00a7",
-    "bird": "\U000f15c6",
-    "bitbucket": "\U000f00a8",
-    "bitcoin": "\U000f0813",
-    "black-mesa": "\U000f00a9",
-    "blender": "\U000f0ceb",
-    "blender-outline": "\U000f181a",
-    "blender-software": "\U000f00ab",
-    "blinds": "\U000f00ac",
-    "blinds-horizontal": "\U000f1a2b",
-    "blinds-horizontal-closed": "\U000f1a2c",
-    "blinds-open": "\U000f1011",
-    "blinds-vertical": "\U000f1a2d",
-    "blinds-vertical-closed": "\U000f1a2e",
-    "block-helper": "\U000f00ad",
-    "blood-bag": "\U000f0cec",
-    "bluetooth": "\U000f00af",
-    "bluetooth-audio": "\U000f00b0",
-    "bluetooth-connect": "\U000f00b1",
-    "bluetooth-off": "\U000f00b2",
-    "bluetooth-settings": "\U000f00b3",
-    "bluetooth-transfer": "\U000f00b4",
-    "blur": "\U000f00b5",
-    "blur-linear": "\U000f00b6",
-    "blur-off": "\U000f00b7",
-    "blur-radial": "\U000f00b8",
-    "bolt": "\U000f0db3",
-    "bomb": "\U000f0691",
-    "bomb-off": "\U000f06c5",
-    "bone": "\U000f00b9",
-    "bone-off": "\U000f19e0",
-    "book": "\U000f00ba",
-    "book-account": "\U000f13ad",
-    "book-account-outline": "\U000f13ae",
-    "book-alert": "\U000f167c",
-    "book-alert-outline": "\U000f167d",
-    "book-alphabet": "\U000f061d",
-    "book-arrow-down": "\U000f167e",
-    "book-arrow-down-outline": "\U000f167f",
-    "book-arrow-left": "\U000f1680",
-    "book-arrow-left-outline": "\U000f1681",
-    "book-arrow-right": "\U000f1682",
-    "book-arrow-right-outline": "\U000f1683",
-    "book-arrow-up": "\U000f1684",
-    "book-arrow-up-outline": "\U000f1685",
-    "book-cancel": "\U000f1686",
-    "book-cancel-outline": "\U000f1687",
-    "book-check": "\U000f14f3",
-    "book-check-outline": "\U000f14f4",
-    "book-clock": "\U000f1688",
-    "book-clock-outline": "\U000f1689",
-    "book-cog": "\U000f168a",
-    "book-cog-outline": "\U000f168b",
-    "book-cross": "\U000f00a2",
-    "book-edit": "\U000f168c",
-    "book-edit-outline": "\U000f168d",
-    "book-education": "\U000f16c9",
-    "book-education-outline": "\U000f16ca",
-    "book-heart": "\U000f1a1d",
-    "book-heart-outline": "\U000f1a1e",
-    "book-information-variant": "\U000f106f",
-    "book-lock": "\U000f079a",
-    "book-lock-open": "\U000f079b",
-    "book-lock-open-outline": "\U000f168e",
-    "book-lock-outline": "\U000f168f",
-    "book-marker": "\U000f1690",
-    "book-marker-outline": "\U000f1691",
-    "book-minus": "\U000f05d9",
-    "book-minus-multiple": "\U000f0a94",
-    "book-minus-multiple-outline": "\U000f090b",
-    "book-minus-outline": "\U000f1692",
-    "book-multiple": "\U000f00bb",
-    "book-multiple-outline": "\U000f0436",
-    "book-music": "\U000f0067",
-    "book-music-outline": "\U000f1693",
-    "book-off": "\U000f1694",
-    "book-off-outline": "\U000f1695",
-    "book-open": "\U000f00bd",
-    "book-open-blank-variant": "\U000f00be",
-    "book-open-blank-variant-outline": "\U000f1ccb",
-    "book-open-outline": "\U000f0b63",
-    "book-open-page-variant": "\U000f05da",
-    "book-open-page-variant-outline": "\U000f15d6",
-    "book-open-variant": "\U000f14f7",
-    "book-open-variant-outline": "\U000f1ccc",
-    "book-outline": "\U000f0b64",
-    "book-play": "\U000f0e82",
-    "book-play-outline": "\U000f0e83",
-    "book-plus": "\U000f05db",
-    "book-plus-multiple": "\U000f0a95",
-    "book-plus-multiple-outline": "\U000f0ade",
-    "book-plus-outline": "\U000f1696",
-    "book-refresh": "\U000f1697",
-    "book-refresh-outline": "\U000f1698",
-    "book-remove": "\U000f0a97",
-    "book-remove-multiple": "\U000f0a96",
-    "book-remove-multiple-outline": "\U000f04ca",
-    "book-remove-outline": "\U000f1699",
-    "book-search": "\U000f0e84",
-    "book-search-outline": "\U000f0e85",
-    "book-settings": "\U000f169a",
-    "book-settings-outline": "\U000f169b",
-    "book-sync": "\U000f169c",
-    "book-sync-outline": "\U000f16c8",
-    "book-variant": "\U000f00bf",
-    "bookmark": "\U000f00c0",
-    "bookmark-box": "\U000f1b75",
-    "bookmark-box-multiple": "\U000f196c",
-    "bookmark-box-multiple-outline": "\U000f196d",
-    "bookmark-box-outline": "\U000f1b76",
-    "bookmark-check": "\U000f00c1",
-    "bookmark-check-outline": "\U000f137b",
-    "bookmark-minus": "\U000f09cc",
-    "bookmark-minus-outline": "\U000f09cd",
-    "bookmark-multiple": "\U000f0e15",
-    "bookmark-multiple-outline": "\U000f0e16",
-    "bookmark-music": "\U000f00c2",
-    "bookmark-music-outline": "\U000f1379",
-    "bookmark-off": "\U000f09ce",
-    "bookmark-off-outline": "\U000f09cf",
-    "bookmark-outline": "\U000f00c3",
-    "bookmark-plus": "\U000f00c5",
-    "bookmark-plus-outline": "\U000f00c4",
-    "bookmark-remove": "\U000f00c6",
-    "bookmark-remove-outline": "\U000f137a",
-    "bookshelf": "\U000f125f",
-    "boom-gate": "\U000f0e86",
-    "boom-gate-alert": "\U000f0e87",
-    "boom-gate-alert-outline": "\U000f0e88",
-    "boom-gate-arrow-down": "\U000f0e89",
-    "boom-gate-arrow-down-outline": "\U000f0e8a",
-    "boom-gate-arrow-up": "\U000f0e8c",
-    "boom-gate-arrow-up-outline": "\U000f0e8d",
-    "boom-gate-outline": "\U000f0e8b",
-    "boom-gate-up": "\U000f17f9",
-    "boom-gate-up-outline": "\U000f17fa",
-    "boombox": "\U000f05dc",
-    "boomerang": "\U000f10cf",
-    "bootstrap": "\U000f06c6",
-    "border-all": "\U000f00c7",
-    "border-all-variant": "\U000f08a1",
-    "border-bottom": "\U000f00c8",
-    "border-bottom-variant": "\U000f08a2",
-    "border-color": "\U000f00c9",
-    "border-horizontal": "\U000f00ca",
-    "border-inside": "\U000f00cb",
-    "border-left": "\U000f00cc",
-    "border-left-variant": "\U000f08a3",
-    "border-none": "\U000f00cd",
-    "border-none-variant": "\U000f08a4",
-    "border-outside": "\U000f00ce",
-    "border-radius": "\U000f1af4",
-    "border-right": "\U000f00cf",
-    "border-right-variant": "\U000f08a5",
-    "border-style": "\U000f00d0",
-    "border-top": "\U000f00d1",
-    "border-top-variant": "\U000f08a6",
-    "border-vertical": "\U000f00d2",
-    "bottle-soda": "\U000f1070",
-    "bottle-soda-classic": "\U000f1071",
-    "bottle-soda-classic-outline": "\U000f1363",
-    "bottle-soda-outline": "\U000f1072",
-    "bottle-tonic": "\U000f112e",
-    "bottle-tonic-outline": "\U000f112f",
-    "bottle-tonic-plus": "\U000f1130",
-    "bottle-tonic-plus-outline": "\U000f1131",
-    "bottle-tonic-skull": "\U000f1132",
-    "bottle-tonic-skull-outline": "\U000f1133",
-    "bottle-wine": "\U000f0854",
-    "bottle-wine-outline": "\U000f1310",
-    "bow-arrow": "\U000f1841",
-    "bow-tie": "\U000f0678",
-    "bowl": "\U000f028e",
-    "bowl-mix": "\U000f0617",
-    "bowl-mix-outline": "\U000f02e4",
-    "bowl-outline": "\U000f02a9",
-    "bowling": "\U000f00d3",
-    "box": "\U000f00d4",
-    "box-cutter": "\U000f00d5",
-    "box-cutter-off": "\U000f0b4a",
-    "box-shadow": "\U000f0637",
-    "boxing-glove": "\U000f0b65",
-    "braille": "\U000f09d0",
-    "brain": "\U000f09d1",
-    "bread-slice": "\U000f0cee",
-    "bread-slice-outline": "\U000f0cef",
-    "bridge": "\U000f0618",
-    "briefcase": "\U000f00d6",
-    "briefcase-account": "\U000f0cf0",
-    "briefcase-account-outline": "\U000f0cf1",
-    "briefcase-arrow-left-right": "\U000f1a8d",
-    "briefcase-arrow-left-right-outline": "\U000f1a8e",
-    "briefcase-arrow-up-down": "\U000f1a8f",
-    "briefcase-arrow-up-down-outline": "\U000f1a90",
-    "briefcase-check": "\U000f00d7",
-    "briefcase-check-outline": "\U000f131e",
-    "briefcase-clock": "\U000f10d0",
-    "briefcase-clock-outline": "\U000f10d1",
-    "briefcase-download": "\U000f00d8",
-    "briefcase-download-outline": "\U000f0c3d",
-    "briefcase-edit": "\U000f0a98",
-    "briefcase-edit-outline": "\U000f0c3e",
-    "briefcase-eye": "\U000f17d9",
-    "briefcase-eye-outline": "\U000f17da",
-    "briefcase-minus": "\U000f0a2a",
-    "briefcase-minus-outline": "\U000f0c3f",
-    "briefcase-off": "\U000f1658",
-    "briefcase-off-outline": "\U000f1659",
-    "briefcase-outline": "\U000f0814",
-    "briefcase-plus": "\U000f0a2b",
-    "briefcase-plus-outline": "\U000f0c40",
-    "briefcase-remove": "\U000f0a2c",
-    "briefcase-remove-outline": "\U000f0c41",
-    "briefcase-search": "\U000f0a2d",
-    "briefcase-search-outline": "\U000f0c42",
-    "briefcase-upload": "\U000f00d9",
-    "briefcase-upload-outline": "\U000f0c43",
-    "briefcase-variant": "\U000f1494",
-    "briefcase-variant-off": "\U000f165a",
-    "briefcase-variant-off-outline": "\U000f165b",
-    "briefcase-variant-outline": "\U000f1495",
-    "brightness-1": "\U000f00da",
-    "brightness-2": "\U000f00db",
-    "brightness-3": "\U000f00dc",
-    "brightness-4": "\U000f00dd",
-    "brightness-5": "\U000f00de",
-    "brightness-6": "\U000f00df",
-    "brightness-7": "\U000f00e0",
-    "brightness-auto": "\U000f00e1",
-    "brightness-percent": "\U000f0cf2",
-    "broadcast": "\U000f1720",
-    "broadcast-off": "\U000f1721",
-    "broom": "\U000f00e2",
-    "brush": "\U000f00e3",
-    "brush-off": "\U000f1771",
-    "brush-outline": "\U000f1a0d",
-    "brush-variant": "\U000f1813",
-    "bucket": "\U000f1415",
-    "bucket-outline": "\U000f1416",
-    "buffet": "\U000f0578",
-    "bug": "\U000f00e4",
-    "bug-check": "\U000f0a2e",
-    "bug-check-outline": "\U000f0a2f",
-    "bug-outline": "\U000f0a30",
-    "bug-pause": "\U000f1af5",
-    "bug-pause-outline": "\U000f1af6",
-    "bug-play": "\U000f1af7",
-    "bug-play-outline": "\U000f1af8",
-    "bug-stop": "\U000f1af9",
-    "bug-stop-outline": "\U000f1afa",
-    "bugle": "\U000f0db4",
-    "bulkhead-light": "\U000f1a2f",
-    "bulldozer": "\U000f0b22",
-    "bullet": "\U000f0cf3",
-    "bulletin-board": "\U000f00e5",
-    "bullhorn": "\U000f00e6",
-    "bullhorn-outline": "\U000f0b23",
-    "bullhorn-variant": "\U000f196e",
-    "bullhorn-variant-outline": "\U000f196f",
-    "bullseye": "\U000f05dd",
-    "bullseye-arrow": "\U000f08c9",
-    "bulma": "\U000f12e7",
-    "bunk-bed": "\U000f1302",
-    "bunk-bed-outline": "\U000f0097",
-    "bus": "\U000f00e7",
-    "bus-alert": "\U000f0a99",
-    "bus-articulated-end": "\U000f079c",
-    "bus-articulated-front": "\U000f079d",
-    "bus-clock": "\U000f08ca",
-    "bus-double-decker": "\U000f079e",
-    "bus-electric": "\U000f191d",
-    "bus-marker": "\U000f1212",
-    "bus-multiple": "\U000f0f3f",
-    "bus-school": "\U000f079f",
-    "bus-side": "\U000f07a0",
-    "bus-sign": "\U000f1cc1",
-    "bus-stop": "\U000f1012",
-    "bus-stop-covered": "\U000f1013",
-    "bus-stop-uncovered": "\U000f1014",
-    "bus-wrench": "\U000f1cc2",
-    "butterfly": "\U000f1589",
-    "butterfly-outline": "\U000f158a",
-    "button-cursor": "\U000f1b4f",
-    "button-pointer": "\U000f1b50",
-    "cabin-a-frame": "\U000f188c",
-    "cable-data": "\U000f1394",
-    "cached": "\U000f00e8",
-    "cactus": "\U000f0db5",
-    "cake": "\U000f00e9",
-    "cake-layered": "\U000f00ea",
-    "cake-variant": "\U000f00eb",
-    "cake-variant-outline": "\U000f17f0",
-    "calculator": "\U000f00ec",
-    "calculator-variant": "\U000f0a9a",
-    "calculator-variant-outline": "\U000f15a6",
-    "calendar": "\U000f00ed",
-    "calendar-account": "\U000f0ed7",
-    "calendar-account-outline": "\U000f0ed8",
-    "calendar-alert": "\U000f0a31",
-    "calendar-alert-outline": "\U000f1b62",
-    "calendar-arrow-left": "\U000f1134",
-    "calendar-arrow-right": "\U000f1135",
-    "calendar-badge": "\U000f1b9d",
-    "calendar-badge-outline": "\U000f1b9e",
-    "calendar-blank": "\U000f00ee",
-    "calendar-blank-multiple": "\U000f1073",
-    "calendar-blank-outline": "\U000f0b66",
-    "calendar-check": "\U000f00ef",
-    "calendar-check-outline": "\U000f0c44",
-    "calendar-clock": "\U000f00f0",
-    "calendar-clock-outline": "\U000f16e1",
-    "calendar-collapse-horizontal": "\U000f189d",
-    "calendar-collapse-horizontal-outline": "\U000f1b63",
-    "calendar-cursor": "\U000f157b",
-    "calendar-cursor-outline": "\U000f1b64",
-    "calendar-edit": "\U000f08a7",
-    "calendar-edit-outline": "\U000f1b65",
-    "calendar-end": "\U000f166c",
-    "calendar-end-outline": "\U000f1b66",
-    "calendar-expand-horizontal": "\U000f189e",
-    "calendar-expand-horizontal-outline": "\U000f1b67",
-    "calendar-export": "\U000f0b24",
-    "calendar-export-outline": "\U000f1b68",
-    "calendar-filter": "\U000f1a32",
-    "calendar-filter-outline": "\U000f1a33",
-    "calendar-heart": "\U000f09d2",
-    "calendar-heart-outline": "\U000f1b69",
-    "calendar-import": "\U000f0b25",
-    "calendar-import-outline": "\U000f1b6a",
-    "calendar-lock": "\U000f1641",
-    "calendar-lock-open": "\U000f1b5b",
-    "calendar-lock-open-outline": "\U000f1b5c",
-    "calendar-lock-outline": "\U000f1642",
-    "calendar-minus": "\U000f0d5c",
-    "calendar-minus-outline": "\U000f1b6b",
-    "calendar-month": "\U000f0e17",
-    "calendar-month-outline": "\U000f0e18",
-    "calendar-multiple": "\U000f00f1",
-    "calendar-multiple-check": "\U000f00f2",
-    "calendar-multiselect": "\U000f0a32",
-    "calendar-multiselect-outline": "\U000f1b55",
-    "calendar-outline": "\U000f0b67",
-    "calendar-plus": "\U000f00f3",
-    "calendar-plus-outline": "\U000f1b6c",
-    "calendar-question": "\U000f0692",
-    "calendar-question-outline": "\U000f1b6d",
-    "calendar-range": "\U000f0679",
-    "calendar-range-outline": "\U000f0b68",
-    "calendar-refresh": "\U000f01e1",
-    "calendar-refresh-outline": "\U000f0203",
-    "calendar-remove": "\U000f00f4",
-    "calendar-remove-outline": "\U000f0c45",
-    "calendar-search": "\U000f094c",
-    "calendar-search-outline": "\U000f1b6e",
-    "calendar-star": "\U000f09d3",
-    "calendar-star-four-points": "\U000f1c1f",
-    "calendar-star-outline": "\U000f1b53",
-    "calendar-start": "\U000f166d",
-    "calendar-start-outline": "\U000f1b6f",
-    "calendar-sync": "\U000f0e8e",
-    "calendar-sync-outline": "\U000f0e8f",
-    "calendar-text": "\U000f00f5",
-    "calendar-text-outline": "\U000f0c46",
-    "calendar-today": "\U000f00f6",
-    "calendar-today-outline": "\U000f1a30",
-    "calendar-week": "\U000f0a33",
-    "calendar-week-begin": "\U000f0a34",
-    "calendar-week-begin-outline": "\U000f1a31",
-    "calendar-week-outline": "\U000f1a34",
-    "calendar-weekend": "\U000f0ed9",
-    "calendar-weekend-outline": "\U000f0eda",
-    "call-made": "\U000f00f7",
-    "call-merge": "\U000f00f8",
-    "call-missed": "\U000f00f9",
-    "call-received": "\U000f00fa",
-    "call-split": "\U000f00fb",
-    "camcorder": "\U000f00fc",
-    "camcorder-off": "\U000f00ff",
-    "camera": "\U000f0100",
-    "camera-account": "\U000f08cb",
-    "camera-burst": "\U000f0693",
-    "camera-control": "\U000f0b69",
-    "camera-document": "\U000f1871",
-    "camera-document-off": "\U000f1872",
-    "camera-enhance": "\U000f0101",
-    "camera-enhance-outline": "\U000f0b6a",
-    "camera-flip": "\U000f15d9",
-    "camera-flip-outline": "\U000f15da",
-    "camera-front": "\U000f0102",
-    "camera-front-variant": "\U000f0103",
-    "camera-gopro": "\U000f07a1",
-    "camera-image": "\U000f08cc",
-    "camera-iris": "\U000f0104",
-    "camera-lock": "\U000f1a14",
-    "camera-lock-open": "\U000f1c0d",
-    "camera-lock-open-outline": "\U000f1c0e",
-    "camera-lock-outline": "\U000f1a15",
-    "camera-marker": "\U000f19a7",
-    "camera-marker-outline": "\U000f19a8",
-    "camera-metering-center": "\U000f07a2",
-    "camera-metering-matrix": "\U000f07a3",
-    "camera-metering-partial": "\U000f07a4",
-    "camera-metering-spot": "\U000f07a5",
-    "camera-off": "\U000f05df",
-    "camera-off-outline": "\U000f19bf",
-    "camera-outline": "\U000f0d5d",
-    "camera-party-mode": "\U000f0105",
-    "camera-plus": "\U000f0edb",
-    "camera-plus-outline": "\U000f0edc",
-    "camera-rear": "\U000f0106",
-    "camera-rear-variant": "\U000f0107",
-    "camera-retake": "\U000f0e19",
-    "camera-retake-outline": "\U000f0e1a",
-    "camera-switch": "\U000f0108",
-    "camera-switch-outline": "\U000f084a",
-    "camera-timer": "\U000f0109",
-    "camera-wireless": "\U000f0db6",
-    "camera-wireless-outline": "\U000f0db7",
-    "campfire": "\U000f0edd",
-    "cancel": "\U000f073a",
-    "candelabra": "\U000f17d2",
-    "candelabra-fire": "\U000f17d3",
-    "candle": "\U000f05e2",
-    "candy": "\U000f1970",
-    "candy-off": "\U000f1971",
-    "candy-off-outline": "\U000f1972",
-    "candy-outline": "\U000f1973",
-    "candycane": "\U000f010a",
-    "cannabis": "\U000f07a6",
-    "cannabis-off": "\U000f166e",
-    "caps-lock": "\U000f0a9b",
-    "car": "\U000f010b",
-    "car-2-plus": "\U000f1015",
-    "car-3-plus": "\U000f1016",
-    "car-arrow-left": "\U000f13b2",
-    "car-arrow-right": "\U000f13b3",
-    "car-back": "\U000f0e1b",
-    "car-battery": "\U000f010c",
-    "car-brake-abs": "\U000f0c47",
-    "car-brake-alert": "\U000f0c48",
-    "car-brake-fluid-level": "\U000f1909",
-    "car-brake-hold": "\U000f0d5e",
-    "car-brake-low-pressure": "\U000f190a",
-    "car-brake-parking": "\U000f0d5f",
-    "car-brake-retarder": "\U000f1017",
-    "car-brake-temperature": "\U000f190b",
-    "car-brake-worn-linings": "\U000f190c",
-    "car-child-seat": "\U000f0fa3",
-    "car-clock": "\U000f1974",
-    "car-clutch": "\U000f1018",
-    "car-cog": "\U000f13cc",
-    "car-connected": "\U000f010d",
-    "car-convertible": "\U000f07a7",
-    "car-coolant-level": "\U000f1019",
-    "car-cruise-control": "\U000f0d60",
-    "car-defrost-front": "\U000f0d61",
-    "car-defrost-rear": "\U000f0d62",
-    "car-door": "\U000f0b6b",
-    "car-door-lock": "\U000f109d",
-    "car-door-lock-open": "\U000f1c81",
-    "car-electric": "\U000f0b6c",
-    "car-electric-outline": "\U000f15b5",
-    "car-emergency": "\U000f160f",
-    "car-esp": "\U000f0c49",
-    "car-estate": "\U000f07a8",
-    "car-hatchback": "\U000f07a9",
-    "car-info": "\U000f11be",
-    "car-key": "\U000f0b6d",
-    "car-lifted-pickup": "\U000f152d",
-    "car-light-alert": "\U000f190d",
-    "car-light-dimmed": "\U000f0c4a",
-    "car-light-fog": "\U000f0c4b",
-    "car-light-high": "\U000f0c4c",
-    "car-limousine": "\U000f08cd",
-    "car-multiple": "\U000f0b6e",
-    "car-off": "\U000f0e1c",
-    "car-outline": "\U000f14ed",
-    "car-parking-lights": "\U000f0d63",
-    "car-pickup": "\U000f07aa",
-    "car-search": "\U000f1b8d",
-    "car-search-outline": "\U000f1b8e",
-    "car-seat": "\U000f0fa4",
-    "car-seat-cooler": "\U000f0fa5",
-    "car-seat-heater": "\U000f0fa6",
-    "car-select": "\U000f1879",
-    "car-settings": "\U000f13cd",
-    "car-shift-pattern": "\U000f0f40",
-    "car-side": "\U000f07ab",
-    "car-speed-limiter": "\U000f190e",
-    "car-sports": "\U000f07ac",
-    "car-tire-alert": "\U000f0c4d",
-    "car-traction-control": "\U000f0d64",
-    "car-turbocharger": "\U000f101a",
-    "car-wash": "\U000f010e",
-    "car-windshield": "\U000f101b",
-    "car-windshield-outline": "\U000f101c",
-    "car-wireless": "\U000f1878",
-    "car-wrench": "\U000f1814",
-    "carabiner": "\U000f14c0",
-    "caravan": "\U000f07ad",
-    "card": "\U000f0b6f",
-    "card-account-details": "\U000f05d2",
-    "card-account-details-outline": "\U000f0dab",
-    "card-account-details-star": "\U000f02a3",
-    "card-account-details-star-outline": "\U000f06db",
-    "card-account-mail": "\U000f018e",
-    "card-account-mail-outline": "\U000f0e98",
-    "card-account-phone": "\U000f0e99",
-    "card-account-phone-outline": "\U000f0e9a",
-    "card-bulleted": "\U000f0b70",
-    "card-bulleted-off": "\U000f0b71",
-    "card-bulleted-off-outline": "\U000f0b72",
-    "card-bulleted-outline": "\U000f0b73",
-    "card-bulleted-settings": "\U000f0b74",
-    "card-bulleted-settings-outline": "\U000f0b75",
-    "card-minus": "\U000f1600",
-    "card-minus-outline": "\U000f1601",
-    "card-multiple": "\U000f17f1",
-    "card-multiple-outline": "\U000f17f2",
-    "card-off": "\U000f1602",
-    "card-off-outline": "\U000f1603",
-    "card-outline": "\U000f0b76",
-    "card-plus": "\U000f11ff",
-    "card-plus-outline": "\U000f1200",
-    "card-remove": "\U000f1604",
-    "card-remove-outline": "\U000f1605",
-    "card-search": "\U000f1074",
-    "card-search-outline": "\U000f1075",
-    "card-text": "\U000f0b77",
-    "card-text-outline": "\U000f0b78",
-    "cards": "\U000f0638",
-    "cards-club": "\U000f08ce",
-    "cards-club-outline": "\U000f189f",
-    "cards-diamond": "\U000f08cf",
-    "cards-diamond-outline": "\U000f101d",
-    "cards-heart": "\U000f08d0",
-    "cards-heart-outline": "\U000f18a0",
-    "cards-outline": "\U000f0639",
-    "cards-playing": "\U000f18a1",
-    "cards-playing-club": "\U000f18a2",
-    "cards-playing-club-multiple": "\U000f18a3",
-    "cards-playing-club-multiple-outline": "\U000f18a4",
-    "cards-playing-club-outline": "\U000f18a5",
-    "cards-playing-diamond": "\U000f18a6",
-    "cards-playing-diamond-multiple": "\U000f18a7",
-    "cards-playing-diamond-multiple-outline": "\U000f18a8",
-    "cards-playing-diamond-outline": "\U000f18a9",
-    "cards-playing-heart": "\U000f18aa",
-    "cards-playing-heart-multiple": "\U000f18ab",
-    "cards-playing-heart-multiple-outline": "\U000f18ac",
-    "cards-playing-heart-outline": "\U000f18ad",
-    "cards-playing-outline": "\U000f063a",
-    "cards-playing-spade": "\U000f18ae",
-    "cards-playing-spade-multiple": "\U000f18af",
-    "cards-playing-spade-multiple-outline": "\U000f18b0",
-    "cards-playing-spade-outline": "\U000f18b1",
-    "cards-spade": "\U000f08d1",
-    "cards-spade-outline": "\U000f18b2",
-    "cards-variant": "\U000f06c7",
-    "carrot": "\U000f010f",
-    "cart": "\U000f0110",
-    "cart-arrow-down": "\U000f0d66",
-    "cart-arrow-right": "\U000f0c4e",
-    "cart-arrow-up": "\U000f0d67",
-    "cart-check": "\U000f15ea",
-    "cart-heart": "\U000f18e0",
-    "cart-minus": "\U000f0d68",
-    "cart-off": "\U000f066b",
-    "cart-outline": "\U000f0111",
-    "cart-percent": "\U000f1bae",
-    "cart-plus": "\U000f0112",
-    "cart-remove": "\U000f0d69",
-    "cart-variant": "\U000f15eb",
-    "case-sensitive-alt": "\U000f0113",
-    "cash": "\U000f0114",
-    "cash-100": "\U000f0115",
-    "cash-check": "\U000f14ee",
-    "cash-clock": "\U000f1a91",
-    "cash-edit": "\U000f1cab",
-    "cash-fast": "\U000f185c",
-    "cash-lock": "\U000f14ea",
-    "cash-lock-open": "\U000f14eb",
-    "cash-marker": "\U000f0db8",
-    "cash-minus": "\U000f1260",
-    "cash-multiple": "\U000f0116",
-    "cash-off": "\U000f1c79",
-    "cash-plus": "\U000f1261",
-    "cash-refund": "\U000f0a9c",
-    "cash-register": "\U000f0cf4",
-    "cash-remove": "\U000f1262",
-    "cash-sync": "\U000f1a92",
-    "cassette": "\U000f09d4",
-    "cast": "\U000f0118",
-    "cast-audio": "\U000f101e",
-    "cast-audio-variant": "\U000f1749",
-    "cast-connected": "\U000f0119",
-    "cast-education": "\U000f0e1d",
-    "cast-off": "\U000f078a",
-    "cast-variant": "\U000f001f",
-    "castle": "\U000f011a",
-    "cat": "\U000f011b",
-    "cctv": "\U000f07ae",
-    "cctv-off": "\U000f185f",
-    "ceiling-fan": "\U000f1797",
-    "ceiling-fan-light": "\U000f1798",
-    "ceiling-light": "\U000f0769",
-    "ceiling-light-multiple": "\U000f18dd",
-    "ceiling-light-multiple-outline": "\U000f18de",
-    "ceiling-light-outline": "\U000f17c7",
-    "cellphone": "\U000f011c",
-    "cellphone-arrow-down": "\U000f09d5",
-    "cellphone-arrow-down-variant": "\U000f19c5",
-    "cellphone-basic": "\U000f011e",
-    "cellphone-charging": "\U000f1397",
-    "cellphone-check": "\U000f17fd",
-    "cellphone-cog": "\U000f0951",
-    "cellphone-dock": "\U000f011f",
-    "cellphone-information": "\U000f0f41",
-    "cellphone-key": "\U000f094e",
-    "cellphone-link": "\U000f0121",
-    "cellphone-link-off": "\U000f0122",
-    "cellphone-lock": "\U000f094f",
-    "cellphone-marker": "\U000f183a",
-    "cellphone-message": "\U000f08d3",
-    "cellphone-message-off": "\U000f10d2",
-    "cellphone-nfc": "\U000f0e90",
-    "cellphone-nfc-off": "\U000f12d8",
-    "cellphone-off": "\U000f0950",
-    "cellphone-play": "\U000f101f",
-    "cellphone-remove": "\U000f094d",
-    "cellphone-screenshot": "\U000f0a35",
-    "cellphone-settings": "\U000f0123",
-    "cellphone-sound": "\U000f0952",
-    "cellphone-text": "\U000f08d2",
-    "cellphone-wireless": "\U000f0815",
-    "centos": "\U000f111a",
-    "certificate": "\U000f0124",
-    "certificate-outline": "\U000f1188",
-    "chair-rolling": "\U000f0f48",
-    "chair-school": "\U000f0125",
-    "chandelier": "\U000f1793",
-    "charity": "\U000f0c4f",
-    "charity-search": "\U000f1c82",
-    "chart-arc": "\U000f0126",
-    "chart-areaspline": "\U000f0127",
-    "chart-areaspline-variant": "\U000f0e91",
-    "chart-bar": "\U000f0128",
-    "chart-bar-stacked": "\U000f076a",
-    "chart-bell-curve": "\U000f0c50",
-    "chart-bell-curve-cumulative": "\U000f0fa7",
-    "chart-box": "\U000f154d",
-    "chart-box-multiple": "\U000f1ccd",
-    "chart-box-multiple-outline": "\U000f1cce",
-    "chart-box-outline": "\U000f154e",
-    "chart-box-plus-outline": "\U000f154f",
-    "chart-bubble": "\U000f05e3",
-    "chart-donut": "\U000f07af",
-    "chart-donut-variant": "\U000f07b0",
-    "chart-gantt": "\U000f066c",
-    "chart-histogram": "\U000f0129",
-    "chart-line": "\U000f012a",
-    "chart-line-stacked": "\U000f076b",
-    "chart-line-variant": "\U000f07b1",
-    "chart-multiline": "\U000f08d4",
-    "chart-multiple": "\U000f1213",
-    "chart-pie": "\U000f012b",
-    "chart-pie-outline": "\U000f1bdf",
-    "chart-ppf": "\U000f1380",
-    "chart-sankey": "\U000f11df",
-    "chart-sankey-variant": "\U000f11e0",
-    "chart-scatter-plot": "\U000f0e92",
-    "chart-scatter-plot-hexbin": "\U000f066d",
-    "chart-timeline": "\U000f066e",
-    "chart-timeline-variant": "\U000f0e93",
-    "chart-timeline-variant-shimmer": "\U000f15b6",
-    "chart-tree": "\U000f0e94",
-    "chart-waterfall": "\U000f1918",
-    "chat": "\U000f0b79",
-    "chat-alert": "\U000f0b7a",
-    "chat-alert-outline": "\U000f12c9",
-    "chat-minus": "\U000f1410",
-    "chat-minus-outline": "\U000f1413",
-    "chat-outline": "\U000f0ede",
-    "chat-plus": "\U000f140f",
-    "chat-plus-outline": "\U000f1412",
-    "chat-processing": "\U000f0b7b",
-    "chat-processing-outline": "\U000f12ca",
-    "chat-question": "\U000f1738",
-    "chat-question-outline": "\U000f1739",
-    "chat-remove": "\U000f1411",
-    "chat-remove-outline": "\U000f1414",
-    "chat-sleep": "\U000f12d1",
-    "chat-sleep-outline": "\U000f12d2",
-    "check": "\U000f012c",
-    "check-all": "\U000f012d",
-    "check-bold": "\U000f0e1e",
-    "check-circle": "\U000f05e0",
-    "check-circle-outline": "\U000f05e1",
-    "check-decagram": "\U000f0791",
-    "check-decagram-outline": "\U000f1740",
-    "check-network": "\U000f0c53",
-    "check-network-outline": "\U000f0c54",
-    "check-outline": "\U000f0855",
-    "check-underline": "\U000f0e1f",
-    "check-underline-circle": "\U000f0e20",
-    "check-underline-circle-outline": "\U000f0e21",
-    "checkbook": "\U000f0a9d",
-    "checkbook-arrow-left": "\U000f1c1d",
-    "checkbook-arrow-right": "\U000f1c1e",
-    "checkbox-blank": "\U000f012e",
-    "checkbox-blank-badge": "\U000f1176",
-    "checkbox-blank-badge-outline": "\U000f0117",
-    "checkbox-blank-circle": "\U000f012f",
-    "checkbox-blank-circle-outline": "\U000f0130",
-    "checkbox-blank-off": "\U000f12ec",
-    "checkbox-blank-off-outline": "\U000f12ed",
-    "checkbox-blank-outline": "\U000f0131",
-    "checkbox-intermediate": "\U000f0856",
-    "checkbox-intermediate-variant": "\U000f1b54",
-    "checkbox-marked": "\U000f0132",
-    "checkbox-marked-circle": "\U000f0133",
-    "checkbox-marked-circle-auto-outline": "\U000f1c26",
-    "checkbox-marked-circle-minus-outline": "\U000f1c27",
-    "checkbox-marked-circle-outline": "\U000f0134",
-    "checkbox-marked-circle-plus-outline": "\U000f1927",
-    "checkbox-marked-outline": "\U000f0135",
-    "checkbox-multiple-blank": "\U000f0136",
-    "checkbox-multiple-blank-circle": "\U000f063b",
-    "checkbox-multiple-blank-circle-outline": "\U000f063c",
-    "checkbox-multiple-blank-outline": "\U000f0137",
-    "checkbox-multiple-marked": "\U000f0138",
-    "checkbox-multiple-marked-circle": "\U000f063d",
-    "checkbox-multiple-marked-circle-outline": "\U000f063e",
-    "checkbox-multiple-marked-outline": "\U000f0139",
-    "checkbox-multiple-outline": "\U000f0c51",
-    "checkbox-outline": "\U000f0c52",
-    "checkerboard": "\U000f013a",
-    "checkerboard-minus": "\U000f1202",
-    "checkerboard-plus": "\U000f1201",
-    "checkerboard-remove": "\U000f1203",
-    "cheese": "\U000f12b9",
-    "cheese-off": "\U000f13ee",
-    "chef-hat": "\U000f0b7c",
-    "chemical-weapon": "\U000f013b",
-    "chess-bishop": "\U000f085c",
-    "chess-king": "\U000f0857",
-    "chess-knight": "\U000f0858",
-    "chess-pawn": "\U000f0859",
-    "chess-queen": "\U000f085a",
-    "chess-rook": "\U000f085b",
-    "chevron-double-down": "\U000f013c",
-    "chevron-double-left": "\U000f013d",
-    "chevron-double-right": "\U000f013e",
-    "chevron-double-up": "\U000f013f",
-    "chevron-down": "\U000f0140",
-    "chevron-down-box": "\U000f09d6",
-    "chevron-down-box-outline": "\U000f09d7",
-    "chevron-down-circle": "\U000f0b26",
-    "chevron-down-circle-outline": "\U000f0b27",
-    "chevron-left": "\U000f0141",
-    "chevron-left-box": "\U000f09d8",
-    "chevron-left-box-outline": "\U000f09d9",
-    "chevron-left-circle": "\U000f0b28",
-    "chevron-left-circle-outline": "\U000f0b29",
-    "chevron-right": "\U000f0142",
-    "chevron-right-box": "\U000f09da",
-    "chevron-right-box-outline": "\U000f09db",
-    "chevron-right-circle": "\U000f0b2a",
-    "chevron-right-circle-outline": "\U000f0b2b",
-    "chevron-triple-down": "\U000f0db9",
-    "chevron-triple-left": "\U000f0dba",
-    "chevron-triple-right": "\U000f0dbb",
-    "chevron-triple-up": "\U000f0dbc",
-    "chevron-up": "\U000f0143",
-    "chevron-up-box": "\U000f09dc",
-    "chevron-up-box-outline": "\U000f09dd",
-    "chevron-up-circle": "\U000f0b2c",
-    "chevron-up-circle-outline": "\U000f0b2d",
-    "chili-alert": "\U000f17ea",
-    "chili-alert-outline": "\U000f17eb",
-    "chili-hot": "\U000f07b2",
-    "chili-hot-outline": "\U000f17ec",
-    "chili-medium": "\U000f07b3",
-    "chili-medium-outline": "\U000f17ed",
-    "chili-mild": "\U000f07b4",
-    "chili-mild-outline": "\U000f17ee",
-    "chili-off": "\U000f1467",
-    "chili-off-outline": "\U000f17ef",
-    "chip": "\U000f061a",
-    "church": "\U000f0144",
-    "church-outline": "\U000f1b02",
-    "cigar": "\U000f1189",
-    "cigar-off": "\U000f141b",
-    "circle": "\U000f0765",
-    "circle-box": "\U000f15dc",
-    "circle-box-outline": "\U000f15dd",
-    "circle-double": "\U000f0e95",
-    "circle-edit-outline": "\U000f08d5",
-    "circle-expand": "\U000f0e96",
-    "circle-half": "\U000f1395",
-    "circle-half-full": "\U000f1396",
-    "circle-medium": "\U000f09de",
-    "circle-multiple": "\U000f0b38",
-    "circle-multiple-outline": "\U000f0695",
-    "circle-off-outline": "\U000f10d3",
-    "circle-opacity": "\U000f1853",
-    "circle-outline": "\U000f0766",
-    "circle-slice-1": "\U000f0a9e",
-    "circle-slice-2": "\U000f0a9f",
-    "circle-slice-3": "\U000f0aa0",
-    "circle-slice-4": "\U000f0aa1",
-    "circle-slice-5": "\U000f0aa2",
-    "circle-slice-6": "\U000f0aa3",
-    "circle-slice-7": "\U000f0aa4",
-    "circle-slice-8": "\U000f0aa5",
-    "circle-small": "\U000f09df",
-    "circular-saw": "\U000f0e22",
-    "city": "\U000f0146",
-    "city-switch": "\U000f1c28",
-    "city-variant": "\U000f0a36",
-    "city-variant-outline": "\U000f0a37",
-    "clipboard": "\U000f0147",
-    "clipboard-account": "\U000f0148",
-    "clipboard-account-outline": "\U000f0c55",
-    "clipboard-alert": "\U000f0149",
-    "clipboard-alert-outline": "\U000f0cf7",
-    "clipboard-arrow-down": "\U000f014a",
-    "clipboard-arrow-down-outline": "\U000f0c56",
-    "clipboard-arrow-left": "\U000f014b",
-    "clipboard-arrow-left-outline": "\U000f0cf8",
-    "clipboard-arrow-right": "\U000f0cf9",
-    "clipboard-arrow-right-outline": "\U000f0cfa",
-    "clipboard-arrow-up": "\U000f0c57",
-    "clipboard-arrow-up-outline": "\U000f0c58",
-    "clipboard-check": "\U000f014e",
-    "clipboard-check-multiple": "\U000f1263",
-    "clipboard-check-multiple-outline": "\U000f1264",
-    "clipboard-check-outline": "\U000f08a8",
-    "clipboard-clock": "\U000f16e2",
-    "clipboard-clock-outline": "\U000f16e3",
-    "clipboard-edit": "\U000f14e5",
-    "clipboard-edit-outline": "\U000f14e6",
-    "clipboard-file": "\U000f1265",
-    "clipboard-file-outline": "\U000f1266",
-    "clipboard-flow": "\U000f06c8",
-    "clipboard-flow-outline": "\U000f1117",
-    "clipboard-list": "\U000f10d4",
-    "clipboard-list-outline": "\U000f10d5",
-    "clipboard-minus": "\U000f1618",
-    "clipboard-minus-outline": "\U000f1619",
-    "clipboard-multiple": "\U000f1267",
-    "clipboard-multiple-outline": "\U000f1268",
-    "clipboard-off": "\U000f161a",
-    "clipboard-off-outline": "\U000f161b",
-    "clipboard-outline": "\U000f014c",
-    "clipboard-play": "\U000f0c59",
-    "clipboard-play-multiple": "\U000f1269",
-    "clipboard-play-multiple-outline": "\U000f126a",
-    "clipboard-play-outline": "\U000f0c5a",
-    "clipboard-plus": "\U000f0751",
-    "clipboard-plus-outline": "\U000f131f",
-    "clipboard-pulse": "\U000f085d",
-    "clipboard-pulse-outline": "\U000f085e",
-    "clipboard-remove": "\U000f161c",
-    "clipboard-remove-outline": "\U000f161d",
-    "clipboard-search": "\U000f161e",
-    "clipboard-search-outline": "\U000f161f",
-    "clipboard-text": "\U000f014d",
-    "clipboard-text-clock": "\U000f18f9",
-    "clipboard-text-clock-outline": "\U000f18fa",
-    "clipboard-text-multiple": "\U000f126b",
-    "clipboard-text-multiple-outline": "\U000f126c",
-    "clipboard-text-off": "\U000f1620",
-    "clipboard-text-off-outline": "\U000f1621",
-    "clipboard-text-outline": "\U000f0a38",
-    "clipboard-text-play": "\U000f0c5b",
-    "clipboard-text-play-outline": "\U000f0c5c",
-    "clipboard-text-search": "\U000f1622",
-    "clipboard-text-search-outline": "\U000f1623",
-    "clippy": "\U000f014f",
-    "clock": "\U000f0954",
-    "clock-alert": "\U000f0955",
-    "clock-alert-outline": "\U000f05ce",
-    "clock-check": "\U000f0fa8",
-    "clock-check-outline": "\U000f0fa9",
-    "clock-digital": "\U000f0e97",
-    "clock-edit": "\U000f19ba",
-    "clock-edit-outline": "\U000f19bb",
-    "clock-end": "\U000f0151",
-    "clock-fast": "\U000f0152",
-    "clock-in": "\U000f0153",
-    "clock-minus": "\U000f1863",
-    "clock-minus-outline": "\U000f1864",
-    "clock-out": "\U000f0154",
-    "clock-outline": "\U000f0150",
-    "clock-plus": "\U000f1861",
-    "clock-plus-outline": "\U000f1862",
-    "clock-remove": "\U000f1865",
-    "clock-remove-outline": "\U000f1866",
-    "clock-star-four-points": "\U000f1c29",
-    "clock-star-four-points-outline": "\U000f1c2a",
-    "clock-start": "\U000f0155",
-    "clock-time-eight": "\U000f1446",
-    "clock-time-eight-outline": "\U000f1452",
-    "clock-time-eleven": "\U000f1449",
-    "clock-time-eleven-outline": "\U000f1455",
-    "clock-time-five": "\U000f1443",
-    "clock-time-five-outline": "\U000f144f",
-    "clock-time-four": "\U000f1442",
-    "clock-time-four-outline": "\U000f144e",
-    "clock-time-nine": "\U000f1447",
-    "clock-time-nine-outline": "\U000f1453",
-    "clock-time-one": "\U000f143f",
-    "clock-time-one-outline": "\U000f144b",
-    "clock-time-seven": "\U000f1445",
-    "clock-time-seven-outline": "\U000f1451",
-    "clock-time-six": "\U000f1444",
-    "clock-time-six-outline": "\U000f1450",
-    "clock-time-ten": "\U000f1448",
-    "clock-time-ten-outline": "\U000f1454",
-    "clock-time-three": "\U000f1441",
-    "clock-time-three-outline": "\U000f144d",
-    "clock-time-twelve": "\U000f144a",
-    "clock-time-twelve-outline": "\U000f1456",
-    "clock-time-two": "\U000f1440",
-    "clock-time-two-outline": "\U000f144c",
-    "close": "\U000f0156",
-    "close-box": "\U000f0157",
-    "close-box-multiple": "\U000f0c5d",
-    "close-box-multiple-outline": "\U000f0c5e",
-    "close-box-outline": "\U000f0158",
-    "close-circle": "\U000f0159",
-    "close-circle-multiple": "\U000f062a",
-    "close-circle-multiple-outline": "\U000f0883",
-    "close-circle-outline": "\U000f015a",
-    "close-network": "\U000f015b",
-    "close-network-outline": "\U000f0c5f",
-    "close-octagon": "\U000f015c",
-    "close-octagon-outline": "\U000f015d",
-    "close-outline": "\U000f06c9",
-    "close-thick": "\U000f1398",
-    "closed-caption": "\U000f015e",
-    "closed-caption-outline": "\U000f0dbd",
-    "cloud": "\U000f015f",
-    "cloud-alert": "\U000f09e0",
-    "cloud-alert-outline": "\U000f1be0",
-    "cloud-arrow-down": "\U000f1be1",
-    "cloud-arrow-down-outline": "\U000f1be2",
-    "cloud-arrow-left": "\U000f1be3",
-    "cloud-arrow-left-outline": "\U000f1be4",
-    "cloud-arrow-right": "\U000f1be5",
-    "cloud-arrow-right-outline": "\U000f1be6",
-    "cloud-arrow-up": "\U000f1be7",
-    "cloud-arrow-up-outline": "\U000f1be8",
-    "cloud-braces": "\U000f07b5",
-    "cloud-cancel": "\U000f1be9",
-    "cloud-cancel-outline": "\U000f1bea",
-    "cloud-check": "\U000f1beb",
-    "cloud-check-outline": "\U000f1bec",
-    "cloud-check-variant": "\U000f0160",
-    "cloud-check-variant-outline": "\U000f12cc",
-    "cloud-circle": "\U000f0161",
-    "cloud-circle-outline": "\U000f1bed",
-    "cloud-clock": "\U000f1bee",
-    "cloud-clock-outline": "\U000f1bef",
-    "cloud-cog": "\U000f1bf0",
-    "cloud-cog-outline": "\U000f1bf1",
-    "cloud-download": "\U000f0162",
-    "cloud-download-outline": "\U000f0b7d",
-    "cloud-key": "\U000f1ca1",
-    "cloud-key-outline": "\U000f1ca2",
-    "cloud-lock": "\U000f11f1",
-    "cloud-lock-open": "\U000f1bf2",
-    "cloud-lock-open-outline": "\U000f1bf3",
-    "cloud-lock-outline": "\U000f11f2",
-    "cloud-minus": "\U000f1bf4",
-    "cloud-minus-outline": "\U000f1bf5",
-    "cloud-off": "\U000f1bf6",
-    "cloud-off-outline": "\U000f0164",
-    "cloud-outline": "\U000f0163",
-    "cloud-percent": "\U000f1a35",
-    "cloud-percent-outline": "\U000f1a36",
-    "cloud-plus": "\U000f1bf7",
-    "cloud-plus-outline": "\U000f1bf8",
-    "cloud-print": "\U000f0165",
-    "cloud-print-outline": "\U000f0166",
-    "cloud-question": "\U000f0a39",
-    "cloud-question-outline": "\U000f1bf9",
-    "cloud-refresh": "\U000f1bfa",
-    "cloud-refresh-outline": "\U000f1bfb",
-    "cloud-refresh-variant": "\U000f052a",
-    "cloud-refresh-variant-outline": "\U000f1bfc",
-    "cloud-remove": "\U000f1bfd",
-    "cloud-remove-outline": "\U000f1bfe",
-    "cloud-search": "\U000f0956",
-    "cloud-search-outline": "\U000f0957",
-    "cloud-sync": "\U000f063f",
-    "cloud-sync-outline": "\U000f12d6",
-    "cloud-tags": "\U000f07b6",
-    "cloud-upload": "\U000f0167",
-    "cloud-upload-outline": "\U000f0b7e",
-    "clouds": "\U000f1b95",
-    "clover": "\U000f0816",
-    "clover-outline": "\U000f1c62",
-    "coach-lamp": "\U000f1020",
-    "coach-lamp-variant": "\U000f1a37",
-    "coat-rack": "\U000f109e",
-    "code-array": "\U000f0168",
-    "code-block-braces": "\U000f1c83",
-    "code-block-brackets": "\U000f1c84",
-    "code-block-parentheses": "\U000f1c85",
-    "code-block-tags": "\U000f1c86",
-    "code-braces": "\U000f0169",
-    "code-braces-box": "\U000f10d6",
-    "code-brackets": "\U000f016a",
-    "code-equal": "\U000f016b",
-    "code-greater-than": "\U000f016c",
-    "code-greater-than-or-equal": "\U000f016d",
-    "code-json": "\U000f0626",
-    "code-less-than": "\U000f016e",
-    "code-less-than-or-equal": "\U000f016f",
-    "code-not-equal": "\U000f0170",
-    "code-not-equal-variant": "\U000f0171",
-    "code-parentheses": "\U000f0172",
-    "code-parentheses-box": "\U000f10d7",
-    "code-string": "\U000f0173",
-    "code-tags": "\U000f0174",
-    "code-tags-check": "\U000f0694",
-    "codepen": "\U000f0175",
-    "coffee": "\U000f0176",
-    "coffee-maker": "\U000f109f",
-    "coffee-maker-check": "\U000f1931",
-    "coffee-maker-check-outline": "\U000f1932",
-    "coffee-maker-outline": "\U000f181b",
-    "coffee-off": "\U000f0faa",
-    "coffee-off-outline": "\U000f0fab",
-    "coffee-outline": "\U000f06ca",
-    "coffee-to-go": "\U000f0177",
-    "coffee-to-go-outline": "\U000f130e",
-    "coffin": "\U000f0b7f",
-    "cog": "\U000f0493",
-    "cog-box": "\U000f0494",
-    "cog-clockwise": "\U000f11dd",
-    "cog-counterclockwise": "\U000f11de",
-    "cog-off": "\U000f13ce",
-    "cog-off-outline": "\U000f13cf",
-    "cog-outline": "\U000f08bb",
-    "cog-pause": "\U000f1933",
-    "cog-pause-outline": "\U000f1934",
-    "cog-play": "\U000f1935",
-    "cog-play-outline": "\U000f1936",
-    "cog-refresh": "\U000f145e",
-    "cog-refresh-outline": "\U000f145f",
-    "cog-stop": "\U000f1937",
-    "cog-stop-outline": "\U000f1938",
-    "cog-sync": "\U000f1460",
-    "cog-sync-outline": "\U000f1461",
-    "cog-transfer": "\U000f105b",
-    "cog-transfer-outline": "\U000f105c",
-    "cogs": "\U000f08d6",
-    "collage": "\U000f0640",
-    "collapse-all": "\U000f0aa6",
-    "collapse-all-outline": "\U000f0aa7",
-    "color-helper": "\U000f0179",
-    "comma": "\U000f0e23",
-    "comma-box": "\U000f0e2b",
-    "comma-box-outline": "\U000f0e24",
-    "comma-circle": "\U000f0e25",
-    "comma-circle-outline": "\U000f0e26",
-    "comment": "\U000f017a",
-    "comment-account": "\U000f017b",
-    "comment-account-outline": "\U000f017c",
-    "comment-alert": "\U000f017d",
-    "comment-alert-outline": "\U000f017e",
-    "comment-arrow-left": "\U000f09e1",
-    "comment-arrow-left-outline": "\U000f09e2",
-    "comment-arrow-right": "\U000f09e3",
-    "comment-arrow-right-outline": "\U000f09e4",
-    "comment-bookmark": "\U000f15ae",
-    "comment-bookmark-outline": "\U000f15af",
-    "comment-check": "\U000f017f",
-    "comment-check-outline": "\U000f0180",
-    "comment-edit": "\U000f11bf",
-    "comment-edit-outline": "\U000f12c4",
-    "comment-eye": "\U000f0a3a",
-    "comment-eye-outline": "\U000f0a3b",
-    "comment-flash": "\U000f15b0",
-    "comment-flash-outline": "\U000f15b1",
-    "comment-minus": "\U000f15df",
-    "comment-minus-outline": "\U000f15e0",
-    "comment-multiple": "\U000f085f",
-    "comment-multiple-outline": "\U000f0181",
-    "comment-off": "\U000f15e1",
-    "comment-off-outline": "\U000f15e2",
-    "comment-outline": "\U000f0182",
-    "comment-plus": "\U000f09e5",
-    "comment-plus-outline": "\U000f0183",
-    "comment-processing": "\U000f0184",
-    "comment-processing-outline": "\U000f0185",
-    "comment-question": "\U000f0817",
-    "comment-question-outline": "\U000f0186",
-    "comment-quote": "\U000f1021",
-    "comment-quote-outline": "\U000f1022",
-    "comment-remove": "\U000f05de",
-    "comment-remove-outline": "\U000f0187",
-    "comment-search": "\U000f0a3c",
-    "comment-search-outline": "\U000f0a3d",
-    "comment-text": "\U000f0188",
-    "comment-text-multiple": "\U000f0860",
-    "comment-text-multiple-outline": "\U000f0861",
-    "comment-text-outline": "\U000f0189",
-    "compare": "\U000f018a",
-    "compare-horizontal": "\U000f1492",
-    "compare-remove": "\U000f18b3",
-    "compare-vertical": "\U000f1493",
-    "compass": "\U000f018b",
-    "compass-off": "\U000f0b80",
-    "compass-off-outline": "\U000f0b81",
-    "compass-outline": "\U000f018c",
-    "compass-rose": "\U000f1382",
-    "compost": "\U000f1a38",
-    "cone": "\U000f194c",
-    "cone-off": "\U000f194d",
-    "connection": "\U000f1616",
-    "console": "\U000f018d",
-    "console-line": "\U000f07b7",
-    "console-network": "\U000f08a9",
-    "console-network-outline": "\U000f0c60",
-    "consolidate": "\U000f10d8",
-    "contactless-payment": "\U000f0d6a",
-    "contactless-payment-circle": "\U000f0321",
-    "contactless-payment-circle-outline": "\U000f0408",
-    "contacts": "\U000f06cb",
-    "contacts-outline": "\U000f05b8",
-    "contain": "\U000f0a3e",
-    "contain-end": "\U000f0a3f",
-    "contain-start": "\U000f0a40",
-    "content-copy": "\U000f018f",
-    "content-cut": "\U000f0190",
-    "content-duplicate": "\U000f0191",
-    "content-paste": "\U000f0192",
-    "content-save": "\U000f0193",
-    "content-save-alert": "\U000f0f42",
-    "content-save-alert-outline": "\U000f0f43",
-    "content-save-all": "\U000f0194",
-    "content-save-all-outline": "\U000f0f44",
-    "content-save-check": "\U000f18ea",
-    "content-save-check-outline": "\U000f18eb",
-    "content-save-cog": "\U000f145b",
-    "content-save-cog-outline": "\U000f145c",
-    "content-save-edit": "\U000f0cfb",
-    "content-save-edit-outline": "\U000f0cfc",
-    "content-save-minus": "\U000f1b43",
-    "content-save-minus-outline": "\U000f1b44",
-    "content-save-move": "\U000f0e27",
-    "content-save-move-outline": "\U000f0e28",
-    "content-save-off": "\U000f1643",
-    "content-save-off-outline": "\U000f1644",
-    "content-save-outline": "\U000f0818",
-    "content-save-plus": "\U000f1b41",
-    "content-save-plus-outline": "\U000f1b42",
-    "content-save-settings": "\U000f061b",
-    "content-save-settings-outline": "\U000f0b2e",
-    "contrast": "\U000f0195",
-    "contrast-box": "\U000f0196",
-    "contrast-circle": "\U000f0197",
-    "controller": "\U000f02b4",
-    "controller-classic": "\U000f0b82",
-    "controller-classic-outline": "\U000f0b83",
-    "controller-off": "\U000f02b5",
-    "cookie": "\U000f0198",
-    "cookie-alert": "\U000f16d0",
-    "cookie-alert-outline": "\U000f16d1",
-    "cookie-check": "\U000f16d2",
-    "cookie-check-outline": "\U000f16d3",
-    "cookie-clock": "\U000f16e4",
-    "cookie-clock-outline": "\U000f16e5",
-    "cookie-cog": "\U000f16d4",
-    "cookie-cog-outline": "\U000f16d5",
-    "cookie-edit": "\U000f16e6",
-    "cookie-edit-outline": "\U000f16e7",
-    "cookie-lock": "\U000f16e8",
-    "cookie-lock-outline": "\U000f16e9",
-    "cookie-minus": "\U000f16da",
-    "cookie-minus-outline": "\U000f16db",
-    "cookie-off": "\U000f16ea",
-    "cookie-off-outline": "\U000f16eb",
-    "cookie-outline": "\U000f16de",
-    "cookie-plus": "\U000f16d6",
-    "cookie-plus-outline": "\U000f16d7",
-    "cookie-refresh": "\U000f16ec",
-    "cookie-refresh-outline": "\U000f16ed",
-    "cookie-remove": "\U000f16d8",
-    "cookie-remove-outline": "\U000f16d9",
-    "cookie-settings": "\U000f16dc",
-    "cookie-settings-outline": "\U000f16dd",
-    "coolant-temperature": "\U000f03c8",
-    "copyleft": "\U000f1939",
-    "copyright": "\U000f05e6",
-    "cordova": "\U000f0958",
-    "corn": "\U000f07b8",
-    "corn-off": "\U000f13ef",
-    "cosine-wave": "\U000f1479",
-    "counter": "\U000f0199",
-    "countertop": "\U000f181c",
-    "countertop-outline": "\U000f181d",
-    "cow": "\U000f019a",
-    "cow-off": "\U000f18fc",
-    "cpu-32-bit": "\U000f0edf",
-    "cpu-64-bit": "\U000f0ee0",
-    "cradle": "\U000f198b",
-    "cradle-outline": "\U000f1991",
-    "crane": "\U000f0862",
-    "creation": "\U000f0674",
-    "creation-outline": "\U000f1c2b",
-    "creative-commons": "\U000f0d6b",
-    "credit-card": "\U000f0fef",
-    "credit-card-check": "\U000f13d0",
-    "credit-card-check-outline": "\U000f13d1",
-    "credit-card-chip": "\U000f190f",
-    "credit-card-chip-outline": "\U000f1910",
-    "credit-card-clock": "\U000f0ee1",
-    "credit-card-clock-outline": "\U000f0ee2",
-    "credit-card-edit": "\U000f17d7",
-    "credit-card-edit-outline": "\U000f17d8",
-    "credit-card-fast": "\U000f1911",
-    "credit-card-fast-outline": "\U000f1912",
-    "credit-card-lock": "\U000f18e7",
-    "credit-card-lock-outline": "\U000f18e8",
-    "credit-card-marker": "\U000f06a8",
-    "credit-card-marker-outline": "\U000f0dbe",
-    "credit-card-minus": "\U000f0fac",
-    "credit-card-minus-outline": "\U000f0fad",
-    "credit-card-multiple": "\U000f0ff0",
-    "credit-card-multiple-outline": "\U000f019c",
-    "credit-card-off": "\U000f0ff1",
-    "credit-card-off-outline": "\U000f05e4",
-    "credit-card-outline": "\U000f019b",
-    "credit-card-plus": "\U000f0ff2",
-    "credit-card-plus-outline": "\U000f0676",
-    "credit-card-refresh": "\U000f1645",
-    "credit-card-refresh-outline": "\U000f1646",
-    "credit-card-refund": "\U000f0ff3",
-    "credit-card-refund-outline": "\U000f0aa8",
-    "credit-card-remove": "\U000f0fae",
-    "credit-card-remove-outline": "\U000f0faf",
-    "credit-card-scan": "\U000f0ff4",
-    "credit-card-scan-outline": "\U000f019d",
-    "credit-card-search": "\U000f1647",
-    "credit-card-search-outline": "\U000f1648",
-    "credit-card-settings": "\U000f0ff5",
-    "credit-card-settings-outline": "\U000f08d7",
-    "credit-card-sync": "\U000f1649",
-    "credit-card-sync-outline": "\U000f164a",
-    "credit-card-wireless": "\U000f0802",
-    "credit-card-wireless-off": "\U000f057a",
-    "credit-card-wireless-off-outline": "\U000f057b",
-    "credit-card-wireless-outline": "\U000f0d6c",
-    "cricket": "\U000f0d6d",
-    "crop": "\U000f019e",
-    "crop-free": "\U000f019f",
-    "crop-landscape": "\U000f01a0",
-    "crop-portrait": "\U000f01a1",
-    "crop-rotate": "\U000f0696",
-    "crop-square": "\U000f01a2",
-    "cross": "\U000f0953",
-    "cross-bolnisi": "\U000f0ced",
-    "cross-celtic": "\U000f0cf5",
-    "cross-outline": "\U000f0cf6",
-    "crosshairs": "\U000f01a3",
-    "crosshairs-gps": "\U000f01a4",
-    "crosshairs-off": "\U000f0f45",
-    "crosshairs-question": "\U000f1136",
-    "crowd": "\U000f1975",
-    "crown": "\U000f01a5",
-    "crown-circle": "\U000f17dc",
-    "crown-circle-outline": "\U000f17dd",
-    "crown-outline": "\U000f11d0",
-    "cryengine": "\U000f0959",
-    "crystal-ball": "\U000f0b2f",
-    "cube": "\U000f01a6",
-    "cube-off": "\U000f141c",
-    "cube-off-outline": "\U000f141d",
-    "cube-outline": "\U000f01a7",
-    "cube-scan": "\U000f0b84",
-    "cube-send": "\U000f01a8",
-    "cube-unfolded": "\U000f01a9",
-    "cup": "\U000f01aa",
-    "cup-off": "\U000f05e5",
-    "cup-off-outline": "\U000f137d",
-    "cup-outline": "\U000f130f",
-    "cup-water": "\U000f01ab",
-    "cupboard": "\U000f0f46",
-    "cupboard-outline": "\U000f0f47",
-    "cupcake": "\U000f095a",
-    "curling": "\U000f0863",
-    "currency-bdt": "\U000f0864",
-    "currency-brl": "\U000f0b85",
-    "currency-btc": "\U000f01ac",
-    "currency-cny": "\U000f07ba",
-    "currency-eth": "\U000f07bb",
-    "currency-eur": "\U000f01ad",
-    "currency-eur-off": "\U000f1315",
-    "currency-fra": "\U000f1a39",
-    "currency-gbp": "\U000f01ae",
-    "currency-ils": "\U000f0c61",
-    "currency-inr": "\U000f01af",
-    "currency-jpy": "\U000f07bc",
-    "currency-krw": "\U000f07bd",
-    "currency-kzt": "\U000f0865",
-    "currency-mnt": "\U000f1512",
-    "currency-ngn": "\U000f01b0",
-    "currency-php": "\U000f09e6",
-    "currency-rial": "\U000f0e9c",
-    "currency-rub": "\U000f01b1",
-    "currency-rupee": "\U000f1976",
-    "currency-sign": "\U000f07be",
-    "currency-thb": "\U000f1c05",
-    "currency-try": "\U000f01b2",
-    "currency-twd": "\U000f07bf",
-    "currency-uah": "\U000f1b9b",
-    "currency-usd": "\U000f01c1",
-    "currency-usd-off": "\U000f067a",
-    "current-ac": "\U000f1480",
-    "current-dc": "\U000f095c",
-    "cursor-default": "\U000f01c0",
-    "cursor-default-click": "\U000f0cfd",
-    "cursor-default-click-outline": "\U000f0cfe",
-    "cursor-default-gesture": "\U000f1127",
-    "cursor-default-gesture-outline": "\U000f1128",
-    "cursor-default-outline": "\U000f01bf",
-    "cursor-move": "\U000f01be",
-    "cursor-pointer": "\U000f01bd",
-    "cursor-text": "\U000f05e7",
-    "curtains": "\U000f1846",
-    "curtains-closed": "\U000f1847",
-    "cylinder": "\U000f194e",
-    "cylinder-off": "\U000f194f",
-    "dance-ballroom": "\U000f15fb",
-    "dance-pole": "\U000f1578",
-    "data-matrix": "\U000f153c",
-    "data-matrix-edit": "\U000f153d",
-    "data-matrix-minus": "\U000f153e",
-    "data-matrix-plus": "\U000f153f",
-    "data-matrix-remove": "\U000f1540",
-    "data-matrix-scan": "\U000f1541",
-    "database": "\U000f01bc",
-    "database-alert": "\U000f163a",
-    "database-alert-outline": "\U000f1624",
-    "database-arrow-down": "\U000f163b",
-    "database-arrow-down-outline": "\U000f1625",
-    "database-arrow-left": "\U000f163c",
-    "database-arrow-left-outline": "\U000f1626",
-    "database-arrow-right": "\U000f163d",
-    "database-arrow-right-outline": "\U000f1627",
-    "database-arrow-up": "\U000f163e",
-    "database-arrow-up-outline": "\U000f1628",
-    "database-check": "\U000f0aa9",
-    "database-check-outline": "\U000f1629",
-    "database-clock": "\U000f163f",
-    "database-clock-outline": "\U000f162a",
-    "database-cog": "\U000f164b",
-    "database-cog-outline": "\U000f164c",
-    "database-edit": "\U000f0b86",
-    "database-edit-outline": "\U000f162b",
-    "database-export": "\U000f095e",
-    "database-export-outline": "\U000f162c",
-    "database-eye": "\U000f191f",
-    "database-eye-off": "\U000f1920",
-    "database-eye-off-outline": "\U000f1921",
-    "database-eye-outline": "\U000f1922",
-    "database-import": "\U000f095d",
-    "database-import-outline": "\U000f162d",
-    "database-lock": "\U000f0aaa",
-    "database-lock-outline": "\U000f162e",
-    "database-marker": "\U000f12f6",
-    "database-marker-outline": "\U000f162f",
-    "database-minus": "\U000f01bb",
-    "database-minus-outline": "\U000f1630",
-    "database-off": "\U000f1640",
-    "database-off-outline": "\U000f1631",
-    "database-outline": "\U000f1632",
-    "database-plus": "\U000f01ba",
-    "database-plus-outline": "\U000f1633",
-    "database-refresh": "\U000f05c2",
-    "database-refresh-outline": "\U000f1634",
-    "database-remove": "\U000f0d00",
-    "database-remove-outline": "\U000f1635",
-    "database-search": "\U000f0866",
-    "database-search-outline": "\U000f1636",
-    "database-settings": "\U000f0d01",
-    "database-settings-outline": "\U000f1637",
-    "database-sync": "\U000f0cff",
-    "database-sync-outline": "\U000f1638",
-    "death-star": "\U000f08d8",
-    "death-star-variant": "\U000f08d9",
-    "deathly-hallows": "\U000f0b87",
-    "debian": "\U000f08da",
-    "debug-step-into": "\U000f01b9",
-    "debug-step-out": "\U000f01b8",
-    "debug-step-over": "\U000f01b7",
-    "decagram": "\U000f076c",
-    "decagram-outline": "\U000f076d",
-    "decimal": "\U000f10a1",
-    "decimal-comma": "\U000f10a2",
-    "decimal-comma-decrease": "\U000f10a3",
-    "decimal-comma-increase": "\U000f10a4",
-    "decimal-decrease": "\U000f01b6",
-    "decimal-increase": "\U000f01b5",
-    "delete": "\U000f01b4",
-    "delete-alert": "\U000f10a5",
-    "delete-alert-outline": "\U000f10a6",
-    "delete-circle": "\U000f0683",
-    "delete-circle-outline": "\U000f0b88",
-    "delete-clock": "\U000f1556",
-    "delete-clock-outline": "\U000f1557",
-    "delete-empty": "\U000f06cc",
-    "delete-empty-outline": "\U000f0e9d",
-    "delete-forever": "\U000f05e8",
-    "delete-forever-outline": "\U000f0b89",
-    "delete-off": "\U000f10a7",
-    "delete-off-outline": "\U000f10a8",
-    "delete-outline": "\U000f09e7",
-    "delete-restore": "\U000f0819",
-    "delete-sweep": "\U000f05e9",
-    "delete-sweep-outline": "\U000f0c62",
-    "delete-variant": "\U000f01b3",
-    "delta": "\U000f01c2",
-    "desk": "\U000f1239",
-    "desk-lamp": "\U000f095f",
-    "desk-lamp-off": "\U000f1b1f",
-    "desk-lamp-on": "\U000f1b20",
-    "deskphone": "\U000f01c3",
-    "desktop-classic": "\U000f07c0",
-    "desktop-tower": "\U000f01c5",
-    "desktop-tower-monitor": "\U000f0aab",
-    "details": "\U000f01c6",
-    "dev-to": "\U000f0d6e",
-    "developer-board": "\U000f0697",
-    "deviantart": "\U000f01c7",
-    "devices": "\U000f0fb0",
-    "dharmachakra": "\U000f094b",
-    "diabetes": "\U000f1126",
-    "dialpad": "\U000f061c",
-    "diameter": "\U000f0c63",
-    "diameter-outline": "\U000f0c64",
-    "diameter-variant": "\U000f0c65",
-    "diamond": "\U000f0b8a",
-    "diamond-outline": "\U000f0b8b",
-    "diamond-stone": "\U000f01c8",
-    "diaper-outline": "\U000f1ccf",
-    "dice-1": "\U000f01ca",
-    "dice-1-outline": "\U000f114a",
-    "dice-2": "\U000f01cb",
-    "dice-2-outline": "\U000f114b",
-    "dice-3": "\U000f01cc",
-    "dice-3-outline": "\U000f114c",
-    "dice-4": "\U000f01cd",
-    "dice-4-outline": "\U000f114d",
-    "dice-5": "\U000f01ce",
-    "dice-5-outline": "\U000f114e",
-    "dice-6": "\U000f01cf",
-    "dice-6-outline": "\U000f114f",
-    "dice-d10": "\U000f1153",
-    "dice-d10-outline": "\U000f076f",
-    "dice-d12": "\U000f1154",
-    "dice-d12-outline": "\U000f0867",
-    "dice-d20": "\U000f1155",
-    "dice-d20-outline": "\U000f05ea",
-    "dice-d4": "\U000f1150",
-    "dice-d4-outline": "\U000f05eb",
-    "dice-d6": "\U000f1151",
-    "dice-d6-outline": "\U000f05ed",
-    "dice-d8": "\U000f1152",
-    "dice-d8-outline": "\U000f05ec",
-    "dice-multiple": "\U000f076e",
-    "dice-multiple-outline": "\U000f1156",
-    "digital-ocean": "\U000f1237",
-    "dip-switch": "\U000f07c1",
-    "directions": "\U000f01d0",
-    "directions-fork": "\U000f0641",
-    "disc": "\U000f05ee",
-    "disc-alert": "\U000f01d1",
-    "disc-player": "\U000f0960",
-    "dishwasher": "\U000f0aac",
-    "dishwasher-alert": "\U000f11b8",
-    "dishwasher-off": "\U000f11b9",
-    "disqus": "\U000f01d2",
-    "distribute-horizontal-center": "\U000f11c9",
-    "distribute-horizontal-left": "\U000f11c8",
-    "distribute-horizontal-right": "\U000f11ca",
-    "distribute-vertical-bottom": "\U000f11cb",
-    "distribute-vertical-center": "\U000f11cc",
-    "distribute-vertical-top": "\U000f11cd",
-    "diversify": "\U000f1877",
-    "diving": "\U000f1977",
-    "diving-flippers": "\U000f0dbf",
-    "diving-helmet": "\U000f0dc0",
-    "diving-scuba": "\U000f1b77",
-    "diving-scuba-flag": "\U000f0dc2",
-    "diving-scuba-mask": "\U000f0dc1",
-    "diving-scuba-tank": "\U000f0dc3",
-    "diving-scuba-tank-multiple": "\U000f0dc4",
-    "diving-snorkel": "\U000f0dc5",
-    "division": "\U000f01d4",
-    "division-box": "\U000f01d5",
-    "dlna": "\U000f0a41",
-    "dna": "\U000f0684",
-    "dns": "\U000f01d6",
-    "dns-outline": "\U000f0b8c",
-    "dock-bottom": "\U000f10a9",
-    "dock-left": "\U000f10aa",
-    "dock-right": "\U000f10ab",
-    "dock-top": "\U000f1513",
-    "dock-window": "\U000f10ac",
-    "docker": "\U000f0868",
-    "doctor": "\U000f0a42",
-    "dog": "\U000f0a43",
-    "dog-service": "\U000f0aad",
-    "dog-side": "\U000f0a44",
-    "dog-side-off": "\U000f16ee",
-    "dolby": "\U000f06b3",
-    "dolly": "\U000f0e9e",
-    "dolphin": "\U000f18b4",
-    "domain": "\U000f01d7",
-    "domain-off": "\U000f0d6f",
-    "domain-plus": "\U000f10ad",
-    "domain-remove": "\U000f10ae",
-    "domain-switch": "\U000f1c2c",
-    "dome-light": "\U000f141e",
-    "domino-mask": "\U000f1023",
-    "donkey": "\U000f07c2",
-    "door": "\U000f081a",
-    "door-closed": "\U000f081b",
-    "door-closed-cancel": "\U000f1c93",
-    "door-closed-lock": "\U000f10af",
-    "door-open": "\U000f081c",
-    "door-sliding": "\U000f181e",
-    "door-sliding-lock": "\U000f181f",
-    "door-sliding-open": "\U000f1820",
-    "doorbell": "\U000f12e6",
-    "doorbell-video": "\U000f0869",
-    "dot-net": "\U000f0aae",
-    "dots-circle": "\U000f1978",
-    "dots-grid": "\U000f15fc",
-    "dots-hexagon": "\U000f15ff",
-    "dots-horizontal": "\U000f01d8",
-    "dots-horizontal-circle": "\U000f07c3",
-    "dots-horizontal-circle-outline": "\U000f0b8d",
-    "dots-square": "\U000f15fd",
-    "dots-triangle": "\U000f15fe",
-    "dots-vertical": "\U000f01d9",
-    "dots-vertical-circle": "\U000f07c4",
-    "dots-vertical-circle-outline": "\U000f0b8e",
-    "download": "\U000f01da",
-    "download-box": "\U000f1462",
-    "download-box-outline": "\U000f1463",
-    "download-circle": "\U000f1464",
-    "download-circle-outline": "\U000f1465",
-    "download-lock": "\U000f1320",
-    "download-lock-outline": "\U000f1321",
-    "download-multiple": "\U000f09e9",
-    "download-multiple-outline": "\U000f1cd0",
-    "download-network": "\U000f06f4",
-    "download-network-outline": "\U000f0c66",
-    "download-off": "\U000f10b0",
-    "download-off-outline": "\U000f10b1",
-    "download-outline": "\U000f0b8f",
-    "drag": "\U000f01db",
-    "drag-horizontal": "\U000f01dc",
-    "drag-horizontal-variant": "\U000f12f0",
-    "drag-variant": "\U000f0b90",
-    "drag-vertical": "\U000f01dd",
-    "drag-vertical-variant": "\U000f12f1",
-    "drama-masks": "\U000f0d02",
-    "draw": "\U000f0f49",
-    "draw-pen": "\U000f19b9",
-    "drawing": "\U000f01de",
-    "drawing-box": "\U000f01df",
-    "dresser": "\U000f0f4a",
-    "dresser-outline": "\U000f0f4b",
-    "drone": "\U000f01e2",
-    "dropbox": "\U000f01e3",
-    "drupal": "\U000f01e4",
-    "duck": "\U000f01e5",
-    "dumbbell": "\U000f01e6",
-    "dump-truck": "\U000f0c67",
-    "ear-hearing": "\U000f07c5",
-    "ear-hearing-loop": "\U000f1aee",
-    "ear-hearing-off": "\U000f0a45",
-    "earbuds": "\U000f184f",
-    "earbuds-off": "\U000f1850",
-    "earbuds-off-outline": "\U000f1851",
-    "earbuds-outline": "\U000f1852",
-    "earth": "\U000f01e7",
-    "earth-arrow-down": "\U000f1c87",
-    "earth-arrow-left": "\U000f1c88",
-    "earth-arrow-right": "\U000f1311",
-    "earth-arrow-up": "\U000f1c89",
-    "earth-box": "\U000f06cd",
-    "earth-box-minus": "\U000f1407",
-    "earth-box-off": "\U000f06ce",
-    "earth-box-plus": "\U000f1406",
-    "earth-box-remove": "\U000f1408",
-    "earth-minus": "\U000f1404",
-    "earth-off": "\U000f01e8",
-    "earth-plus": "\U000f1403",
-    "earth-remove": "\U000f1405",
-    "egg": "\U000f0aaf",
-    "egg-easter": "\U000f0ab0",
-    "egg-fried": "\U000f184a",
-    "egg-off": "\U000f13f0",
-    "egg-off-outline": "\U000f13f1",
-    "egg-outline": "\U000f13f2",
-    "eiffel-tower": "\U000f156b",
-    "eight-track": "\U000f09ea",
-    "eject": "\U000f01ea",
-    "eject-circle": "\U000f1b23",
-    "eject-circle-outline": "\U000f1b24",
-    "eject-outline": "\U000f0b91",
-    "electric-switch": "\U000f0e9f",
-    "electric-switch-closed": "\U000f10d9",
-    "electron-framework": "\U000f1024",
-    "elephant": "\U000f07c6",
-    "elevation-decline": "\U000f01eb",
-    "elevation-rise": "\U000f01ec",
-    "elevator": "\U000f01ed",
-    "elevator-down": "\U000f12c2",
-    "elevator-passenger": "\U000f1381",
-    "elevator-passenger-off": "\U000f1979",
-    "elevator-passenger-off-outline": "\U000f197a",
-    "elevator-passenger-outline": "\U000f197b",
-    "elevator-up": "\U000f12c1",
-    "ellipse": "\U000f0ea0",
-    "ellipse-outline": "\U000f0ea1",
-    "email": "\U000f01ee",
-    "email-alert": "\U000f06cf",
-    "email-alert-outline": "\U000f0d42",
-    "email-arrow-left": "\U000f10da",
-    "email-arrow-left-outline": "\U000f10db",
-    "email-arrow-right": "\U000f10dc",
-    "email-arrow-right-outline": "\U000f10dd",
-    "email-box": "\U000f0d03",
-    "email-check": "\U000f0ab1",
-    "email-check-outline": "\U000f0ab2",
-    "email-edit": "\U000f0ee3",
-    "email-edit-outline": "\U000f0ee4",
-    "email-fast": "\U000f186f",
-    "email-fast-outline": "\U000f1870",
-    "email-heart-outline": "\U000f1c5b",
-    "email-lock": "\U000f01f1",
-    "email-lock-outline": "\U000f1b61",
-    "email-mark-as-unread": "\U000f0b92",
-    "email-minus": "\U000f0ee5",
-    "email-minus-outline": "\U000f0ee6",
-    "email-multiple": "\U000f0ee7",
-    "email-multiple-outline": "\U000f0ee8",
-    "email-newsletter": "\U000f0fb1",
-    "email-off": "\U000f13e3",
-    "email-off-outline": "\U000f13e4",
-    "email-open": "\U000f01ef",
-    "email-open-heart-outline": "\U000f1c5c",
-    "email-open-multiple": "\U000f0ee9",
-    "email-open-multiple-outline": "\U000f0eea",
-    "email-open-outline": "\U000f05ef",
-    "email-outline": "\U000f01f0",
-    "email-plus": "\U000f09eb",
-    "email-plus-outline": "\U000f09ec",
-    "email-remove": "\U000f1661",
-    "email-remove-outline": "\U000f1662",
-    "email-seal": "\U000f195b",
-    "email-seal-outline": "\U000f195c",
-    "email-search": "\U000f0961",
-    "email-search-outline": "\U000f0962",
-    "email-sync": "\U000f12c7",
-    "email-sync-outline": "\U000f12c8",
-    "email-variant": "\U000f05f0",
-    "ember": "\U000f0b30",
-    "emby": "\U000f06b4",
-    "emoticon": "\U000f0c68",
-    "emoticon-angry": "\U000f0c69",
-    "emoticon-angry-outline": "\U000f0c6a",
-    "emoticon-confused": "\U000f10de",
-    "emoticon-confused-outline": "\U000f10df",
-    "emoticon-cool": "\U000f0c6b",
-    "emoticon-cool-outline": "\U000f01f3",
-    "emoticon-cry": "\U000f0c6c",
-    "emoticon-cry-outline": "\U000f0c6d",
-    "emoticon-dead": "\U000f0c6e",
-    "emoticon-dead-outline": "\U000f069b",
-    "emoticon-devil": "\U000f0c6f",
-    "emoticon-devil-outline": "\U000f01f4",
-    "emoticon-excited": "\U000f0c70",
-    "emoticon-excited-outline": "\U000f069c",
-    "emoticon-frown": "\U000f0f4c",
-    "emoticon-frown-outline": "\U000f0f4d",
-    "emoticon-happy": "\U000f0c71",
-    "emoticon-happy-outline": "\U000f01f5",
-    "emoticon-kiss": "\U000f0c72",
-    "emoticon-kiss-outline": "\U000f0c73",
-    "emoticon-lol": "\U000f1214",
-    "emoticon-lol-outline": "\U000f1215",
-    "emoticon-minus": "\U000f1cb2",
-    "emoticon-minus-outline": "\U000f1cb3",
-    "emoticon-neutral": "\U000f0c74",
-    "emoticon-neutral-outline": "\U000f01f6",
-    "emoticon-outline": "\U000f01f2",
-    "emoticon-plus": "\U000f1cb4",
-    "emoticon-plus-outline": "\U000f1cb5",
-    "emoticon-poop": "\U000f01f7",
-    "emoticon-poop-outline": "\U000f0c75",
-    "emoticon-remove": "\U000f1cb6",
-    "emoticon-remove-outline": "\U000f1cb7",
-    "emoticon-sad": "\U000f0c76",
-    "emoticon-sad-outline": "\U000f01f8",
-    "emoticon-sick": "\U000f157c",
-    "emoticon-sick-outline": "\U000f157d",
-    "emoticon-tongue": "\U000f01f9",
-    "emoticon-tongue-outline": "\U000f0c77",
-    "emoticon-wink": "\U000f0c78",
-    "emoticon-wink-outline": "\U000f0c79",
-    "engine": "\U000f01fa",
-    "engine-off": "\U000f0a46",
-    "engine-off-outline": "\U000f0a47",
-    "engine-outline": "\U000f01fb",
-    "epsilon": "\U000f10e0",
-    "equal": "\U000f01fc",
-    "equal-box": "\U000f01fd",
-    "equalizer": "\U000f0ea2",
-    "equalizer-outline": "\U000f0ea3",
-    "eraser": "\U000f01fe",
-    "eraser-variant": "\U000f0642",
-    "escalator": "\U000f01ff",
-    "escalator-box": "\U000f1399",
-    "escalator-down": "\U000f12c0",
-    "escalator-up": "\U000f12bf",
-    "eslint": "\U000f0c7a",
-    "et": "\U000f0ab3",
-    "ethereum": "\U000f086a",
-    "ethernet": "\U000f0200",
-    "ethernet-cable": "\U000f0201",
-    "ethernet-cable-off": "\U000f0202",
-    "ethernet-off": "\U000f1cd1",
-    "ev-plug-ccs1": "\U000f1519",
-    "ev-plug-ccs2": "\U000f151a",
-    "ev-plug-chademo": "\U000f151b",
-    "ev-plug-tesla": "\U000f151c",
-    "ev-plug-type1": "\U000f151d",
-    "ev-plug-type2": "\U000f151e",
-    "ev-station": "\U000f05f1",
-    "evernote": "\U000f0204",
-    "excavator": "\U000f1025",
-    "exclamation": "\U000f0205",
-    "exclamation-thick": "\U000f1238",
-    "exit-run": "\U000f0a48",
-    "exit-to-app": "\U000f0206",
-    "expand-all": "\U000f0ab4",
-    "expand-all-outline": "\U000f0ab5",
-    "expansion-card": "\U000f08ae",
-    "expansion-card-variant": "\U000f0fb2",
-    "exponent": "\U000f0963",
-    "exponent-box": "\U000f0964",
-    "export": "\U000f0207",
-    "export-variant": "\U000f0b93",
-    "eye": "\U000f0208",
-    "eye-arrow-left": "\U000f18fd",
-    "eye-arrow-left-outline": "\U000f18fe",
-    "eye-arrow-right": "\U000f18ff",
-    "eye-arrow-right-outline": "\U000f1900",
-    "eye-check": "\U000f0d04",
-    "eye-check-outline": "\U000f0d05",
-    "eye-circle": "\U000f0b94",
-    "eye-circle-outline": "\U000f0b95",
-    "eye-closed": "\U000f1ca3",
-    "eye-lock": "\U000f1c06",
-    "eye-lock-open": "\U000f1c07",
-    "eye-lock-open-outline": "\U000f1c08",
-    "eye-lock-outline": "\U000f1c09",
-    "eye-minus": "\U000f1026",
-    "eye-minus-outline": "\U000f1027",
-    "eye-off": "\U000f0209",
-    "eye-off-outline": "\U000f06d1",
-    "eye-outline": "\U000f06d0",
-    "eye-plus": "\U000f086b",
-    "eye-plus-outline": "\U000f086c",
-    "eye-refresh": "\U000f197c",
-    "eye-refresh-outline": "\U000f197d",
-    "eye-remove": "\U000f15e3",
-    "eye-remove-outline": "\U000f15e4",
-    "eye-settings": "\U000f086d",
-    "eye-settings-outline": "\U000f086e",
-    "eyedropper": "\U000f020a",
-    "eyedropper-minus": "\U000f13dd",
-    "eyedropper-off": "\U000f13df",
-    "eyedropper-plus": "\U000f13dc",
-    "eyedropper-remove": "\U000f13de",
-    "eyedropper-variant": "\U000f020b",
-    "face-agent": "\U000f0d70",
-    "face-man": "\U000f0643",
-    "face-man-outline": "\U000f0b96",
-    "face-man-profile": "\U000f0644",
-    "face-man-shimmer": "\U000f15cc",
-    "face-man-shimmer-outline": "\U000f15cd",
-    "face-mask": "\U000f1586",
-    "face-mask-outline": "\U000f1587",
-    "face-recognition": "\U000f0c7b",
-    "face-woman": "\U000f1077",
-    "face-woman-outline": "\U000f1078",
-    "face-woman-profile": "\U000f1076",
-    "face-woman-shimmer": "\U000f15ce",
-    "face-woman-shimmer-outline": "\U000f15cf",
-    "facebook": "\U000f020c",
-    "facebook-gaming": "\U000f07dd",
-    "facebook-messenger": "\U000f020e",
-    "facebook-workplace": "\U000f0b31",
-    "factory": "\U000f020f",
-    "family-tree": "\U000f160e",
-    "fan": "\U000f0210",
-    "fan-alert": "\U000f146c",
-    "fan-auto": "\U000f171d",
-    "fan-chevron-down": "\U000f146d",
-    "fan-chevron-up": "\U000f146e",
-    "fan-clock": "\U000f1a3a",
-    "fan-minus": "\U000f1470",
-    "fan-off": "\U000f081d",
-    "fan-plus": "\U000f146f",
-    "fan-remove": "\U000f1471",
-    "fan-speed-1": "\U000f1472",
-    "fan-speed-2": "\U000f1473",
-    "fan-speed-3": "\U000f1474",
-    "fast-forward": "\U000f0211",
-    "fast-forward-10": "\U000f0d71",
-    "fast-forward-15": "\U000f193a",
-    "fast-forward-30": "\U000f0d06",
-    "fast-forward-45": "\U000f1b12",
-    "fast-forward-5": "\U000f11f8",
-    "fast-forward-60": "\U000f160b",
-    "fast-forward-outline": "\U000f06d2",
-    "faucet": "\U000f1b29",
-    "faucet-variant": "\U000f1b2a",
-    "fax": "\U000f0212",
-    "feather": "\U000f06d3",
-    "feature-search": "\U000f0a49",
-    "feature-search-outline": "\U000f0a4a",
-    "fedora": "\U000f08db",
-    "fence": "\U000f179a",
-    "fence-electric": "\U000f17f6",
-    "fencing": "\U000f14c1",
-    "ferris-wheel": "\U000f0ea4",
-    "ferry": "\U000f0213",
-    "file": "\U000f0214",
-    "file-account": "\U000f073b",
-    "file-account-outline": "\U000f1028",
-    "file-alert": "\U000f0a4b",
-    "file-alert-outline": "\U000f0a4c",
-    "file-arrow-left-right": "\U000f1a93",
-    "file-arrow-left-right-outline": "\U000f1a94",
-    "file-arrow-up-down": "\U000f1a95",
-    "file-arrow-up-down-outline": "\U000f1a96",
-    "file-cabinet": "\U000f0ab6",
-    "file-cad": "\U000f0eeb",
-    "file-cad-box": "\U000f0eec",
-    "file-cancel": "\U000f0dc6",
-    "file-cancel-outline": "\U000f0dc7",
-    "file-certificate": "\U000f1186",
-    "file-certificate-outline": "\U000f1187",
-    "file-chart": "\U000f0215",
-    "file-chart-check": "\U000f19c6",
-    "file-chart-check-outline": "\U000f19c7",
-    "file-chart-outline": "\U000f1029",
-    "file-check": "\U000f0216",
-    "file-check-outline": "\U000f0e29",
-    "file-clock": "\U000f12e1",
-    "file-clock-outline": "\U000f12e2",
-    "file-cloud": "\U000f0217",
-    "file-cloud-outline": "\U000f102a",
-    "file-code": "\U000f022e",
-    "file-code-outline": "\U000f102b",
-    "file-cog": "\U000f107b",
-    "file-cog-outline": "\U000f107c",
-    "file-compare": "\U000f08aa",
-    "file-delimited": "\U000f0218",
-    "file-delimited-outline": "\U000f0ea5",
-    "file-document": "\U000f0219",
-    "file-document-alert": "\U000f1a97",
-    "file-document-alert-outline": "\U000f1a98",
-    "file-document-arrow-right": "\U000f1c0f",
-    "file-document-arrow-right-outline": "\U000f1c10",
-    "file-document-check": "\U000f1a99",
-    "file-document-check-outline": "\U000f1a9a",
-    "file-document-edit": "\U000f0dc8",
-    "file-document-edit-outline": "\U000f0dc9",
-    "file-document-minus": "\U000f1a9b",
-    "file-document-minus-outline": "\U000f1a9c",
-    "file-document-multiple": "\U000f1517",
-    "file-document-multiple-outline": "\U000f1518",
-    "file-document-outline": "\U000f09ee",
-    "file-document-plus": "\U000f1a9d",
-    "file-document-plus-outline": "\U000f1a9e",
-    "file-document-refresh": "\U000f1c7a",
-    "file-document-refresh-outline": "\U000f1c7b",
-    "file-document-remove": "\U000f1a9f",
-    "file-document-remove-outline": "\U000f1aa0",
-    "file-download": "\U000f0965",
-    "file-download-outline": "\U000f0966",
-    "file-edit": "\U000f11e7",
-    "file-edit-outline": "\U000f11e8",
-    "file-excel": "\U000f021b",
-    "file-excel-box": "\U000f021c",
-    "file-excel-box-outline": "\U000f102c",
-    "file-excel-outline": "\U000f102d",
-    "file-export": "\U000f021d",
-    "file-export-outline": "\U000f102e",
-    "file-eye": "\U000f0dca",
-    "file-eye-outline": "\U000f0dcb",
-    "file-find": "\U000f021e",
-    "file-find-outline": "\U000f0b97",
-    "file-gif-box": "\U000f0d78",
-    "file-hidden": "\U000f0613",
-    "file-image": "\U000f021f",
-    "file-image-marker": "\U000f1772",
-    "file-image-marker-outline": "\U000f1773",
-    "file-image-minus": "\U000f193b",
-    "file-image-minus-outline": "\U000f193c",
-    "file-image-outline": "\U000f0eb0",
-    "file-image-plus": "\U000f193d",
-    "file-image-plus-outline": "\U000f193e",
-    "file-image-remove": "\U000f193f",
-    "file-image-remove-outline": "\U000f1940",
-    "file-import": "\U000f0220",
-    "file-import-outline": "\U000f102f",
-    "file-jpg-box": "\U000f0225",
-    "file-key": "\U000f1184",
-    "file-key-outline": "\U000f1185",
-    "file-link": "\U000f1177",
-    "file-link-outline": "\U000f1178",
-    "file-lock": "\U000f0221",
-    "file-lock-open": "\U000f19c8",
-    "file-lock-open-outline": "\U000f19c9",
-    "file-lock-outline": "\U000f1030",
-    "file-marker": "\U000f1774",
-    "file-marker-outline": "\U000f1775",
-    "file-minus": "\U000f1aa1",
-    "file-minus-outline": "\U000f1aa2",
-    "file-move": "\U000f0ab9",
-    "file-move-outline": "\U000f1031",
-    "file-multiple": "\U000f0222",
-    "file-multiple-outline": "\U000f1032",
-    "file-music": "\U000f0223",
-    "file-music-outline": "\U000f0e2a",
-    "file-outline": "\U000f0224",
-    "file-pdf-box": "\U000f0226",
-    "file-percent": "\U000f081e",
-    "file-percent-outline": "\U000f1033",
-    "file-phone": "\U000f1179",
-    "file-phone-outline": "\U000f117a",
-    "file-plus": "\U000f0752",
-    "file-plus-outline": "\U000f0eed",
-    "file-png-box": "\U000f0e2d",
-    "file-powerpoint": "\U000f0227",
-    "file-powerpoint-box": "\U000f0228",
-    "file-powerpoint-box-outline": "\U000f1034",
-    "file-powerpoint-outline": "\U000f1035",
-    "file-presentation-box": "\U000f0229",
-    "file-question": "\U000f086f",
-    "file-question-outline": "\U000f1036",
-    "file-refresh": "\U000f0918",
-    "file-refresh-outline": "\U000f0541",
-    "file-remove": "\U000f0b98",
-    "file-remove-outline": "\U000f1037",
-    "file-replace": "\U000f0b32",
-    "file-replace-outline": "\U000f0b33",
-    "file-restore": "\U000f0670",
-    "file-restore-outline": "\U000f1038",
-    "file-rotate-left": "\U000f1a3b",
-    "file-rotate-left-outline": "\U000f1a3c",
-    "file-rotate-right": "\U000f1a3d",
-    "file-rotate-right-outline": "\U000f1a3e",
-    "file-search": "\U000f0c7c",
-    "file-search-outline": "\U000f0c7d",
-    "file-send": "\U000f022a",
-    "file-send-outline": "\U000f1039",
-    "file-settings": "\U000f1079",
-    "file-settings-outline": "\U000f107a",
-    "file-sign": "\U000f19c3",
-    "file-star": "\U000f103a",
-    "file-star-four-points": "\U000f1c2d",
-    "file-star-four-points-outline": "\U000f1c2e",
-    "file-star-outline": "\U000f103b",
-    "file-swap": "\U000f0fb4",
-    "file-swap-outline": "\U000f0fb5",
-    "file-sync": "\U000f1216",
-    "file-sync-outline": "\U000f1217",
-    "file-table": "\U000f0c7e",
-    "file-table-box": "\U000f10e1",
-    "file-table-box-multiple": "\U000f10e2",
-    "file-table-box-multiple-outline": "\U000f10e3",
-    "file-table-box-outline": "\U000f10e4",
-    "file-table-outline": "\U000f0c7f",
-    "file-tree": "\U000f0645",
-    "file-tree-outline": "\U000f13d2",
-    "file-undo": "\U000f08dc",
-    "file-undo-outline": "\U000f103c",
-    "file-upload": "\U000f0a4d",
-    "file-upload-outline": "\U000f0a4e",
-    "file-video": "\U000f022b",
-    "file-video-outline": "\U000f0e2c",
-    "file-word": "\U000f022c",
-    "file-word-box": "\U000f022d",
-    "file-word-box-outline": "\U000f103d",
-    "file-word-outline": "\U000f103e",
-    "file-xml-box": "\U000f1b4b",
-    "film": "\U000f022f",
-    "filmstrip": "\U000f0230",
-    "filmstrip-box": "\U000f0332",
-    "filmstrip-box-multiple": "\U000f0d18",
-    "filmstrip-off": "\U000f0231",
-    "filter": "\U000f0232",
-    "filter-check": "\U000f18ec",
-    "filter-check-outline": "\U000f18ed",
-    "filter-cog": "\U000f1aa3",
-    "filter-cog-outline": "\U000f1aa4",
-    "filter-menu": "\U000f10e5",
-    "filter-menu-outline": "\U000f10e6",
-    "filter-minus": "\U000f0eee",
-    "filter-minus-outline": "\U000f0eef",
-    "filter-multiple": "\U000f1a3f",
-    "filter-multiple-outline": "\U000f1a40",
-    "filter-off": "\U000f14ef",
-    "filter-off-outline": "\U000f14f0",
-    "filter-outline": "\U000f0233",
-    "filter-plus": "\U000f0ef0",
-    "filter-plus-outline": "\U000f0ef1",
-    "filter-remove": "\U000f0234",
-    "filter-remove-outline": "\U000f0235",
-    "filter-settings": "\U000f1aa5",
-    "filter-settings-outline": "\U000f1aa6",
-    "filter-variant": "\U000f0236",
-    "filter-variant-minus": "\U000f1112",
-    "filter-variant-plus": "\U000f1113",
-    "filter-variant-remove": "\U000f103f",
-    "finance": "\U000f081f",
-    "find-replace": "\U000f06d4",
-    "fingerprint": "\U000f0237",
-    "fingerprint-off": "\U000f0eb1",
-    "fire": "\U000f0238",
-    "fire-alert": "\U000f15d7",
-    "fire-circle": "\U000f1807",
-    "fire-extinguisher": "\U000f0ef2",
-    "fire-hydrant": "\U000f1137",
-    "fire-hydrant-alert": "\U000f1138",
-    "fire-hydrant-off": "\U000f1139",
-    "fire-off": "\U000f1722",
-    "fire-station": "\U000f1cc3",
-    "fire-truck": "\U000f08ab",
-    "firebase": "\U000f0967",
-    "firefox": "\U000f0239",
-    "fireplace": "\U000f0e2e",
-    "fireplace-off": "\U000f0e2f",
-    "firewire": "\U000f05be",
-    "firework": "\U000f0e30",
-    "firework-off": "\U000f1723",
-    "fish": "\U000f023a",
-    "fish-off": "\U000f13f3",
-    "fishbowl": "\U000f0ef3",
-    "fishbowl-outline": "\U000f0ef4",
-    "fit-to-page": "\U000f0ef5",
-    "fit-to-page-outline": "\U000f0ef6",
-    "fit-to-screen": "\U000f18f4",
-    "fit-to-screen-outline": "\U000f18f5",
-    "flag": "\U000f023b",
-    "flag-checkered": "\U000f023c",
-    "flag-minus": "\U000f0b99",
-    "flag-minus-outline": "\U000f10b2",
-    "flag-off": "\U000f18ee",
-    "flag-off-outline": "\U000f18ef",
-    "flag-outline": "\U000f023d",
-    "flag-plus": "\U000f0b9a",
-    "flag-plus-outline": "\U000f10b3",
-    "flag-remove": "\U000f0b9b",
-    "flag-remove-outline": "\U000f10b4",
-    "flag-triangle": "\U000f023f",
-    "flag-variant": "\U000f0240",
-    "flag-variant-minus": "\U000f1bb4",
-    "flag-variant-minus-outline": "\U000f1bb5",
-    "flag-variant-off": "\U000f1bb0",
-    "flag-variant-off-outline": "\U000f1bb1",
-    "flag-variant-outline": "\U000f023e",
-    "flag-variant-plus": "\U000f1bb2",
-    "flag-variant-plus-outline": "\U000f1bb3",
-    "flag-variant-remove": "\U000f1bb6",
-    "flag-variant-remove-outline": "\U000f1bb7",
-    "flare": "\U000f0d72",
-    "flash": "\U000f0241",
-    "flash-alert": "\U000f0ef7",
-    "flash-alert-outline": "\U000f0ef8",
-    "flash-auto": "\U000f0242",
-    "flash-off": "\U000f0243",
-    "flash-off-outline": "\U000f1b45",
-    "flash-outline": "\U000f06d5",
-    "flash-red-eye": "\U000f067b",
-    "flash-triangle": "\U000f1b1d",
-    "flash-triangle-outline": "\U000f1b1e",
-    "flashlight": "\U000f0244",
-    "flashlight-off": "\U000f0245",
-    "flask": "\U000f0093",
-    "flask-empty": "\U000f0094",
-    "flask-empty-minus": "\U000f123a",
-    "flask-empty-minus-outline": "\U000f123b",
-    "flask-empty-off": "\U000f13f4",
-    "flask-empty-off-outline": "\U000f13f5",
-    "flask-empty-outline": "\U000f0095",
-    "flask-empty-plus": "\U000f123c",
-    "flask-empty-plus-outline": "\U000f123d",
-    "flask-empty-remove": "\U000f123e",
-    "flask-empty-remove-outline": "\U000f123f",
-    "flask-minus": "\U000f1240",
-    "flask-minus-outline": "\U000f1241",
-    "flask-off": "\U000f13f6",
-    "flask-off-outline": "\U000f13f7",
-    "flask-outline": "\U000f0096",
-    "flask-plus": "\U000f1242",
-    "flask-plus-outline": "\U000f1243",
-    "flask-remove": "\U000f1244",
-    "flask-remove-outline": "\U000f1245",
-    "flask-round-bottom": "\U000f124b",
-    "flask-round-bottom-empty": "\U000f124c",
-    "flask-round-bottom-empty-outline": "\U000f124d",
-    "flask-round-bottom-outline": "\U000f124e",
-    "fleur-de-lis": "\U000f1303",
-    "flip-horizontal": "\U000f10e7",
-    "flip-to-back": "\U000f0247",
-    "flip-to-front": "\U000f0248",
-    "flip-vertical": "\U000f10e8",
-    "floor-lamp": "\U000f08dd",
-    "floor-lamp-dual": "\U000f1040",
-    "floor-lamp-dual-outline": "\U000f17ce",
-    "floor-lamp-outline": "\U000f17c8",
-    "floor-lamp-torchiere": "\U000f1747",
-    "floor-lamp-torchiere-outline": "\U000f17d6",
-    "floor-lamp-torchiere-variant": "\U000f1041",
-    "floor-lamp-torchiere-variant-outline": "\U000f17cf",
-    "floor-plan": "\U000f0821",
-    "floppy": "\U000f0249",
-    "floppy-variant": "\U000f09ef",
-    "flower": "\U000f024a",
-    "flower-outline": "\U000f09f0",
-    "flower-pollen": "\U000f1885",
-    "flower-pollen-outline": "\U000f1886",
-    "flower-poppy": "\U000f0d08",
-    "flower-tulip": "\U000f09f1",
-    "flower-tulip-outline": "\U000f09f2",
-    "focus-auto": "\U000f0f4e",
-    "focus-field": "\U000f0f4f",
-    "focus-field-horizontal": "\U000f0f50",
-    "focus-field-vertical": "\U000f0f51",
-    "folder": "\U000f024b",
-    "folder-account": "\U000f024c",
-    "folder-account-outline": "\U000f0b9c",
-    "folder-alert": "\U000f0dcc",
-    "folder-alert-outline": "\U000f0dcd",
-    "folder-arrow-down": "\U000f19e8",
-    "folder-arrow-down-outline": "\U000f19e9",
-    "folder-arrow-left": "\U000f19ea",
-    "folder-arrow-left-outline": "\U000f19eb",
-    "folder-arrow-left-right": "\U000f19ec",
-    "folder-arrow-left-right-outline": "\U000f19ed",
-    "folder-arrow-right": "\U000f19ee",
-    "folder-arrow-right-outline": "\U000f19ef",
-    "folder-arrow-up": "\U000f19f0",
-    "folder-arrow-up-down": "\U000f19f1",
-    "folder-arrow-up-down-outline": "\U000f19f2",
-    "folder-arrow-up-outline": "\U000f19f3",
-    "folder-cancel": "\U000f19f4",
-    "folder-cancel-outline": "\U000f19f5",
-    "folder-check": "\U000f197e",
-    "folder-check-outline": "\U000f197f",
-    "folder-clock": "\U000f0aba",
-    "folder-clock-outline": "\U000f0abb",
-    "folder-cog": "\U000f107f",
-    "folder-cog-outline": "\U000f1080",
-    "folder-download": "\U000f024d",
-    "folder-download-outline": "\U000f10e9",
-    "folder-edit": "\U000f08de",
-    "folder-edit-outline": "\U000f0dce",
-    "folder-eye": "\U000f178a",
-    "folder-eye-outline": "\U000f178b",
-    "folder-file": "\U000f19f6",
-    "folder-file-outline": "\U000f19f7",
-    "folder-google-drive": "\U000f024e",
-    "folder-heart": "\U000f10ea",
-    "folder-heart-outline": "\U000f10eb",
-    "folder-hidden": "\U000f179e",
-    "folder-home": "\U000f10b5",
-    "folder-home-outline": "\U000f10b6",
-    "folder-image": "\U000f024f",
-    "folder-information": "\U000f10b7",
-    "folder-information-outline": "\U000f10b8",
-    "folder-key": "\U000f08ac",
-    "folder-key-network": "\U000f08ad",
-    "folder-key-network-outline": "\U000f0c80",
-    "folder-key-outline": "\U000f10ec",
-    "folder-lock": "\U000f0250",
-    "folder-lock-open": "\U000f0251",
-    "folder-lock-open-outline": "\U000f1aa7",
-    "folder-lock-outline": "\U000f1aa8",
-    "folder-marker": "\U000f126d",
-    "folder-marker-outline": "\U000f126e",
-    "folder-minus": "\U000f1b49",
-    "folder-minus-outline": "\U000f1b4a",
-    "folder-move": "\U000f0252",
-    "folder-move-outline": "\U000f1246",
-    "folder-multiple": "\U000f0253",
-    "folder-multiple-image": "\U000f0254",
-    "folder-multiple-outline": "\U000f0255",
-    "folder-multiple-plus": "\U000f147e",
-    "folder-multiple-plus-outline": "\U000f147f",
-    "folder-music": "\U000f1359",
-    "folder-music-outline": "\U000f135a",
-    "folder-network": "\U000f0870",
-    "folder-network-outline": "\U000f0c81",
-    "folder-off": "\U000f19f8",
-    "folder-off-outline": "\U000f19f9",
-    "folder-open": "\U000f0770",
-    "folder-open-outline": "\U000f0dcf",
-    "folder-outline": "\U000f0256",
-    "folder-play": "\U000f19fa",
-    "folder-play-outline": "\U000f19fb",
-    "folder-plus": "\U000f0257",
-    "folder-plus-outline": "\U000f0b9d",
-    "folder-pound": "\U000f0d09",
-    "folder-pound-outline": "\U000f0d0a",
-    "folder-question": "\U000f19ca",
-    "folder-question-outline": "\U000f19cb",
-    "folder-refresh": "\U000f0749",
-    "folder-refresh-outline": "\U000f0542",
-    "folder-remove": "\U000f0258",
-    "folder-remove-outline": "\U000f0b9e",
-    "folder-search": "\U000f0968",
-    "folder-search-outline": "\U000f0969",
-    "folder-settings": "\U000f107d",
-    "folder-settings-outline": "\U000f107e",
-    "folder-star": "\U000f069d",
-    "folder-star-multiple": "\U000f13d3",
-    "folder-star-multiple-outline": "\U000f13d4",
-    "folder-star-outline": "\U000f0b9f",
-    "folder-swap": "\U000f0fb6",
-    "folder-swap-outline": "\U000f0fb7",
-    "folder-sync": "\U000f0d0b",
-    "folder-sync-outline": "\U000f0d0c",
-    "folder-table": "\U000f12e3",
-    "folder-table-outline": "\U000f12e4",
-    "folder-text": "\U000f0c82",
-    "folder-text-outline": "\U000f0c83",
-    "folder-upload": "\U000f0259",
-    "folder-upload-outline": "\U000f10ed",
-    "folder-wrench": "\U000f19fc",
-    "folder-wrench-outline": "\U000f19fd",
-    "folder-zip": "\U000f06eb",
-    "folder-zip-outline": "\U000f07b9",
-    "font-awesome": "\U000f003a",
-    "food": "\U000f025a",
-    "food-apple": "\U000f025b",
-    "food-apple-outline": "\U000f0c84",
-    "food-croissant": "\U000f07c8",
-    "food-drumstick": "\U000f141f",
-    "food-drumstick-off": "\U000f1468",
-    "food-drumstick-off-outline": "\U000f1469",
-    "food-drumstick-outline": "\U000f1420",
-    "food-fork-drink": "\U000f05f2",
-    "food-halal": "\U000f1572",
-    "food-hot-dog": "\U000f184b",
-    "food-kosher": "\U000f1573",
-    "food-off": "\U000f05f3",
-    "food-off-outline": "\U000f1915",
-    "food-outline": "\U000f1916",
-    "food-steak": "\U000f146a",
-    "food-steak-off": "\U000f146b",
-    "food-takeout-box": "\U000f1836",
-    "food-takeout-box-outline": "\U000f1837",
-    "food-turkey": "\U000f171c",
-    "food-variant": "\U000f025c",
-    "food-variant-off": "\U000f13e5",
-    "foot-print": "\U000f0f52",
-    "football": "\U000f025d",
-    "football-australian": "\U000f025e",
-    "football-helmet": "\U000f025f",
-    "forest": "\U000f1897",
-    "forest-outline": "\U000f1c63",
-    "forklift": "\U000f07c9",
-    "form-dropdown": "\U000f1400",
-    "form-select": "\U000f1401",
-    "form-textarea": "\U000f1095",
-    "form-textbox": "\U000f060e",
-    "form-textbox-lock": "\U000f135d",
-    "form-textbox-password": "\U000f07f5",
-    "format-align-bottom": "\U000f0753",
-    "format-align-center": "\U000f0260",
-    "format-align-justify": "\U000f0261",
-    "format-align-left": "\U000f0262",
-    "format-align-middle": "\U000f0754",
-    "format-align-right": "\U000f0263",
-    "format-align-top": "\U000f0755",
-    "format-annotation-minus": "\U000f0abc",
-    "format-annotation-plus": "\U000f0646",
-    "format-bold": "\U000f0264",
-    "format-clear": "\U000f0265",
-    "format-color-fill": "\U000f0266",
-    "format-color-highlight": "\U000f0e31",
-    "format-color-marker-cancel": "\U000f1313",
-    "format-color-text": "\U000f069e",
-    "format-columns": "\U000f08df",
-    "format-float-center": "\U000f0267",
-    "format-float-left": "\U000f0268",
-    "format-float-none": "\U000f0269",
-    "format-float-right": "\U000f026a",
-    "format-font": "\U000f06d6",
-    "format-font-size-decrease": "\U000f09f3",
-    "format-font-size-increase": "\U000f09f4",
-    "format-header-1": "\U000f026b",
-    "format-header-2": "\U000f026c",
-    "format-header-3": "\U000f026d",
-    "format-header-4": "\U000f026e",
-    "format-header-5": "\U000f026f",
-    "format-header-6": "\U000f0270",
-    "format-header-decrease": "\U000f0271",
-    "format-header-equal": "\U000f0272",
-    "format-header-increase": "\U000f0273",
-    "format-header-pound": "\U000f0274",
-    "format-horizontal-align-center": "\U000f061e",
-    "format-horizontal-align-left": "\U000f061f",
-    "format-horizontal-align-right": "\U000f0620",
-    "format-indent-decrease": "\U000f0275",
-    "format-indent-increase": "\U000f0276",
-    "format-italic": "\U000f0277",
-    "format-letter-case": "\U000f0b34",
-    "format-letter-case-lower": "\U000f0b35",
-    "format-letter-case-upper": "\U000f0b36",
-    "format-letter-ends-with": "\U000f0fb8",
-    "format-letter-matches": "\U000f0fb9",
-    "format-letter-spacing": "\U000f1956",
-    "format-letter-spacing-variant": "\U000f1afb",
-    "format-letter-starts-with": "\U000f0fba",
-    "format-line-height": "\U000f1afc",
-    "format-line-spacing": "\U000f0278",
-    "format-line-style": "\U000f05c8",
-    "format-line-weight": "\U000f05c9",
-    "format-list-bulleted": "\U000f0279",
-    "format-list-bulleted-square": "\U000f0dd0",
-    "format-list-bulleted-triangle": "\U000f0eb2",
-    "format-list-bulleted-type": "\U000f027a",
-    "format-list-checkbox": "\U000f096a",
-    "format-list-checks": "\U000f0756",
-    "format-list-group": "\U000f1860",
-    "format-list-group-plus": "\U000f1b56",
-    "format-list-numbered": "\U000f027b",
-    "format-list-numbered-rtl": "\U000f0d0d",
-    "format-list-text": "\U000f126f",
-    "format-overline": "\U000f0eb3",
-    "format-page-break": "\U000f06d7",
-    "format-page-split": "\U000f1917",
-    "format-paint": "\U000f027c",
-    "format-paragraph": "\U000f027d",
-    "format-paragraph-spacing": "\U000f1afd",
-    "format-pilcrow": "\U000f06d8",
-    "format-pilcrow-arrow-left": "\U000f0286",
-    "format-pilcrow-arrow-right": "\U000f0285",
-    "format-quote-close": "\U000f027e",
-    "format-quote-close-outline": "\U000f11a8",
-    "format-quote-open": "\U000f0757",
-    "format-quote-open-outline": "\U000f11a7",
-    "format-rotate-90": "\U000f06aa",
-    "format-section": "\U000f069f",
-    "format-size": "\U000f027f",
-    "format-strikethrough": "\U000f0280",
-    "format-strikethrough-variant": "\U000f0281",
-    "format-subscript": "\U000f0282",
-    "format-superscript": "\U000f0283",
-    "format-text": "\U000f0284",
-    "format-text-rotation-angle-down": "\U000f0fbb",
-    "format-text-rotation-angle-up": "\U000f0fbc",
-    "format-text-rotation-down": "\U000f0d73",
-    "format-text-rotation-down-vertical": "\U000f0fbd",
-    "format-text-rotation-none": "\U000f0d74",
-    "format-text-rotation-up": "\U000f0fbe",
-    "format-text-rotation-vertical": "\U000f0fbf",
-    "format-text-variant": "\U000f0e32",
-    "format-text-variant-outline": "\U000f150f",
-    "format-text-wrapping-clip": "\U000f0d0e",
-    "format-text-wrapping-overflow": "\U000f0d0f",
-    "format-text-wrapping-wrap": "\U000f0d10",
-    "format-textbox": "\U000f0d11",
-    "format-title": "\U000f05f4",
-    "format-underline": "\U000f0287",
-    "format-underline-wavy": "\U000f18e9",
-    "format-vertical-align-bottom": "\U000f0621",
-    "format-vertical-align-center": "\U000f0622",
-    "format-vertical-align-top": "\U000f0623",
-    "format-wrap-inline": "\U000f0288",
-    "format-wrap-square": "\U000f0289",
-    "format-wrap-tight": "\U000f028a",
-    "format-wrap-top-bottom": "\U000f028b",
-    "forum": "\U000f028c",
-    "forum-minus": "\U000f1aa9",
-    "forum-minus-outline": "\U000f1aaa",
-    "forum-outline": "\U000f0822",
-    "forum-plus": "\U000f1aab",
-    "forum-plus-outline": "\U000f1aac",
-    "forum-remove": "\U000f1aad",
-    "forum-remove-outline": "\U000f1aae",
-    "forward": "\U000f028d",
-    "forwardburger": "\U000f0d75",
-    "fountain": "\U000f096b",
-    "fountain-pen": "\U000f0d12",
-    "fountain-pen-tip": "\U000f0d13",
-    "fraction-one-half": "\U000f1992",
-    "freebsd": "\U000f08e0",
-    "french-fries": "\U000f1957",
-    "frequently-asked-questions": "\U000f0eb4",
-    "fridge": "\U000f0290",
-    "fridge-alert": "\U000f11b1",
-    "fridge-alert-outline": "\U000f11b2",
-    "fridge-bottom": "\U000f0292",
-    "fridge-industrial": "\U000f15ee",
-    "fridge-industrial-alert": "\U000f15ef",
-    "fridge-industrial-alert-outline": "\U000f15f0",
-    "fridge-industrial-off": "\U000f15f1",
-    "fridge-industrial-off-outline": "\U000f15f2",
-    "fridge-industrial-outline": "\U000f15f3",
-    "fridge-off": "\U000f11af",
-    "fridge-off-outline": "\U000f11b0",
-    "fridge-outline": "\U000f028f",
-    "fridge-top": "\U000f0291",
-    "fridge-variant": "\U000f15f4",
-    "fridge-variant-alert": "\U000f15f5",
-    "fridge-variant-alert-outline": "\U000f15f6",
-    "fridge-variant-off": "\U000f15f7",
-    "fridge-variant-off-outline": "\U000f15f8",
-    "fridge-variant-outline": "\U000f15f9",
-    "fruit-cherries": "\U000f1042",
-    "fruit-cherries-off": "\U000f13f8",
-    "fruit-citrus": "\U000f1043",
-    "fruit-citrus-off": "\U000f13f9",
-    "fruit-grapes": "\U000f1044",
-    "fruit-grapes-outline": "\U000f1045",
-    "fruit-pear": "\U000f1a0e",
-    "fruit-pineapple": "\U000f1046",
-    "fruit-watermelon": "\U000f1047",
-    "fuel": "\U000f07ca",
-    "fuel-cell": "\U000f18b5",
-    "fullscreen": "\U000f0293",
-    "fullscreen-exit": "\U000f0294",
-    "function": "\U000f0295",
-    "function-variant": "\U000f0871",
-    "furigana-horizontal": "\U000f1081",
-    "furigana-vertical": "\U000f1082",
-    "fuse": "\U000f0c85",
-    "fuse-alert": "\U000f142d",
-    "fuse-blade": "\U000f0c86",
-    "fuse-off": "\U000f142c",
-    "gamepad": "\U000f0296",
-    "gamepad-circle": "\U000f0e33",
-    "gamepad-circle-down": "\U000f0e34",
-    "gamepad-circle-left": "\U000f0e35",
-    "gamepad-circle-outline": "\U000f0e36",
-    "gamepad-circle-right": "\U000f0e37",
-    "gamepad-circle-up": "\U000f0e38",
-    "gamepad-down": "\U000f0e39",
-    "gamepad-left": "\U000f0e3a",
-    "gamepad-outline": "\U000f1919",
-    "gamepad-right": "\U000f0e3b",
-    "gamepad-round": "\U000f0e3c",
-    "gamepad-round-down": "\U000f0e3d",
-    "gamepad-round-left": "\U000f0e3e",
-    "gamepad-round-outline": "\U000f0e3f",
-    "gamepad-round-right": "\U000f0e40",
-    "gamepad-round-up": "\U000f0e41",
-    "gamepad-square": "\U000f0eb5",
-    "gamepad-square-outline": "\U000f0eb6",
-    "gamepad-up": "\U000f0e42",
-    "gamepad-variant": "\U000f0297",
-    "gamepad-variant-outline": "\U000f0eb7",
-    "gamma": "\U000f10ee",
-    "gantry-crane": "\U000f0dd1",
-    "garage": "\U000f06d9",
-    "garage-alert": "\U000f0872",
-    "garage-alert-variant": "\U000f12d5",
-    "garage-lock": "\U000f17fb",
-    "garage-open": "\U000f06da",
-    "garage-open-variant": "\U000f12d4",
-    "garage-variant": "\U000f12d3",
-    "garage-variant-lock": "\U000f17fc",
-    "gas-burner": "\U000f1a1b",
-    "gas-cylinder": "\U000f0647",
-    "gas-station": "\U000f0298",
-    "gas-station-in-use": "\U000f1cc4",
-    "gas-station-in-use-outline": "\U000f1cc5",
-    "gas-station-off": "\U000f1409",
-    "gas-station-off-outline": "\U000f140a",
-    "gas-station-outline": "\U000f0eb8",
-    "gate": "\U000f0299",
-    "gate-alert": "\U000f17f8",
-    "gate-and": "\U000f08e1",
-    "gate-arrow-left": "\U000f17f7",
-    "gate-arrow-right": "\U000f1169",
-    "gate-buffer": "\U000f1afe",
-    "gate-nand": "\U000f08e2",
-    "gate-nor": "\U000f08e3",
-    "gate-not": "\U000f08e4",
-    "gate-open": "\U000f116a",
-    "gate-or": "\U000f08e5",
-    "gate-xnor": "\U000f08e6",
-    "gate-xor": "\U000f08e7",
-    "gatsby": "\U000f0e43",
-    "gauge": "\U000f029a",
-    "gauge-empty": "\U000f0873",
-    "gauge-full": "\U000f0874",
-    "gauge-low": "\U000f0875",
-    "gavel": "\U000f029b",
-    "gender-female": "\U000f029c",
-    "gender-male": "\U000f029d",
-    "gender-male-female": "\U000f029e",
-    "gender-male-female-variant": "\U000f113f",
-    "gender-non-binary": "\U000f1140",
-    "gender-transgender": "\U000f029f",
-    "generator-mobile": "\U000f1c8a",
-    "generator-portable": "\U000f1c8b",
-    "generator-stationary": "\U000f1c8c",
-    "gentoo": "\U000f08e8",
-    "gesture": "\U000f07cb",
-    "gesture-double-tap": "\U000f073c",
-    "gesture-pinch": "\U000f0abd",
-    "gesture-spread": "\U000f0abe",
-    "gesture-swipe": "\U000f0d76",
-    "gesture-swipe-down": "\U000f073d",
-    "gesture-swipe-horizontal": "\U000f0abf",
-    "gesture-swipe-left": "\U000f073e",
-    "gesture-swipe-right": "\U000f073f",
-    "gesture-swipe-up": "\U000f0740",
-    "gesture-swipe-vertical": "\U000f0ac0",
-    "gesture-tap": "\U000f0741",
-    "gesture-tap-box": "\U000f12a9",
-    "gesture-tap-button": "\U000f12a8",
-    "gesture-tap-hold": "\U000f0d77",
-    "gesture-two-double-tap": "\U000f0742",
-    "gesture-two-tap": "\U000f0743",
-    "ghost": "\U000f02a0",
-    "ghost-off": "\U000f09f5",
-    "ghost-off-outline": "\U000f165c",
-    "ghost-outline": "\U000f165d",
-    "gift": "\U000f0e44",
-    "gift-off": "\U000f16ef",
-    "gift-off-outline": "\U000f16f0",
-    "gift-open": "\U000f16f1",
-    "gift-open-outline": "\U000f16f2",
-    "gift-outline": "\U000f02a1",
-    "git": "\U000f02a2",
-    "github": "\U000f02a4",
-    "gitlab": "\U000f0ba0",
-    "glass-cocktail": "\U000f0356",
-    "glass-cocktail-off": "\U000f15e6",
-    "glass-flute": "\U000f02a5",
-    "glass-fragile": "\U000f1873",
-    "glass-mug": "\U000f02a6",
-    "glass-mug-off": "\U000f15e7",
-    "glass-mug-variant": "\U000f1116",
-    "glass-mug-variant-off": "\U000f15e8",
-    "glass-pint-outline": "\U000f130d",
-    "glass-stange": "\U000f02a7",
-    "glass-tulip": "\U000f02a8",
-    "glass-wine": "\U000f0876",
-    "glasses": "\U000f02aa",
-    "globe-light": "\U000f066f",
-    "globe-light-outline": "\U000f12d7",
-    "globe-model": "\U000f08e9",
-    "gmail": "\U000f02ab",
-    "gnome": "\U000f02ac",
-    "go-kart": "\U000f0d79",
-    "go-kart-track": "\U000f0d7a",
-    "gog": "\U000f0ba1",
-    "gold": "\U000f124f",
-    "golf": "\U000f0823",
-    "golf-cart": "\U000f11a4",
-    "golf-tee": "\U000f1083",
-    "gondola": "\U000f0686",
-    "goodreads": "\U000f0d7b",
-    "google": "\U000f02ad",
-    "google-ads": "\U000f0c87",
-    "google-analytics": "\U000f07cc",
-    "google-assistant": "\U000f07cd",
-    "google-cardboard": "\U000f02ae",
-    "google-chrome": "\U000f02af",
-    "google-circles": "\U000f02b0",
-    "google-circles-communities": "\U000f02b1",
-    "google-circles-extended": "\U000f02b2",
-    "google-circles-group": "\U000f02b3",
-    "google-classroom": "\U000f02c0",
-    "google-cloud": "\U000f11f6",
-    "google-downasaur": "\U000f1362",
-    "google-drive": "\U000f02b6",
-    "google-earth": "\U000f02b7",
-    "google-fit": "\U000f096c",
-    "google-glass": "\U000f02b8",
-    "google-hangouts": "\U000f02c9",
-    "google-keep": "\U000f06dc",
-    "google-lens": "\U000f09f6",
-    "google-maps": "\U000f05f5",
-    "google-my-business": "\U000f1048",
-    "google-nearby": "\U000f02b9",
-    "google-play": "\U000f02bc",
-    "google-plus": "\U000f02bd",
-    "google-podcast": "\U000f0eb9",
-    "google-spreadsheet": "\U000f09f7",
-    "google-street-view": "\U000f0c88",
-    "google-translate": "\U000f02bf",
-    "gradient-horizontal": "\U000f174a",
-    "gradient-vertical": "\U000f06a0",
-    "grain": "\U000f0d7c",
-    "graph": "\U000f1049",
-    "graph-outline": "\U000f104a",
-    "graphql": "\U000f0877",
-    "grass": "\U000f1510",
-    "grave-stone": "\U000f0ba2",
-    "grease-pencil": "\U000f0648",
-    "greater-than": "\U000f096d",
-    "greater-than-or-equal": "\U000f096e",
-    "greenhouse": "\U000f002d",
-    "grid": "\U000f02c1",
-    "grid-large": "\U000f0758",
-    "grid-off": "\U000f02c2",
-    "grill": "\U000f0e45",
-    "grill-outline": "\U000f118a",
-    "group": "\U000f02c3",
-    "guitar-acoustic": "\U000f0771",
-    "guitar-electric": "\U000f02c4",
-    "guitar-pick": "\U000f02c5",
-    "guitar-pick-outline": "\U000f02c6",
-    "guy-fawkes-mask": "\U000f0825",
-    "gymnastics": "\U000f1a41",
-    "hail": "\U000f0ac1",
-    "hair-dryer": "\U000f10ef",
-    "hair-dryer-outline": "\U000f10f0",
-    "halloween": "\U000f0ba3",
-    "hamburger": "\U000f0685",
-    "hamburger-check": "\U000f1776",
-    "hamburger-minus": "\U000f1777",
-    "hamburger-off": "\U000f1778",
-    "hamburger-plus": "\U000f1779",
-    "hamburger-remove": "\U000f177a",
-    "hammer": "\U000f08ea",
-    "hammer-screwdriver": "\U000f1322",
-    "hammer-sickle": "\U000f1887",
-    "hammer-wrench": "\U000f1323",
-    "hand-back-left": "\U000f0e46",
-    "hand-back-left-off": "\U000f1830",
-    "hand-back-left-off-outline": "\U000f1832",
-    "hand-back-left-outline": "\U000f182c",
-    "hand-back-right": "\U000f0e47",
-    "hand-back-right-off": "\U000f1831",
-    "hand-back-right-off-outline": "\U000f1833",
-    "hand-back-right-outline": "\U000f182d",
-    "hand-clap": "\U000f194b",
-    "hand-clap-off": "\U000f1a42",
-    "hand-coin": "\U000f188f",
-    "hand-coin-outline": "\U000f1890",
-    "hand-cycle": "\U000f1b9c",
-    "hand-extended": "\U000f18b6",
-    "hand-extended-outline": "\U000f18b7",
-    "hand-front-left": "\U000f182b",
-    "hand-front-left-outline": "\U000f182e",
-    "hand-front-right": "\U000f0a4f",
-    "hand-front-right-outline": "\U000f182f",
-    "hand-heart": "\U000f10f1",
-    "hand-heart-outline": "\U000f157e",
-    "hand-okay": "\U000f0a50",
-    "hand-peace": "\U000f0a51",
-    "hand-peace-variant": "\U000f0a52",
-    "hand-pointing-down": "\U000f0a53",
-    "hand-pointing-left": "\U000f0a54",
-    "hand-pointing-right": "\U000f02c7",
-    "hand-pointing-up": "\U000f0a55",
-    "hand-saw": "\U000f0e48",
-    "hand-wash": "\U000f157f",
-    "hand-wash-outline": "\U000f1580",
-    "hand-water": "\U000f139f",
-    "hand-wave": "\U000f1821",
-    "hand-wave-outline": "\U000f1822",
-    "handball": "\U000f0f53",
-    "handcuffs": "\U000f113e",
-    "hands-pray": "\U000f0579",
-    "handshake": "\U000f1218",
-    "handshake-outline": "\U000f15a1",
-    "hanger": "\U000f02c8",
-    "hard-hat": "\U000f096f",
-    "harddisk": "\U000f02ca",
-    "harddisk-plus": "\U000f104b",
-    "harddisk-remove": "\U000f104c",
-    "hat-fedora": "\U000f0ba4",
-    "hazard-lights": "\U000f0c89",
-    "hdmi-port": "\U000f1bb8",
-    "hdr": "\U000f0d7d",
-    "hdr-off": "\U000f0d7e",
-    "head": "\U000f135e",
-    "head-alert": "\U000f1338",
-    "head-alert-outline": "\U000f1339",
-    "head-check": "\U000f133a",
-    "head-check-outline": "\U000f133b",
-    "head-cog": "\U000f133c",
-    "head-cog-outline": "\U000f133d",
-    "head-dots-horizontal": "\U000f133e",
-    "head-dots-horizontal-outline": "\U000f133f",
-    "head-flash": "\U000f1340",
-    "head-flash-outline": "\U000f1341",
-    "head-heart": "\U000f1342",
-    "head-heart-outline": "\U000f1343",
-    "head-lightbulb": "\U000f1344",
-    "head-lightbulb-outline": "\U000f1345",
-    "head-minus": "\U000f1346",
-    "head-minus-outline": "\U000f1347",
-    "head-outline": "\U000f135f",
-    "head-plus": "\U000f1348",
-    "head-plus-outline": "\U000f1349",
-    "head-question": "\U000f134a",
-    "head-question-outline": "\U000f134b",
-    "head-remove": "\U000f134c",
-    "head-remove-outline": "\U000f134d",
-    "head-snowflake": "\U000f134e",
-    "head-snowflake-outline": "\U000f134f",
-    "head-sync": "\U000f1350",
-    "head-sync-outline": "\U000f1351",
-    "headphones": "\U000f02cb",
-    "headphones-bluetooth": "\U000f0970",
-    "headphones-box": "\U000f02cc",
-    "headphones-off": "\U000f07ce",
-    "headphones-settings": "\U000f02cd",
-    "headset": "\U000f02ce",
-    "headset-dock": "\U000f02cf",
-    "headset-off": "\U000f02d0",
-    "heart": "\U000f02d1",
-    "heart-box": "\U000f02d2",
-    "heart-box-outline": "\U000f02d3",
-    "heart-broken": "\U000f02d4",
-    "heart-broken-outline": "\U000f0d14",
-    "heart-circle": "\U000f0971",
-    "heart-circle-outline": "\U000f0972",
-    "heart-cog": "\U000f1663",
-    "heart-cog-outline": "\U000f1664",
-    "heart-flash": "\U000f0ef9",
-    "heart-half": "\U000f06df",
-    "heart-half-full": "\U000f06de",
-    "heart-half-outline": "\U000f06e0",
-    "heart-minus": "\U000f142f",
-    "heart-minus-outline": "\U000f1432",
-    "heart-multiple": "\U000f0a56",
-    "heart-multiple-outline": "\U000f0a57",
-    "heart-off": "\U000f0759",
-    "heart-off-outline": "\U000f1434",
-    "heart-outline": "\U000f02d5",
-    "heart-plus": "\U000f142e",
-    "heart-plus-outline": "\U000f1431",
-    "heart-pulse": "\U000f05f6",
-    "heart-remove": "\U000f1430",
-    "heart-remove-outline": "\U000f1433",
-    "heart-search": "\U000f1c8d",
-    "heart-settings": "\U000f1665",
-    "heart-settings-outline": "\U000f1666",
-    "heat-pump": "\U000f1a43",
-    "heat-pump-outline": "\U000f1a44",
-    "heat-wave": "\U000f1a45",
-    "heating-coil": "\U000f1aaf",
-    "helicopter": "\U000f0ac2",
-    "help": "\U000f02d6",
-    "help-box": "\U000f078b",
-    "help-box-multiple": "\U000f1c0a",
-    "help-box-multiple-outline": "\U000f1c0b",
-    "help-box-outline": "\U000f1c0c",
-    "help-circle": "\U000f02d7",
-    "help-circle-outline": "\U000f0625",
-    "help-network": "\U000f06f5",
-    "help-network-outline": "\U000f0c8a",
-    "help-rhombus": "\U000f0ba5",
-    "help-rhombus-outline": "\U000f0ba6",
-    "hexadecimal": "\U000f12a7",
-    "hexagon": "\U000f02d8",
-    "hexagon-multiple": "\U000f06e1",
-    "hexagon-multiple-outline": "\U000f10f2",
-    "hexagon-outline": "\U000f02d9",
-    "hexagon-slice-1": "\U000f0ac3",
-    "hexagon-slice-2": "\U000f0ac4",
-    "hexagon-slice-3": "\U000f0ac5",
-    "hexagon-slice-4": "\U000f0ac6",
-    "hexagon-slice-5": "\U000f0ac7",
-    "hexagon-slice-6": "\U000f0ac8",
-    "hexagram": "\U000f0ac9",
-    "hexagram-outline": "\U000f0aca",
-    "high-definition": "\U000f07cf",
-    "high-definition-box": "\U000f0878",
-    "highway": "\U000f05f7",
-    "hiking": "\U000f0d7f",
-    "history": "\U000f02da",
-    "hockey-puck": "\U000f0879",
-    "hockey-sticks": "\U000f087a",
-    "hololens": "\U000f02db",
-    "home": "\U000f02dc",
-    "home-account": "\U000f0826",
-    "home-alert": "\U000f087b",
-    "home-alert-outline": "\U000f15d0",
-    "home-analytics": "\U000f0eba",
-    "home-assistant": "\U000f07d0",
-    "home-automation": "\U000f07d1",
-    "home-battery": "\U000f1901",
-    "home-battery-outline": "\U000f1902",
-    "home-circle": "\U000f07d2",
-    "home-circle-outline": "\U000f104d",
-    "home-city": "\U000f0d15",
-    "home-city-outline": "\U000f0d16",
-    "home-clock": "\U000f1a12",
-    "home-clock-outline": "\U000f1a13",
-    "home-edit": "\U000f1159",
-    "home-edit-outline": "\U000f115a",
-    "home-export-outline": "\U000f0f9b",
-    "home-flood": "\U000f0efa",
-    "home-floor-0": "\U000f0dd2",
-    "home-floor-1": "\U000f0d80",
-    "home-floor-2": "\U000f0d81",
-    "home-floor-3": "\U000f0d82",
-    "home-floor-a": "\U000f0d83",
-    "home-floor-b": "\U000f0d84",
-    "home-floor-g": "\U000f0d85",
-    "home-floor-l": "\U000f0d86",
-    "home-floor-negative-1": "\U000f0dd3",
-    "home-group": "\U000f0dd4",
-    "home-group-minus": "\U000f19c1",
-    "home-group-plus": "\U000f19c0",
-    "home-group-remove": "\U000f19c2",
-    "home-heart": "\U000f0827",
-    "home-import-outline": "\U000f0f9c",
-    "home-lightbulb": "\U000f1251",
-    "home-lightbulb-outline": "\U000f1252",
-    "home-lightning-bolt": "\U000f1903",
-    "home-lightning-bolt-outline": "\U000f1904",
-    "home-lock": "\U000f08eb",
-    "home-lock-open": "\U000f08ec",
-    "home-map-marker": "\U000f05f8",
-    "home-minus": "\U000f0974",
-    "home-minus-outline": "\U000f13d5",
-    "home-modern": "\U000f02dd",
-    "home-off": "\U000f1a46",
-    "home-off-outline": "\U000f1a47",
-    "home-outline": "\U000f06a1",
-    "home-percent": "\U000f1c7c",
-    "home-percent-outline": "\U000f1c7d",
-    "home-plus": "\U000f0975",
-    "home-plus-outline": "\U000f13d6",
-    "home-remove": "\U000f1247",
-    "home-remove-outline": "\U000f13d7",
-    "home-roof": "\U000f112b",
-    "home-search": "\U000f13b0",
-    "home-search-outline": "\U000f13b1",
-    "home-silo": "\U000f1ba0",
-    "home-silo-outline": "\U000f1ba1",
-    "home-sound-in": "\U000f1c2f",
-    "home-sound-in-outline": "\U000f1c30",
-    "home-sound-out": "\U000f1c31",
-    "home-sound-out-outline": "\U000f1c32",
-    "home-switch": "\U000f1794",
-    "home-switch-outline": "\U000f1795",
-    "home-thermometer": "\U000f0f54",
-    "home-thermometer-outline": "\U000f0f55",
-    "home-variant": "\U000f02de",
-    "home-variant-outline": "\U000f0ba7",
-    "hook": "\U000f06e2",
-    "hook-off": "\U000f06e3",
-    "hoop-house": "\U000f0e56",
-    "hops": "\U000f02df",
-    "horizontal-rotate-clockwise": "\U000f10f3",
-    "horizontal-rotate-counterclockwise": "\U000f10f4",
-    "horse": "\U000f15bf",
-    "horse-human": "\U000f15c0",
-    "horse-variant": "\U000f15c1",
-    "horse-variant-fast": "\U000f186e",
-    "horseshoe": "\U000f0a58",
-    "hospital": "\U000f0ff6",
-    "hospital-box": "\U000f02e0",
-    "hospital-box-outline": "\U000f0ff7",
-    "hospital-building": "\U000f02e1",
-    "hospital-marker": "\U000f02e2",
-    "hot-tub": "\U000f0828",
-    "hours-12": "\U000f1c94",
-    "hours-24": "\U000f1478",
-    "hub": "\U000f1c95",
-    "hub-outline": "\U000f1c96",
-    "hubspot": "\U000f0d17",
-    "hulu": "\U000f0829",
-    "human": "\U000f02e6",
-    "human-baby-changing-table": "\U000f138b",
-    "human-cane": "\U000f1581",
-    "human-capacity-decrease": "\U000f159b",
-    "human-capacity-increase": "\U000f159c",
-    "human-child": "\U000f02e7",
-    "human-dolly": "\U000f1980",
-    "human-edit": "\U000f14e8",
-    "human-female": "\U000f0649",
-    "human-female-boy": "\U000f0a59",
-    "human-female-dance": "\U000f15c9",
-    "human-female-female": "\U000f0a5a",
-    "human-female-female-child": "\U000f1c8e",
-    "human-female-girl": "\U000f0a5b",
-    "human-greeting": "\U000f17c4",
-    "human-greeting-proximity": "\U000f159d",
-    "human-greeting-variant": "\U000f064a",
-    "human-handsdown": "\U000f064b",
-    "human-handsup": "\U000f064c",
-    "human-male": "\U000f064d",
-    "human-male-board": "\U000f0890",
-    "human-male-board-poll": "\U000f0846",
-    "human-male-boy": "\U000f0a5c",
-    "human-male-child": "\U000f138c",
-    "human-male-female": "\U000f02e8",
-    "human-male-female-child": "\U000f1823",
-    "human-male-girl": "\U000f0a5d",
-    "human-male-height": "\U000f0efb",
-    "human-male-height-variant": "\U000f0efc",
-    "human-male-male": "\U000f0a5e",
-    "human-male-male-child": "\U000f1c8f",
-    "human-non-binary": "\U000f1848",
-    "human-pregnant": "\U000f05cf",
-    "human-queue": "\U000f1571",
-    "human-scooter": "\U000f11e9",
-    "human-walker": "\U000f1b71",
-    "human-wheelchair": "\U000f138d",
-    "human-white-cane": "\U000f1981",
-    "humble-bundle": "\U000f0744",
-    "hvac": "\U000f1352",
-    "hvac-off": "\U000f159e",
-    "hydraulic-oil-level": "\U000f1324",
-    "hydraulic-oil-temperature": "\U000f1325",
-    "hydro-power": "\U000f12e5",
-    "hydrogen-station": "\U000f1894",
-    "ice-cream": "\U000f082a",
-    "ice-cream-off": "\U000f0e52",
-    "ice-pop": "\U000f0efd",
-    "id-card": "\U000f0fc0",
-    "identifier": "\U000f0efe",
-    "ideogram-cjk": "\U000f1331",
-    "ideogram-cjk-variant": "\U000f1332",
-    "image": "\U000f02e9",
-    "image-album": "\U000f02ea",
-    "image-area": "\U000f02eb",
-    "image-area-close": "\U000f02ec",
-    "image-auto-adjust": "\U000f0fc1",
-    "image-broken": "\U000f02ed",
-    "image-broken-variant": "\U000f02ee",
-    "image-check": "\U000f1b25",
-    "image-check-outline": "\U000f1b26",
-    "image-edit": "\U000f11e3",
-    "image-edit-outline": "\U000f11e4",
-    "image-filter-black-white": "\U000f02f0",
-    "image-filter-center-focus": "\U000f02f1",
-    "image-filter-center-focus-strong": "\U000f0eff",
-    "image-filter-center-focus-strong-outline": "\U000f0f00",
-    "image-filter-center-focus-weak": "\U000f02f2",
-    "image-filter-drama": "\U000f02f3",
-    "image-filter-drama-outline": "\U000f1bff",
-    "image-filter-frames": "\U000f02f4",
-    "image-filter-hdr": "\U000f02f5",
-    "image-filter-hdr-outline": "\U000f1c64",
-    "image-filter-none": "\U000f02f6",
-    "image-filter-tilt-shift": "\U000f02f7",
-    "image-filter-vintage": "\U000f02f8",
-    "image-frame": "\U000f0e49",
-    "image-lock": "\U000f1ab0",
-    "image-lock-outline": "\U000f1ab1",
-    "image-marker": "\U000f177b",
-    "image-marker-outline": "\U000f177c",
-    "image-minus": "\U000f1419",
-    "image-minus-outline": "\U000f1b47",
-    "image-move": "\U000f09f8",
-    "image-multiple": "\U000f02f9",
-    "image-multiple-outline": "\U000f02ef",
-    "image-off": "\U000f082b",
-    "image-off-outline": "\U000f11d1",
-    "image-outline": "\U000f0976",
-    "image-plus": "\U000f087c",
-    "image-plus-outline": "\U000f1b46",
-    "image-refresh": "\U000f19fe",
-    "image-refresh-outline": "\U000f19ff",
-    "image-remove": "\U000f1418",
-    "image-remove-outline": "\U000f1b48",
-    "image-search": "\U000f0977",
-    "image-search-outline": "\U000f0978",
-    "image-size-select-actual": "\U000f0c8d",
-    "image-size-select-large": "\U000f0c8e",
-    "image-size-select-small": "\U000f0c8f",
-    "image-sync": "\U000f1a00",
-    "image-sync-outline": "\U000f1a01",
-    "image-text": "\U000f160d",
-    "import": "\U000f02fa",
-    "inbox": "\U000f0687",
-    "inbox-arrow-down": "\U000f02fb",
-    "inbox-arrow-down-outline": "\U000f1270",
-    "inbox-arrow-up": "\U000f03d1",
-    "inbox-arrow-up-outline": "\U000f1271",
-    "inbox-full": "\U000f1272",
-    "inbox-full-outline": "\U000f1273",
-    "inbox-multiple": "\U000f08b0",
-    "inbox-multiple-outline": "\U000f0ba8",
-    "inbox-outline": "\U000f1274",
-    "inbox-remove": "\U000f159f",
-    "inbox-remove-outline": "\U000f15a0",
-    "incognito": "\U000f05f9",
-    "incognito-circle": "\U000f1421",
-    "incognito-circle-off": "\U000f1422",
-    "incognito-off": "\U000f0075",
-    "induction": "\U000f184c",
-    "infinity": "\U000f06e4",
-    "information": "\U000f02fc",
-    "information-box": "\U000f1c65",
-    "information-box-outline": "\U000f1c66",
-    "information-off": "\U000f178c",
-    "information-off-outline": "\U000f178d",
-    "information-outline": "\U000f02fd",
-    "information-slab-box": "\U000f1c67",
-    "information-slab-box-outline": "\U000f1c68",
-    "information-slab-circle": "\U000f1c69",
-    "information-slab-circle-outline": "\U000f1c6a",
-    "information-slab-symbol": "\U000f1c6b",
-    "information-symbol": "\U000f1c6c",
-    "information-variant": "\U000f064e",
-    "information-variant-box": "\U000f1c6d",
-    "information-variant-box-outline": "\U000f1c6e",
-    "information-variant-circle": "\U000f1c6f",
-    "information-variant-circle-outline": "\U000f1c70",
-    "instagram": "\U000f02fe",
-    "instrument-triangle": "\U000f104e",
-    "integrated-circuit-chip": "\U000f1913",
-    "invert-colors": "\U000f0301",
-    "invert-colors-off": "\U000f0e4a",
-    "invoice": "\U000f1cd2",
-    "invoice-arrow-left": "\U000f1cd3",
-    "invoice-arrow-left-outline": "\U000f1cd4",
-    "invoice-arrow-right": "\U000f1cd5",
-    "invoice-arrow-right-outline": "\U000f1cd6",
-    "invoice-check": "\U000f1cd7",
-    "invoice-check-outline": "\U000f1cd8",
-    "invoice-clock": "\U000f1cd9",
-    "invoice-clock-outline": "\U000f1cda",
-    "invoice-edit": "\U000f1cdb",
-    "invoice-edit-outline": "\U000f1cdc",
-    "invoice-export-outline": "\U000f1cdd",
-    "invoice-fast": "\U000f1cde",
-    "invoice-fast-outline": "\U000f1cdf",
-    "invoice-import": "\U000f1ce0",
-    "invoice-import-outline": "\U000f1ce1",
-    "invoice-list": "\U000f1ce2",
-    "invoice-list-outline": "\U000f1ce3",
-    "invoice-minus": "\U000f1ce4",
-    "invoice-minus-outline": "\U000f1ce5",
-    "invoice-multiple": "\U000f1ce6",
-    "invoice-multiple-outline": "\U000f1ce7",
-    "invoice-outline": "\U000f1ce8",
-    "invoice-plus": "\U000f1ce9",
-    "invoice-plus-outline": "\U000f1cea",
-    "invoice-remove": "\U000f1ceb",
-    "invoice-remove-outline": "\U000f1cec",
-    "invoice-send": "\U000f1ced",
-    "invoice-send-outline": "\U000f1cee",
-    "invoice-text": "\U000f1cef",
-    "invoice-text-arrow-left": "\U000f1cf0",
-    "invoice-text-arrow-left-outline": "\U000f1cf1",
-    "invoice-text-arrow-right": "\U000f1cf2",
-    "invoice-text-arrow-right-outline": "\U000f1cf3",
-    "invoice-text-check": "\U000f1cf4",
-    "invoice-text-check-outline": "\U000f1cf5",
-    "invoice-text-clock": "\U000f1cf6",
-    "invoice-text-clock-outline": "\U000f1cf7",
-    "invoice-text-edit": "\U000f1cf8",
-    "invoice-text-edit-outline": "\U000f1cf9",
-    "invoice-text-fast": "\U000f1cfa",
-    "invoice-text-fast-outline": "\U000f1cfb",
-    "invoice-text-minus": "\U000f1cfc",
-    "invoice-text-minus-outline": "\U000f1cfd",
-    "invoice-text-multiple": "\U000f1cfe",
-    "invoice-text-multiple-outline": "\U000f1cff",
-    "invoice-text-outline": "\U000f1d00",
-    "invoice-text-plus": "\U000f1d01",
-    "invoice-text-plus-outline": "\U000f1d02",
-    "invoice-text-remove": "\U000f1d03",
-    "invoice-text-remove-outline": "\U000f1d04",
-    "invoice-text-send": "\U000f1d05",
-    "invoice-text-send-outline": "\U000f1d06",
-    "iobroker": "\U000f12e8",
-    "ip": "\U000f0a5f",
-    "ip-network": "\U000f0a60",
-    "ip-network-outline": "\U000f0c90",
-    "ip-outline": "\U000f1982",
-    "ipod": "\U000f0c91",
-    "iron": "\U000f1824",
-    "iron-board": "\U000f1838",
-    "iron-outline": "\U000f1825",
-    "island": "\U000f104f",
-    "island-variant": "\U000f1cc6",
-    "iv-bag": "\U000f10b9",
-    "jabber": "\U000f0dd5",
-    "jeepney": "\U000f0302",
-    "jellyfish": "\U000f0f01",
-    "jellyfish-outline": "\U000f0f02",
-    "jira": "\U000f0303",
-    "jquery": "\U000f087d",
-    "jsfiddle": "\U000f0304",
-    "jump-rope": "\U000f12ff",
-    "kabaddi": "\U000f0d87",
-    "kangaroo": "\U000f1558",
-    "karate": "\U000f082c",
-    "kayaking": "\U000f08af",
-    "keg": "\U000f0305",
-    "kettle": "\U000f05fa",
-    "kettle-alert": "\U000f1317",
-    "kettle-alert-outline": "\U000f1318",
-    "kettle-off": "\U000f131b",
-    "kettle-off-outline": "\U000f131c",
-    "kettle-outline": "\U000f0f56",
-    "kettle-pour-over": "\U000f173c",
-    "kettle-steam": "\U000f1319",
-    "kettle-steam-outline": "\U000f131a",
-    "kettlebell": "\U000f1300",
-    "key": "\U000f0306",
-    "key-alert": "\U000f1983",
-    "key-alert-outline": "\U000f1984",
-    "key-arrow-right": "\U000f1312",
-    "key-chain": "\U000f1574",
-    "key-chain-variant": "\U000f1575",
-    "key-change": "\U000f0307",
-    "key-link": "\U000f119f",
-    "key-minus": "\U000f0308",
-    "key-outline": "\U000f0dd6",
-    "key-plus": "\U000f0309",
-    "key-remove": "\U000f030a",
-    "key-star": "\U000f119e",
-    "key-variant": "\U000f030b",
-    "key-wireless": "\U000f0fc2",
-    "keyboard": "\U000f030c",
-    "keyboard-backspace": "\U000f030d",
-    "keyboard-caps": "\U000f030e",
-    "keyboard-close": "\U000f030f",
-    "keyboard-close-outline": "\U000f1c00",
-    "keyboard-esc": "\U000f12b7",
-    "keyboard-f1": "\U000f12ab",
-    "keyboard-f10": "\U000f12b4",
-    "keyboard-f11": "\U000f12b5",
-    "keyboard-f12": "\U000f12b6",
-    "keyboard-f2": "\U000f12ac",
-    "keyboard-f3": "\U000f12ad",
-    "keyboard-f4": "\U000f12ae",
-    "keyboard-f5": "\U000f12af",
-    "keyboard-f6": "\U000f12b0",
-    "keyboard-f7": "\U000f12b1",
-    "keyboard-f8": "\U000f12b2",
-    "keyboard-f9": "\U000f12b3",
-    "keyboard-off": "\U000f0310",
-    "keyboard-off-outline": "\U000f0e4b",
-    "keyboard-outline": "\U000f097b",
-    "keyboard-return": "\U000f0311",
-    "keyboard-settings": "\U000f09f9",
-    "keyboard-settings-outline": "\U000f09fa",
-    "keyboard-space": "\U000f1050",
-    "keyboard-tab": "\U000f0312",
-    "keyboard-tab-reverse": "\U000f0325",
-    "keyboard-variant": "\U000f0313",
-    "khanda": "\U000f10fd",
-    "kickstarter": "\U000f0745",
-    "kite": "\U000f1985",
-    "kite-outline": "\U000f1986",
-    "kitesurfing": "\U000f1744",
-    "klingon": "\U000f135b",
-    "knife": "\U000f09fb",
-    "knife-military": "\U000f09fc",
-    "knob": "\U000f1b96",
-    "koala": "\U000f173f",
-    "kodi": "\U000f0314",
-    "kubernetes": "\U000f10fe",
-    "label": "\U000f0315",
-    "label-multiple": "\U000f1375",
-    "label-multiple-outline": "\U000f1376",
-    "label-off": "\U000f0acb",
-    "label-off-outline": "\U000f0acc",
-    "label-outline": "\U000f0316",
-    "label-percent": "\U000f12ea",
-    "label-percent-outline": "\U000f12eb",
-    "label-variant": "\U000f0acd",
-    "label-variant-outline": "\U000f0ace",
-    "ladder": "\U000f15a2",
-    "ladybug": "\U000f082d",
-    "lambda": "\U000f0627",
-    "lamp": "\U000f06b5",
-    "lamp-outline": "\U000f17d0",
-    "lamps": "\U000f1576",
-    "lamps-outline": "\U000f17d1",
-    "lan": "\U000f0317",
-    "lan-check": "\U000f12aa",
-    "lan-connect": "\U000f0318",
-    "lan-disconnect": "\U000f0319",
-    "lan-pending": "\U000f031a",
-    "land-fields": "\U000f1ab2",
-    "land-plots": "\U000f1ab3",
-    "land-plots-circle": "\U000f1ab4",
-    "land-plots-circle-variant": "\U000f1ab5",
-    "land-plots-marker": "\U000f1c5d",
-    "land-rows-horizontal": "\U000f1ab6",
-    "land-rows-vertical": "\U000f1ab7",
-    "landslide": "\U000f1a48",
-    "landslide-outline": "\U000f1a49",
-    "language-c": "\U000f0671",
-    "language-cpp": "\U000f0672",
-    "language-csharp": "\U000f031b",
-    "language-css3": "\U000f031c",
-    "language-fortran": "\U000f121a",
-    "language-go": "\U000f07d3",
-    "language-haskell": "\U000f0c92",
-    "language-html5": "\U000f031d",
-    "language-java": "\U000f0b37",
-    "language-javascript": "\U000f031e",
-    "language-kotlin": "\U000f1219",
-    "language-lua": "\U000f08b1",
-    "language-markdown": "\U000f0354",
-    "language-markdown-outline": "\U000f0f5b",
-    "language-php": "\U000f031f",
-    "language-python": "\U000f0320",
-    "language-r": "\U000f07d4",
-    "language-ruby": "\U000f0d2d",
-    "language-ruby-on-rails": "\U000f0acf",
-    "language-rust": "\U000f1617",
-    "language-swift": "\U000f06e5",
-    "language-typescript": "\U000f06e6",
-    "language-xaml": "\U000f0673",
-    "laptop": "\U000f0322",
-    "laptop-account": "\U000f1a4a",
-    "laptop-off": "\U000f06e7",
-    "laravel": "\U000f0ad0",
-    "laser-pointer": "\U000f1484",
-    "lasso": "\U000f0f03",
-    "lastpass": "\U000f0446",
-    "latitude": "\U000f0f57",
-    "launch": "\U000f0327",
-    "lava-lamp": "\U000f07d5",
-    "layers": "\U000f0328",
-    "layers-edit": "\U000f1892",
-    "layers-minus": "\U000f0e4c",
-    "layers-off": "\U000f0329",
-    "layers-off-outline": "\U000f09fd",
-    "layers-outline": "\U000f09fe",
-    "layers-plus": "\U000f0e4d",
-    "layers-remove": "\U000f0e4e",
-    "layers-search": "\U000f1206",
-    "layers-search-outline": "\U000f1207",
-    "layers-triple": "\U000f0f58",
-    "layers-triple-outline": "\U000f0f59",
-    "lead-pencil": "\U000f064f",
-    "leaf": "\U000f032a",
-    "leaf-circle": "\U000f1905",
-    "leaf-circle-outline": "\U000f1906",
-    "leaf-maple": "\U000f0c93",
-    "leaf-maple-off": "\U000f12da",
-    "leaf-off": "\U000f12d9",
-    "leak": "\U000f0dd7",
-    "leak-off": "\U000f0dd8",
-    "lectern": "\U000f1af0",
-    "led-off": "\U000f032b",
-    "led-on": "\U000f032c",
-    "led-outline": "\U000f032d",
-    "led-strip": "\U000f07d6",
-    "led-strip-variant": "\U000f1051",
-    "led-strip-variant-off": "\U000f1a4b",
-    "led-variant-off": "\U000f032e",
-    "led-variant-on": "\U000f032f",
-    "led-variant-outline": "\U000f0330",
-    "leek": "\U000f117d",
-    "less-than": "\U000f097c",
-    "less-than-or-equal": "\U000f097d",
-    "library": "\U000f0331",
-    "library-outline": "\U000f1a22",
-    "library-shelves": "\U000f0ba9",
-    "license": "\U000f0fc3",
-    "lifebuoy": "\U000f087e",
-    "light-flood-down": "\U000f1987",
-    "light-flood-up": "\U000f1988",
-    "light-recessed": "\U000f179b",
-    "light-switch": "\U000f097e",
-    "light-switch-off": "\U000f1a24",
-    "lightbulb": "\U000f0335",
-    "lightbulb-alert": "\U000f19e1",
-    "lightbulb-alert-outline": "\U000f19e2",
-    "lightbulb-auto": "\U000f1800",
-    "lightbulb-auto-outline": "\U000f1801",
-    "lightbulb-cfl": "\U000f1208",
-    "lightbulb-cfl-off": "\U000f1209",
-    "lightbulb-cfl-spiral": "\U000f1275",
-    "lightbulb-cfl-spiral-off": "\U000f12c3",
-    "lightbulb-fluorescent-tube": "\U000f1804",
-    "lightbulb-fluorescent-tube-outline": "\U000f1805",
-    "lightbulb-group": "\U000f1253",
-    "lightbulb-group-off": "\U000f12cd",
-    "lightbulb-group-off-outline": "\U000f12ce",
-    "lightbulb-group-outline": "\U000f1254",
-    "lightbulb-multiple": "\U000f1255",
-    "lightbulb-multiple-off": "\U000f12cf",
-    "lightbulb-multiple-off-outline": "\U000f12d0",
-    "lightbulb-multiple-outline": "\U000f1256",
-    "lightbulb-night": "\U000f1a4c",
-    "lightbulb-night-outline": "\U000f1a4d",
-    "lightbulb-off": "\U000f0e4f",
-    "lightbulb-off-outline": "\U000f0e50",
-    "lightbulb-on": "\U000f06e8",
-    "lightbulb-on-10": "\U000f1a4e",
-    "lightbulb-on-20": "\U000f1a4f",
-    "lightbulb-on-30": "\U000f1a50",
-    "lightbulb-on-40": "\U000f1a51",
-    "lightbulb-on-50": "\U000f1a52",
-    "lightbulb-on-60": "\U000f1a53",
-    "lightbulb-on-70": "\U000f1a54",
-    "lightbulb-on-80": "\U000f1a55",
-    "lightbulb-on-90": "\U000f1a56",
-    "lightbulb-on-outline": "\U000f06e9",
-    "lightbulb-outline": "\U000f0336",
-    "lightbulb-question": "\U000f19e3",
-    "lightbulb-question-outline": "\U000f19e4",
-    "lightbulb-spot": "\U000f17f4",
-    "lightbulb-spot-off": "\U000f17f5",
-    "lightbulb-variant": "\U000f1802",
-    "lightbulb-variant-outline": "\U000f1803",
-    "lighthouse": "\U000f09ff",
-    "lighthouse-on": "\U000f0a00",
-    "lightning-bolt": "\U000f140b",
-    "lightning-bolt-circle": "\U000f0820",
-    "lightning-bolt-outline": "\U000f140c",
-    "line-scan": "\U000f0624",
-    "lingerie": "\U000f1476",
-    "link": "\U000f0337",
-    "link-box": "\U000f0d1a",
-    "link-box-outline": "\U000f0d1b",
-    "link-box-variant": "\U000f0d1c",
-    "link-box-variant-outline": "\U000f0d1d",
-    "link-circle": "\U000f1cac",
-    "link-circle-outline": "\U000f1cad",
-    "link-edit": "\U000f1cae",
-    "link-lock": "\U000f10ba",
-    "link-off": "\U000f0338",
-    "link-plus": "\U000f0c94",
-    "link-variant": "\U000f0339",
-    "link-variant-minus": "\U000f10ff",
-    "link-variant-off": "\U000f033a",
-    "link-variant-plus": "\U000f1100",
-    "link-variant-remove": "\U000f1101",
-    "linkedin": "\U000f033b",
-    "linux": "\U000f033d",
-    "linux-mint": "\U000f08ed",
-    "lipstick": "\U000f13b5",
-    "liquid-spot": "\U000f1826",
-    "liquor": "\U000f191e",
-    "list-box": "\U000f1b7b",
-    "list-box-outline": "\U000f1b7c",
-    "list-status": "\U000f15ab",
-    "litecoin": "\U000f0a61",
-    "loading": "\U000f0772",
-    "location-enter": "\U000f0fc4",
-    "location-exit": "\U000f0fc5",
-    "lock": "\U000f033e",
-    "lock-alert": "\U000f08ee",
-    "lock-alert-outline": "\U000f15d1",
-    "lock-check": "\U000f139a",
-    "lock-check-outline": "\U000f16a8",
-    "lock-clock": "\U000f097f",
-    "lock-minus": "\U000f16a9",
-    "lock-minus-outline": "\U000f16aa",
-    "lock-off": "\U000f1671",
-    "lock-off-outline": "\U000f1672",
-    "lock-open": "\U000f033f",
-    "lock-open-alert": "\U000f139b",
-    "lock-open-alert-outline": "\U000f15d2",
-    "lock-open-check": "\U000f139c",
-    "lock-open-check-outline": "\U000f16ab",
-    "lock-open-minus": "\U000f16ac",
-    "lock-open-minus-outline": "\U000f16ad",
-    "lock-open-outline": "\U000f0340",
-    "lock-open-plus": "\U000f16ae",
-    "lock-open-plus-outline": "\U000f16af",
-    "lock-open-remove": "\U000f16b0",
-    "lock-open-remove-outline": "\U000f16b1",
-    "lock-open-variant": "\U000f0fc6",
-    "lock-open-variant-outline": "\U000f0fc7",
-    "lock-outline": "\U000f0341",
-    "lock-pattern": "\U000f06ea",
-    "lock-percent": "\U000f1c12",
-    "lock-percent-open": "\U000f1c13",
-    "lock-percent-open-outline": "\U000f1c14",
-    "lock-percent-open-variant": "\U000f1c15",
-    "lock-percent-open-variant-outline": "\U000f1c16",
-    "lock-percent-outline": "\U000f1c17",
-    "lock-plus": "\U000f05fb",
-    "lock-plus-outline": "\U000f16b2",
-    "lock-question": "\U000f08ef",
-    "lock-remove": "\U000f16b3",
-    "lock-remove-outline": "\U000f16b4",
-    "lock-reset": "\U000f0773",
-    "lock-smart": "\U000f08b2",
-    "locker": "\U000f07d7",
-    "locker-multiple": "\U000f07d8",
-    "login": "\U000f0342",
-    "login-variant": "\U000f05fc",
-    "logout": "\U000f0343",
-    "logout-variant": "\U000f05fd",
-    "longitude": "\U000f0f5a",
-    "looks": "\U000f0344",
-    "lotion": "\U000f1582",
-    "lotion-outline": "\U000f1583",
-    "lotion-plus": "\U000f1584",
-    "lotion-plus-outline": "\U000f1585",
-    "loupe": "\U000f0345",
-    "lumx": "\U000f0346",
-    "lungs": "\U000f1084",
-    "mace": "\U000f1843",
-    "magazine-pistol": "\U000f0324",
-    "magazine-rifle": "\U000f0323",
-    "magic-staff": "\U000f1844",
-    "magnet": "\U000f0347",
-    "magnet-on": "\U000f0348",
-    "magnify": "\U000f0349",
-    "magnify-close": "\U000f0980",
-    "magnify-expand": "\U000f1874",
-    "magnify-minus": "\U000f034a",
-    "magnify-minus-cursor": "\U000f0a62",
-    "magnify-minus-outline": "\U000f06ec",
-    "magnify-plus": "\U000f034b",
-    "magnify-plus-cursor": "\U000f0a63",
-    "magnify-plus-outline": "\U000f06ed",
-    "magnify-remove-cursor": "\U000f120c",
-    "magnify-remove-outline": "\U000f120d",
-    "magnify-scan": "\U000f1276",
-    "mail": "\U000f0ebb",
-    "mailbox": "\U000f06ee",
-    "mailbox-open": "\U000f0d88",
-    "mailbox-open-outline": "\U000f0d89",
-    "mailbox-open-up": "\U000f0d8a",
-    "mailbox-open-up-outline": "\U000f0d8b",
-    "mailbox-outline": "\U000f0d8c",
-    "mailbox-up": "\U000f0d8d",
-    "mailbox-up-outline": "\U000f0d8e",
-    "manjaro": "\U000f160a",
-    "map": "\U000f034d",
-    "map-check": "\U000f0ebc",
-    "map-check-outline": "\U000f0ebd",
-    "map-clock": "\U000f0d1e",
-    "map-clock-outline": "\U000f0d1f",
-    "map-legend": "\U000f0a01",
-    "map-marker": "\U000f034e",
-    "map-marker-account": "\U000f18e3",
-    "map-marker-account-outline": "\U000f18e4",
-    "map-marker-alert": "\U000f0f05",
-    "map-marker-alert-outline": "\U000f0f06",
-    "map-marker-check": "\U000f0c95",
-    "map-marker-check-outline": "\U000f12fb",
-    "map-marker-circle": "\U000f034f",
-    "map-marker-distance": "\U000f08f0",
-    "map-marker-down": "\U000f1102",
-    "map-marker-left": "\U000f12db",
-    "map-marker-left-outline": "\U000f12dd",
-    "map-marker-minus": "\U000f0650",
-    "map-marker-minus-outline": "\U000f12f9",
-    "map-marker-multiple": "\U000f0350",
-    "map-marker-multiple-outline": "\U000f1277",
-    "map-marker-off": "\U000f0351",
-    "map-marker-off-outline": "\U000f12fd",
-    "map-marker-outline": "\U000f07d9",
-    "map-marker-path": "\U000f0d20",
-    "map-marker-plus": "\U000f0651",
-    "map-marker-plus-outline": "\U000f12f8",
-    "map-marker-question": "\U000f0f07",
-    "map-marker-question-outline": "\U000f0f08",
-    "map-marker-radius": "\U000f0352",
-    "map-marker-radius-outline": "\U000f12fc",
-    "map-marker-remove": "\U000f0f09",
-    "map-marker-remove-outline": "\U000f12fa",
-    "map-marker-remove-variant": "\U000f0f0a",
-    "map-marker-right": "\U000f12dc",
-    "map-marker-right-outline": "\U000f12de",
-    "map-marker-star": "\U000f1608",
-    "map-marker-star-outline": "\U000f1609",
-    "map-marker-up": "\U000f1103",
-    "map-minus": "\U000f0981",
-    "map-outline": "\U000f0982",
-    "map-plus": "\U000f0983",
-    "map-search": "\U000f0984",
-    "map-search-outline": "\U000f0985",
-    "mapbox": "\U000f0baa",
-    "margin": "\U000f0353",
-    "marker": "\U000f0652",
-    "marker-cancel": "\U000f0dd9",
-    "marker-check": "\U000f0355",
-    "mastodon": "\U000f0ad1",
-    "material-design": "\U000f0986",
-    "material-ui": "\U000f0357",
-    "math-compass": "\U000f0358",
-    "math-cos": "\U000f0c96",
-    "math-integral": "\U000f0fc8",
-    "math-integral-box": "\U000f0fc9",
-    "math-log": "\U000f1085",
-    "math-norm": "\U000f0fca",
-    "math-norm-box": "\U000f0fcb",
-    "math-sin": "\U000f0c97",
-    "math-tan": "\U000f0c98",
-    "matrix": "\U000f0628",
-    "medal": "\U000f0987",
-    "medal-outline": "\U000f1326",
-    "medical-bag": "\U000f06ef",
-    "medical-cotton-swab": "\U000f1ab8",
-    "medication": "\U000f1b14",
-    "medication-outline": "\U000f1b15",
-    "meditation": "\U000f117b",
-    "memory": "\U000f035b",
-    "memory-arrow-down": "\U000f1ca6",
-    "menorah": "\U000f17d4",
-    "menorah-fire": "\U000f17d5",
-    "menu": "\U000f035c",
-    "menu-close": "\U000f1c90",
-    "menu-down": "\U000f035d",
-    "menu-down-outline": "\U000f06b6",
-    "menu-left": "\U000f035e",
-    "menu-left-outline": "\U000f0a02",
-    "menu-open": "\U000f0bab",
-    "menu-right": "\U000f035f",
-    "menu-right-outline": "\U000f0a03",
-    "menu-swap": "\U000f0a64",
-    "menu-swap-outline": "\U000f0a65",
-    "menu-up": "\U000f0360",
-    "menu-up-outline": "\U000f06b7",
-    "merge": "\U000f0f5c",
-    "message": "\U000f0361",
-    "message-alert": "\U000f0362",
-    "message-alert-outline": "\U000f0a04",
-    "message-arrow-left": "\U000f12f2",
-    "message-arrow-left-outline": "\U000f12f3",
-    "message-arrow-right": "\U000f12f4",
-    "message-arrow-right-outline": "\U000f12f5",
-    "message-badge": "\U000f1941",
-    "message-badge-outline": "\U000f1942",
-    "message-bookmark": "\U000f15ac",
-    "message-bookmark-outline": "\U000f15ad",
-    "message-bulleted": "\U000f06a2",
-    "message-bulleted-off": "\U000f06a3",
-    "message-check": "\U000f1b8a",
-    "message-check-outline": "\U000f1b8b",
-    "message-cog": "\U000f06f1",
-    "message-cog-outline": "\U000f1172",
-    "message-draw": "\U000f0363",
-    "message-fast": "\U000f19cc",
-    "message-fast-outline": "\U000f19cd",
-    "message-flash": "\U000f15a9",
-    "message-flash-outline": "\U000f15aa",
-    "message-image": "\U000f0364",
-    "message-image-outline": "\U000f116c",
-    "message-lock": "\U000f0fcc",
-    "message-lock-outline": "\U000f116d",
-    "message-minus": "\U000f116e",
-    "message-minus-outline": "\U000f116f",
-    "message-off": "\U000f164d",
-    "message-off-outline": "\U000f164e",
-    "message-outline": "\U000f0365",
-    "message-plus": "\U000f0653",
-    "message-plus-outline": "\U000f10bb",
-    "message-processing": "\U000f0366",
-    "message-processing-outline": "\U000f1170",
-    "message-question": "\U000f173a",
-    "message-question-outline": "\U000f173b",
-    "message-reply": "\U000f0367",
-    "message-reply-outline": "\U000f173d",
-    "message-reply-text": "\U000f0368",
-    "message-reply-text-outline": "\U000f173e",
-    "message-settings": "\U000f06f0",
-    "message-settings-outline": "\U000f1171",
-    "message-star": "\U000f069a",
-    "message-star-outline": "\U000f1250",
-    "message-text": "\U000f0369",
-    "message-text-clock": "\U000f1173",
-    "message-text-clock-outline": "\U000f1174",
-    "message-text-fast": "\U000f19ce",
-    "message-text-fast-outline": "\U000f19cf",
-    "message-text-lock": "\U000f0fcd",
-    "message-text-lock-outline": "\U000f1175",
-    "message-text-outline": "\U000f036a",
-    "message-video": "\U000f036b",
-    "meteor": "\U000f0629",
-    "meter-electric": "\U000f1a57",
-    "meter-electric-outline": "\U000f1a58",
-    "meter-gas": "\U000f1a59",
-    "meter-gas-outline": "\U000f1a5a",
-    "metronome": "\U000f07da",
-    "metronome-tick": "\U000f07db",
-    "micro-sd": "\U000f07dc",
-    "microphone": "\U000f036c",
-    "microphone-message": "\U000f050a",
-    "microphone-message-off": "\U000f050b",
-    "microphone-minus": "\U000f08b3",
-    "microphone-off": "\U000f036d",
-    "microphone-outline": "\U000f036e",
-    "microphone-plus": "\U000f08b4",
-    "microphone-question": "\U000f1989",
-    "microphone-question-outline": "\U000f198a",
-    "microphone-settings": "\U000f036f",
-    "microphone-variant": "\U000f0370",
-    "microphone-variant-off": "\U000f0371",
-    "microscope": "\U000f0654",
-    "microsoft": "\U000f0372",
-    "microsoft-access": "\U000f138e",
-    "microsoft-azure": "\U000f0805",
-    "microsoft-azure-devops": "\U000f0fd5",
-    "microsoft-bing": "\U000f00a4",
-    "microsoft-dynamics-365": "\U000f0988",
-    "microsoft-edge": "\U000f01e9",
-    "microsoft-excel": "\U000f138f",
-    "microsoft-internet-explorer": "\U000f0300",
-    "microsoft-office": "\U000f03c6",
-    "microsoft-onedrive": "\U000f03ca",
-    "microsoft-onenote": "\U000f0747",
-    "microsoft-outlook": "\U000f0d22",
-    "microsoft-powerpoint": "\U000f1390",
-    "microsoft-sharepoint": "\U000f1391",
-    "microsoft-teams": "\U000f02bb",
-    "microsoft-visual-studio": "\U000f0610",
-    "microsoft-visual-studio-code": "\U000f0a1e",
-    "microsoft-windows": "\U000f05b3",
-    "microsoft-windows-classic": "\U000f0a21",
-    "microsoft-word": "\U000f1392",
-    "microsoft-xbox": "\U000f05b9",
-    "microsoft-xbox-controller": "\U000f05ba",
-    "microsoft-xbox-controller-battery-alert": "\U000f074b",
-    "microsoft-xbox-controller-battery-charging": "\U000f0a22",
-    "microsoft-xbox-controller-battery-empty": "\U000f074c",
-    "microsoft-xbox-controller-battery-full": "\U000f074d",
-    "microsoft-xbox-controller-battery-low": "\U000f074e",
-    "microsoft-xbox-controller-battery-medium": "\U000f074f",
-    "microsoft-xbox-controller-battery-unknown": "\U000f0750",
-    "microsoft-xbox-controller-menu": "\U000f0e6f",
-    "microsoft-xbox-controller-off": "\U000f05bb",
-    "microsoft-xbox-controller-view": "\U000f0e70",
-    "microwave": "\U000f0c99",
-    "microwave-off": "\U000f1423",
-    "middleware": "\U000f0f5d",
-    "middleware-outline": "\U000f0f5e",
-    "midi": "\U000f08f1",
-    "midi-port": "\U000f08f2",
-    "mine": "\U000f0dda",
-    "minecraft": "\U000f0373",
-    "mini-sd": "\U000f0a05",
-    "minidisc": "\U000f0a06",
-    "minus": "\U000f0374",
-    "minus-box": "\U000f0375",
-    "minus-box-multiple": "\U000f1141",
-    "minus-box-multiple-outline": "\U000f1142",
-    "minus-box-outline": "\U000f06f2",
-    "minus-circle": "\U000f0376",
-    "minus-circle-multiple": "\U000f035a",
-    "minus-circle-multiple-outline": "\U000f0ad3",
-    "minus-circle-off": "\U000f1459",
-    "minus-circle-off-outline": "\U000f145a",
-    "minus-circle-outline": "\U000f0377",
-    "minus-network": "\U000f0378",
-    "minus-network-outline": "\U000f0c9a",
-    "minus-thick": "\U000f1639",
-    "mirror": "\U000f11fd",
-    "mirror-rectangle": "\U000f179f",
-    "mirror-variant": "\U000f17a0",
-    "mixed-martial-arts": "\U000f0d8f",
-    "mixed-reality": "\U000f087f",
-    "molecule": "\U000f0bac",
-    "molecule-co": "\U000f12fe",
-    "molecule-co2": "\U000f07e4",
-    "monitor": "\U000f0379",
-    "monitor-account": "\U000f1a5b",
-    "monitor-arrow-down": "\U000f19d0",
-    "monitor-arrow-down-variant": "\U000f19d1",
-    "monitor-cellphone": "\U000f0989",
-    "monitor-cellphone-star": "\U000f098a",
-    "monitor-dashboard": "\U000f0a07",
-    "monitor-edit": "\U000f12c6",
-    "monitor-eye": "\U000f13b4",
-    "monitor-lock": "\U000f0ddb",
-    "monitor-multiple": "\U000f037a",
-    "monitor-off": "\U000f0d90",
-    "monitor-screenshot": "\U000f0e51",
-    "monitor-share": "\U000f1483",
-    "monitor-shimmer": "\U000f1104",
-    "monitor-small": "\U000f1876",
-    "monitor-speaker": "\U000f0f5f",
-    "monitor-speaker-off": "\U000f0f60",
-    "monitor-star": "\U000f0ddc",
-    "monitor-vertical": "\U000f1c33",
-    "moon-first-quarter": "\U000f0f61",
-    "moon-full": "\U000f0f62",
-    "moon-last-quarter": "\U000f0f63",
-    "moon-new": "\U000f0f64",
-    "moon-waning-crescent": "\U000f0f65",
-    "moon-waning-gibbous": "\U000f0f66",
-    "moon-waxing-crescent": "\U000f0f67",
-    "moon-waxing-gibbous": "\U000f0f68",
-    "moped": "\U000f1086",
-    "moped-electric": "\U000f15b7",
-    "moped-electric-outline": "\U000f15b8",
-    "moped-outline": "\U000f15b9",
-    "more": "\U000f037b",
-    "mortar-pestle": "\U000f1748",
-    "mortar-pestle-plus": "\U000f03f1",
-    "mosque": "\U000f0d45",
-    "mosque-outline": "\U000f1827",
-    "mother-heart": "\U000f1314",
-    "mother-nurse": "\U000f0d21",
-    "motion": "\U000f15b2",
-    "motion-outline": "\U000f15b3",
-    "motion-pause": "\U000f1590",
-    "motion-pause-outline": "\U000f1592",
-    "motion-play": "\U000f158f",
-    "motion-play-outline": "\U000f1591",
-    "motion-sensor": "\U000f0d91",
-    "motion-sensor-off": "\U000f1435",
-    "motorbike": "\U000f037c",
-    "motorbike-electric": "\U000f15ba",
-    "motorbike-off": "\U000f1b16",
-    "mouse": "\U000f037d",
-    "mouse-bluetooth": "\U000f098b",
-    "mouse-left-click": "\U000f1d07",
-    "mouse-left-click-outline": "\U000f1d08",
-    "mouse-move-down": "\U000f1550",
-    "mouse-move-up": "\U000f1551",
-    "mouse-move-vertical": "\U000f1552",
-    "mouse-off": "\U000f037e",
-    "mouse-outline": "\U000f1d09",
-    "mouse-right-click": "\U000f1d0a",
-    "mouse-right-click-outline": "\U000f1d0b",
-    "mouse-scroll-wheel": "\U000f1d0c",
-    "mouse-variant": "\U000f037f",
-    "mouse-variant-off": "\U000f0380",
-    "move-resize": "\U000f0655",
-    "move-resize-variant": "\U000f0656",
-    "movie": "\U000f0381",
-    "movie-check": "\U000f16f3",
-    "movie-check-outline": "\U000f16f4",
-    "movie-cog": "\U000f16f5",
-    "movie-cog-outline": "\U000f16f6",
-    "movie-edit": "\U000f1122",
-    "movie-edit-outline": "\U000f1123",
-    "movie-filter": "\U000f1124",
-    "movie-filter-outline": "\U000f1125",
-    "movie-minus": "\U000f16f7",
-    "movie-minus-outline": "\U000f16f8",
-    "movie-off": "\U000f16f9",
-    "movie-off-outline": "\U000f16fa",
-    "movie-open": "\U000f0fce",
-    "movie-open-check": "\U000f16fb",
-    "movie-open-check-outline": "\U000f16fc",
-    "movie-open-cog": "\U000f16fd",
-    "movie-open-cog-outline": "\U000f16fe",
-    "movie-open-edit": "\U000f16ff",
-    "movie-open-edit-outline": "\U000f1700",
-    "movie-open-minus": "\U000f1701",
-    "movie-open-minus-outline": "\U000f1702",
-    "movie-open-off": "\U000f1703",
-    "movie-open-off-outline": "\U000f1704",
-    "movie-open-outline": "\U000f0fcf",
-    "movie-open-play": "\U000f1705",
-    "movie-open-play-outline": "\U000f1706",
-    "movie-open-plus": "\U000f1707",
-    "movie-open-plus-outline": "\U000f1708",
-    "movie-open-remove": "\U000f1709",
-    "movie-open-remove-outline": "\U000f170a",
-    "movie-open-settings": "\U000f170b",
-    "movie-open-settings-outline": "\U000f170c",
-    "movie-open-star": "\U000f170d",
-    "movie-open-star-outline": "\U000f170e",
-    "movie-outline": "\U000f0ddd",
-    "movie-play": "\U000f170f",
-    "movie-play-outline": "\U000f1710",
-    "movie-plus": "\U000f1711",
-    "movie-plus-outline": "\U000f1712",
-    "movie-remove": "\U000f1713",
-    "movie-remove-outline": "\U000f1714",
-    "movie-roll": "\U000f07de",
-    "movie-search": "\U000f11d2",
-    "movie-search-outline": "\U000f11d3",
-    "movie-settings": "\U000f1715",
-    "movie-settings-outline": "\U000f1716",
-    "movie-star": "\U000f1717",
-    "movie-star-outline": "\U000f1718",
-    "mower": "\U000f166f",
-    "mower-bag": "\U000f1670",
-    "mower-bag-on": "\U000f1b60",
-    "mower-on": "\U000f1b5f",
-    "muffin": "\U000f098c",
-    "multicast": "\U000f1893",
-    "multimedia": "\U000f1b97",
-    "multiplication": "\U000f0382",
-    "multiplication-box": "\U000f0383",
-    "mushroom": "\U000f07df",
-    "mushroom-off": "\U000f13fa",
-    "mushroom-off-outline": "\U000f13fb",
-    "mushroom-outline": "\U000f07e0",
-    "music": "\U000f075a",
-    "music-accidental-double-flat": "\U000f0f69",
-    "music-accidental-double-sharp": "\U000f0f6a",
-    "music-accidental-flat": "\U000f0f6b",
-    "music-accidental-natural": "\U000f0f6c",
-    "music-accidental-sharp": "\U000f0f6d",
-    "music-box": "\U000f0384",
-    "music-box-multiple": "\U000f0333",
-    "music-box-multiple-outline": "\U000f0f04",
-    "music-box-outline": "\U000f0385",
-    "music-circle": "\U000f0386",
-    "music-circle-outline": "\U000f0ad4",
-    "music-clef-alto": "\U000f0f6e",
-    "music-clef-bass": "\U000f0f6f",
-    "music-clef-treble": "\U000f0f70",
-    "music-note": "\U000f0387",
-    "music-note-bluetooth": "\U000f05fe",
-    "music-note-bluetooth-off": "\U000f05ff",
-    "music-note-eighth": "\U000f0388",
-    "music-note-eighth-dotted": "\U000f0f71",
-    "music-note-half": "\U000f0389",
-    "music-note-half-dotted": "\U000f0f72",
-    "music-note-minus": "\U000f1b89",
-    "music-note-off": "\U000f038a",
-    "music-note-off-outline": "\U000f0f73",
-    "music-note-outline": "\U000f0f74",
-    "music-note-plus": "\U000f0dde",
-    "music-note-quarter": "\U000f038b",
-    "music-note-quarter-dotted": "\U000f0f75",
-    "music-note-sixteenth": "\U000f038c",
-    "music-note-sixteenth-dotted": "\U000f0f76",
-    "music-note-whole": "\U000f038d",
-    "music-note-whole-dotted": "\U000f0f77",
-    "music-off": "\U000f075b",
-    "music-rest-eighth": "\U000f0f78",
-    "music-rest-half": "\U000f0f79",
-    "music-rest-quarter": "\U000f0f7a",
-    "music-rest-sixteenth": "\U000f0f7b",
-    "music-rest-whole": "\U000f0f7c",
-    "mustache": "\U000f15de",
-    "nail": "\U000f0ddf",
-    "nas": "\U000f08f3",
-    "nativescript": "\U000f0880",
-    "nature": "\U000f038e",
-    "nature-outline": "\U000f1c71",
-    "nature-people": "\U000f038f",
-    "nature-people-outline": "\U000f1c72",
-    "navigation": "\U000f0390",
-    "navigation-outline": "\U000f1607",
-    "navigation-variant": "\U000f18f0",
-    "navigation-variant-outline": "\U000f18f1",
-    "near-me": "\U000f05cd",
-    "necklace": "\U000f0f0b",
-    "needle": "\U000f0391",
-    "needle-off": "\U000f19d2",
-    "netflix": "\U000f0746",
-    "network": "\U000f06f3",
-    "network-off": "\U000f0c9b",
-    "network-off-outline": "\U000f0c9c",
-    "network-outline": "\U000f0c9d",
-    "network-pos": "\U000f1acb",
-    "network-strength-1": "\U000f08f4",
-    "network-strength-1-alert": "\U000f08f5",
-    "network-strength-2": "\U000f08f6",
-    "network-strength-2-alert": "\U000f08f7",
-    "network-strength-3": "\U000f08f8",
-    "network-strength-3-alert": "\U000f08f9",
-    "network-strength-4": "\U000f08fa",
-    "network-strength-4-alert": "\U000f08fb",
-    "network-strength-4-cog": "\U000f191a",
-    "network-strength-off": "\U000f08fc",
-    "network-strength-off-outline": "\U000f08fd",
-    "network-strength-outline": "\U000f08fe",
-    "new-box": "\U000f0394",
-    "newspaper": "\U000f0395",
-    "newspaper-check": "\U000f1943",
-    "newspaper-minus": "\U000f0f0c",
-    "newspaper-plus": "\U000f0f0d",
-    "newspaper-remove": "\U000f1944",
-    "newspaper-variant": "\U000f1001",
-    "newspaper-variant-multiple": "\U000f1002",
-    "newspaper-variant-multiple-outline": "\U000f1003",
-    "newspaper-variant-outline": "\U000f1004",
-    "nfc": "\U000f0396",
-    "nfc-search-variant": "\U000f0e53",
-    "nfc-tap": "\U000f0397",
-    "nfc-variant": "\U000f0398",
-    "nfc-variant-off": "\U000f0e54",
-    "ninja": "\U000f0774",
-    "nintendo-game-boy": "\U000f1393",
-    "nintendo-switch": "\U000f07e1",
-    "nintendo-wii": "\U000f05ab",
-    "nintendo-wiiu": "\U000f072d",
-    "nix": "\U000f1105",
-    "nodejs": "\U000f0399",
-    "noodles": "\U000f117e",
-    "not-equal": "\U000f098d",
-    "not-equal-variant": "\U000f098e",
-    "note": "\U000f039a",
-    "note-alert": "\U000f177d",
-    "note-alert-outline": "\U000f177e",
-    "note-check": "\U000f177f",
-    "note-check-outline": "\U000f1780",
-    "note-edit": "\U000f1781",
-    "note-edit-outline": "\U000f1782",
-    "note-minus": "\U000f164f",
-    "note-minus-outline": "\U000f1650",
-    "note-multiple": "\U000f06b8",
-    "note-multiple-outline": "\U000f06b9",
-    "note-off": "\U000f1783",
-    "note-off-outline": "\U000f1784",
-    "note-outline": "\U000f039b",
-    "note-plus": "\U000f039c",
-    "note-plus-outline": "\U000f039d",
-    "note-remove": "\U000f1651",
-    "note-remove-outline": "\U000f1652",
-    "note-search": "\U000f1653",
-    "note-search-outline": "\U000f1654",
-    "note-text": "\U000f039e",
-    "note-text-outline": "\U000f11d7",
-    "notebook": "\U000f082e",
-    "notebook-check": "\U000f14f5",
-    "notebook-check-outline": "\U000f14f6",
-    "notebook-edit": "\U000f14e7",
-    "notebook-edit-outline": "\U000f14e9",
-    "notebook-heart": "\U000f1a0b",
-    "notebook-heart-outline": "\U000f1a0c",
-    "notebook-minus": "\U000f1610",
-    "notebook-minus-outline": "\U000f1611",
-    "notebook-multiple": "\U000f0e55",
-    "notebook-outline": "\U000f0ebf",
-    "notebook-plus": "\U000f1612",
-    "notebook-plus-outline": "\U000f1613",
-    "notebook-remove": "\U000f1614",
-    "notebook-remove-outline": "\U000f1615",
-    "notification-clear-all": "\U000f039f",
-    "npm": "\U000f06f7",
-    "nuke": "\U000f06a4",
-    "null": "\U000f07e2",
-    "numeric": "\U000f03a0",
-    "numeric-0": "\U000f0b39",
-    "numeric-0-box": "\U000f03a1",
-    "numeric-0-box-multiple": "\U000f0f0e",
-    "numeric-0-box-multiple-outline": "\U000f03a2",
-    "numeric-0-box-outline": "\U000f03a3",
-    "numeric-0-circle": "\U000f0c9e",
-    "numeric-0-circle-outline": "\U000f0c9f",
-    "numeric-1": "\U000f0b3a",
-    "numeric-1-box": "\U000f03a4",
-    "numeric-1-box-multiple": "\U000f0f0f",
-    "numeric-1-box-multiple-outline": "\U000f03a5",
-    "numeric-1-box-outline": "\U000f03a6",
-    "numeric-1-circle": "\U000f0ca0",
-    "numeric-1-circle-outline": "\U000f0ca1",
-    "numeric-10": "\U000f0fe9",
-    "numeric-10-box": "\U000f0f7d",
-    "numeric-10-box-multiple": "\U000f0fea",
-    "numeric-10-box-multiple-outline": "\U000f0feb",
-    "numeric-10-box-outline": "\U000f0f7e",
-    "numeric-10-circle": "\U000f0fec",
-    "numeric-10-circle-outline": "\U000f0fed",
-    "numeric-2": "\U000f0b3b",
-    "numeric-2-box": "\U000f03a7",
-    "numeric-2-box-multiple": "\U000f0f10",
-    "numeric-2-box-multiple-outline": "\U000f03a8",
-    "numeric-2-box-outline": "\U000f03a9",
-    "numeric-2-circle": "\U000f0ca2",
-    "numeric-2-circle-outline": "\U000f0ca3",
-    "numeric-3": "\U000f0b3c",
-    "numeric-3-box": "\U000f03aa",
-    "numeric-3-box-multiple": "\U000f0f11",
-    "numeric-3-box-multiple-outline": "\U000f03ab",
-    "numeric-3-box-outline": "\U000f03ac",
-    "numeric-3-circle": "\U000f0ca4",
-    "numeric-3-circle-outline": "\U000f0ca5",
-    "numeric-4": "\U000f0b3d",
-    "numeric-4-box": "\U000f03ad",
-    "numeric-4-box-multiple": "\U000f0f12",
-    "numeric-4-box-multiple-outline": "\U000f03b2",
-    "numeric-4-box-outline": "\U000f03ae",
-    "numeric-4-circle": "\U000f0ca6",
-    "numeric-4-circle-outline": "\U000f0ca7",
-    "numeric-5": "\U000f0b3e",
-    "numeric-5-box": "\U000f03b1",
-    "numeric-5-box-multiple": "\U000f0f13",
-    "numeric-5-box-multiple-outline": "\U000f03af",
-    "numeric-5-box-outline": "\U000f03b0",
-    "numeric-5-circle": "\U000f0ca8",
-    "numeric-5-circle-outline": "\U000f0ca9",
-    "numeric-6": "\U000f0b3f",
-    "numeric-6-box": "\U000f03b3",
-    "numeric-6-box-multiple": "\U000f0f14",
-    "numeric-6-box-multiple-outline": "\U000f03b4",
-    "numeric-6-box-outline": "\U000f03b5",
-    "numeric-6-circle": "\U000f0caa",
-    "numeric-6-circle-outline": "\U000f0cab",
-    "numeric-7": "\U000f0b40",
-    "numeric-7-box": "\U000f03b6",
-    "numeric-7-box-multiple": "\U000f0f15",
-    "numeric-7-box-multiple-outline": "\U000f03b7",
-    "numeric-7-box-outline": "\U000f03b8",
-    "numeric-7-circle": "\U000f0cac",
-    "numeric-7-circle-outline": "\U000f0cad",
-    "numeric-8": "\U000f0b41",
-    "numeric-8-box": "\U000f03b9",
-    "numeric-8-box-multiple": "\U000f0f16",
-    "numeric-8-box-multiple-outline": "\U000f03ba",
-    "numeric-8-box-outline": "\U000f03bb",
-    "numeric-8-circle": "\U000f0cae",
-    "numeric-8-circle-outline": "\U000f0caf",
-    "numeric-9": "\U000f0b42",
-    "numeric-9-box": "\U000f03bc",
-    "numeric-9-box-multiple": "\U000f0f17",
-    "numeric-9-box-multiple-outline": "\U000f03bd",
-    "numeric-9-box-outline": "\U000f03be",
-    "numeric-9-circle": "\U000f0cb0",
-    "numeric-9-circle-outline": "\U000f0cb1",
-    "numeric-9-plus": "\U000f0fee",
-    "numeric-9-plus-box": "\U000f03bf",
-    "numeric-9-plus-box-multiple": "\U000f0f18",
-    "numeric-9-plus-box-multiple-outline": "\U000f03c0",
-    "numeric-9-plus-box-outline": "\U000f03c1",
-    "numeric-9-plus-circle": "\U000f0cb2",
-    "numeric-9-plus-circle-outline": "\U000f0cb3",
-    "numeric-negative-1": "\U000f1052",
-    "numeric-off": "\U000f19d3",
-    "numeric-positive-1": "\U000f15cb",
-    "nut": "\U000f06f8",
-    "nutrition": "\U000f03c2",
-    "nuxt": "\U000f1106",
-    "oar": "\U000f067c",
-    "ocarina": "\U000f0de0",
-    "oci": "\U000f12e9",
-    "ocr": "\U000f113a",
-    "octagon": "\U000f03c3",
-    "octagon-outline": "\U000f03c4",
-    "octagram": "\U000f06f9",
-    "octagram-edit": "\U000f1c34",
-    "octagram-edit-outline": "\U000f1c35",
-    "octagram-minus": "\U000f1c36",
-    "octagram-minus-outline": "\U000f1c37",
-    "octagram-outline": "\U000f0775",
-    "octagram-plus": "\U000f1c38",
-    "octagram-plus-outline": "\U000f1c39",
-    "octahedron": "\U000f1950",
-    "octahedron-off": "\U000f1951",
-    "odnoklassniki": "\U000f03c5",
-    "offer": "\U000f121b",
-    "office-building": "\U000f0991",
-    "office-building-cog": "\U000f1949",
-    "office-building-cog-outline": "\U000f194a",
-    "office-building-marker": "\U000f1520",
-    "office-building-marker-outline": "\U000f1521",
-    "office-building-minus": "\U000f1baa",
-    "office-building-minus-outline": "\U000f1bab",
-    "office-building-outline": "\U000f151f",
-    "office-building-plus": "\U000f1ba8",
-    "office-building-plus-outline": "\U000f1ba9",
-    "office-building-remove": "\U000f1bac",
-    "office-building-remove-outline": "\U000f1bad",
-    "oil": "\U000f03c7",
-    "oil-lamp": "\U000f0f19",
-    "oil-level": "\U000f1053",
-    "oil-temperature": "\U000f0ff8",
-    "om": "\U000f0973",
-    "omega": "\U000f03c9",
-    "one-up": "\U000f0bad",
-    "onepassword": "\U000f0881",
-    "opacity": "\U000f05cc",
-    "open-in-app": "\U000f03cb",
-    "open-in-new": "\U000f03cc",
-    "open-source-initiative": "\U000f0bae",
-    "openid": "\U000f03cd",
-    "opera": "\U000f03ce",
-    "orbit": "\U000f0018",
-    "orbit-variant": "\U000f15db",
-    "order-alphabetical-ascending": "\U000f020d",
-    "order-alphabetical-descending": "\U000f0d07",
-    "order-bool-ascending": "\U000f02be",
-    "order-bool-ascending-variant": "\U000f098f",
-    "order-bool-descending": "\U000f1384",
-    "order-bool-descending-variant": "\U000f0990",
-    "order-numeric-ascending": "\U000f0545",
-    "order-numeric-descending": "\U000f0546",
-    "origin": "\U000f0b43",
-    "ornament": "\U000f03cf",
-    "ornament-variant": "\U000f03d0",
-    "outdoor-lamp": "\U000f1054",
-    "overscan": "\U000f1005",
-    "owl": "\U000f03d2",
-    "pac-man": "\U000f0baf",
-    "package": "\U000f03d3",
-    "package-check": "\U000f1b51",
-    "package-down": "\U000f03d4",
-    "package-up": "\U000f03d5",
-    "package-variant": "\U000f03d6",
-    "package-variant-closed": "\U000f03d7",
-    "package-variant-closed-check": "\U000f1b52",
-    "package-variant-closed-minus": "\U000f19d4",
-    "package-variant-closed-plus": "\U000f19d5",
-    "package-variant-closed-remove": "\U000f19d6",
-    "package-variant-minus": "\U000f19d7",
-    "package-variant-plus": "\U000f19d8",
-    "package-variant-remove": "\U000f19d9",
-    "page-first": "\U000f0600",
-    "page-last": "\U000f0601",
-    "page-layout-body": "\U000f06fa",
-    "page-layout-footer": "\U000f06fb",
-    "page-layout-header": "\U000f06fc",
-    "page-layout-header-footer": "\U000f0f7f",
-    "page-layout-sidebar-left": "\U000f06fd",
-    "page-layout-sidebar-right": "\U000f06fe",
-    "page-next": "\U000f0bb0",
-    "page-next-outline": "\U000f0bb1",
-    "page-previous": "\U000f0bb2",
-    "page-previous-outline": "\U000f0bb3",
-    "pail": "\U000f1417",
-    "pail-minus": "\U000f1437",
-    "pail-minus-outline": "\U000f143c",
-    "pail-off": "\U000f1439",
-    "pail-off-outline": "\U000f143e",
-    "pail-outline": "\U000f143a",
-    "pail-plus": "\U000f1436",
-    "pail-plus-outline": "\U000f143b",
-    "pail-remove": "\U000f1438",
-    "pail-remove-outline": "\U000f143d",
-    "palette": "\U000f03d8",
-    "palette-advanced": "\U000f03d9",
-    "palette-outline": "\U000f0e0c",
-    "palette-swatch": "\U000f08b5",
-    "palette-swatch-outline": "\U000f135c",
-    "palette-swatch-variant": "\U000f195a",
-    "palm-tree": "\U000f1055",
-    "pan": "\U000f0bb4",
-    "pan-bottom-left": "\U000f0bb5",
-    "pan-bottom-right": "\U000f0bb6",
-    "pan-down": "\U000f0bb7",
-    "pan-horizontal": "\U000f0bb8",
-    "pan-left": "\U000f0bb9",
-    "pan-right": "\U000f0bba",
-    "pan-top-left": "\U000f0bbb",
-    "pan-top-right": "\U000f0bbc",
-    "pan-up": "\U000f0bbd",
-    "pan-vertical": "\U000f0bbe",
-    "panda": "\U000f03da",
-    "pandora": "\U000f03db",
-    "panorama": "\U000f03dc",
-    "panorama-fisheye": "\U000f03dd",
-    "panorama-horizontal": "\U000f1928",
-    "panorama-horizontal-outline": "\U000f03de",
-    "panorama-outline": "\U000f198c",
-    "panorama-sphere": "\U000f198d",
-    "panorama-sphere-outline": "\U000f198e",
-    "panorama-variant": "\U000f198f",
-    "panorama-variant-outline": "\U000f1990",
-    "panorama-vertical": "\U000f1929",
-    "panorama-vertical-outline": "\U000f03df",
-    "panorama-wide-angle": "\U000f195f",
-    "panorama-wide-angle-outline": "\U000f03e0",
-    "paper-cut-vertical": "\U000f03e1",
-    "paper-roll": "\U000f1157",
-    "paper-roll-outline": "\U000f1158",
-    "paperclip": "\U000f03e2",
-    "paperclip-check": "\U000f1ac6",
-    "paperclip-lock": "\U000f19da",
-    "paperclip-minus": "\U000f1ac7",
-    "paperclip-off": "\U000f1ac8",
-    "paperclip-plus": "\U000f1ac9",
-    "paperclip-remove": "\U000f1aca",
-    "parachute": "\U000f0cb4",
-    "parachute-outline": "\U000f0cb5",
-    "paragliding": "\U000f1745",
-    "parking": "\U000f03e3",
-    "party-popper": "\U000f1056",
-    "passport": "\U000f07e3",
-    "passport-alert": "\U000f1cb8",
-    "passport-biometric": "\U000f0de1",
-    "passport-cancel": "\U000f1cb9",
-    "passport-check": "\U000f1cba",
-    "passport-minus": "\U000f1cbb",
-    "passport-plus": "\U000f1cbc",
-    "passport-remove": "\U000f1cbd",
-    "pasta": "\U000f1160",
-    "patio-heater": "\U000f0f80",
-    "patreon": "\U000f0882",
-    "pause": "\U000f03e4",
-    "pause-box": "\U000f00bc",
-    "pause-box-outline": "\U000f1b7a",
-    "pause-circle": "\U000f03e5",
-    "pause-circle-outline": "\U000f03e6",
-    "pause-octagon": "\U000f03e7",
-    "pause-octagon-outline": "\U000f03e8",
-    "paw": "\U000f03e9",
-    "paw-off": "\U000f0657",
-    "paw-off-outline": "\U000f1676",
-    "paw-outline": "\U000f1675",
-    "peace": "\U000f0884",
-    "peanut": "\U000f0ffc",
-    "peanut-off": "\U000f0ffd",
-    "peanut-off-outline": "\U000f0fff",
-    "peanut-outline": "\U000f0ffe",
-    "pen": "\U000f03ea",
-    "pen-lock": "\U000f0de2",
-    "pen-minus": "\U000f0de3",
-    "pen-off": "\U000f0de4",
-    "pen-plus": "\U000f0de5",
-    "pen-remove": "\U000f0de6",
-    "pencil": "\U000f03eb",
-    "pencil-box": "\U000f03ec",
-    "pencil-box-multiple": "\U000f1144",
-    "pencil-box-multiple-outline": "\U000f1145",
-    "pencil-box-outline": "\U000f03ed",
-    "pencil-circle": "\U000f06ff",
-    "pencil-circle-outline": "\U000f0776",
-    "pencil-lock": "\U000f03ee",
-    "pencil-lock-outline": "\U000f0de7",
-    "pencil-minus": "\U000f0de8",
-    "pencil-minus-outline": "\U000f0de9",
-    "pencil-off": "\U000f03ef",
-    "pencil-off-outline": "\U000f0dea",
-    "pencil-outline": "\U000f0cb6",
-    "pencil-plus": "\U000f0deb",
-    "pencil-plus-outline": "\U000f0dec",
-    "pencil-remove": "\U000f0ded",
-    "pencil-remove-outline": "\U000f0dee",
-    "pencil-ruler": "\U000f1353",
-    "pencil-ruler-outline": "\U000f1c11",
-    "penguin": "\U000f0ec0",
-    "pentagon": "\U000f0701",
-    "pentagon-outline": "\U000f0700",
-    "pentagram": "\U000f1667",
-    "percent": "\U000f03f0",
-    "percent-box": "\U000f1a02",
-    "percent-box-outline": "\U000f1a03",
-    "percent-circle": "\U000f1a04",
-    "percent-circle-outline": "\U000f1a05",
-    "percent-outline": "\U000f1278",
-    "periodic-table": "\U000f08b6",
-    "perspective-less": "\U000f0d23",
-    "perspective-more": "\U000f0d24",
-    "ph": "\U000f17c5",
-    "phone": "\U000f03f2",
-    "phone-alert": "\U000f0f1a",
-    "phone-alert-outline": "\U000f118e",
-    "phone-bluetooth": "\U000f03f3",
-    "phone-bluetooth-outline": "\U000f118f",
-    "phone-cancel": "\U000f10bc",
-    "phone-cancel-outline": "\U000f1190",
-    "phone-check": "\U000f11a9",
-    "phone-check-outline": "\U000f11aa",
-    "phone-classic": "\U000f0602",
-    "phone-classic-off": "\U000f1279",
-    "phone-clock": "\U000f19db",
-    "phone-dial": "\U000f1559",
-    "phone-dial-outline": "\U000f155a",
-    "phone-forward": "\U000f03f4",
-    "phone-forward-outline": "\U000f1191",
-    "phone-hangup": "\U000f03f5",
-    "phone-hangup-outline": "\U000f1192",
-    "phone-in-talk": "\U000f03f6",
-    "phone-in-talk-outline": "\U000f1182",
-    "phone-incoming": "\U000f03f7",
-    "phone-incoming-outgoing": "\U000f1b3f",
-    "phone-incoming-outgoing-outline": "\U000f1b40",
-    "phone-incoming-outline": "\U000f1193",
-    "phone-lock": "\U000f03f8",
-    "phone-lock-outline": "\U000f1194",
-    "phone-log": "\U000f03f9",
-    "phone-log-outline": "\U000f1195",
-    "phone-message": "\U000f1196",
-    "phone-message-outline": "\U000f1197",
-    "phone-minus": "\U000f0658",
-    "phone-minus-outline": "\U000f1198",
-    "phone-missed": "\U000f03fa",
-    "phone-missed-outline": "\U000f11a5",
-    "phone-off": "\U000f0def",
-    "phone-off-outline": "\U000f11a6",
-    "phone-outgoing": "\U000f03fb",
-    "phone-outgoing-outline": "\U000f1199",
-    "phone-outline": "\U000f0df0",
-    "phone-paused": "\U000f03fc",
-    "phone-paused-outline": "\U000f119a",
-    "phone-plus": "\U000f0659",
-    "phone-plus-outline": "\U000f119b",
-    "phone-refresh": "\U000f1993",
-    "phone-refresh-outline": "\U000f1994",
-    "phone-remove": "\U000f152f",
-    "phone-remove-outline": "\U000f1530",
-    "phone-return": "\U000f082f",
-    "phone-return-outline": "\U000f119c",
-    "phone-ring": "\U000f11ab",
-    "phone-ring-outline": "\U000f11ac",
-    "phone-rotate-landscape": "\U000f0885",
-    "phone-rotate-portrait": "\U000f0886",
-    "phone-settings": "\U000f03fd",
-    "phone-settings-outline": "\U000f119d",
-    "phone-sync": "\U000f1995",
-    "phone-sync-outline": "\U000f1996",
-    "phone-voip": "\U000f03fe",
-    "pi": "\U000f03ff",
-    "pi-box": "\U000f0400",
-    "pi-hole": "\U000f0df1",
-    "piano": "\U000f067d",
-    "piano-off": "\U000f0698",
-    "pickaxe": "\U000f08b7",
-    "picture-in-picture-bottom-right": "\U000f0e57",
-    "picture-in-picture-bottom-right-outline": "\U000f0e58",
-    "picture-in-picture-top-right": "\U000f0e59",
-    "picture-in-picture-top-right-outline": "\U000f0e5a",
-    "pier": "\U000f0887",
-    "pier-crane": "\U000f0888",
-    "pig": "\U000f0401",
-    "pig-variant": "\U000f1006",
-    "pig-variant-outline": "\U000f1678",
-    "piggy-bank": "\U000f1007",
-    "piggy-bank-outline": "\U000f1679",
-    "pill": "\U000f0402",
-    "pill-multiple": "\U000f1b4c",
-    "pill-off": "\U000f1a5c",
-    "pillar": "\U000f0702",
-    "pin": "\U000f0403",
-    "pin-off": "\U000f0404",
-    "pin-off-outline": "\U000f0930",
-    "pin-outline": "\U000f0931",
-    "pine-tree": "\U000f0405",
-    "pine-tree-box": "\U000f0406",
-    "pine-tree-fire": "\U000f141a",
-    "pine-tree-variant": "\U000f1c73",
-    "pine-tree-variant-outline": "\U000f1c74",
-    "pinterest": "\U000f0407",
-    "pinwheel": "\U000f0ad5",
-    "pinwheel-outline": "\U000f0ad6",
-    "pipe": "\U000f07e5",
-    "pipe-disconnected": "\U000f07e6",
-    "pipe-leak": "\U000f0889",
-    "pipe-valve": "\U000f184d",
-    "pipe-wrench": "\U000f1354",
-    "pirate": "\U000f0a08",
-    "pistol": "\U000f0703",
-    "piston": "\U000f088a",
-    "pitchfork": "\U000f1553",
-    "pizza": "\U000f0409",
-    "plane-car": "\U000f1aff",
-    "plane-train": "\U000f1b00",
-    "play": "\U000f040a",
-    "play-box": "\U000f127a",
-    "play-box-edit-outline": "\U000f1c3a",
-    "play-box-lock": "\U000f1a16",
-    "play-box-lock-open": "\U000f1a17",
-    "play-box-lock-open-outline": "\U000f1a18",
-    "play-box-lock-outline": "\U000f1a19",
-    "play-box-multiple": "\U000f0d19",
-    "play-box-multiple-outline": "\U000f13e6",
-    "play-box-outline": "\U000f040b",
-    "play-circle": "\U000f040c",
-    "play-circle-outline": "\U000f040d",
-    "play-network": "\U000f088b",
-    "play-network-outline": "\U000f0cb7",
-    "play-outline": "\U000f0f1b",
-    "play-pause": "\U000f040e",
-    "play-protected-content": "\U000f040f",
-    "play-speed": "\U000f08ff",
-    "playlist-check": "\U000f05c7",
-    "playlist-edit": "\U000f0900",
-    "playlist-minus": "\U000f0410",
-    "playlist-music": "\U000f0cb8",
-    "playlist-music-outline": "\U000f0cb9",
-    "playlist-play": "\U000f0411",
-    "playlist-plus": "\U000f0412",
-    "playlist-remove": "\U000f0413",
-    "playlist-star": "\U000f0df2",
-    "plex": "\U000f06ba",
-    "pliers": "\U000f19a4",
-    "plus": "\U000f0415",
-    "plus-box": "\U000f0416",
-    "plus-box-multiple": "\U000f0334",
-    "plus-box-multiple-outline": "\U000f1143",
-    "plus-box-outline": "\U000f0704",
-    "plus-circle": "\U000f0417",
-    "plus-circle-multiple": "\U000f034c",
-    "plus-circle-multiple-outline": "\U000f0418",
-    "plus-circle-outline": "\U000f0419",
-    "plus-lock": "\U000f1a5d",
-    "plus-lock-open": "\U000f1a5e",
-    "plus-minus": "\U000f0992",
-    "plus-minus-box": "\U000f0993",
-    "plus-minus-variant": "\U000f14c9",
-    "plus-network": "\U000f041a",
-    "plus-network-outline": "\U000f0cba",
-    "plus-outline": "\U000f0705",
-    "plus-thick": "\U000f11ec",
-    "pocket": "\U000f1cbe",
-    "podcast": "\U000f0994",
-    "podium": "\U000f0d25",
-    "podium-bronze": "\U000f0d26",
-    "podium-gold": "\U000f0d27",
-    "podium-silver": "\U000f0d28",
-    "point-of-sale": "\U000f0d92",
-    "pokeball": "\U000f041d",
-    "pokemon-go": "\U000f0a09",
-    "poker-chip": "\U000f0830",
-    "polaroid": "\U000f041e",
-    "police-badge": "\U000f1167",
-    "police-badge-outline": "\U000f1168",
-    "police-station": "\U000f1839",
-    "poll": "\U000f041f",
-    "polo": "\U000f14c3",
-    "polymer": "\U000f0421",
-    "pool": "\U000f0606",
-    "pool-thermometer": "\U000f1a5f",
-    "popcorn": "\U000f0422",
-    "post": "\U000f1008",
-    "post-lamp": "\U000f1a60",
-    "post-outline": "\U000f1009",
-    "postage-stamp": "\U000f0cbb",
-    "pot": "\U000f02e5",
-    "pot-mix": "\U000f065b",
-    "pot-mix-outline": "\U000f0677",
-    "pot-outline": "\U000f02ff",
-    "pot-steam": "\U000f065a",
-    "pot-steam-outline": "\U000f0326",
-    "pound": "\U000f0423",
-    "pound-box": "\U000f0424",
-    "pound-box-outline": "\U000f117f",
-    "power": "\U000f0425",
-    "power-cycle": "\U000f0901",
-    "power-off": "\U000f0902",
-    "power-on": "\U000f0903",
-    "power-plug": "\U000f06a5",
-    "power-plug-battery": "\U000f1c3b",
-    "power-plug-battery-outline": "\U000f1c3c",
-    "power-plug-off": "\U000f06a6",
-    "power-plug-off-outline": "\U000f1424",
-    "power-plug-outline": "\U000f1425",
-    "power-settings": "\U000f0426",
-    "power-sleep": "\U000f0904",
-    "power-socket": "\U000f0427",
-    "power-socket-au": "\U000f0905",
-    "power-socket-ch": "\U000f0fb3",
-    "power-socket-de": "\U000f1107",
-    "power-socket-eu": "\U000f07e7",
-    "power-socket-fr": "\U000f1108",
-    "power-socket-it": "\U000f14ff",
-    "power-socket-jp": "\U000f1109",
-    "power-socket-uk": "\U000f07e8",
-    "power-socket-us": "\U000f07e9",
-    "power-standby": "\U000f0906",
-    "powershell": "\U000f0a0a",
-    "prescription": "\U000f0706",
-    "presentation": "\U000f0428",
-    "presentation-play": "\U000f0429",
-    "pretzel": "\U000f1562",
-    "printer": "\U000f042a",
-    "printer-3d": "\U000f042b",
-    "printer-3d-nozzle": "\U000f0e5b",
-    "printer-3d-nozzle-alert": "\U000f11c0",
-    "printer-3d-nozzle-alert-outline": "\U000f11c1",
-    "printer-3d-nozzle-heat": "\U000f18b8",
-    "printer-3d-nozzle-heat-outline": "\U000f18b9",
-    "printer-3d-nozzle-off": "\U000f1b19",
-    "printer-3d-nozzle-off-outline": "\U000f1b1a",
-    "printer-3d-nozzle-outline": "\U000f0e5c",
-    "printer-3d-off": "\U000f1b0e",
-    "printer-alert": "\U000f042c",
-    "printer-check": "\U000f1146",
-    "printer-eye": "\U000f1458",
-    "printer-off": "\U000f0e5d",
-    "printer-off-outline": "\U000f1785",
-    "printer-outline": "\U000f1786",
-    "printer-pos": "\U000f1057",
-    "printer-pos-alert": "\U000f1bbc",
-    "printer-pos-alert-outline": "\U000f1bbd",
-    "printer-pos-cancel": "\U000f1bbe",
-    "printer-pos-cancel-outline": "\U000f1bbf",
-    "printer-pos-check": "\U000f1bc0",
-    "printer-pos-check-outline": "\U000f1bc1",
-    "printer-pos-cog": "\U000f1bc2",
-    "printer-pos-cog-outline": "\U000f1bc3",
-    "printer-pos-edit": "\U000f1bc4",
-    "printer-pos-edit-outline": "\U000f1bc5",
-    "printer-pos-minus": "\U000f1bc6",
-    "printer-pos-minus-outline": "\U000f1bc7",
-    "printer-pos-network": "\U000f1bc8",
-    "printer-pos-network-outline": "\U000f1bc9",
-    "printer-pos-off": "\U000f1bca",
-    "printer-pos-off-outline": "\U000f1bcb",
-    "printer-pos-outline": "\U000f1bcc",
-    "printer-pos-pause": "\U000f1bcd",
-    "printer-pos-pause-outline": "\U000f1bce",
-    "printer-pos-play": "\U000f1bcf",
-    "printer-pos-play-outline": "\U000f1bd0",
-    "printer-pos-plus": "\U000f1bd1",
-    "printer-pos-plus-outline": "\U000f1bd2",
-    "printer-pos-refresh": "\U000f1bd3",
-    "printer-pos-refresh-outline": "\U000f1bd4",
-    "printer-pos-remove": "\U000f1bd5",
-    "printer-pos-remove-outline": "\U000f1bd6",
-    "printer-pos-star": "\U000f1bd7",
-    "printer-pos-star-outline": "\U000f1bd8",
-    "printer-pos-stop": "\U000f1bd9",
-    "printer-pos-stop-outline": "\U000f1bda",
-    "printer-pos-sync": "\U000f1bdb",
-    "printer-pos-sync-outline": "\U000f1bdc",
-    "printer-pos-wrench": "\U000f1bdd",
-    "printer-pos-wrench-outline": "\U000f1bde",
-    "printer-search": "\U000f1457",
-    "printer-settings": "\U000f0707",
-    "printer-wireless": "\U000f0a0b",
-    "priority-high": "\U000f0603",
-    "priority-low": "\U000f0604",
-    "professional-hexagon": "\U000f042d",
-    "progress-alert": "\U000f0cbc",
-    "progress-check": "\U000f0995",
-    "progress-clock": "\U000f0996",
-    "progress-close": "\U000f110a",
-    "progress-download": "\U000f0997",
-    "progress-helper": "\U000f1ba2",
-    "progress-pencil": "\U000f1787",
-    "progress-question": "\U000f1522",
-    "progress-star": "\U000f1788",
-    "progress-star-four-points": "\U000f1c3d",
-    "progress-tag": "\U000f1d0d",
-    "progress-upload": "\U000f0998",
-    "progress-wrench": "\U000f0cbd",
-    "projector": "\U000f042e",
-    "projector-off": "\U000f1a23",
-    "projector-screen": "\U000f042f",
-    "projector-screen-off": "\U000f180d",
-    "projector-screen-off-outline": "\U000f180e",
-    "projector-screen-outline": "\U000f1724",
-    "projector-screen-variant": "\U000f180f",
-    "projector-screen-variant-off": "\U000f1810",
-    "projector-screen-variant-off-outline": "\U000f1811",
-    "projector-screen-variant-outline": "\U000f1812",
-    "propane-tank": "\U000f1357",
-    "propane-tank-outline": "\U000f1358",
-    "protocol": "\U000f0fd8",
-    "publish": "\U000f06a7",
-    "publish-off": "\U000f1945",
-    "pulse": "\U000f0430",
-    "pump": "\U000f1402",
-    "pump-off": "\U000f1b22",
-    "pumpkin": "\U000f0bbf",
-    "purse": "\U000f0f1c",
-    "purse-outline": "\U000f0f1d",
-    "puzzle": "\U000f0431",
-    "puzzle-check": "\U000f1426",
-    "puzzle-check-outline": "\U000f1427",
-    "puzzle-edit": "\U000f14d3",
-    "puzzle-edit-outline": "\U000f14d9",
-    "puzzle-heart": "\U000f14d4",
-    "puzzle-heart-outline": "\U000f14da",
-    "puzzle-minus": "\U000f14d1",
-    "puzzle-minus-outline": "\U000f14d7",
-    "puzzle-outline": "\U000f0a66",
-    "puzzle-plus": "\U000f14d0",
-    "puzzle-plus-outline": "\U000f14d6",
-    "puzzle-remove": "\U000f14d2",
-    "puzzle-remove-outline": "\U000f14d8",
-    "puzzle-star": "\U000f14d5",
-    "puzzle-star-outline": "\U000f14db",
-    "pyramid": "\U000f1952",
-    "pyramid-off": "\U000f1953",
-    "qi": "\U000f0999",
-    "qqchat": "\U000f0605",
-    "qrcode": "\U000f0432",
-    "qrcode-edit": "\U000f08b8",
-    "qrcode-minus": "\U000f118c",
-    "qrcode-plus": "\U000f118b",
-    "qrcode-remove": "\U000f118d",
-    "qrcode-scan": "\U000f0433",
-    "quadcopter": "\U000f0434",
-    "quality-high": "\U000f0435",
-    "quality-low": "\U000f0a0c",
-    "quality-medium": "\U000f0a0d",
-    "queue-first-in-last-out": "\U000f1caf",
-    "quora": "\U000f0d29",
-    "rabbit": "\U000f0907",
-    "rabbit-variant": "\U000f1a61",
-    "rabbit-variant-outline": "\U000f1a62",
-    "racing-helmet": "\U000f0d93",
-    "racquetball": "\U000f0d94",
-    "radar": "\U000f0437",
-    "radiator": "\U000f0438",
-    "radiator-disabled": "\U000f0ad7",
-    "radiator-off": "\U000f0ad8",
-    "radio": "\U000f0439",
-    "radio-am": "\U000f0cbe",
-    "radio-fm": "\U000f0cbf",
-    "radio-handheld": "\U000f043a",
-    "radio-off": "\U000f121c",
-    "radio-tower": "\U000f043b",
-    "radioactive": "\U000f043c",
-    "radioactive-circle": "\U000f185d",
-    "radioactive-circle-outline": "\U000f185e",
-    "radioactive-off": "\U000f0ec1",
-    "radiobox-blank": "\U000f043d",
-    "radiobox-indeterminate-variant": "\U000f1c5e",
-    "radiobox-marked": "\U000f043e",
-    "radiology-box": "\U000f14c5",
-    "radiology-box-outline": "\U000f14c6",
-    "radius": "\U000f0cc0",
-    "radius-outline": "\U000f0cc1",
-    "railroad-light": "\U000f0f1e",
-    "rake": "\U000f1544",
-    "raspberry-pi": "\U000f043f",
-    "raw": "\U000f1a0f",
-    "raw-off": "\U000f1a10",
-    "ray-end": "\U000f0440",
-    "ray-end-arrow": "\U000f0441",
-    "ray-start": "\U000f0442",
-    "ray-start-arrow": "\U000f0443",
-    "ray-start-end": "\U000f0444",
-    "ray-start-vertex-end": "\U000f15d8",
-    "ray-vertex": "\U000f0445",
-    "razor-double-edge": "\U000f1997",
-    "razor-single-edge": "\U000f1998",
-    "react": "\U000f0708",
-    "read": "\U000f0447",
-    "receipt": "\U000f0824",
-    "receipt-clock": "\U000f1c3e",
-    "receipt-clock-outline": "\U000f1c3f",
-    "receipt-outline": "\U000f04f7",
-    "receipt-send": "\U000f1c40",
-    "receipt-send-outline": "\U000f1c41",
-    "receipt-text": "\U000f0449",
-    "receipt-text-arrow-left": "\U000f1c42",
-    "receipt-text-arrow-left-outline": "\U000f1c43",
-    "receipt-text-arrow-right": "\U000f1c44",
-    "receipt-text-arrow-right-outline": "\U000f1c45",
-    "receipt-text-check": "\U000f1a63",
-    "receipt-text-check-outline": "\U000f1a64",
-    "receipt-text-clock": "\U000f1c46",
-    "receipt-text-clock-outline": "\U000f1c47",
-    "receipt-text-edit": "\U000f1c48",
-    "receipt-text-edit-outline": "\U000f1c49",
-    "receipt-text-minus": "\U000f1a65",
-    "receipt-text-minus-outline": "\U000f1a66",
-    "receipt-text-outline": "\U000f19dc",
-    "receipt-text-plus": "\U000f1a67",
-    "receipt-text-plus-outline": "\U000f1a68",
-    "receipt-text-remove": "\U000f1a69",
-    "receipt-text-remove-outline": "\U000f1a6a",
-    "receipt-text-send": "\U000f1c4a",
-    "receipt-text-send-outline": "\U000f1c4b",
-    "record": "\U000f044a",
-    "record-circle": "\U000f0ec2",
-    "record-circle-outline": "\U000f0ec3",
-    "record-player": "\U000f099a",
-    "record-rec": "\U000f044b",
-    "rectangle": "\U000f0e5e",
-    "rectangle-outline": "\U000f0e5f",
-    "recycle": "\U000f044c",
-    "recycle-variant": "\U000f139d",
-    "reddit": "\U000f044d",
-    "redhat": "\U000f111b",
-    "redo": "\U000f044e",
-    "redo-variant": "\U000f044f",
-    "reflect-horizontal": "\U000f0a0e",
-    "reflect-vertical": "\U000f0a0f",
-    "refresh": "\U000f0450",
-    "refresh-auto": "\U000f18f2",
-    "refresh-circle": "\U000f1377",
-    "regex": "\U000f0451",
-    "registered-trademark": "\U000f0a67",
-    "reiterate": "\U000f1588",
-    "relation-many-to-many": "\U000f1496",
-    "relation-many-to-one": "\U000f1497",
-    "relation-many-to-one-or-many": "\U000f1498",
-    "relation-many-to-only-one": "\U000f1499",
-    "relation-many-to-zero-or-many": "\U000f149a",
-    "relation-many-to-zero-or-one": "\U000f149b",
-    "relation-one-or-many-to-many": "\U000f149c",
-    "relation-one-or-many-to-one": "\U000f149d",
-    "relation-one-or-many-to-one-or-many": "\U000f149e",
-    "relation-one-or-many-to-only-one": "\U000f149f",
-    "relation-one-or-many-to-zero-or-many": "\U000f14a0",
-    "relation-one-or-many-to-zero-or-one": "\U000f14a1",
-    "relation-one-to-many": "\U000f14a2",
-    "relation-one-to-one": "\U000f14a3",
-    "relation-one-to-one-or-many": "\U000f14a4",
-    "relation-one-to-only-one": "\U000f14a5",
-    "relation-one-to-zero-or-many": "\U000f14a6",
-    "relation-one-to-zero-or-one": "\U000f14a7",
-    "relation-only-one-to-many": "\U000f14a8",
-    "relation-only-one-to-one": "\U000f14a9",
-    "relation-only-one-to-one-or-many": "\U000f14aa",
-    "relation-only-one-to-only-one": "\U000f14ab",
-    "relation-only-one-to-zero-or-many": "\U000f14ac",
-    "relation-only-one-to-zero-or-one": "\U000f14ad",
-    "relation-zero-or-many-to-many": "\U000f14ae",
-    "relation-zero-or-many-to-one": "\U000f14af",
-    "relation-zero-or-many-to-one-or-many": "\U000f14b0",
-    "relation-zero-or-many-to-only-one": "\U000f14b1",
-    "relation-zero-or-many-to-zero-or-many": "\U000f14b2",
-    "relation-zero-or-many-to-zero-or-one": "\U000f14b3",
-    "relation-zero-or-one-to-many": "\U000f14b4",
-    "relation-zero-or-one-to-one": "\U000f14b5",
-    "relation-zero-or-one-to-one-or-many": "\U000f14b6",
-    "relation-zero-or-one-to-only-one": "\U000f14b7",
-    "relation-zero-or-one-to-zero-or-many": "\U000f14b8",
-    "relation-zero-or-one-to-zero-or-one": "\U000f14b9",
-    "relative-scale": "\U000f0452",
-    "reload": "\U000f0453",
-    "reload-alert": "\U000f110b",
-    "reminder": "\U000f088c",
-    "remote": "\U000f0454",
-    "remote-desktop": "\U000f08b9",
-    "remote-off": "\U000f0ec4",
-    "remote-tv": "\U000f0ec5",
-    "remote-tv-off": "\U000f0ec6",
-    "rename": "\U000f1c18",
-    "rename-box": "\U000f0455",
-    "rename-box-outline": "\U000f1c19",
-    "rename-outline": "\U000f1c1a",
-    "reorder-horizontal": "\U000f0688",
-    "reorder-vertical": "\U000f0689",
-    "repeat": "\U000f0456",
-    "repeat-off": "\U000f0457",
-    "repeat-once": "\U000f0458",
-    "repeat-variant": "\U000f0547",
-    "replay": "\U000f0459",
-    "reply": "\U000f045a",
-    "reply-all": "\U000f045b",
-    "reply-all-outline": "\U000f0f1f",
-    "reply-circle": "\U000f11ae",
-    "reply-outline": "\U000f0f20",
-    "reproduction": "\U000f045c",
-    "resistor": "\U000f0b44",
-    "resistor-nodes": "\U000f0b45",
-    "resize": "\U000f0a68",
-    "resize-bottom-right": "\U000f045d",
-    "responsive": "\U000f045e",
-    "restart": "\U000f0709",
-    "restart-alert": "\U000f110c",
-    "restart-off": "\U000f0d95",
-    "restore": "\U000f099b",
-    "restore-alert": "\U000f110d",
-    "rewind": "\U000f045f",
-    "rewind-10": "\U000f0d2a",
-    "rewind-15": "\U000f1946",
-    "rewind-30": "\U000f0d96",
-    "rewind-45": "\U000f1b13",
-    "rewind-5": "\U000f11f9",
-    "rewind-60": "\U000f160c",
-    "rewind-outline": "\U000f070a",
-    "rhombus": "\U000f070b",
-    "rhombus-medium": "\U000f0a10",
-    "rhombus-medium-outline": "\U000f14dc",
-    "rhombus-outline": "\U000f070c",
-    "rhombus-split": "\U000f0a11",
-    "rhombus-split-outline": "\U000f14dd",
-    "ribbon": "\U000f0460",
-    "rice": "\U000f07ea",
-    "rickshaw": "\U000f15bb",
-    "rickshaw-electric": "\U000f15bc",
-    "ring": "\U000f07eb",
-    "rivet": "\U000f0e60",
-    "road": "\U000f0461",
-    "road-variant": "\U000f0462",
-    "robber": "\U000f1058",
-    "robot": "\U000f06a9",
-    "robot-angry": "\U000f169d",
-    "robot-angry-outline": "\U000f169e",
-    "robot-confused": "\U000f169f",
-    "robot-confused-outline": "\U000f16a0",
-    "robot-dead": "\U000f16a1",
-    "robot-dead-outline": "\U000f16a2",
-    "robot-excited": "\U000f16a3",
-    "robot-excited-outline": "\U000f16a4",
-    "robot-happy": "\U000f1719",
-    "robot-happy-outline": "\U000f171a",
-    "robot-industrial": "\U000f0b46",
-    "robot-industrial-outline": "\U000f1a1a",
-    "robot-love": "\U000f16a5",
-    "robot-love-outline": "\U000f16a6",
-    "robot-mower": "\U000f11f7",
-    "robot-mower-outline": "\U000f11f3",
-    "robot-off": "\U000f16a7",
-    "robot-off-outline": "\U000f167b",
-    "robot-outline": "\U000f167a",
-    "robot-vacuum": "\U000f070d",
-    "robot-vacuum-alert": "\U000f1b5d",
-    "robot-vacuum-off": "\U000f1c01",
-    "robot-vacuum-variant": "\U000f0908",
-    "robot-vacuum-variant-alert": "\U000f1b5e",
-    "robot-vacuum-variant-off": "\U000f1c02",
-    "rocket": "\U000f0463",
-    "rocket-launch": "\U000f14de",
-    "rocket-launch-outline": "\U000f14df",
-    "rocket-outline": "\U000f13af",
-    "rodent": "\U000f1327",
-    "roller-shade": "\U000f1a6b",
-    "roller-shade-closed": "\U000f1a6c",
-    "roller-skate": "\U000f0d2b",
-    "roller-skate-off": "\U000f0145",
-    "rollerblade": "\U000f0d2c",
-    "rollerblade-off": "\U000f002e",
-    "rollupjs": "\U000f0bc0",
-    "rolodex": "\U000f1ab9",
-    "rolodex-outline": "\U000f1aba",
-    "roman-numeral-1": "\U000f1088",
-    "roman-numeral-10": "\U000f1091",
-    "roman-numeral-2": "\U000f1089",
-    "roman-numeral-3": "\U000f108a",
-    "roman-numeral-4": "\U000f108b",
-    "roman-numeral-5": "\U000f108c",
-    "roman-numeral-6": "\U000f108d",
-    "roman-numeral-7": "\U000f108e",
-    "roman-numeral-8": "\U000f108f",
-    "roman-numeral-9": "\U000f1090",
-    "room-service": "\U000f088d",
-    "room-service-outline": "\U000f0d97",
-    "rotate-360": "\U000f1999",
-    "rotate-3d": "\U000f0ec7",
-    "rotate-3d-variant": "\U000f0464",
-    "rotate-left": "\U000f0465",
-    "rotate-left-variant": "\U000f0466",
-    "rotate-orbit": "\U000f0d98",
-    "rotate-right": "\U000f0467",
-    "rotate-right-variant": "\U000f0468",
-    "rounded-corner": "\U000f0607",
-    "router": "\U000f11e2",
-    "router-network": "\U000f1087",
-    "router-network-wireless": "\U000f1c97",
-    "router-wireless": "\U000f0469",
-    "router-wireless-off": "\U000f15a3",
-    "router-wireless-settings": "\U000f0a69",
-    "routes": "\U000f046a",
-    "routes-clock": "\U000f1059",
-    "rowing": "\U000f0608",
-    "rss": "\U000f046b",
-    "rss-box": "\U000f046c",
-    "rss-off": "\U000f0f21",
-    "rug": "\U000f1475",
-    "rugby": "\U000f0d99",
-    "ruler": "\U000f046d",
-    "ruler-square": "\U000f0cc2",
-    "ruler-square-compass": "\U000f0ebe",
-    "run": "\U000f070e",
-    "run-fast": "\U000f046e",
-    "rv-truck": "\U000f11d4",
-    "sack": "\U000f0d2e",
-    "sack-outline": "\U000f1c4c",
-    "sack-percent": "\U000f0d2f",
-    "safe": "\U000f0a6a",
-    "safe-square": "\U000f127c",
-    "safe-square-outline": "\U000f127d",
-    "safety-goggles": "\U000f0d30",
-    "sail-boat": "\U000f0ec8",
-    "sail-boat-sink": "\U000f1aef",
-    "sale": "\U000f046f",
-    "sale-outline": "\U000f1a06",
-    "salesforce": "\U000f088e",
-    "sass": "\U000f07ec",
-    "satellite": "\U000f0470",
-    "satellite-uplink": "\U000f0909",
-    "satellite-variant": "\U000f0471",
-    "sausage": "\U000f08ba",
-    "sausage-off": "\U000f1789",
-    "saw-blade": "\U000f0e61",
-    "sawtooth-wave": "\U000f147a",
-    "saxophone": "\U000f0609",
-    "scale": "\U000f0472",
-    "scale-balance": "\U000f05d1",
-    "scale-bathroom": "\U000f0473",
-    "scale-off": "\U000f105a",
-    "scale-unbalanced": "\U000f19b8",
-    "scan-helper": "\U000f13d8",
-    "scanner": "\U000f06ab",
-    "scanner-off": "\U000f090a",
-    "scatter-plot": "\U000f0ec9",
-    "scatter-plot-outline": "\U000f0eca",
-    "scent": "\U000f1958",
-    "scent-off": "\U000f1959",
-    "school": "\U000f0474",
-    "school-outline": "\U000f1180",
-    "scissors-cutting": "\U000f0a6b",
-    "scooter": "\U000f15bd",
-    "scooter-electric": "\U000f15be",
-    "scoreboard": "\U000f127e",
-    "scoreboard-outline": "\U000f127f",
-    "screen-rotation": "\U000f0475",
-    "screen-rotation-lock": "\U000f0478",
-    "screw-flat-top": "\U000f0df3",
-    "screw-lag": "\U000f0df4",
-    "screw-machine-flat-top": "\U000f0df5",
-    "screw-machine-round-top": "\U000f0df6",
-    "screw-round-top": "\U000f0df7",
-    "screwdriver": "\U000f0476",
-    "script": "\U000f0bc1",
-    "script-outline": "\U000f0477",
-    "script-text": "\U000f0bc2",
-    "script-text-key": "\U000f1725",
-    "script-text-key-outline": "\U000f1726",
-    "script-text-outline": "\U000f0bc3",
-    "script-text-play": "\U000f1727",
-    "script-text-play-outline": "\U000f1728",
-    "sd": "\U000f0479",
-    "seal": "\U000f047a",
-    "seal-variant": "\U000f0fd9",
-    "search-web": "\U000f070f",
-    "seat": "\U000f0cc3",
-    "seat-flat": "\U000f047b",
-    "seat-flat-angled": "\U000f047c",
-    "seat-individual-suite": "\U000f047d",
-    "seat-legroom-extra": "\U000f047e",
-    "seat-legroom-normal": "\U000f047f",
-    "seat-legroom-reduced": "\U000f0480",
-    "seat-outline": "\U000f0cc4",
-    "seat-passenger": "\U000f1249",
-    "seat-recline-extra": "\U000f0481",
-    "seat-recline-normal": "\U000f0482",
-    "seatbelt": "\U000f0cc5",
-    "security": "\U000f0483",
-    "security-network": "\U000f0484",
-    "seed": "\U000f0e62",
-    "seed-off": "\U000f13fd",
-    "seed-off-outline": "\U000f13fe",
-    "seed-outline": "\U000f0e63",
-    "seed-plus": "\U000f1a6d",
-    "seed-plus-outline": "\U000f1a6e",
-    "seesaw": "\U000f15a4",
-    "segment": "\U000f0ecb",
-    "select": "\U000f0485",
-    "select-all": "\U000f0486",
-    "select-arrow-down": "\U000f1b59",
-    "select-arrow-up": "\U000f1b58",
-    "select-color": "\U000f0d31",
-    "select-compare": "\U000f0ad9",
-    "select-drag": "\U000f0a6c",
-    "select-group": "\U000f0f82",
-    "select-inverse": "\U000f0487",
-    "select-marker": "\U000f1280",
-    "select-multiple": "\U000f1281",
-    "select-multiple-marker": "\U000f1282",
-    "select-off": "\U000f0488",
-    "select-place": "\U000f0fda",
-    "select-remove": "\U000f17c1",
-    "select-search": "\U000f1204",
-    "selection": "\U000f0489",
-    "selection-drag": "\U000f0a6d",
-    "selection-ellipse": "\U000f0d32",
-    "selection-ellipse-arrow-inside": "\U000f0f22",
-    "selection-ellipse-remove": "\U000f17c2",
-    "selection-marker": "\U000f1283",
-    "selection-multiple": "\U000f1285",
-    "selection-multiple-marker": "\U000f1284",
-    "selection-off": "\U000f0777",
-    "selection-remove": "\U000f17c3",
-    "selection-search": "\U000f1205",
-    "semantic-web": "\U000f1316",
-    "send": "\U000f048a",
-    "send-check": "\U000f1161",
-    "send-check-outline": "\U000f1162",
-    "send-circle": "\U000f0df8",
-    "send-circle-outline": "\U000f0df9",
-    "send-clock": "\U000f1163",
-    "send-clock-outline": "\U000f1164",
-    "send-lock": "\U000f07ed",
-    "send-lock-outline": "\U000f1166",
-    "send-outline": "\U000f1165",
-    "send-variant": "\U000f1c4d",
-    "send-variant-clock": "\U000f1c7e",
-    "send-variant-clock-outline": "\U000f1c7f",
-    "send-variant-outline": "\U000f1c4e",
-    "serial-port": "\U000f065c",
-    "server": "\U000f048b",
-    "server-minus": "\U000f048c",
-    "server-minus-outline": "\U000f1c98",
-    "server-network": "\U000f048d",
-    "server-network-off": "\U000f048e",
-    "server-network-outline": "\U000f1c99",
-    "server-off": "\U000f048f",
-    "server-outline": "\U000f1c9a",
-    "server-plus": "\U000f0490",
-    "server-plus-outline": "\U000f1c9b",
-    "server-remove": "\U000f0491",
-    "server-security": "\U000f0492",
-    "set-all": "\U000f0778",
-    "set-center": "\U000f0779",
-    "set-center-right": "\U000f077a",
-    "set-left": "\U000f077b",
-    "set-left-center": "\U000f077c",
-    "set-left-right": "\U000f077d",
-    "set-merge": "\U000f14e0",
-    "set-none": "\U000f077e",
-    "set-right": "\U000f077f",
-    "set-split": "\U000f14e1",
-    "set-square": "\U000f145d",
-    "set-top-box": "\U000f099f",
-    "settings-helper": "\U000f0a6e",
-    "shaker": "\U000f110e",
-    "shaker-outline": "\U000f110f",
-    "shape": "\U000f0831",
-    "shape-circle-plus": "\U000f065d",
-    "shape-outline": "\U000f0832",
-    "shape-oval-plus": "\U000f11fa",
-    "shape-plus": "\U000f0495",
-    "shape-plus-outline": "\U000f1c4f",
-    "shape-polygon-plus": "\U000f065e",
-    "shape-rectangle-plus": "\U000f065f",
-    "shape-square-plus": "\U000f0660",
-    "shape-square-rounded-plus": "\U000f14fa",
-    "share": "\U000f0496",
-    "share-all": "\U000f11f4",
-    "share-all-outline": "\U000f11f5",
-    "share-circle": "\U000f11ad",
-    "share-off": "\U000f0f23",
-    "share-off-outline": "\U000f0f24",
-    "share-outline": "\U000f0932",
-    "share-variant": "\U000f0497",
-    "share-variant-outline": "\U000f1514",
-    "shark": "\U000f18ba",
-    "shark-fin": "\U000f1673",
-    "shark-fin-outline": "\U000f1674",
-    "shark-off": "\U000f18bb",
-    "sheep": "\U000f0cc6",
-    "shield": "\U000f0498",
-    "shield-account": "\U000f088f",
-    "shield-account-outline": "\U000f0a12",
-    "shield-account-variant": "\U000f15a7",
-    "shield-account-variant-outline": "\U000f15a8",
-    "shield-airplane": "\U000f06bb",
-    "shield-airplane-outline": "\U000f0cc7",
-    "shield-alert": "\U000f0ecc",
-    "shield-alert-outline": "\U000f0ecd",
-    "shield-bug": "\U000f13da",
-    "shield-bug-outline": "\U000f13db",
-    "shield-car": "\U000f0f83",
-    "shield-check": "\U000f0565",
-    "shield-check-outline": "\U000f0cc8",
-    "shield-cross": "\U000f0cc9",
-    "shield-cross-outline": "\U000f0cca",
-    "shield-crown": "\U000f18bc",
-    "shield-crown-outline": "\U000f18bd",
-    "shield-edit": "\U000f11a0",
-    "shield-edit-outline": "\U000f11a1",
-    "shield-half": "\U000f1360",
-    "shield-half-full": "\U000f0780",
-    "shield-home": "\U000f068a",
-    "shield-home-outline": "\U000f0ccb",
-    "shield-key": "\U000f0bc4",
-    "shield-key-outline": "\U000f0bc5",
-    "shield-link-variant": "\U000f0d33",
-    "shield-link-variant-outline": "\U000f0d34",
-    "shield-lock": "\U000f099d",
-    "shield-lock-open": "\U000f199a",
-    "shield-lock-open-outline": "\U000f199b",
-    "shield-lock-outline": "\U000f0ccc",
-    "shield-moon": "\U000f1828",
-    "shield-moon-outline": "\U000f1829",
-    "shield-off": "\U000f099e",
-    "shield-off-outline": "\U000f099c",
-    "shield-outline": "\U000f0499",
-    "shield-plus": "\U000f0ada",
-    "shield-plus-outline": "\U000f0adb",
-    "shield-refresh": "\U000f00aa",
-    "shield-refresh-outline": "\U000f01e0",
-    "shield-remove": "\U000f0adc",
-    "shield-remove-outline": "\U000f0add",
-    "shield-search": "\U000f0d9a",
-    "shield-star": "\U000f113b",
-    "shield-star-outline": "\U000f113c",
-    "shield-sun": "\U000f105d",
-    "shield-sun-outline": "\U000f105e",
-    "shield-sword": "\U000f18be",
-    "shield-sword-outline": "\U000f18bf",
-    "shield-sync": "\U000f11a2",
-    "shield-sync-outline": "\U000f11a3",
-    "shimmer": "\U000f1545",
-    "ship-wheel": "\U000f0833",
-    "shipping-pallet": "\U000f184e",
-    "shoe-ballet": "\U000f15ca",
-    "shoe-cleat": "\U000f15c7",
-    "shoe-formal": "\U000f0b47",
-    "shoe-heel": "\U000f0b48",
-    "shoe-print": "\U000f0dfa",
-    "shoe-sneaker": "\U000f15c8",
-    "shopping": "\U000f049a",
-    "shopping-music": "\U000f049b",
-    "shopping-outline": "\U000f11d5",
-    "shopping-search": "\U000f0f84",
-    "shopping-search-outline": "\U000f1a6f",
-    "shore": "\U000f14f9",
-    "shovel": "\U000f0710",
-    "shovel-off": "\U000f0711",
-    "shower": "\U000f09a0",
-    "shower-head": "\U000f09a1",
-    "shredder": "\U000f049c",
-    "shuffle": "\U000f049d",
-    "shuffle-disabled": "\U000f049e",
-    "shuffle-variant": "\U000f049f",
-    "shuriken": "\U000f137f",
-    "sickle": "\U000f18c0",
-    "sigma": "\U000f04a0",
-    "sigma-lower": "\U000f062b",
-    "sign-caution": "\U000f04a1",
-    "sign-direction": "\U000f0781",
-    "sign-direction-minus": "\U000f1000",
-    "sign-direction-plus": "\U000f0fdc",
-    "sign-direction-remove": "\U000f0fdd",
-    "sign-language": "\U000f1b4d",
-    "sign-language-outline": "\U000f1b4e",
-    "sign-pole": "\U000f14f8",
-    "sign-real-estate": "\U000f1118",
-    "sign-text": "\U000f0782",
-    "sign-yield": "\U000f1baf",
-    "signal": "\U000f04a2",
-    "signal-2g": "\U000f0712",
-    "signal-3g": "\U000f0713",
-    "signal-4g": "\U000f0714",
-    "signal-5g": "\U000f0a6f",
-    "signal-cellular-1": "\U000f08bc",
-    "signal-cellular-2": "\U000f08bd",
-    "signal-cellular-3": "\U000f08be",
-    "signal-cellular-outline": "\U000f08bf",
-    "signal-distance-variant": "\U000f0e64",
-    "signal-hspa": "\U000f0715",
-    "signal-hspa-plus": "\U000f0716",
-    "signal-off": "\U000f0783",
-    "signal-variant": "\U000f060a",
-    "signature": "\U000f0dfb",
-    "signature-freehand": "\U000f0dfc",
-    "signature-image": "\U000f0dfd",
-    "signature-text": "\U000f0dfe",
-    "silo": "\U000f1b9f",
-    "silo-outline": "\U000f0b49",
-    "silverware": "\U000f04a3",
-    "silverware-clean": "\U000f0fde",
-    "silverware-fork": "\U000f04a4",
-    "silverware-fork-knife": "\U000f0a70",
-    "silverware-spoon": "\U000f04a5",
-    "silverware-variant": "\U000f04a6",
-    "sim": "\U000f04a7",
-    "sim-alert": "\U000f04a8",
-    "sim-alert-outline": "\U000f15d3",
-    "sim-off": "\U000f04a9",
-    "sim-off-outline": "\U000f15d4",
-    "sim-outline": "\U000f15d5",
-    "simple-icons": "\U000f131d",
-    "sina-weibo": "\U000f0adf",
-    "sine-wave": "\U000f095b",
-    "sitemap": "\U000f04aa",
-    "sitemap-outline": "\U000f199c",
-    "size-l": "\U000f13a6",
-    "size-m": "\U000f13a5",
-    "size-s": "\U000f13a4",
-    "size-xl": "\U000f13a7",
-    "size-xs": "\U000f13a3",
-    "size-xxl": "\U000f13a8",
-    "size-xxs": "\U000f13a2",
-    "size-xxxl": "\U000f13a9",
-    "skate": "\U000f0d35",
-    "skate-off": "\U000f0699",
-    "skateboard": "\U000f14c2",
-    "skateboarding": "\U000f0501",
-    "skew-less": "\U000f0d36",
-    "skew-more": "\U000f0d37",
-    "ski": "\U000f1304",
-    "ski-cross-country": "\U000f1305",
-    "ski-water": "\U000f1306",
-    "skip-backward": "\U000f04ab",
-    "skip-backward-outline": "\U000f0f25",
-    "skip-forward": "\U000f04ac",
-    "skip-forward-outline": "\U000f0f26",
-    "skip-next": "\U000f04ad",
-    "skip-next-circle": "\U000f0661",
-    "skip-next-circle-outline": "\U000f0662",
-    "skip-next-outline": "\U000f0f27",
-    "skip-previous": "\U000f04ae",
-    "skip-previous-circle": "\U000f0663",
-    "skip-previous-circle-outline": "\U000f0664",
-    "skip-previous-outline": "\U000f0f28",
-    "skull": "\U000f068c",
-    "skull-crossbones": "\U000f0bc6",
-    "skull-crossbones-outline": "\U000f0bc7",
-    "skull-outline": "\U000f0bc8",
-    "skull-scan": "\U000f14c7",
-    "skull-scan-outline": "\U000f14c8",
-    "skype": "\U000f04af",
-    "skype-business": "\U000f04b0",
-    "slack": "\U000f04b1",
-    "slash-forward": "\U000f0fdf",
-    "slash-forward-box": "\U000f0fe0",
-    "sledding": "\U000f041b",
-    "sleep": "\U000f04b2",
-    "sleep-off": "\U000f04b3",
-    "slide": "\U000f15a5",
-    "slope-downhill": "\U000f0dff",
-    "slope-uphill": "\U000f0e00",
-    "slot-machine": "\U000f1114",
-    "slot-machine-outline": "\U000f1115",
-    "smart-card": "\U000f10bd",
-    "smart-card-off": "\U000f18f7",
-    "smart-card-off-outline": "\U000f18f8",
-    "smart-card-outline": "\U000f10be",
-    "smart-card-reader": "\U000f10bf",
-    "smart-card-reader-outline": "\U000f10c0",
-    "smog": "\U000f0a71",
-    "smoke": "\U000f1799",
-    "smoke-detector": "\U000f0392",
-    "smoke-detector-alert": "\U000f192e",
-    "smoke-detector-alert-outline": "\U000f192f",
-    "smoke-detector-off": "\U000f1809",
-    "smoke-detector-off-outline": "\U000f180a",
-    "smoke-detector-outline": "\U000f1808",
-    "smoke-detector-variant": "\U000f180b",
-    "smoke-detector-variant-alert": "\U000f1930",
-    "smoke-detector-variant-off": "\U000f180c",
-    "smoking": "\U000f04b4",
-    "smoking-off": "\U000f04b5",
-    "smoking-pipe": "\U000f140d",
-    "smoking-pipe-off": "\U000f1428",
-    "snail": "\U000f1677",
-    "snake": "\U000f150e",
-    "snapchat": "\U000f04b6",
-    "snowboard": "\U000f1307",
-    "snowflake": "\U000f0717",
-    "snowflake-alert": "\U000f0f29",
-    "snowflake-check": "\U000f1a70",
-    "snowflake-melt": "\U000f12cb",
-    "snowflake-off": "\U000f14e3",
-    "snowflake-thermometer": "\U000f1a71",
-    "snowflake-variant": "\U000f0f2a",
-    "snowman": "\U000f04b7",
-    "snowmobile": "\U000f06dd",
-    "snowshoeing": "\U000f1a72",
-    "soccer": "\U000f04b8",
-    "soccer-field": "\U000f0834",
-    "social-distance-2-meters": "\U000f1579",
-    "social-distance-6-feet": "\U000f157a",
-    "sofa": "\U000f04b9",
-    "sofa-outline": "\U000f156d",
-    "sofa-single": "\U000f156e",
-    "sofa-single-outline": "\U000f156f",
-    "solar-panel": "\U000f0d9b",
-    "solar-panel-large": "\U000f0d9c",
-    "solar-power": "\U000f0a72",
-    "solar-power-variant": "\U000f1a73",
-    "solar-power-variant-outline": "\U000f1a74",
-    "soldering-iron": "\U000f1092",
-    "solid": "\U000f068d",
-    "sony-playstation": "\U000f0414",
-    "sort": "\U000f04ba",
-    "sort-alphabetical-ascending": "\U000f05bd",
-    "sort-alphabetical-ascending-variant": "\U000f1148",
-    "sort-alphabetical-descending": "\U000f05bf",
-    "sort-alphabetical-descending-variant": "\U000f1149",
-    "sort-alphabetical-variant": "\U000f04bb",
-    "sort-ascending": "\U000f04bc",
-    "sort-bool-ascending": "\U000f1385",
-    "sort-bool-ascending-variant": "\U000f1386",
-    "sort-bool-descending": "\U000f1387",
-    "sort-bool-descending-variant": "\U000f1388",
-    "sort-calendar-ascending": "\U000f1547",
-    "sort-calendar-descending": "\U000f1548",
-    "sort-clock-ascending": "\U000f1549",
-    "sort-clock-ascending-outline": "\U000f154a",
-    "sort-clock-descending": "\U000f154b",
-    "sort-clock-descending-outline": "\U000f154c",
-    "sort-descending": "\U000f04bd",
-    "sort-numeric-ascending": "\U000f1389",
-    "sort-numeric-ascending-variant": "\U000f090d",
-    "sort-numeric-descending": "\U000f138a",
-    "sort-numeric-descending-variant": "\U000f0ad2",
-    "sort-numeric-variant": "\U000f04be",
-    "sort-reverse-variant": "\U000f033c",
-    "sort-variant": "\U000f04bf",
-    "sort-variant-lock": "\U000f0ccd",
-    "sort-variant-lock-open": "\U000f0cce",
-    "sort-variant-off": "\U000f1abb",
-    "sort-variant-remove": "\U000f1147",
-    "soundbar": "\U000f17db",
-    "soundcloud": "\U000f04c0",
-    "source-branch": "\U000f062c",
-    "source-branch-check": "\U000f14cf",
-    "source-branch-minus": "\U000f14cb",
-    "source-branch-plus": "\U000f14ca",
-    "source-branch-refresh": "\U000f14cd",
-    "source-branch-remove": "\U000f14cc",
-    "source-branch-sync": "\U000f14ce",
-    "source-commit": "\U000f0718",
-    "source-commit-end": "\U000f0719",
-    "source-commit-end-local": "\U000f071a",
-    "source-commit-local": "\U000f071b",
-    "source-commit-next-local": "\U000f071c",
-    "source-commit-start": "\U000f071d",
-    "source-commit-start-next-local": "\U000f071e",
-    "source-fork": "\U000f04c1",
-    "source-merge": "\U000f062d",
-    "source-pull": "\U000f04c2",
-    "source-repository": "\U000f0ccf",
-    "source-repository-multiple": "\U000f0cd0",
-    "soy-sauce": "\U000f07ee",
-    "soy-sauce-off": "\U000f13fc",
-    "spa": "\U000f0cd1",
-    "spa-outline": "\U000f0cd2",
-    "space-invaders": "\U000f0bc9",
-    "space-station": "\U000f1383",
-    "spade": "\U000f0e65",
-    "speaker": "\U000f04c3",
-    "speaker-bluetooth": "\U000f09a2",
-    "speaker-message": "\U000f1b11",
-    "speaker-multiple": "\U000f0d38",
-    "speaker-off": "\U000f04c4",
-    "speaker-pause": "\U000f1b73",
-    "speaker-play": "\U000f1b72",
-    "speaker-stop": "\U000f1b74",
-    "speaker-wireless": "\U000f071f",
-    "spear": "\U000f1845",
-    "speedometer": "\U000f04c5",
-    "speedometer-medium": "\U000f0f85",
-    "speedometer-slow": "\U000f0f86",
-    "spellcheck": "\U000f04c6",
-    "sphere": "\U000f1954",
-    "sphere-off": "\U000f1955",
-    "spider": "\U000f11ea",
-    "spider-outline": "\U000f1c75",
-    "spider-thread": "\U000f11eb",
-    "spider-web": "\U000f0bca",
-    "spirit-level": "\U000f14f1",
-    "spoon-sugar": "\U000f1429",
-    "spotify": "\U000f04c7",
-    "spotlight": "\U000f04c8",
-    "spotlight-beam": "\U000f04c9",
-    "spray": "\U000f0665",
-    "spray-bottle": "\U000f0ae0",
-    "sprinkler": "\U000f105f",
-    "sprinkler-fire": "\U000f199d",
-    "sprinkler-variant": "\U000f1060",
-    "sprout": "\U000f0e66",
-    "sprout-outline": "\U000f0e67",
-    "square": "\U000f0764",
-    "square-circle": "\U000f1500",
-    "square-circle-outline": "\U000f1c50",
-    "square-edit-outline": "\U000f090c",
-    "square-medium": "\U000f0a13",
-    "square-medium-outline": "\U000f0a14",
-    "square-off": "\U000f12ee",
-    "square-off-outline": "\U000f12ef",
-    "square-opacity": "\U000f1854",
-    "square-outline": "\U000f0763",
-    "square-root": "\U000f0784",
-    "square-root-box": "\U000f09a3",
-    "square-rounded": "\U000f14fb",
-    "square-rounded-badge": "\U000f1a07",
-    "square-rounded-badge-outline": "\U000f1a08",
-    "square-rounded-outline": "\U000f14fc",
-    "square-small": "\U000f0a15",
-    "square-wave": "\U000f147b",
-    "squeegee": "\U000f0ae1",
-    "ssh": "\U000f08c0",
-    "stack-exchange": "\U000f060b",
-    "stack-overflow": "\U000f04cc",
-    "stackpath": "\U000f0359",
-    "stadium": "\U000f0ff9",
-    "stadium-outline": "\U000f1b03",
-    "stadium-variant": "\U000f0720",
-    "stairs": "\U000f04cd",
-    "stairs-box": "\U000f139e",
-    "stairs-down": "\U000f12be",
-    "stairs-up": "\U000f12bd",
-    "stamper": "\U000f0d39",
-    "standard-definition": "\U000f07ef",
-    "star": "\U000f04ce",
-    "star-box": "\U000f0a73",
-    "star-box-multiple": "\U000f1286",
-    "star-box-multiple-outline": "\U000f1287",
-    "star-box-outline": "\U000f0a74",
-    "star-check": "\U000f1566",
-    "star-check-outline": "\U000f156a",
-    "star-circle": "\U000f04cf",
-    "star-circle-outline": "\U000f09a4",
-    "star-cog": "\U000f1668",
-    "star-cog-outline": "\U000f1669",
-    "star-crescent": "\U000f0979",
-    "star-david": "\U000f097a",
-    "star-face": "\U000f09a5",
-    "star-four-points": "\U000f0ae2",
-    "star-four-points-box": "\U000f1c51",
-    "star-four-points-box-outline": "\U000f1c52",
-    "star-four-points-circle": "\U000f1c53",
-    "star-four-points-circle-outline": "\U000f1c54",
-    "star-four-points-outline": "\U000f0ae3",
-    "star-four-points-small": "\U000f1c55",
-    "star-half": "\U000f0246",
-    "star-half-full": "\U000f04d0",
-    "star-minus": "\U000f1564",
-    "star-minus-outline": "\U000f1568",
-    "star-off": "\U000f04d1",
-    "star-off-outline": "\U000f155b",
-    "star-outline": "\U000f04d2",
-    "star-plus": "\U000f1563",
-    "star-plus-outline": "\U000f1567",
-    "star-remove": "\U000f1565",
-    "star-remove-outline": "\U000f1569",
-    "star-settings": "\U000f166a",
-    "star-settings-outline": "\U000f166b",
-    "star-shooting": "\U000f1741",
-    "star-shooting-outline": "\U000f1742",
-    "star-three-points": "\U000f0ae4",
-    "star-three-points-outline": "\U000f0ae5",
-    "state-machine": "\U000f11ef",
-    "steam": "\U000f04d3",
-    "steering": "\U000f04d4",
-    "steering-off": "\U000f090e",
-    "step-backward": "\U000f04d5",
-    "step-backward-2": "\U000f04d6",
-    "step-forward": "\U000f04d7",
-    "step-forward-2": "\U000f04d8",
-    "stethoscope": "\U000f04d9",
-    "sticker": "\U000f1364",
-    "sticker-alert": "\U000f1365",
-    "sticker-alert-outline": "\U000f1366",
-    "sticker-check": "\U000f1367",
-    "sticker-check-outline": "\U000f1368",
-    "sticker-circle-outline": "\U000f05d0",
-    "sticker-emoji": "\U000f0785",
-    "sticker-minus": "\U000f1369",
-    "sticker-minus-outline": "\U000f136a",
-    "sticker-outline": "\U000f136b",
-    "sticker-plus": "\U000f136c",
-    "sticker-plus-outline": "\U000f136d",
-    "sticker-remove": "\U000f136e",
-    "sticker-remove-outline": "\U000f136f",
-    "sticker-text": "\U000f178e",
-    "sticker-text-outline": "\U000f178f",
-    "stocking": "\U000f04da",
-    "stomach": "\U000f1093",
-    "stool": "\U000f195d",
-    "stool-outline": "\U000f195e",
-    "stop": "\U000f04db",
-    "stop-circle": "\U000f0666",
-    "stop-circle-outline": "\U000f0667",
-    "storage-tank": "\U000f1a75",
-    "storage-tank-outline": "\U000f1a76",
-    "store": "\U000f04dc",
-    "store-24-hour": "\U000f04dd",
-    "store-alert": "\U000f18c1",
-    "store-alert-outline": "\U000f18c2",
-    "store-check": "\U000f18c3",
-    "store-check-outline": "\U000f18c4",
-    "store-clock": "\U000f18c5",
-    "store-clock-outline": "\U000f18c6",
-    "store-cog": "\U000f18c7",
-    "store-cog-outline": "\U000f18c8",
-    "store-edit": "\U000f18c9",
-    "store-edit-outline": "\U000f18ca",
-    "store-marker": "\U000f18cb",
-    "store-marker-outline": "\U000f18cc",
-    "store-minus": "\U000f165e",
-    "store-minus-outline": "\U000f18cd",
-    "store-off": "\U000f18ce",
-    "store-off-outline": "\U000f18cf",
-    "store-outline": "\U000f1361",
-    "store-plus": "\U000f165f",
-    "store-plus-outline": "\U000f18d0",
-    "store-remove": "\U000f1660",
-    "store-remove-outline": "\U000f18d1",
-    "store-search": "\U000f18d2",
-    "store-search-outline": "\U000f18d3",
-    "store-settings": "\U000f18d4",
-    "store-settings-outline": "\U000f18d5",
-    "storefront": "\U000f07c7",
-    "storefront-check": "\U000f1b7d",
-    "storefront-check-outline": "\U000f1b7e",
-    "storefront-edit": "\U000f1b7f",
-    "storefront-edit-outline": "\U000f1b80",
-    "storefront-minus": "\U000f1b83",
-    "storefront-minus-outline": "\U000f1b84",
-    "storefront-outline": "\U000f10c1",
-    "storefront-plus": "\U000f1b81",
-    "storefront-plus-outline": "\U000f1b82",
-    "storefront-remove": "\U000f1b85",
-    "storefront-remove-outline": "\U000f1b86",
-    "stove": "\U000f04de",
-    "strategy": "\U000f11d6",
-    "stretch-to-page": "\U000f0f2b",
-    "stretch-to-page-outline": "\U000f0f2c",
-    "string-lights": "\U000f12ba",
-    "string-lights-off": "\U000f12bb",
-    "subdirectory-arrow-left": "\U000f060c",
-    "subdirectory-arrow-right": "\U000f060d",
-    "submarine": "\U000f156c",
-    "subtitles": "\U000f0a16",
-    "subtitles-outline": "\U000f0a17",
-    "subway": "\U000f06ac",
-    "subway-alert-variant": "\U000f0d9d",
-    "subway-variant": "\U000f04df",
-    "summit": "\U000f0786",
-    "sun-angle": "\U000f1b27",
-    "sun-angle-outline": "\U000f1b28",
-    "sun-clock": "\U000f1a77",
-    "sun-clock-outline": "\U000f1a78",
-    "sun-compass": "\U000f19a5",
-    "sun-snowflake": "\U000f1796",
-    "sun-snowflake-variant": "\U000f1a79",
-    "sun-thermometer": "\U000f18d6",
-    "sun-thermometer-outline": "\U000f18d7",
-    "sun-wireless": "\U000f17fe",
-    "sun-wireless-outline": "\U000f17ff",
-    "sunglasses": "\U000f04e0",
-    "surfing": "\U000f1746",
-    "surround-sound": "\U000f05c5",
-    "surround-sound-2-0": "\U000f07f0",
-    "surround-sound-2-1": "\U000f1729",
-    "surround-sound-3-1": "\U000f07f1",
-    "surround-sound-5-1": "\U000f07f2",
-    "surround-sound-5-1-2": "\U000f172a",
-    "surround-sound-7-1": "\U000f07f3",
-    "svg": "\U000f0721",
-    "swap-horizontal": "\U000f04e1",
-    "swap-horizontal-bold": "\U000f0bcd",
-    "swap-horizontal-circle": "\U000f0fe1",
-    "swap-horizontal-circle-outline": "\U000f0fe2",
-    "swap-horizontal-hidden": "\U000f1d0e",
-    "swap-horizontal-variant": "\U000f08c1",
-    "swap-vertical": "\U000f04e2",
-    "swap-vertical-bold": "\U000f0bce",
-    "swap-vertical-circle": "\U000f0fe3",
-    "swap-vertical-circle-outline": "\U000f0fe4",
-    "swap-vertical-variant": "\U000f08c2",
-    "swim": "\U000f04e3",
-    "switch": "\U000f04e4",
-    "sword": "\U000f04e5",
-    "sword-cross": "\U000f0787",
-    "syllabary-hangul": "\U000f1333",
-    "syllabary-hiragana": "\U000f1334",
-    "syllabary-katakana": "\U000f1335",
-    "syllabary-katakana-halfwidth": "\U000f1336",
-    "symbol": "\U000f1501",
-    "symfony": "\U000f0ae6",
-    "synagogue": "\U000f1b04",
-    "synagogue-outline": "\U000f1b05",
-    "sync": "\U000f04e6",
-    "sync-alert": "\U000f04e7",
-    "sync-circle": "\U000f1378",
-    "sync-off": "\U000f04e8",
-    "tab": "\U000f04e9",
-    "tab-minus": "\U000f0b4b",
-    "tab-plus": "\U000f075c",
-    "tab-remove": "\U000f0b4c",
-    "tab-search": "\U000f199e",
-    "tab-unselected": "\U000f04ea",
-    "table": "\U000f04eb",
-    "table-account": "\U000f13b9",
-    "table-alert": "\U000f13ba",
-    "table-arrow-down": "\U000f13bb",
-    "table-arrow-left": "\U000f13bc",
-    "table-arrow-right": "\U000f13bd",
-    "table-arrow-up": "\U000f13be",
-    "table-border": "\U000f0a18",
-    "table-cancel": "\U000f13bf",
-    "table-chair": "\U000f1061",
-    "table-check": "\U000f13c0",
-    "table-clock": "\U000f13c1",
-    "table-cog": "\U000f13c2",
-    "table-column": "\U000f0835",
-    "table-column-plus-after": "\U000f04ec",
-    "table-column-plus-before": "\U000f04ed",
-    "table-column-remove": "\U000f04ee",
-    "table-column-width": "\U000f04ef",
-    "table-edit": "\U000f04f0",
-    "table-eye": "\U000f1094",
-    "table-eye-off": "\U000f13c3",
-    "table-filter": "\U000f1b8c",
-    "table-furniture": "\U000f05bc",
-    "table-headers-eye": "\U000f121d",
-    "table-headers-eye-off": "\U000f121e",
-    "table-heart": "\U000f13c4",
-    "table-key": "\U000f13c5",
-    "table-large": "\U000f04f1",
-    "table-large-plus": "\U000f0f87",
-    "table-large-remove": "\U000f0f88",
-    "table-lock": "\U000f13c6",
-    "table-merge-cells": "\U000f09a6",
-    "table-minus": "\U000f13c7",
-    "table-multiple": "\U000f13c8",
-    "table-network": "\U000f13c9",
-    "table-of-contents": "\U000f0836",
-    "table-off": "\U000f13ca",
-    "table-picnic": "\U000f1743",
-    "table-pivot": "\U000f183c",
-    "table-plus": "\U000f0a75",
-    "table-question": "\U000f1b21",
-    "table-refresh": "\U000f13a0",
-    "table-remove": "\U000f0a76",
-    "table-row": "\U000f0837",
-    "table-row-height": "\U000f04f2",
-    "table-row-plus-after": "\U000f04f3",
-    "table-row-plus-before": "\U000f04f4",
-    "table-row-remove": "\U000f04f5",
-    "table-search": "\U000f090f",
-    "table-settings": "\U000f0838",
-    "table-split-cell": "\U000f142a",
-    "table-star": "\U000f13cb",
-    "table-sync": "\U000f13a1",
-    "table-tennis": "\U000f0e68",
-    "tablet": "\U000f04f6",
-    "tablet-cellphone": "\U000f09a7",
-    "tablet-dashboard": "\U000f0ece",
-    "taco": "\U000f0762",
-    "tag": "\U000f04f9",
-    "tag-arrow-down": "\U000f172b",
-    "tag-arrow-down-outline": "\U000f172c",
-    "tag-arrow-left": "\U000f172d",
-    "tag-arrow-left-outline": "\U000f172e",
-    "tag-arrow-right": "\U000f172f",
-    "tag-arrow-right-outline": "\U000f1730",
-    "tag-arrow-up": "\U000f1731",
-    "tag-arrow-up-outline": "\U000f1732",
-    "tag-check": "\U000f1a7a",
-    "tag-check-outline": "\U000f1a7b",
-    "tag-edit": "\U000f1c9c",
-    "tag-edit-outline": "\U000f1c9d",
-    "tag-faces": "\U000f04fa",
-    "tag-heart": "\U000f068b",
-    "tag-heart-outline": "\U000f0bcf",
-    "tag-hidden": "\U000f1c76",
-    "tag-minus": "\U000f0910",
-    "tag-minus-outline": "\U000f121f",
-    "tag-multiple": "\U000f04fb",
-    "tag-multiple-outline": "\U000f12f7",
-    "tag-off": "\U000f1220",
-    "tag-off-outline": "\U000f1221",
-    "tag-outline": "\U000f04fc",
-    "tag-plus": "\U000f0722",
-    "tag-plus-outline": "\U000f1222",
-    "tag-remove": "\U000f0723",
-    "tag-remove-outline": "\U000f1223",
-    "tag-search": "\U000f1907",
-    "tag-search-outline": "\U000f1908",
-    "tag-text": "\U000f1224",
-    "tag-text-outline": "\U000f04fd",
-    "tailwind": "\U000f13ff",
-    "tally-mark-1": "\U000f1abc",
-    "tally-mark-2": "\U000f1abd",
-    "tally-mark-3": "\U000f1abe",
-    "tally-mark-4": "\U000f1abf",
-    "tally-mark-5": "\U000f1ac0",
-    "tangram": "\U000f04f8",
-    "tank": "\U000f0d3a",
-    "tanker-truck": "\U000f0fe5",
-    "tape-drive": "\U000f16df",
-    "tape-measure": "\U000f0b4d",
-    "target": "\U000f04fe",
-    "target-account": "\U000f0bd0",
-    "target-variant": "\U000f0a77",
-    "taxi": "\U000f04ff",
-    "tea": "\U000f0d9e",
-    "tea-outline": "\U000f0d9f",
-    "teamviewer": "\U000f0500",
-    "teddy-bear": "\U000f18fb",
-    "telescope": "\U000f0b4e",
-    "television": "\U000f0502",
-    "television-ambient-light": "\U000f1356",
-    "television-box": "\U000f0839",
-    "television-classic": "\U000f07f4",
-    "television-classic-off": "\U000f083a",
-    "television-guide": "\U000f0503",
-    "television-off": "\U000f083b",
-    "television-pause": "\U000f0f89",
-    "television-play": "\U000f0ecf",
-    "television-shimmer": "\U000f1110",
-    "television-speaker": "\U000f1b1b",
-    "television-speaker-off": "\U000f1b1c",
-    "television-stop": "\U000f0f8a",
-    "temperature-celsius": "\U000f0504",
-    "temperature-fahrenheit": "\U000f0505",
-    "temperature-kelvin": "\U000f0506",
-    "temple-buddhist": "\U000f1b06",
-    "temple-buddhist-outline": "\U000f1b07",
-    "temple-hindu": "\U000f1b08",
-    "temple-hindu-outline": "\U000f1b09",
-    "tennis": "\U000f0da0",
-    "tennis-ball": "\U000f0507",
-    "tennis-ball-outline": "\U000f1c5f",
-    "tent": "\U000f0508",
-    "terraform": "\U000f1062",
-    "terrain": "\U000f0509",
-    "test-tube": "\U000f0668",
-    "test-tube-empty": "\U000f0911",
-    "test-tube-off": "\U000f0912",
-    "text": "\U000f09a8",
-    "text-account": "\U000f1570",
-    "text-box": "\U000f021a",
-    "text-box-check": "\U000f0ea6",
-    "text-box-check-outline": "\U000f0ea7",
-    "text-box-edit": "\U000f1a7c",
-    "text-box-edit-outline": "\U000f1a7d",
-    "text-box-minus": "\U000f0ea8",
-    "text-box-minus-outline": "\U000f0ea9",
-    "text-box-multiple": "\U000f0ab7",
-    "text-box-multiple-outline": "\U000f0ab8",
-    "text-box-outline": "\U000f09ed",
-    "text-box-plus": "\U000f0eaa",
-    "text-box-plus-outline": "\U000f0eab",
-    "text-box-remove": "\U000f0eac",
-    "text-box-remove-outline": "\U000f0ead",
-    "text-box-search": "\U000f0eae",
-    "text-box-search-outline": "\U000f0eaf",
-    "text-long": "\U000f09aa",
-    "text-recognition": "\U000f113d",
-    "text-search": "\U000f13b8",
-    "text-search-variant": "\U000f1a7e",
-    "text-shadow": "\U000f0669",
-    "text-short": "\U000f09a9",
-    "texture": "\U000f050c",
-    "texture-box": "\U000f0fe6",
-    "theater": "\U000f050d",
-    "theme-light-dark": "\U000f050e",
-    "thermometer": "\U000f050f",
-    "thermometer-alert": "\U000f0e01",
-    "thermometer-auto": "\U000f1b0f",
-    "thermometer-bluetooth": "\U000f1895",
-    "thermometer-check": "\U000f1a7f",
-    "thermometer-chevron-down": "\U000f0e02",
-    "thermometer-chevron-up": "\U000f0e03",
-    "thermometer-high": "\U000f10c2",
-    "thermometer-lines": "\U000f0510",
-    "thermometer-low": "\U000f10c3",
-    "thermometer-minus": "\U000f0e04",
-    "thermometer-off": "\U000f1531",
-    "thermometer-plus": "\U000f0e05",
-    "thermometer-probe": "\U000f1b2b",
-    "thermometer-probe-off": "\U000f1b2c",
-    "thermometer-water": "\U000f1a80",
-    "thermostat": "\U000f0393",
-    "thermostat-auto": "\U000f1b17",
-    "thermostat-box": "\U000f0891",
-    "thermostat-box-auto": "\U000f1b18",
-    "thermostat-cog": "\U000f1c80",
-    "thought-bubble": "\U000f07f6",
-    "thought-bubble-outline": "\U000f07f7",
-    "thumb-down": "\U000f0511",
-    "thumb-down-outline": "\U000f0512",
-    "thumb-up": "\U000f0513",
-    "thumb-up-outline": "\U000f0514",
-    "thumbs-up-down": "\U000f0515",
-    "thumbs-up-down-outline": "\U000f1914",
-    "ticket": "\U000f0516",
-    "ticket-account": "\U000f0517",
-    "ticket-confirmation": "\U000f0518",
-    "ticket-confirmation-outline": "\U000f13aa",
-    "ticket-outline": "\U000f0913",
-    "ticket-percent": "\U000f0724",
-    "ticket-percent-outline": "\U000f142b",
-    "tie": "\U000f0519",
-    "tilde": "\U000f0725",
-    "tilde-off": "\U000f18f3",
-    "timelapse": "\U000f051a",
-    "timeline": "\U000f0bd1",
-    "timeline-alert": "\U000f0f95",
-    "timeline-alert-outline": "\U000f0f98",
-    "timeline-check": "\U000f1532",
-    "timeline-check-outline": "\U000f1533",
-    "timeline-clock": "\U000f11fb",
-    "timeline-clock-outline": "\U000f11fc",
-    "timeline-minus": "\U000f1534",
-    "timeline-minus-outline": "\U000f1535",
-    "timeline-outline": "\U000f0bd2",
-    "timeline-plus": "\U000f0f96",
-    "timeline-plus-outline": "\U000f0f97",
-    "timeline-question": "\U000f0f99",
-    "timeline-question-outline": "\U000f0f9a",
-    "timeline-remove": "\U000f1536",
-    "timeline-remove-outline": "\U000f1537",
-    "timeline-text": "\U000f0bd3",
-    "timeline-text-outline": "\U000f0bd4",
-    "timer": "\U000f13ab",
-    "timer-10": "\U000f051c",
-    "timer-3": "\U000f051d",
-    "timer-alert": "\U000f1acc",
-    "timer-alert-outline": "\U000f1acd",
-    "timer-cancel": "\U000f1ace",
-    "timer-cancel-outline": "\U000f1acf",
-    "timer-check": "\U000f1ad0",
-    "timer-check-outline": "\U000f1ad1",
-    "timer-cog": "\U000f1925",
-    "timer-cog-outline": "\U000f1926",
-    "timer-edit": "\U000f1ad2",
-    "timer-edit-outline": "\U000f1ad3",
-    "timer-lock": "\U000f1ad4",
-    "timer-lock-open": "\U000f1ad5",
-    "timer-lock-open-outline": "\U000f1ad6",
-    "timer-lock-outline": "\U000f1ad7",
-    "timer-marker": "\U000f1ad8",
-    "timer-marker-outline": "\U000f1ad9",
-    "timer-minus": "\U000f1ada",
-    "timer-minus-outline": "\U000f1adb",
-    "timer-music": "\U000f1adc",
-    "timer-music-outline": "\U000f1add",
-    "timer-off": "\U000f13ac",
-    "timer-off-outline": "\U000f051e",
-    "timer-outline": "\U000f051b",
-    "timer-pause": "\U000f1ade",
-    "timer-pause-outline": "\U000f1adf",
-    "timer-play": "\U000f1ae0",
-    "timer-play-outline": "\U000f1ae1",
-    "timer-plus": "\U000f1ae2",
-    "timer-plus-outline": "\U000f1ae3",
-    "timer-refresh": "\U000f1ae4",
-    "timer-refresh-outline": "\U000f1ae5",
-    "timer-remove": "\U000f1ae6",
-    "timer-remove-outline": "\U000f1ae7",
-    "timer-sand": "\U000f051f",
-    "timer-sand-complete": "\U000f199f",
-    "timer-sand-empty": "\U000f06ad",
-    "timer-sand-full": "\U000f078c",
-    "timer-sand-paused": "\U000f19a0",
-    "timer-settings": "\U000f1923",
-    "timer-settings-outline": "\U000f1924",
-    "timer-star": "\U000f1ae8",
-    "timer-star-outline": "\U000f1ae9",
-    "timer-stop": "\U000f1aea",
-    "timer-stop-outline": "\U000f1aeb",
-    "timer-sync": "\U000f1aec",
-    "timer-sync-outline": "\U000f1aed",
-    "timetable": "\U000f0520",
-    "tire": "\U000f1896",
-    "toaster": "\U000f1063",
-    "toaster-off": "\U000f11b7",
-    "toaster-oven": "\U000f0cd3",
-    "toggle-switch": "\U000f0521",
-    "toggle-switch-off": "\U000f0522",
-    "toggle-switch-off-outline": "\U000f0a19",
-    "toggle-switch-outline": "\U000f0a1a",
-    "toggle-switch-variant": "\U000f1a25",
-    "toggle-switch-variant-off": "\U000f1a26",
-    "toilet": "\U000f09ab",
-    "toolbox": "\U000f09ac",
-    "toolbox-outline": "\U000f09ad",
-    "tools": "\U000f1064",
-    "tooltip": "\U000f0523",
-    "tooltip-account": "\U000f000c",
-    "tooltip-cellphone": "\U000f183b",
-    "tooltip-check": "\U000f155c",
-    "tooltip-check-outline": "\U000f155d",
-    "tooltip-edit": "\U000f0524",
-    "tooltip-edit-outline": "\U000f12c5",
-    "tooltip-image": "\U000f0525",
-    "tooltip-image-outline": "\U000f0bd5",
-    "tooltip-minus": "\U000f155e",
-    "tooltip-minus-outline": "\U000f155f",
-    "tooltip-outline": "\U000f0526",
-    "tooltip-plus": "\U000f0bd6",
-    "tooltip-plus-outline": "\U000f0527",
-    "tooltip-question": "\U000f1bba",
-    "tooltip-question-outline": "\U000f1bbb",
-    "tooltip-remove": "\U000f1560",
-    "tooltip-remove-outline": "\U000f1561",
-    "tooltip-text": "\U000f0528",
-    "tooltip-text-outline": "\U000f0bd7",
-    "tooth": "\U000f08c3",
-    "tooth-outline": "\U000f0529",
-    "toothbrush": "\U000f1129",
-    "toothbrush-electric": "\U000f112c",
-    "toothbrush-paste": "\U000f112a",
-    "torch": "\U000f1606",
-    "tortoise": "\U000f0d3b",
-    "toslink": "\U000f12b8",
-    "touch-text-outline": "\U000f1c60",
-    "tournament": "\U000f09ae",
-    "tow-truck": "\U000f083c",
-    "tower-beach": "\U000f0681",
-    "tower-fire": "\U000f0682",
-    "town-hall": "\U000f1875",
-    "toy-brick": "\U000f1288",
-    "toy-brick-marker": "\U000f1289",
-    "toy-brick-marker-outline": "\U000f128a",
-    "toy-brick-minus": "\U000f128b",
-    "toy-brick-minus-outline": "\U000f128c",
-    "toy-brick-outline": "\U000f128d",
-    "toy-brick-plus": "\U000f128e",
-    "toy-brick-plus-outline": "\U000f128f",
-    "toy-brick-remove": "\U000f1290",
-    "toy-brick-remove-outline": "\U000f1291",
-    "toy-brick-search": "\U000f1292",
-    "toy-brick-search-outline": "\U000f1293",
-    "track-light": "\U000f0914",
-    "track-light-off": "\U000f1b01",
-    "trackpad": "\U000f07f8",
-    "trackpad-lock": "\U000f0933",
-    "tractor": "\U000f0892",
-    "tractor-variant": "\U000f14c4",
-    "trademark": "\U000f0a78",
-    "traffic-cone": "\U000f137c",
-    "traffic-light": "\U000f052b",
-    "traffic-light-outline": "\U000f182a",
-    "train": "\U000f052c",
-    "train-bus": "\U000f1cc7",
-    "train-car": "\U000f0bd8",
-    "train-car-autorack": "\U000f1b2d",
-    "train-car-box": "\U000f1b2e",
-    "train-car-box-full": "\U000f1b2f",
-    "train-car-box-open": "\U000f1b30",
-    "train-car-caboose": "\U000f1b31",
-    "train-car-centerbeam": "\U000f1b32",
-    "train-car-centerbeam-full": "\U000f1b33",
-    "train-car-container": "\U000f1b34",
-    "train-car-flatbed": "\U000f1b35",
-    "train-car-flatbed-car": "\U000f1b36",
-    "train-car-flatbed-tank": "\U000f1b37",
-    "train-car-gondola": "\U000f1b38",
-    "train-car-gondola-full": "\U000f1b39",
-    "train-car-hopper": "\U000f1b3a",
-    "train-car-hopper-covered": "\U000f1b3b",
-    "train-car-hopper-full": "\U000f1b3c",
-    "train-car-intermodal": "\U000f1b3d",
-    "train-car-passenger": "\U000f1733",
-    "train-car-passenger-door": "\U000f1734",
-    "train-car-passenger-door-open": "\U000f1735",
-    "train-car-passenger-variant": "\U000f1736",
-    "train-car-tank": "\U000f1b3e",
-    "train-variant": "\U000f08c4",
-    "tram": "\U000f052d",
-    "tram-side": "\U000f0fe7",
-    "transcribe": "\U000f052e",
-    "transcribe-close": "\U000f052f",
-    "transfer": "\U000f1065",
-    "transfer-down": "\U000f0da1",
-    "transfer-left": "\U000f0da2",
-    "transfer-right": "\U000f0530",
-    "transfer-up": "\U000f0da3",
-    "transit-connection": "\U000f0d3c",
-    "transit-connection-horizontal": "\U000f1546",
-    "transit-connection-variant": "\U000f0d3d",
-    "transit-detour": "\U000f0f8b",
-    "transit-skip": "\U000f1515",
-    "transit-transfer": "\U000f06ae",
-    "transition": "\U000f0915",
-    "transition-masked": "\U000f0916",
-    "translate": "\U000f05ca",
-    "translate-off": "\U000f0e06",
-    "translate-variant": "\U000f1b99",
-    "transmission-tower": "\U000f0d3e",
-    "transmission-tower-export": "\U000f192c",
-    "transmission-tower-import": "\U000f192d",
-    "transmission-tower-off": "\U000f19dd",
-    "trash-can": "\U000f0a79",
-    "trash-can-outline": "\U000f0a7a",
-    "tray": "\U000f1294",
-    "tray-alert": "\U000f1295",
-    "tray-arrow-down": "\U000f0120",
-    "tray-arrow-up": "\U000f011d",
-    "tray-full": "\U000f1296",
-    "tray-minus": "\U000f1297",
-    "tray-plus": "\U000f1298",
-    "tray-remove": "\U000f1299",
-    "treasure-chest": "\U000f0726",
-    "treasure-chest-outline": "\U000f1c77",
-    "tree": "\U000f0531",
-    "tree-outline": "\U000f0e69",
-    "trello": "\U000f0532",
-    "trending-down": "\U000f0533",
-    "trending-neutral": "\U000f0534",
-    "trending-up": "\U000f0535",
-    "triangle": "\U000f0536",
-    "triangle-down": "\U000f1c56",
-    "triangle-down-outline": "\U000f1c57",
-    "triangle-outline": "\U000f0537",
-    "triangle-small-down": "\U000f1a09",
-    "triangle-small-up": "\U000f1a0a",
-    "triangle-wave": "\U000f147c",
-    "triforce": "\U000f0bd9",
-    "trophy": "\U000f0538",
-    "trophy-award": "\U000f0539",
-    "trophy-broken": "\U000f0da4",
-    "trophy-outline": "\U000f053a",
-    "trophy-variant": "\U000f053b",
-    "trophy-variant-outline": "\U000f053c",
-    "truck": "\U000f053d",
-    "truck-alert": "\U000f19de",
-    "truck-alert-outline": "\U000f19df",
-    "truck-cargo-container": "\U000f18d8",
-    "truck-check": "\U000f0cd4",
-    "truck-check-outline": "\U000f129a",
-    "truck-delivery": "\U000f053e",
-    "truck-delivery-outline": "\U000f129b",
-    "truck-fast": "\U000f0788",
-    "truck-fast-outline": "\U000f129c",
-    "truck-flatbed": "\U000f1891",
-    "truck-minus": "\U000f19ae",
-    "truck-minus-outline": "\U000f19bd",
-    "truck-off-road": "\U000f1c9e",
-    "truck-off-road-off": "\U000f1c9f",
-    "truck-outline": "\U000f129d",
-    "truck-plus": "\U000f19ad",
-    "truck-plus-outline": "\U000f19bc",
-    "truck-remove": "\U000f19af",
-    "truck-remove-outline": "\U000f19be",
-    "truck-snowflake": "\U000f19a6",
-    "truck-trailer": "\U000f0727",
-    "trumpet": "\U000f1096",
-    "tshirt-crew": "\U000f0a7b",
-    "tshirt-crew-outline": "\U000f053f",
-    "tshirt-v": "\U000f0a7c",
-    "tshirt-v-outline": "\U000f0540",
-    "tsunami": "\U000f1a81",
-    "tumble-dryer": "\U000f0917",
-    "tumble-dryer-alert": "\U000f11ba",
-    "tumble-dryer-off": "\U000f11bb",
-    "tune": "\U000f062e",
-    "tune-variant": "\U000f1542",
-    "tune-vertical": "\U000f066a",
-    "tune-vertical-variant": "\U000f1543",
-    "tunnel": "\U000f183d",
-    "tunnel-outline": "\U000f183e",
-    "turbine": "\U000f1a82",
-    "turkey": "\U000f171b",
-    "turnstile": "\U000f0cd5",
-    "turnstile-outline": "\U000f0cd6",
-    "turtle": "\U000f0cd7",
-    "twitch": "\U000f0543",
-    "twitter": "\U000f0544",
-    "two-factor-authentication": "\U000f09af",
-    "typewriter": "\U000f0f2d",
-    "ubisoft": "\U000f0bda",
-    "ubuntu": "\U000f0548",
-    "ufo": "\U000f10c4",
-    "ufo-outline": "\U000f10c5",
-    "ultra-high-definition": "\U000f07f9",
-    "umbraco": "\U000f0549",
-    "umbrella": "\U000f054a",
-    "umbrella-beach": "\U000f188a",
-    "umbrella-beach-outline": "\U000f188b",
-    "umbrella-closed": "\U000f09b0",
-    "umbrella-closed-outline": "\U000f13e2",
-    "umbrella-closed-variant": "\U000f13e1",
-    "umbrella-outline": "\U000f054b",
-    "underwear-outline": "\U000f1d0f",
-    "undo": "\U000f054c",
-    "undo-variant": "\U000f054d",
-    "unfold-less-horizontal": "\U000f054e",
-    "unfold-less-vertical": "\U000f0760",
-    "unfold-more-horizontal": "\U000f054f",
-    "unfold-more-vertical": "\U000f0761",
-    "ungroup": "\U000f0550",
-    "unicode": "\U000f0ed0",
-    "unicorn": "\U000f15c2",
-    "unicorn-variant": "\U000f15c3",
-    "unicycle": "\U000f15e5",
-    "unity": "\U000f06af",
-    "unreal": "\U000f09b1",
-    "update": "\U000f06b0",
-    "upload": "\U000f0552",
-    "upload-box": "\U000f1d10",
-    "upload-box-outline": "\U000f1d11",
-    "upload-circle": "\U000f1d12",
-    "upload-circle-outline": "\U000f1d13",
-    "upload-lock": "\U000f1373",
-    "upload-lock-outline": "\U000f1374",
-    "upload-multiple": "\U000f083d",
-    "upload-multiple-outline": "\U000f1d14",
-    "upload-network": "\U000f06f6",
-    "upload-network-outline": "\U000f0cd8",
-    "upload-off": "\U000f10c6",
-    "upload-off-outline": "\U000f10c7",
-    "upload-outline": "\U000f0e07",
-    "usb": "\U000f0553",
-    "usb-c-port": "\U000f1cbf",
-    "usb-flash-drive": "\U000f129e",
-    "usb-flash-drive-outline": "\U000f129f",
-    "usb-port": "\U000f11f0",
-    "vacuum": "\U000f19a1",
-    "vacuum-outline": "\U000f19a2",
-    "valve": "\U000f1066",
-    "valve-closed": "\U000f1067",
-    "valve-open": "\U000f1068",
-    "van-passenger": "\U000f07fa",
-    "van-utility": "\U000f07fb",
-    "vanish": "\U000f07fc",
-    "vanish-quarter": "\U000f1554",
-    "vanity-light": "\U000f11e1",
-    "variable": "\U000f0ae7",
-    "variable-box": "\U000f1111",
-    "vector-arrange-above": "\U000f0554",
-    "vector-arrange-below": "\U000f0555",
-    "vector-bezier": "\U000f0ae8",
-    "vector-circle": "\U000f0556",
-    "vector-circle-variant": "\U000f0557",
-    "vector-combine": "\U000f0558",
-    "vector-curve": "\U000f0559",
-    "vector-difference": "\U000f055a",
-    "vector-difference-ab": "\U000f055b",
-    "vector-difference-ba": "\U000f055c",
-    "vector-ellipse": "\U000f0893",
-    "vector-intersection": "\U000f055d",
-    "vector-line": "\U000f055e",
-    "vector-link": "\U000f0fe8",
-    "vector-point": "\U000f01c4",
-    "vector-point-edit": "\U000f09e8",
-    "vector-point-minus": "\U000f1b78",
-    "vector-point-plus": "\U000f1b79",
-    "vector-point-select": "\U000f055f",
-    "vector-polygon": "\U000f0560",
-    "vector-polygon-variant": "\U000f1856",
-    "vector-polyline": "\U000f0561",
-    "vector-polyline-edit": "\U000f1225",
-    "vector-polyline-minus": "\U000f1226",
-    "vector-polyline-plus": "\U000f1227",
-    "vector-polyline-remove": "\U000f1228",
-    "vector-radius": "\U000f074a",
-    "vector-rectangle": "\U000f05c6",
-    "vector-selection": "\U000f0562",
-    "vector-square": "\U000f0001",
-    "vector-square-close": "\U000f1857",
-    "vector-square-edit": "\U000f18d9",
-    "vector-square-minus": "\U000f18da",
-    "vector-square-open": "\U000f1858",
-    "vector-square-plus": "\U000f18db",
-    "vector-square-remove": "\U000f18dc",
-    "vector-triangle": "\U000f0563",
-    "vector-union": "\U000f0564",
-    "vhs": "\U000f0a1b",
-    "vibrate": "\U000f0566",
-    "vibrate-off": "\U000f0cd9",
-    "video": "\U000f0567",
-    "video-2d": "\U000f1a1c",
-    "video-3d": "\U000f07fd",
-    "video-3d-off": "\U000f13d9",
-    "video-3d-variant": "\U000f0ed1",
-    "video-4k-box": "\U000f083e",
-    "video-account": "\U000f0919",
-    "video-box": "\U000f00fd",
-    "video-box-off": "\U000f00fe",
-    "video-check": "\U000f1069",
-    "video-check-outline": "\U000f106a",
-    "video-high-definition": "\U000f152e",
-    "video-image": "\U000f091a",
-    "video-input-antenna": "\U000f083f",
-    "video-input-component": "\U000f0840",
-    "video-input-hdmi": "\U000f0841",
-    "video-input-scart": "\U000f0f8c",
-    "video-input-svideo": "\U000f0842",
-    "video-marker": "\U000f19a9",
-    "video-marker-outline": "\U000f19aa",
-    "video-minus": "\U000f09b2",
-    "video-minus-outline": "\U000f02ba",
-    "video-off": "\U000f0568",
-    "video-off-outline": "\U000f0bdb",
-    "video-outline": "\U000f0bdc",
-    "video-plus": "\U000f09b3",
-    "video-plus-outline": "\U000f01d3",
-    "video-stabilization": "\U000f091b",
-    "video-standard-definition": "\U000f1ca0",
-    "video-switch": "\U000f0569",
-    "video-switch-outline": "\U000f0790",
-    "video-vintage": "\U000f0a1c",
-    "video-wireless": "\U000f0ed2",
-    "video-wireless-outline": "\U000f0ed3",
-    "view-agenda": "\U000f056a",
-    "view-agenda-outline": "\U000f11d8",
-    "view-array": "\U000f056b",
-    "view-array-outline": "\U000f1485",
-    "view-carousel": "\U000f056c",
-    "view-carousel-outline": "\U000f1486",
-    "view-column": "\U000f056d",
-    "view-column-outline": "\U000f1487",
-    "view-comfy": "\U000f0e6a",
-    "view-comfy-outline": "\U000f1488",
-    "view-compact": "\U000f0e6b",
-    "view-compact-outline": "\U000f0e6c",
-    "view-dashboard": "\U000f056e",
-    "view-dashboard-edit": "\U000f1947",
-    "view-dashboard-edit-outline": "\U000f1948",
-    "view-dashboard-outline": "\U000f0a1d",
-    "view-dashboard-variant": "\U000f0843",
-    "view-dashboard-variant-outline": "\U000f1489",
-    "view-day": "\U000f056f",
-    "view-day-outline": "\U000f148a",
-    "view-gallery": "\U000f1888",
-    "view-gallery-outline": "\U000f1889",
-    "view-grid": "\U000f0570",
-    "view-grid-compact": "\U000f1c61",
-    "view-grid-outline": "\U000f11d9",
-    "view-grid-plus": "\U000f0f8d",
-    "view-grid-plus-outline": "\U000f11da",
-    "view-headline": "\U000f0571",
-    "view-list": "\U000f0572",
-    "view-list-outline": "\U000f148b",
-    "view-module": "\U000f0573",
-    "view-module-outline": "\U000f148c",
-    "view-parallel": "\U000f0728",
-    "view-parallel-outline": "\U000f148d",
-    "view-quilt": "\U000f0574",
-    "view-quilt-outline": "\U000f148e",
-    "view-sequential": "\U000f0729",
-    "view-sequential-outline": "\U000f148f",
-    "view-split-horizontal": "\U000f0bcb",
-    "view-split-vertical": "\U000f0bcc",
-    "view-stream": "\U000f0575",
-    "view-stream-outline": "\U000f1490",
-    "view-week": "\U000f0576",
-    "view-week-outline": "\U000f1491",
-    "vimeo": "\U000f0577",
-    "violin": "\U000f060f",
-    "virtual-reality": "\U000f0894",
-    "virus": "\U000f13b6",
-    "virus-off": "\U000f18e1",
-    "virus-off-outline": "\U000f18e2",
-    "virus-outline": "\U000f13b7",
-    "vlc": "\U000f057c",
-    "voicemail": "\U000f057d",
-    "volcano": "\U000f1a83",
-    "volcano-outline": "\U000f1a84",
-    "volleyball": "\U000f09b4",
-    "volume-equal": "\U000f1b10",
-    "volume-high": "\U000f057e",
-    "volume-low": "\U000f057f",
-    "volume-medium": "\U000f0580",
-    "volume-minus": "\U000f075e",
-    "volume-mute": "\U000f075f",
-    "volume-off": "\U000f0581",
-    "volume-plus": "\U000f075d",
-    "volume-source": "\U000f1120",
-    "volume-variant-off": "\U000f0e08",
-    "volume-vibrate": "\U000f1121",
-    "vote": "\U000f0a1f",
-    "vote-outline": "\U000f0a20",
-    "vpn": "\U000f0582",
-    "vuejs": "\U000f0844",
-    "vuetify": "\U000f0e6d",
-    "walk": "\U000f0583",
-    "wall": "\U000f07fe",
-    "wall-fire": "\U000f1a11",
-    "wall-sconce": "\U000f091c",
-    "wall-sconce-flat": "\U000f091d",
-    "wall-sconce-flat-outline": "\U000f17c9",
-    "wall-sconce-flat-variant": "\U000f041c",
-    "wall-sconce-flat-variant-outline": "\U000f17ca",
-    "wall-sconce-outline": "\U000f17cb",
-    "wall-sconce-round": "\U000f0748",
-    "wall-sconce-round-outline": "\U000f17cc",
-    "wall-sconce-round-variant": "\U000f091e",
-    "wall-sconce-round-variant-outline": "\U000f17cd",
-    "wallet": "\U000f0584",
-    "wallet-bifold": "\U000f1c58",
-    "wallet-bifold-outline": "\U000f1c59",
-    "wallet-giftcard": "\U000f0585",
-    "wallet-membership": "\U000f0586",
-    "wallet-outline": "\U000f0bdd",
-    "wallet-plus": "\U000f0f8e",
-    "wallet-plus-outline": "\U000f0f8f",
-    "wallet-travel": "\U000f0587",
-    "wallpaper": "\U000f0e09",
-    "wan": "\U000f0588",
-    "wardrobe": "\U000f0f90",
-    "wardrobe-outline": "\U000f0f91",
-    "warehouse": "\U000f0f81",
-    "washing-machine": "\U000f072a",
-    "washing-machine-alert": "\U000f11bc",
-    "washing-machine-off": "\U000f11bd",
-    "watch": "\U000f0589",
-    "watch-export": "\U000f058a",
-    "watch-export-variant": "\U000f0895",
-    "watch-import": "\U000f058b",
-    "watch-import-variant": "\U000f0896",
-    "watch-variant": "\U000f0897",
-    "watch-vibrate": "\U000f06b1",
-    "watch-vibrate-off": "\U000f0cda",
-    "water": "\U000f058c",
-    "water-alert": "\U000f1502",
-    "water-alert-outline": "\U000f1503",
-    "water-boiler": "\U000f0f92",
-    "water-boiler-alert": "\U000f11b3",
-    "water-boiler-auto": "\U000f1b98",
-    "water-boiler-off": "\U000f11b4",
-    "water-check": "\U000f1504",
-    "water-check-outline": "\U000f1505",
-    "water-circle": "\U000f1806",
-    "water-minus": "\U000f1506",
-    "water-minus-outline": "\U000f1507",
-    "water-off": "\U000f058d",
-    "water-off-outline": "\U000f1508",
-    "water-opacity": "\U000f1855",
-    "water-outline": "\U000f0e0a",
-    "water-percent": "\U000f058e",
-    "water-percent-alert": "\U000f1509",
-    "water-plus": "\U000f150a",
-    "water-plus-outline": "\U000f150b",
-    "water-polo": "\U000f12a0",
-    "water-pump": "\U000f058f",
-    "water-pump-off": "\U000f0f93",
-    "water-remove": "\U000f150c",
-    "water-remove-outline": "\U000f150d",
-    "water-sync": "\U000f17c6",
-    "water-thermometer": "\U000f1a85",
-    "water-thermometer-outline": "\U000f1a86",
-    "water-well": "\U000f106b",
-    "water-well-outline": "\U000f106c",
-    "waterfall": "\U000f1849",
-    "watering-can": "\U000f1481",
-    "watering-can-outline": "\U000f1482",
-    "watermark": "\U000f0612",
-    "wave": "\U000f0f2e",
-    "wave-arrow-down": "\U000f1cb0",
-    "wave-arrow-up": "\U000f1cb1",
-    "wave-undercurrent": "\U000f1cc0",
-    "waveform": "\U000f147d",
-    "waves": "\U000f078d",
-    "waves-arrow-left": "\U000f1859",
-    "waves-arrow-right": "\U000f185a",
-    "waves-arrow-up": "\U000f185b",
-    "waze": "\U000f0bde",
-    "weather-cloudy": "\U000f0590",
-    "weather-cloudy-alert": "\U000f0f2f",
-    "weather-cloudy-arrow-right": "\U000f0e6e",
-    "weather-cloudy-clock": "\U000f18f6",
-    "weather-dust": "\U000f1b5a",
-    "weather-fog": "\U000f0591",
-    "weather-hail": "\U000f0592",
-    "weather-hazy": "\U000f0f30",
-    "weather-hurricane": "\U000f0898",
-    "weather-hurricane-outline": "\U000f1c78",
-    "weather-lightning": "\U000f0593",
-    "weather-lightning-rainy": "\U000f067e",
-    "weather-moonset": "\U000f1d15",
-    "weather-moonset-down": "\U000f1d16",
-    "weather-moonset-up": "\U000f1d17",
-    "weather-night": "\U000f0594",
-    "weather-night-partly-cloudy": "\U000f0f31",
-    "weather-partly-cloudy": "\U000f0595",
-    "weather-partly-lightning": "\U000f0f32",
-    "weather-partly-rainy": "\U000f0f33",
-    "weather-partly-snowy": "\U000f0f34",
-    "weather-partly-snowy-rainy": "\U000f0f35",
-    "weather-pouring": "\U000f0596",
-    "weather-rainy": "\U000f0597",
-    "weather-snowy": "\U000f0598",
-    "weather-snowy-heavy": "\U000f0f36",
-    "weather-snowy-rainy": "\U000f067f",
-    "weather-sunny": "\U000f0599",
-    "weather-sunny-alert": "\U000f0f37",
-    "weather-sunny-off": "\U000f14e4",
-    "weather-sunset": "\U000f059a",
-    "weather-sunset-down": "\U000f059b",
-    "weather-sunset-up": "\U000f059c",
-    "weather-tornado": "\U000f0f38",
-    "weather-windy": "\U000f059d",
-    "weather-windy-variant": "\U000f059e",
-    "web": "\U000f059f",
-    "web-box": "\U000f0f94",
-    "web-cancel": "\U000f1790",
-    "web-check": "\U000f0789",
-    "web-clock": "\U000f124a",
-    "web-minus": "\U000f10a0",
-    "web-off": "\U000f0a8e",
-    "web-plus": "\U000f0033",
-    "web-refresh": "\U000f1791",
-    "web-remove": "\U000f0551",
-    "web-sync": "\U000f1792",
-    "webcam": "\U000f05a0",
-    "webcam-off": "\U000f1737",
-    "webhook": "\U000f062f",
-    "webpack": "\U000f072b",
-    "webrtc": "\U000f1248",
-    "wechat": "\U000f0611",
-    "weight": "\U000f05a1",
-    "weight-gram": "\U000f0d3f",
-    "weight-kilogram": "\U000f05a2",
-    "weight-lifter": "\U000f115d",
-    "weight-pound": "\U000f09b5",
-    "whatsapp": "\U000f05a3",
-    "wheel-barrow": "\U000f14f2",
-    "wheelchair": "\U000f1a87",
-    "wheelchair-accessibility": "\U000f05a4",
-    "whistle": "\U000f09b6",
-    "whistle-outline": "\U000f12bc",
-    "white-balance-auto": "\U000f05a5",
-    "white-balance-incandescent": "\U000f05a6",
-    "white-balance-iridescent": "\U000f05a7",
-    "white-balance-sunny": "\U000f05a8",
-    "widgets": "\U000f072c",
-    "widgets-outline": "\U000f1355",
-    "wifi": "\U000f05a9",
-    "wifi-alert": "\U000f16b5",
-    "wifi-arrow-down": "\U000f16b6",
-    "wifi-arrow-left": "\U000f16b7",
-    "wifi-arrow-left-right": "\U000f16b8",
-    "wifi-arrow-right": "\U000f16b9",
-    "wifi-arrow-up": "\U000f16ba",
-    "wifi-arrow-up-down": "\U000f16bb",
-    "wifi-cancel": "\U000f16bc",
-    "wifi-check": "\U000f16bd",
-    "wifi-cog": "\U000f16be",
-    "wifi-lock": "\U000f16bf",
-    "wifi-lock-open": "\U000f16c0",
-    "wifi-marker": "\U000f16c1",
-    "wifi-minus": "\U000f16c2",
-    "wifi-off": "\U000f05aa",
-    "wifi-plus": "\U000f16c3",
-    "wifi-refresh": "\U000f16c4",
-    "wifi-remove": "\U000f16c5",
-    "wifi-settings": "\U000f16c6",
-    "wifi-star": "\U000f0e0b",
-    "wifi-strength-1": "\U000f091f",
-    "wifi-strength-1-alert": "\U000f0920",
-    "wifi-strength-1-lock": "\U000f0921",
-    "wifi-strength-1-lock-open": "\U000f16cb",
-    "wifi-strength-2": "\U000f0922",
-    "wifi-strength-2-alert": "\U000f0923",
-    "wifi-strength-2-lock": "\U000f0924",
-    "wifi-strength-2-lock-open": "\U000f16cc",
-    "wifi-strength-3": "\U000f0925",
-    "wifi-strength-3-alert": "\U000f0926",
-    "wifi-strength-3-lock": "\U000f0927",
-    "wifi-strength-3-lock-open": "\U000f16cd",
-    "wifi-strength-4": "\U000f0928",
-    "wifi-strength-4-alert": "\U000f0929",
-    "wifi-strength-4-lock": "\U000f092a",
-    "wifi-strength-4-lock-open": "\U000f16ce",
-    "wifi-strength-alert-outline": "\U000f092b",
-    "wifi-strength-lock-open-outline": "\U000f16cf",
-    "wifi-strength-lock-outline": "\U000f092c",
-    "wifi-strength-off": "\U000f092d",
-    "wifi-strength-off-outline": "\U000f092e",
-    "wifi-strength-outline": "\U000f092f",
-    "wifi-sync": "\U000f16c7",
-    "wikipedia": "\U000f05ac",
-    "wind-power": "\U000f1a88",
-    "wind-power-outline": "\U000f1a89",
-    "wind-turbine": "\U000f0da5",
-    "wind-turbine-alert": "\U000f19ab",
-    "wind-turbine-check": "\U000f19ac",
-    "window-close": "\U000f05ad",
-    "window-closed": "\U000f05ae",
-    "window-closed-variant": "\U000f11db",
-    "window-maximize": "\U000f05af",
-    "window-minimize": "\U000f05b0",
-    "window-open": "\U000f05b1",
-    "window-open-variant": "\U000f11dc",
-    "window-restore": "\U000f05b2",
-    "window-shutter": "\U000f111c",
-    "window-shutter-alert": "\U000f111d",
-    "window-shutter-auto": "\U000f1ba3",
-    "window-shutter-cog": "\U000f1a8a",
-    "window-shutter-open": "\U000f111e",
-    "window-shutter-settings": "\U000f1a8b",
-    "windsock": "\U000f15fa",
-    "wiper": "\U000f0ae9",
-    "wiper-wash": "\U000f0da6",
-    "wiper-wash-alert": "\U000f18df",
-    "wizard-hat": "\U000f1477",
-    "wordpress": "\U000f05b4",
-    "wrap": "\U000f05b6",
-    "wrap-disabled": "\U000f0bdf",
-    "wrench": "\U000f05b7",
-    "wrench-check": "\U000f1b8f",
-    "wrench-check-outline": "\U000f1b90",
-    "wrench-clock": "\U000f19a3",
-    "wrench-clock-outline": "\U000f1b93",
-    "wrench-cog": "\U000f1b91",
-    "wrench-cog-outline": "\U000f1b92",
-    "wrench-outline": "\U000f0be0",
-    "xamarin": "\U000f0845",
-    "xml": "\U000f05c0",
-    "xmpp": "\U000f07ff",
-    "yahoo": "\U000f0b4f",
-    "yeast": "\U000f05c1",
-    "yin-yang": "\U000f0680",
-    "yoga": "\U000f117c",
-    "youtube": "\U000f05c3",
-    "youtube-gaming": "\U000f0848",
-    "youtube-studio": "\U000f0847",
-    "youtube-subscription": "\U000f0d40",
-    "youtube-tv": "\U000f0448",
-    "yurt": "\U000f1516",
-    "z-wave": "\U000f0aea",
-    "zend": "\U000f0aeb",
-    "zigbee": "\U000f0d41",
-    "zip-box": "\U000f05c4",
-    "zip-box-outline": "\U000f0ffa",
-    "zip-disk": "\U000f0a23",
-    "zodiac-aquarius": "\U000f0a7d",
-    "zodiac-aries": "\U000f0a7e",
-    "zodiac-cancer": "\U000f0a7f",
-    "zodiac-capricorn": "\U000f0a80",
-    "zodiac-gemini": "\U000f0a81",
-    "zodiac-leo": "\U000f0a82",
-    "zodiac-libra": "\U000f0a83",
-    "zodiac-pisces": "\U000f0a84",
-    "zodiac-sagittarius": "\U000f0a85",
-    "zodiac-scorpio": "\U000f0a86",
-    "zodiac-taurus": "\U000f0a87",
-    "zodiac-virgo": "\U000f0a88",
-    "blank": " ",
-}
+__all__ = ("IconRegistry", "md_icons", "write_icon_table")
+
+import heapq
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Iterator, List, Union
+
+from kivymd import fonts_path
+
+_TABLE_HEADER = struct.Struct("<4sI")
+_TABLE_MAGIC = b"MDI1"
+
+
+def write_icon_table(path: str, icons: dict) -> None:
+    """
+    Writes the table of icons read by :class:`IconRegistry`.
+
+    The table consists of a header with the number of icons, the code points
+    of the icons as little-endian 32-bit integers and the names of the icons
+    separated by new lines. The icons are sorted by name.
+
+    .. versionadded:: 2.0.0
+
+    :param icons: `{name: character}` dictionary.
+    """
+
+    names = sorted(icons)
+    codepoints = array("I", (ord(icons[name]) for name in names))
+
+    if sys.byteorder == "big":
+        codepoints.byteswap()
+
+    with open(path, "wb") as file:
+        file.write(_TABLE_HEADER.pack(_TABLE_MAGIC, len(names)))
+        file.write(codepoints.tobytes())
+        file.write("\n".join(names).encode("utf-8"))
+
+
+class IconRegistry(Mapping):
+    """
+    Read-only `{name: character}` mapping of the icons from a table written
+    by :func:`write_icon_table`.
+
+    The table is read on the first access. The names are kept in a sorted
+    list and the code points in an :class:`array.array`, so looking up an
+    icon is a binary search.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._names = None
+        self._codepoints = None
+        self._rank = None
+        self._words = None
+        self._word_indices = None
+        self._trigrams = None
+
+    def __getitem__(self, name: str) -> str:
+        names = self._get_names()
+        index = bisect_left(names, name)
+
+        if index == len(names) or names[index] != name:
+            raise KeyError(name)
+
+        return chr(self._codepoints[index])
+
+    def __contains__(self, name) -> bool:
+        names = self._get_names()
+        index = bisect_left(names, name) if isinstance(name, str) else -1
+
+        return 0 <= index < len(names) and names[index] == name
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_names())
+
+    def __len__(self) -> int:
+        return len(self._get_names())
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.path!r}>"
+
+    def search(self, text: str, limit: Union[int, None] = None) -> List[str]:
+        """
+        Returns the names of the icons that contain `text`.
+
+        The names that start with `text` go first, followed by the names in
+        which a word (a part between hyphens) starts with `text` and the
+        rest. Shorter names go first within each group.
+
+        :param limit: Maximum number of the returned names.
+        """
+
+        names = self._get_names()
+
+        if not text:
+            return names[:limit]
+
+        rank = self._get_rank().__getitem__
+        end = text + chr(sys.maxunicode)
+        groups = (
+            lambda: range(bisect_left(names, text), bisect_left(names, end)),
+            lambda: self._find_words(text, end),
+            lambda: self._find(text),
+        )
+        found = set()
+        indices = []
+
+        for get_group in groups:
+            group = set(get_group()).difference(found)
+            found.update(group)
+
+            if limit is None:
+                indices.extend(sorted(group, key=rank))
+                continue
+
+            indices.extend(
+                heapq.nsmallest(limit - len(indices), group, key=rank)
+            )
+
+            if len(indices) == limit:
+                break
+
+        return [names[index] for index in indices]
+
+    def _get_names(self) -> List[str]:
+        if self._names is None:
+            self._load()
+
+        return self._names
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        magic, count = _TABLE_HEADER.unpack_from(data)
+
+        if magic != _TABLE_MAGIC:
+            raise ValueError(f"{self.path} is not a table of icons")
+
+        start = _TABLE_HEADER.size
+        end = start + count * 4
+        codepoints = array("I")
+        codepoints.frombytes(data[start:end])
+
+        if sys.byteorder == "big":
+            codepoints.byteswap()
+
+        self._codepoints = codepoints
+        self._names = data[end:].decode("utf-8").split("\n")
+
+    def _get_rank(self) -> array:
+        # Positions of the names ordered by length.
+        if self._rank is None:
+            names = self._names
+            rank = array("I", bytes(4 * len(names)))
+            indices = sorted(range(len(names)), key=lambda i: len(names[i]))
+
+            for position, index in enumerate(indices):
+                rank[index] = position
+
+            self._rank = rank
+
+        return self._rank
+
+    def _find_words(self, text: str, end: str) -> array:
+        # Searches the sorted ends of the names that start after a hyphen.
+        if self._words is None:
+            words = sorted(
+                (name[i + 1 :], index)
+                for index, name in enumerate(self._names)
+                for i, char in enumerate(name)
+                if char == "-"
+            )
+            self._words = [word for word, index in words]
+            self._word_indices = array("I", (index for word, index in words))
+
+        return self._word_indices[
+            bisect_left(self._words, text) : bisect_left(self._words, end)
+        ]
+
+    def _find(self, text: str) -> List[int]:
+        names = self._names
+
+        if len(text) < 3:
+            return [i for i, name in enumerate(names) if text in name]
+
+        if self._trigrams is None:
+            trigrams = {}
+
+            for index, name in enumerate(names):
+                for trigram in {name[i : i + 3] for i in range(len(name) - 2)}:
+                    trigrams.setdefault(trigram, []).append(index)
+
+            self._trigrams = trigrams
+
+        postings = []
+
+        for i in range(len(text) - 2):
+            posting = self._trigrams.get(text[i : i + 3])
+
+            if posting is None:
+                return []
+
+            postings.append(posting)
+
+        # Intersects the shortest lists of the names that contain the
+        # triples of characters of the text.
+        postings.sort(key=len)
+        candidates = postings[0]
+
+        for posting in postings[1:4]:
+            candidates = set(candidates).intersection(posting)
+
+        return [index for index in candidates if text in names[index]]
+
+
+md_icons = IconRegistry(os.path.join(fonts_path, "materialdesignicons.bin"))
+"""
+Icons of the `Icons` font.
+
+.. versionchanged:: 2.0.0
+
+    :data:`md_icons` is an :class:`IconRegistry` instead of a `dict`.
+"""
 
 
 if __name__ == "__main__":
@@ -7766,12 +560,8 @@ if __name__ == "__main__":
                 )
 
             self.ids.rv.data = []
-            for name_icon in md_icons.keys():
-                if search:
-                    if text in name_icon:
-                        add_icon_item(name_icon)
-                else:
-                    add_icon_item(name_icon)
+            for name_icon in md_icons.search(text) if search else md_icons:
+                add_icon_item(name_icon)
 
     class MainApp(MDApp):
         def __init__(self, **kwargs):
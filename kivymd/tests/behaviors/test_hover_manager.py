@@ -0,0 +1,64 @@
+"""
+Test that the hover manager dispatches `on_enter` and `on_leave` events
+only to the widgets under the mouse cursor.
+
+The test creates a column of hover widgets, moves the mouse cursor over
+them and verifies the events received by each widget, including after
+the position of the parent layout has changed.
+"""
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+
+from kivymd.app import MDApp
+from kivymd.uix.behaviors import HoverBehavior
+from kivymd.uix.behaviors.hover_behavior import hover_manager
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.relativelayout import MDRelativeLayout
+
+
+class HoverItem(MDBoxLayout, HoverBehavior):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = []
+
+    def on_enter(self, *args):
+        self.events.append("enter")
+
+    def on_leave(self, *args):
+        self.events.append("leave")
+
+
+class TestHoverManager(MDApp):
+    def build(self):
+        self.box = MDBoxLayout(orientation="vertical")
+        for i in range(10):
+            self.box.add_widget(HoverItem())
+        root = MDRelativeLayout()
+        root.add_widget(self.box)
+        return root
+
+    def on_start(self):
+        Clock.schedule_once(self.check_events, 1)
+
+    def check_events(self, *args):
+        first, second = self.box.children[-1], self.box.children[-2]
+        Window.mouse_pos = first.center
+        assert first.events == ["enter"]
+        assert second.events == []
+        assert hover_manager.checked_widgets <= 2
+
+        Window.mouse_pos = second.center
+        assert first.events == ["enter", "leave"]
+        assert second.events == ["enter"]
+
+        self.root.x += Window.width
+        Window.mouse_pos = (second.center_x + Window.width, second.center_y)
+        assert second.events == ["enter"]
+        Window.mouse_pos = (5, 5)
+        assert second.events == ["enter", "leave"]
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestHoverManager().run()
@@ -0,0 +1,84 @@
+"""
+Test that widgets with the M3 ripple effect borrow FBOs from the shared
+pool only while the ripple animation is running.
+
+The test creates many ripple widgets, starts the ripple animation on
+several of them and verifies that no FBO is allocated before the touch,
+that all FBOs are returned to the pool after the animations complete and
+that the FBOs of the widgets removed or deleted during the animation are
+returned too.
+"""
+
+import gc
+
+from kivy.clock import Clock
+from kivy.tests.common import UnitTestTouch
+
+from kivymd.app import MDApp
+from kivymd.uix.behaviors import RectangularRippleBehavior
+from kivymd.uix.behaviors.ripple_behavior import ripple_fbo_pool
+from kivymd.uix.boxlayout import MDBoxLayout
+
+
+class RippleItem(RectangularRippleBehavior, MDBoxLayout):
+    pass
+
+
+class TestRippleFboPool(MDApp):
+    def build(self):
+        root = MDBoxLayout(orientation="vertical")
+        for i in range(100):
+            root.add_widget(RippleItem())
+        return root
+
+    def on_start(self):
+        Clock.schedule_once(self.touch_items, 1)
+
+    def touch_items(self, *args):
+        assert ripple_fbo_pool.live == 0
+
+        for item in self.root.children[:3]:
+            touch = UnitTestTouch(*item.center)
+            touch.touch_down()
+            touch.touch_up()
+        Clock.schedule_once(self.check_running, 0.2)
+
+    def check_running(self, *args):
+        assert ripple_fbo_pool.in_use == 3
+        assert ripple_fbo_pool.peak == 3
+        Clock.schedule_once(self.check_completed, 2)
+
+    def check_completed(self, *args):
+        assert ripple_fbo_pool.in_use == 0
+        assert ripple_fbo_pool.live <= ripple_fbo_pool.max_idle
+        assert all(item.fbo is None for item in self.root.children)
+
+        # The widget is removed from the root together with its container,
+        # so only the removal of the container is observed.
+        self.container = MDBoxLayout(RippleItem())
+        self.root.add_widget(self.container)
+        for item in [self.root.children[1], self.container.children[0]]:
+            touch = UnitTestTouch(*item.to_window(*item.center))
+            touch.touch_down()
+        Clock.schedule_once(self.remove_items, 0.2)
+
+    def remove_items(self, *args):
+        assert ripple_fbo_pool.in_use == 2
+
+        # The removed widget returns its FBO at once.
+        item = self.root.children[1]
+        self.root.remove_widget(item)
+        assert item.fbo is None
+        assert ripple_fbo_pool.in_use == 1
+
+        # The deleted widget returns its FBO when it is collected.
+        self.root.remove_widget(self.container)
+        assert ripple_fbo_pool.in_use == 1
+        self.container = None
+        gc.collect()
+        assert ripple_fbo_pool.in_use == 0
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestRippleFboPool().run()
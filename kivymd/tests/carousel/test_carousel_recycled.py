@@ -0,0 +1,109 @@
+"""
+Test that MDCarousel with `viewclass` creates views only for the visible
+items and the overscan, reuses them when it scrolls, prefetches the images of
+the next items and that the carousel of widgets shows only the visible items.
+"""
+
+from kivy.clock import Clock
+
+from kivymd.app import MDApp
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.carousel import MDCarousel, MDCarouselItem
+from kivymd.uix.label import MDLabel
+
+IMAGE = "kivymd/images/logo/kivymd-icon-256.png"
+
+
+class CountingLabel(MDLabel):
+    created = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        CountingLabel.created += 1
+
+
+class TestCarouselRecycled(MDApp):
+    def build(self):
+        self.recycled = MDCarousel(
+            viewclass=CountingLabel,
+            data=[
+                {"text": f"Item {i}", "source": f"{IMAGE}?{i}"}
+                for i in range(500)
+            ],
+        )
+        # The image sources are not used by the labels.
+        CountingLabel.source = None
+        self.widgets = MDCarousel()
+        for i in range(20):
+            self.widgets.add_widget(MDLabel(text=f"Widget {i}"))
+
+        root = MDBoxLayout(orientation="vertical")
+        root.add_widget(self.recycled)
+        root.add_widget(self.widgets)
+        return root
+
+    def on_start(self):
+        Clock.schedule_once(self.check_views, 0.5)
+
+    def get_texts(self, carousel):
+        # The items to the right of the carousel are clipped.
+        return {
+            item.children[0].text
+            for item in carousel._get_live_items()
+            if item.opacity > 0
+            and item.width > 2
+            and item.x < carousel.right
+            and item.right > carousel.x
+        }
+
+    def check_views(self, *args):
+        carousel = self.recycled
+        # multi-browse shows three items and has one more item that comes in
+        # when it scrolls, one more is the overscan.
+        assert len(carousel._views) == 5
+        assert CountingLabel.created == 5
+        assert self.get_texts(carousel) == {f"Item {i}" for i in range(3)}
+        assert f"{IMAGE}?6" in carousel._prefetched
+
+        step = carousel._get_step_size()
+        for index in range(1, 300, 7):
+            carousel.scroll_offset = index * step
+
+        assert carousel.index == 295
+        assert "Item 295" in self.get_texts(carousel)
+        assert len(carousel._views) + len(carousel._view_pool) < 10
+        assert CountingLabel.created < 10
+
+        for layouts in (
+            "full-screen-horizontal",
+            "full-screen-vertical",
+            "center-aligned",
+            "hero",
+            "uncontained",
+        ):
+            carousel.layouts = layouts
+            carousel.scroll_offset = 295 * carousel._get_step_size()
+            assert carousel._views[295].children[0].text == "Item 295"
+            assert len(carousel._views) <= 8
+            # The items of the uncontained layout appear with an animation.
+            if layouts != "uncontained":
+                assert "Item 295" in self.get_texts(carousel)
+
+        # The new data reuses the views.
+        carousel.layouts = "multi-browse"
+        carousel.scroll_offset = 0
+        carousel.data = [{"text": f"New {i}"} for i in range(3)]
+        assert self.get_texts(carousel) == {"New 0", "New 1", "New 2"}
+        assert CountingLabel.created < 10
+
+        # The carousel of widgets shows only the visible items.
+        widgets = self.widgets
+        assert self.get_texts(widgets) == {f"Widget {i}" for i in range(3)}
+        widgets.scroll_offset = 10 * widgets._get_step_size()
+        assert self.get_texts(widgets) == {f"Widget {i}" for i in range(10, 13)}
+        assert all(isinstance(item, MDCarouselItem) for item in widgets._items)
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestCarouselRecycled().run()
@@ -0,0 +1,84 @@
+"""
+Test that rows of the data table are changed by key without rebuilding
+the table.
+
+The test checks two rows, then updates, removes and adds rows with several
+calls during one frame and verifies that the displayed page is refreshed
+once, that the checks moved with their rows and that the rows are found by
+their keys.
+"""
+
+from kivy.clock import Clock
+from kivy.metrics import dp
+
+from kivymd.app import MDApp
+from kivymd.uix.datatables import MDDataTable
+from kivymd.uix.screen import MDScreen
+
+
+class TestApplyChanges(MDApp):
+    refreshes = 0
+
+    def build(self):
+        self.data_table = MDDataTable(
+            use_pagination=True,
+            check=True,
+            rows_num=10,
+            column_data=[
+                ("No.", dp(30)),
+                ("Name", dp(40)),
+                ("Value", dp(40)),
+            ],
+            row_data=[(f"{i}", f"Name {i}", f"{i * 2}") for i in range(100)],
+        )
+        return MDScreen(self.data_table)
+
+    def on_start(self):
+        Clock.schedule_once(self.change_rows, 1)
+
+    def count_refresh(self, *args):
+        self.refreshes += 1
+
+    def change_rows(self, *args):
+        table = self.data_table
+        table.set_row_checked(5, True)
+        table.set_row_checked(50, True)
+        table.table_data.bind(recycle_data=self.count_refresh)
+
+        table.apply_changes(
+            updates=[("3", "Changed", "0")],
+            deletes=["0"],
+        )
+        table.add_row(("100", "Name 100", "200"))
+        table.update_row(("4", "Name 4", "8"), ("4", "Changed", "1"))
+        table.remove_row(("1", "Name 1", "2"))
+
+        assert len(table.row_data) == 99
+        assert len(table.table_data.row_data) == 99
+        assert table.row_data[-1][0] == "100"
+        assert table.get_checked_row_indices() == [3, 48]
+        assert table.table_data.model.index_of("100") == 98
+
+        try:
+            table.apply_changes(deletes=["1"])
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("Row with key '1' has already been removed")
+
+        Clock.schedule_once(self.check_page)
+
+    def check_page(self, *args):
+        table_data = self.data_table.table_data
+
+        assert self.refreshes == 1
+        assert table_data.recycle_data[0]["text"] == "2"
+        assert table_data.recycle_data[3]["text"] == "3"
+        assert table_data.recycle_data[4]["text"] == "Changed"
+        assert table_data.recycle_data[7]["text"] == "Changed"
+        assert self.data_table.get_row_checks()[0][0] == "5"
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestApplyChanges().run()
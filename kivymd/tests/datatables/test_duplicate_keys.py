@@ -0,0 +1,79 @@
+"""
+Test that rows of the data table with the same first cell are found by their
+data.
+
+The rows of the table share their keys, the test updates and removes the
+rows that are not found by the key and verifies that the right rows were
+changed.
+"""
+
+from kivy.clock import Clock
+from kivy.metrics import dp
+
+from kivymd.app import MDApp
+from kivymd.uix.datatables import MDDataTable
+from kivymd.uix.screen import MDScreen
+
+
+class TestDuplicateKeys(MDApp):
+    def build(self):
+        self.data_table = MDDataTable(
+            column_data=[
+                ("Name", dp(40)),
+                ("Value", dp(40)),
+            ],
+            row_data=[
+                ("A", "1"),
+                ("A", "2"),
+                ("A", "3"),
+                ("B", "4"),
+            ],
+        )
+        return MDScreen(self.data_table)
+
+    def on_start(self):
+        Clock.schedule_once(self.change_rows, 1)
+
+    def change_rows(self, *args):
+        table = self.data_table
+
+        table.update_row(("A", "1"), ("A", "10"))
+        assert [list(row) for row in table.row_data] == [
+            ["A", "10"],
+            ["A", "2"],
+            ["A", "3"],
+            ["B", "4"],
+        ]
+
+        table.remove_row(("A", "2"))
+        assert [list(row) for row in table.row_data] == [
+            ["A", "10"],
+            ["A", "3"],
+            ["B", "4"],
+        ]
+
+        table.remove_row(("A", "3"))
+        table.update_row(("B", "4"), ("B", "40"))
+        assert [list(row) for row in table.row_data] == [
+            ["A", "10"],
+            ["B", "40"],
+        ]
+
+        try:
+            table.remove_row(("A", "3"))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Row ('A', '3') has already been removed")
+
+        Clock.schedule_once(self.check_page)
+
+    def check_page(self, *args):
+        recycle_data = self.data_table.table_data.recycle_data
+
+        assert [item["text"] for item in recycle_data] == ["A", "10", "B", "40"]
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestDuplicateKeys().run()
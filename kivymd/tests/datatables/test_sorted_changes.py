@@ -0,0 +1,100 @@
+"""
+Test that the rows of the data table are changed in place after the rows
+have been sorted by the header.
+
+The test sorts the rows in descending order, then updates, removes and
+inserts rows with `update_row`, `remove_row` and `apply_changes` and verifies
+that `row_data` keeps its order and that the displayed page shows the sorted
+rows.
+"""
+
+from kivy.clock import Clock
+from kivy.metrics import dp
+
+from kivymd.app import MDApp
+from kivymd.uix.datatables import MDDataTable
+from kivymd.uix.screen import MDScreen
+
+
+def sort_on_name(data):
+    return zip(*sorted(enumerate(data), key=lambda row: row[1][1]))
+
+
+class TestSortedChanges(MDApp):
+    def build(self):
+        self.data_table = MDDataTable(
+            column_data=[
+                ("No.", dp(30)),
+                ("Name", dp(40), sort_on_name),
+            ],
+            row_data=[(f"{i}", f"Name {i}") for i in range(5)],
+            use_pagination=False,
+        )
+        return MDScreen(self.data_table)
+
+    def on_start(self):
+        Clock.schedule_once(self.sort_rows, 1)
+
+    def sort_rows(self, *args):
+        table = self.data_table
+        header = next(
+            cell
+            for cell in table.header.ids.header.children
+            if cell.text == "Name"
+        )
+        header._sort_release(header.ids.box.children[1])
+        assert [row[0] for row in table.table_data.row_data] == [
+            "4",
+            "3",
+            "2",
+            "1",
+            "0",
+        ]
+        Clock.schedule_once(self.change_rows)
+
+    def change_rows(self, *args):
+        table = self.data_table
+
+        table.update_row(("0", "Name 0"), ("0", "Changed 0"))
+        table.remove_row(("3", "Name 3"))
+        assert [tuple(row) for row in table.row_data] == [
+            ("0", "Changed 0"),
+            ("1", "Name 1"),
+            ("2", "Name 2"),
+            ("4", "Name 4"),
+        ]
+
+        table.apply_changes(
+            inserts=[("5", "Name 5")],
+            updates=[("1", "Changed 1")],
+            deletes=["4"],
+        )
+        assert [tuple(row) for row in table.row_data] == [
+            ("0", "Changed 0"),
+            ("1", "Changed 1"),
+            ("2", "Name 2"),
+            ("5", "Name 5"),
+        ]
+        table.update_row(("5", "Name 5"), ("5", "Changed 5"))
+        assert [tuple(row) for row in table.table_data.row_data] == [
+            ("2", "Name 2"),
+            ("1", "Changed 1"),
+            ("0", "Changed 0"),
+            ("5", "Changed 5"),
+        ]
+        Clock.schedule_once(self.check_page)
+
+    def check_page(self, *args):
+        recycle_data = self.data_table.table_data.recycle_data
+
+        assert [item["text"] for item in recycle_data][::2] == [
+            "2",
+            "1",
+            "0",
+            "5",
+        ]
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestSortedChanges().run()
@@ -0,0 +1,77 @@
+"""
+Test that the rows, pages and checks of the data table are served from the
+column-oriented table model.
+
+The test creates a table with pagination, checks a row on the third page,
+moves to that page and verifies the displayed cells and the check state,
+then checks all rows and reorders them.
+"""
+
+from kivy.clock import Clock
+from kivy.metrics import dp
+
+from kivymd.app import MDApp
+from kivymd.uix.datatables import MDDataTable
+from kivymd.uix.screen import MDScreen
+
+
+class TestTableModel(MDApp):
+    def build(self):
+        self.data_table = MDDataTable(
+            use_pagination=True,
+            check=True,
+            rows_num=10,
+            column_data=[
+                ("No.", dp(30)),
+                ("Name", dp(40)),
+                ("Value", dp(40)),
+            ],
+            row_data=[
+                (f"{i}", ("account", f"Name {i}"), f"{i * 2}")
+                for i in range(1000)
+            ],
+        )
+        return MDScreen(self.data_table)
+
+    def on_start(self):
+        Clock.schedule_once(self.check_model, 1)
+
+    def check_model(self, *args):
+        table = self.data_table
+        table_data = table.table_data
+
+        assert len(table_data.model) == 1000
+        assert len(table_data.model.columns) == 3
+        assert len(table_data.recycle_data) == 30
+
+        table.set_row_checked(25, True)
+        assert table.is_row_checked(25)
+        assert table.get_checked_row_indices() == [25]
+        assert table.get_row_checks() == [table.row_data[25]]
+        assert table_data.checked_row_indices == [75]
+        assert table_data.current_selection_check == {2: [15]}
+
+        table_data.set_next_row_data_parts("forward")
+        table_data.set_next_row_data_parts("forward")
+        assert table_data.recycle_data[0]["text"] == "20"
+        assert table_data.recycle_data[1]["icon"] == "account"
+        assert table_data._get_row_index(15) == 25
+
+        table.toggle_row_checked(25)
+        assert not table.is_row_checked(25)
+
+        table_data.select_all("down")
+        assert len(table.get_checked_row_indices()) == 1000
+        table_data.select_all("normal")
+        assert table.get_checked_row_indices() == []
+
+        # Reorders the rows as sorting the table does.
+        table.set_row_checked(0, True)
+        table_data.row_data = list(reversed(table_data.row_data))
+        table_data.model.remap_checked({0: 999})
+        assert table_data._get_row_checks()[0][0] == "0"
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestTableModel().run()
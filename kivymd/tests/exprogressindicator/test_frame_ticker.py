@@ -0,0 +1,102 @@
+"""
+Test that progress indicators are rendered by the shared frame ticker only
+while they are animated and visible.
+
+The test creates animated, static and hidden indicators and verifies that
+the static indicator is not ticked, that the hidden indicator is skipped,
+that the ticker waits for a redraw of the window when none of the widgets are
+visible, that a widget can have several callbacks and that the ticker
+schedules nothing when no widgets are registered.
+"""
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+
+from kivymd.app import MDApp
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.exprogressindicator import (
+    MDExCircularProgressIndicator,
+    MDExLinearProgressIndicator,
+)
+from kivymd.utils.frame_ticker import FrameTicker, frame_ticker
+
+
+class TestFrameTicker(MDApp):
+    def build(self):
+        self.animated = MDExLinearProgressIndicator(value=50)
+        self.static = MDExLinearProgressIndicator(value=50, wave_speed=0)
+        self.hidden = MDExCircularProgressIndicator(
+            determinate=False, size_hint=(None, None), size=(48, 48)
+        )
+        hidden_box = MDBoxLayout(opacity=0)
+        hidden_box.add_widget(self.hidden)
+        root = MDBoxLayout(orientation="vertical")
+        root.add_widget(self.animated)
+        root.add_widget(self.static)
+        root.add_widget(hidden_box)
+        return root
+
+    def on_start(self):
+        Clock.schedule_once(self.check_indicators, 0.5)
+
+    def check_indicators(self, *args):
+        assert frame_ticker.is_ticking(self.animated)
+        assert frame_ticker.is_ticking(self.hidden)
+        assert not frame_ticker.is_ticking(self.static)
+        assert self.animated._time > 0
+        assert self.static._time == 0
+        assert self.hidden._time == 0
+        assert self.static._active_line_objs[0].points
+
+        # The wave stops at the end of the progress.
+        self.animated.value = 100
+        assert not frame_ticker.is_ticking(self.animated)
+        self.animated.value = 50
+        assert frame_ticker.is_ticking(self.animated)
+
+        self.check_scheduling()
+        self.stop()
+
+    def check_scheduling(self):
+        ticks = []
+        other_ticks = []
+        ticker = FrameTicker()
+        assert ticker._event is None
+
+        # Widgets that are not in the window are not visible, and nothing is
+        # scheduled until the window is redrawn.
+        widget = Widget()
+        ticker.add(widget, ticks.append)
+        assert ticker._event is not None
+        ticker._tick(1 / 60)
+        assert not ticks
+        assert ticker._event is None
+        assert ticker._waiting
+
+        self.root.add_widget(widget)
+        Window.dispatch("on_draw")
+        assert ticker._event is not None
+        assert not ticker._waiting
+        ticker._tick(1 / 60)
+        assert ticks == [1 / 60]
+
+        # A widget has a callback for each registration.
+        ticker.add(widget, other_ticks.append)
+        ticker._tick(1 / 60)
+        assert ticks == other_ticks + [1 / 60]
+        ticker.remove(widget, ticks.append)
+        assert not ticker.is_ticking(widget, ticks.append)
+        assert ticker.is_ticking(widget, other_ticks.append)
+        ticker._tick(1 / 60)
+        assert len(ticks) == 2 and len(other_ticks) == 2
+
+        ticker.remove(widget)
+        assert not ticker.is_ticking(widget)
+        assert ticker._event is None
+        assert not ticker._waiting
+        self.root.remove_widget(widget)
+
+
+if __name__ == "__main__":
+    TestFrameTicker().run()
@@ -0,0 +1,66 @@
+import math
+
+
+def test_wave_points():
+    from kivymd.uix.exprogressindicator.geometry import get_wave_table
+
+    amplitude, wave_length, center, phase = 8, 21.5, 100, -1234.5
+    k = 2 * math.pi / wave_length
+    table = get_wave_table(wave_length, amplitude)
+    points = table.get_points(10.7, 1090.2, phase, offset=center)
+
+    assert len(points) == (1090 - 10) * 2
+    assert points[0::2] == list(range(10, 1090))
+    for x, y in zip(points[0::2], points[1::2]):
+        assert abs(y - center - amplitude * math.sin(k * (x - phase))) < 0.3
+
+    points = table.get_points(
+        10, 20, phase, vertical=True, scale=0.5, offset=center
+    )
+    assert points[1::2] == list(range(10, 20))
+    for y, x in zip(points[1::2], points[0::2]):
+        expected = center + amplitude * 0.5 * math.sin(k * (y - phase))
+        assert abs(x - expected) < 0.15
+
+    assert table.get_points(20, 20, phase) == []
+
+    # The table does not depend on the position of the wave.
+    assert get_wave_table(wave_length, amplitude) is table
+    points = table.get_points(10, 20, phase, offset=center + 50)
+    for x, y in zip(points[0::2], points[1::2]):
+        expected = center + 50 + amplitude * math.sin(k * (x - phase))
+        assert abs(y - expected) < 0.3
+
+
+def test_arc_points():
+    from kivymd.uix.exprogressindicator.geometry import get_arc_table
+
+    radius, cx, cy = 46, 200, 300
+    table = get_arc_table(radius, 1 / 96)
+    points = table.get_points(-7.5, -7.5 + math.pi, (cx, cy))
+
+    assert len(points) == (int(math.pi / table.step) + 1) * 2
+    for x, y in zip(points[0::2], points[1::2]):
+        assert abs(math.hypot(x - cx, y - cy) - radius) < 1e-6
+
+    # The arc starts at the given angle.
+    assert abs(points[0] - (cx + radius * math.sin(-7.5))) < 0.3
+    assert abs(points[1] - (cy + radius * math.cos(-7.5))) < 0.3
+    assert table.get_points(1, 0) == []
+    assert get_arc_table(radius, 1 / 96) is table
+
+    mode_number, amplitude, phase = 17.3, 5, 2.5
+    points = table.get_wave_points(
+        0, 2 * math.pi, mode_number, amplitude, phase, (cx, cy)
+    )
+    assert len(points) == (table.count + 1) * 2
+    for i, (x, y) in enumerate(zip(points[0::2], points[1::2])):
+        angle = i * table.step
+        r = radius + amplitude * math.sin(mode_number * angle - phase)
+        assert abs(x - cx - r * math.sin(angle)) < 1e-6
+        assert abs(y - cy - r * math.cos(angle)) < 1e-6
+
+
+if __name__ == "__main__":
+    test_wave_points()
+    test_arc_points()
@@ -0,0 +1,79 @@
+"""
+Test that the file manager reads directories in a worker thread, adds the
+items to the list in chunks and reuses the cached listings.
+
+The test opens a directory with many files, waits until all items have
+been added to the list, then opens the directory again and verifies that
+the cached listing is used until a file is added to the directory.
+"""
+
+import os
+import tempfile
+
+from kivy.clock import Clock
+
+from kivymd.app import MDApp
+from kivymd.uix.filemanager import MDFileManager
+from kivymd.uix.filemanager.scanner import directory_scanner
+from kivymd.uix.screen import MDScreen
+
+
+class TestDirectoryScanner(MDApp):
+    def build(self):
+        self.path = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.path, "folder"))
+        for i in range(500):
+            with open(os.path.join(self.path, f"file_{i:03}.txt"), "w") as file:
+                file.write("x" * i)
+
+        self.file_manager = MDFileManager(sort_by="size", sort_by_desc=True)
+        return MDScreen()
+
+    def on_start(self):
+        self.file_manager.show(self.path)
+        # The directory is read in the worker thread.
+        assert not self.file_manager.ids.rv.data
+        self.wait_time = 0
+        Clock.schedule_once(self.wait_for_list, 0.1)
+
+    def wait_for_list(self, dt):
+        # The listing is delivered by the worker thread and the items are
+        # added in chunks, so the list is checked once all items are added.
+        data = self.file_manager.ids.rv.data
+        self.wait_time += dt
+
+        if len(data) < 501 or self.file_manager._pending_items:
+            assert self.wait_time < 10, "The directory was not listed"
+            Clock.schedule_once(self.wait_for_list, 0.1)
+        else:
+            self.check_list()
+
+    def check_list(self):
+        data = self.file_manager.ids.rv.data
+
+        assert len(data) == 501
+        assert data[0]["dir_or_file_name"] == "folder"
+        assert data[1]["dir_or_file_name"] == "file_000.txt"
+        assert data[-1]["dir_or_file_name"] == "file_499.txt"
+
+        entries = directory_scanner.get_cached(self.path)
+        assert entries is not None
+        self.file_manager.show(self.path)
+        # The cached listing is used immediately.
+        assert len(self.file_manager.ids.rv.data) == 200
+        assert self.file_manager._pending_items
+
+        with open(os.path.join(self.path, "new.txt"), "w"):
+            pass
+        os.utime(self.path, ns=(0, 0))
+        assert directory_scanner.get_cached(self.path) is None
+
+        dirs, files = self.file_manager.get_content()
+        assert dirs == ["folder"]
+        assert len(files) == 501
+        self.file_manager.close()
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestDirectoryScanner().run()
@@ -0,0 +1,79 @@
+"""
+Test that the thumbnails of the file manager are decoded at the tile
+resolution in the worker threads, saved to the disk cache and reused from
+the memory cache.
+
+The test opens a directory with large images in `preview` mode, waits until
+the thumbnails of the visible tiles have been loaded, then requests the same
+thumbnails from a new cache to verify that they are read from disk without
+decoding the images again.
+"""
+
+import os
+import tempfile
+
+from kivy.clock import Clock
+from PIL import Image
+
+from kivymd.app import MDApp
+from kivymd.uix.filemanager import MDFileManager
+from kivymd.uix.filemanager.thumbnails import ThumbnailCache, thumbnail_cache
+from kivymd.uix.screen import MDScreen
+
+
+class TestThumbnailCache(MDApp):
+    def build(self):
+        self.path = tempfile.mkdtemp()
+        thumbnail_cache.cache_dir = os.path.join(self.path, "cache")
+        for i in range(4):
+            Image.new("RGB", (2000, 1000), (i * 60, 0, 0)).save(
+                os.path.join(self.path, f"image_{i}.png")
+            )
+
+        self.file_manager = MDFileManager(preview=True, ext=[".png"])
+        return MDScreen()
+
+    def on_start(self):
+        self.file_manager.show(self.path)
+        Clock.schedule_once(self.check_thumbnails, 2)
+
+    def check_thumbnails(self, *args):
+        rv = self.file_manager.ids.rv
+        thumbnails = [
+            view.children[-1]
+            for view in rv.view_adapter.views.values()
+            if view.type != "folder"
+        ]
+        size = thumbnails[0].thumbnail_size
+
+        assert thumbnails
+        assert thumbnail_cache.decoded == len(thumbnails)
+        for thumbnail in thumbnails:
+            assert not thumbnail.source
+            assert thumbnail.texture.size == (int(size), int(size) // 2)
+        assert len(os.listdir(thumbnail_cache.cache_dir)) == len(thumbnails)
+
+        # The texture is taken from the memory cache.
+        textures = []
+        thumbnail_cache.request(
+            thumbnails[0].thumbnail_path,
+            size,
+            lambda path, texture: textures.append(texture),
+        )
+        assert textures == [thumbnails[0].texture]
+
+        # The thumbnail is read from the disk cache.
+        self.cache = ThumbnailCache(thumbnail_cache.cache_dir)
+        self.cache.request(
+            thumbnails[0].thumbnail_path, size, self.check_disk_cache
+        )
+
+    def check_disk_cache(self, path, texture):
+        assert texture is not None
+        assert self.cache.decoded == 0
+        self.file_manager.close()
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestThumbnailCache().run()
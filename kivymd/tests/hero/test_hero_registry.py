@@ -0,0 +1,84 @@
+"""
+Test that MDHeroFrom widgets join the hero registry when they are added to
+a parent, move to the new tag when the tag changes, leave the registry when
+they are removed or deleted and that MDScreenManager finds only the heroes
+of its own screens.
+"""
+
+import gc
+
+from kivy.clock import Clock
+
+from kivymd.app import MDApp
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.hero import HeroRegistry, MDHeroFrom, hero_registry
+from kivymd.uix.screen import MDScreen
+from kivymd.uix.screenmanager import MDScreenManager
+
+
+class Hero:
+    pass
+
+
+class TestHeroRegistry(MDApp):
+    def build(self):
+        self.other_manager = MDScreenManager()
+        return MDScreenManager()
+
+    def on_start(self):
+        Clock.schedule_once(self.check_registry)
+
+    def check_registry(self, *args):
+        screens = []
+        for manager in (self.root, self.other_manager):
+            screen = MDScreen(name="tiles")
+            grid = MDBoxLayout()
+            for i in range(10):
+                grid.add_widget(MDHeroFrom(tag=f"tile {i}"))
+            screen.add_widget(grid)
+            manager.add_widget(screen)
+            screens.append(screen)
+
+        # A hero without a parent is not registered.
+        hero = MDHeroFrom(tag="tile 3")
+        assert len(hero_registry.get_heroes("tile 3")) == 2
+
+        # Each manager finds its own heroes.
+        self.root.current_heroes = ["tile 3", "tile 7"]
+        heroes = self.root.get_hero_from_widget()
+        assert [hero.tag for hero in heroes] == ["tile 3", "tile 7"]
+        assert all(self.root._get_hero_manager(h) is self.root for h in heroes)
+
+        # The tag change moves the hero.
+        heroes[0].tag = "tile 42"
+        assert [hero.tag for hero in self.root.get_hero_from_widget()] == [
+            "tile 7"
+        ]
+        self.root.current_heroes = ["tile 42"]
+        assert self.root.get_hero_from_widget() == [heroes[0]]
+
+        # The removed hero leaves the registry.
+        heroes[0].parent.remove_widget(heroes[0])
+        assert not hero_registry.get_heroes("tile 42")
+
+        # The heroes of the removed screen are not found.
+        self.other_manager.remove_widget(screens[1])
+        self.other_manager.current_heroes = ["tile 7"]
+        assert not self.other_manager.get_hero_from_widget()
+
+        # The registry does not keep the deleted heroes.
+        registry = HeroRegistry()
+        hero = Hero()
+        registry.register(hero, "tile")
+        assert registry.get_heroes("tile") == [hero]
+        del hero
+        gc.collect()
+        assert not registry.get_heroes("tile")
+        assert not registry._heroes and not registry._tags
+
+        self.root.current_heroes = []
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestHeroRegistry().run()
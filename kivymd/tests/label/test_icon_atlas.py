@@ -0,0 +1,104 @@
+"""
+Test that icons draw their glyphs from the shared icon atlas.
+
+The test creates many icons with a few different glyphs and verifies that
+each glyph is rendered once, that icons look the same as icons rendered as
+labels, that the icons without `use_atlas` are rendered as labels, that
+changing the theme does not render the glyphs again and that the cells of
+the unused glyphs are reused when the atlas is full.
+"""
+
+from kivy.clock import Clock
+
+from kivymd.app import MDApp
+from kivymd.icon_definitions import md_icons
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.label import MDIcon
+from kivymd.uix.label.icon_atlas import IconAtlas, icon_atlas
+
+ICONS = ["home", "magnify", "account", "cog", "heart"]
+FONT_SIZE = 37
+
+
+class TestIconAtlas(MDApp):
+    def build(self):
+        # The font size that is not used by other icons.
+        self.icons = [
+            MDIcon(
+                icon=ICONS[i % len(ICONS)],
+                theme_font_size="Custom",
+                font_size=FONT_SIZE,
+                use_atlas=True,
+            )
+            for i in range(100)
+        ]
+        self.label_icon = MDIcon(
+            icon="home",
+            theme_font_size="Custom",
+            font_size=FONT_SIZE,
+        )
+        self.stats = icon_atlas.get_stats()
+        root = MDBoxLayout(md_bg_color=(1, 1, 1, 1))
+        root.add_widget(self.icons[0])
+        root.add_widget(self.label_icon)
+        return root
+
+    def on_start(self):
+        Clock.schedule_once(self.check_atlas, 0.5)
+
+    def check_atlas(self, *args):
+        stats = icon_atlas.get_stats()
+        assert stats["misses"] - self.stats["misses"] == len(ICONS)
+        assert stats["hits"] - self.stats["hits"] == 100 - len(ICONS)
+        assert stats["pages"] - self.stats["pages"] == 1
+        assert len({icon._glyph_texture.id for icon in self.icons}) == 1
+        # The icons are rendered as labels by default.
+        assert not self.label_icon.use_atlas
+        assert self.label_icon._glyph_texture is None
+        assert self.icons[0].size == self.label_icon.size
+        assert (
+            self.icons[0].export_as_image().texture.pixels
+            == self.label_icon.export_as_image().texture.pixels
+        )
+
+        # Changing the color does not render the glyphs.
+        self.theme_cls.theme_style = "Dark"
+        Clock.schedule_once(self.check_theme_switch, 0.5)
+
+    def check_theme_switch(self, *args):
+        assert icon_atlas.misses - self.stats["misses"] == len(ICONS)
+        assert self.icons[0].color == self.theme_cls.onSurfaceVariantColor
+        assert self.icons[0]._glyph_texture is self.icons[5]._glyph_texture
+
+        # The glyph is released when the icon is changed.
+        key = ("Icons", FONT_SIZE, 1.0, md_icons["home"])
+        for icon in self.icons[::5]:
+            icon.icon = "plus"
+            icon.texture_update()
+            assert (key in icon_atlas._unused) is (icon is self.icons[-5])
+
+        self.check_eviction()
+        self.stop()
+
+    def check_eviction(self):
+        atlas = IconAtlas()
+        atlas.page_size = 58
+        atlas.max_pages = 1
+        keys = [
+            atlas.make_key(md_icons[name], "Icons", 24, 1.0) for name in ICONS
+        ]
+        for key in keys[:4]:
+            assert atlas.acquire(key) is not None
+
+        # Four cells of 28x28 pixels and the spacing fit into the page.
+        assert atlas.acquire(keys[4]) is None
+        atlas.release(keys[1])
+        atlas.release(keys[0])
+        assert atlas.acquire(keys[4]) is not None
+        assert keys[1] not in atlas._glyphs
+        assert keys[0] in atlas._glyphs
+        assert atlas.get_stats()["evictions"] == 1
+
+
+if __name__ == "__main__":
+    TestIconAtlas().run()
@@ -0,0 +1,95 @@
+"""
+Test that labels with the texture cache render each text once, look the
+same as labels without the cache and that the cached textures are not
+changed when the labels show other texts.
+"""
+
+from kivy.clock import Clock
+from kivy.core.text import Label as CoreLabel
+
+from kivymd.app import MDApp
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.label import MDLabel
+from kivymd.uix.label.texture_cache import (
+    LabelTextureCache,
+    label_texture_cache,
+)
+
+TEXTS = ["Inbox", "Outbox", "Favorites", "Trash", "Spam"]
+
+
+class TestLabelTextureCache(MDApp):
+    def build(self):
+        self.stats = label_texture_cache.get_stats()
+        self.labels = [
+            MDLabel(text=TEXTS[i % len(TEXTS)], use_texture_cache=True)
+            for i in range(50)
+        ]
+        self.label = MDLabel(text="Inbox")
+        root = MDBoxLayout(orientation="vertical", md_bg_color=(1, 1, 1, 1))
+        root.add_widget(self.labels[0])
+        root.add_widget(self.label)
+        return root
+
+    def on_start(self):
+        Clock.schedule_once(self.check_cache, 0.5)
+
+    def check_cache(self, *args):
+        # The textures of the new width of the labels.
+        for label in self.labels + [self.label]:
+            label.texture_update()
+
+        stats = label_texture_cache.get_stats()
+        assert stats["misses"] - self.stats["misses"] >= len(TEXTS)
+        assert stats["hits"] - self.stats["hits"] >= 50 - len(TEXTS)
+        # The first label is wider than the labels that are not in the
+        # window.
+        textures = {label.texture.id for label in self.labels[1:]}
+        assert len(textures) == len(TEXTS)
+        assert self.labels[0].texture.pixels == self.label.texture.pixels
+        assert self.labels[0].texture_size == self.label.texture_size
+
+        # A recycled label shows another text and the cached texture of the
+        # previous text stays the same.
+        texture = self.labels[0].texture
+        pixels = texture.pixels
+        self.labels[0].text = "Inbax"
+        self.labels[0].texture_update()
+        assert self.labels[0].texture is not texture
+        assert texture.pixels == pixels
+        self.labels[0].text = "Inbox"
+        self.labels[0].texture_update()
+        assert self.labels[0].texture is texture
+
+        # The style is a part of the key.
+        self.labels[5].bold = True
+        self.labels[5].texture_update()
+        assert self.labels[5].texture is not texture
+
+        self.check_eviction()
+        self.stop()
+
+    def check_eviction(self):
+        cache = LabelTextureCache()
+        keys = []
+        for text in TEXTS:
+            label = CoreLabel(text=text, font_size=20)
+            label.refresh()
+            keys.append(cache.make_key(label, text))
+            cache.add(keys[-1], label)
+
+        cache.max_bytes = cache.bytes - 1
+        cache.get(keys[0])
+        label = CoreLabel(text="A", font_size=20)
+        label.refresh()
+        cache.add(cache.make_key(label, "A"), label)
+        stats = cache.get_stats()
+        assert stats["evictions"] >= 1
+        assert stats["bytes"] <= cache.max_bytes
+        # The least recently used texture is removed first.
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+
+
+if __name__ == "__main__":
+    TestLabelTextureCache().run()
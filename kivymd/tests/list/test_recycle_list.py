@@ -0,0 +1,129 @@
+"""
+Test that MDRecycleList creates views only for the visible items, shows the
+variant of each item when the views are reused, keeps the state of the
+checkboxes in the data and computes the height of the list from the cached
+heights of the items.
+"""
+
+from kivy.clock import Clock
+from kivy.metrics import dp
+
+from kivymd.app import MDApp
+from kivymd.uix.list import MDRecycleList, MDRecycleListItem
+
+IMAGE = "kivymd/images/logo/kivymd-icon-256.png"
+
+
+class CountingItem(MDRecycleListItem):
+    created = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        CountingItem.created += 1
+
+
+def get_item_data(index):
+    data = {"headline_text": f"Contact {index}"}
+    if index % 3 > 0:
+        data["supporting_text"] = f"+1 555 {index:04d}"
+    if index % 3 > 1:
+        data["tertiary_text"] = "Tertiary text"
+    if index % 4 == 0:
+        data["leading_avatar"] = IMAGE
+    elif index % 4 == 1:
+        data["leading_checkbox"] = True
+    else:
+        data["leading_icon"] = "account"
+    if index % 5 == 0:
+        data["trailing_checkbox"] = True
+    elif index % 5 == 1:
+        data["trailing_icon"] = "trash-can-outline"
+    elif index % 5 == 2:
+        data["trailing_text"] = "100+"
+    return data
+
+
+class TestRecycleList(MDApp):
+    def build(self):
+        return MDRecycleList(
+            viewclass=CountingItem,
+            data=[get_item_data(i) for i in range(5000)],
+        )
+
+    def on_start(self):
+        Clock.schedule_once(self.check_top, 0.5)
+
+    def check_views(self):
+        layout = self.root.layout_manager
+        assert len(layout.children) < 30
+        for view in layout.children:
+            data = self.root.data[view.index]
+            texts = [label.text for label in view.ids.text_container.children]
+            assert texts[::-1] == [
+                data[key]
+                for key in ("headline_text", "supporting_text", "tertiary_text")
+                if key in data
+            ]
+            leading = view.ids.leading_container.children
+            assert len(leading) == 1
+            if "leading_icon" in data:
+                assert leading[0].icon == data["leading_icon"]
+            elif "leading_avatar" in data:
+                assert leading[0].source == data["leading_avatar"]
+            else:
+                assert leading[0].active == data.get("active", False)
+            trailing = view.ids.trailing_container.children
+            assert len(trailing) == (view.index % 5 < 3)
+            if "trailing_icon" in data:
+                assert trailing[0].icon == data["trailing_icon"]
+            elif "trailing_text" in data:
+                assert trailing[0].text == data["trailing_text"]
+
+    def check_top(self, *args):
+        layout = self.root.layout_manager
+        self.check_views()
+        heights = {0: dp(56), 1: dp(72), 2: dp(88)}
+        assert layout.height == sum(heights[i % 3] for i in range(5000)) + dp(
+            16
+        )
+
+        # The checkbox of the first item keeps its state in the data.
+        view = next(view for view in layout.children if view.index == 0)
+        view.ids.trailing_container.children[0].active = True
+        assert self.root.data[0]["active"] is True
+
+        self.root.scroll_y = 0
+        Clock.schedule_once(self.check_bottom, 0.5)
+
+    def check_bottom(self, *args):
+        layout = self.root.layout_manager
+        self.check_views()
+        assert 4999 in [view.index for view in layout.children]
+        self.root.scroll_y = 1
+        Clock.schedule_once(self.check_reused, 0.5)
+
+    def check_reused(self, *args):
+        layout = self.root.layout_manager
+        self.check_views()
+        view = next(view for view in layout.children if view.index == 0)
+        assert view.ids.trailing_container.children[0].active is True
+        view = next(view for view in layout.children if view.index == 5)
+        assert view.ids.trailing_container.children[0].active is False
+        assert CountingItem.created < 60
+
+        # The new data of an item drops its cached height.
+        self.root.data[1] = {"headline_text": "One line"}
+        Clock.schedule_once(self.check_modified, 0.5)
+
+    def check_modified(self, *args):
+        layout = self.root.layout_manager
+        assert layout.get_item_height(1, self.root.data[1]) == dp(56)
+        view = next(view for view in layout.children if view.index == 1)
+        assert len(view.ids.text_container.children) == 1
+        assert not view.ids.leading_container.children
+        assert not view.ids.trailing_container.children
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestRecycleList().run()
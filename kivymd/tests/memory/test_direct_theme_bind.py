@@ -0,0 +1,60 @@
+"""
+Test that the widgets do not leak theme observers that were bound directly
+with `theme_cls.bind` instead of `bind_theme`.
+
+The test adds widgets that bind their methods to the theme style and the
+palette in their constructor, removes them with `remove_widget` and
+`clear_widgets` and verifies that the number of the observers of the theme
+manager returns to the initial number.
+"""
+
+from kivy.clock import Clock
+
+from kivymd.app import MDApp
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.label import MDLabel
+
+
+class DirectBindLabel(MDLabel):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.theme_cls.bind(
+            theme_style=self.update_style, primary_palette=self.update_style
+        )
+        self.bind_theme(theme_style=lambda *args: None)
+
+    def update_style(self, *args):
+        pass
+
+
+class TestDirectThemeBind(MDApp):
+    def build(self):
+        return MDBoxLayout(orientation="vertical")
+
+    def on_start(self):
+        Clock.schedule_once(self.check_observers)
+
+    def count_observers(self):
+        return len(self.theme_cls.get_property_observers("theme_style")), len(
+            self.theme_cls.get_property_observers("primary_palette")
+        )
+
+    def check_observers(self, *args):
+        initial = self.count_observers()
+
+        widgets = [DirectBindLabel(text=str(i)) for i in range(50)]
+        for widget in widgets:
+            self.root.add_widget(widget)
+        assert self.count_observers() == (initial[0] + 100, initial[1] + 50)
+
+        self.root.remove_widget(widgets[0])
+        assert self.count_observers() == (initial[0] + 98, initial[1] + 49)
+
+        self.root.clear_widgets()
+        assert not self.root.children
+        assert self.count_observers() == initial
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestDirectThemeBind().run()
@@ -0,0 +1,104 @@
+"""
+Test that dropdown menus taken from the pool are reused after they are
+dismissed and observe the window only while they are open.
+
+The test opens and dismisses a menu from the pool, opens it again with
+other items and verifies that the same menu is reused, that the window
+observers are removed after the menu is dismissed and that prewarming fills
+the pool and the cache of the item widgets of the recycle views.
+"""
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.factory import Factory
+from kivy.uix.recycleview.views import RecycleDataAdapter
+
+from kivymd.app import MDApp
+from kivymd.uix.button import MDButton, MDButtonText
+from kivymd.uix.menu import MDDropdownMenuPool
+from kivymd.uix.menu.menu import MDDropdownTextItem
+from kivymd.uix.screen import MDScreen
+
+
+class CountingTextItem(MDDropdownTextItem):
+    created = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        CountingTextItem.created += 1
+
+
+Factory.register("CountingTextItem", cls=CountingTextItem)
+
+
+def get_resize_observers():
+    return len(Window.get_property_observers("on_resize"))
+
+
+class TestMenuPool(MDApp):
+    def build(self):
+        self.pool = MDDropdownMenuPool()
+        self.button = MDButton(
+            MDButtonText(text="Menu"),
+            pos_hint={"center_x": 0.5, "center_y": 0.5},
+        )
+        return MDScreen(self.button)
+
+    def on_start(self):
+        Clock.schedule_once(self.open_menu, 0.5)
+
+    def open_menu(self, *args):
+        self.observers = get_resize_observers()
+        self.menu = self.pool.acquire(
+            caller=self.button,
+            items=[{"text": f"Item {i}"} for i in range(3)],
+            position="bottom",
+        )
+        assert get_resize_observers() == self.observers
+        self.menu.open()
+        assert get_resize_observers() == self.observers + 1
+        Clock.schedule_once(self.dismiss_menu, 0.5)
+
+    def dismiss_menu(self, *args):
+        self.menu.dismiss()
+        Clock.schedule_once(self.reopen_menu, 0.5)
+
+    def reopen_menu(self, *args):
+        assert self.menu.parent is None
+        assert get_resize_observers() == self.observers
+        assert self.pool.get_stats()["idle"] == 1
+
+        menu = self.pool.acquire(
+            caller=self.button, items=[{"text": "Item", "leading_icon": "web"}]
+        )
+        assert menu is self.menu
+        assert menu.position == "auto"
+        assert menu.menu.data[0]["viewclass"] == "MDDropdownLeadingIconItem"
+        assert self.pool.hits == 1
+        assert self.pool.misses == 1
+        assert self.pool.construction_time > 0
+
+        menu.open()
+        menu.dismiss()
+        self.pool.prewarm(count=2, viewclasses=("CountingTextItem",), views=2)
+        Clock.schedule_once(self.check_prewarm, 1)
+
+    def check_prewarm(self, *args):
+        stats = self.pool.get_stats()
+        assert stats["idle"] == 3
+        assert stats["created"] == 3
+        assert self.pool._prewarm_event is None
+        assert CountingTextItem.created == 2
+
+        # Recycle views take the prewarmed widgets of the items.
+        adapter = RecycleDataAdapter()
+        adapter.set_visible_views(
+            range(3), [{}] * 3, [{"viewclass": CountingTextItem}] * 3
+        )
+        assert CountingTextItem.created == 3
+        assert get_resize_observers() == self.observers
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestMenuPool().run()
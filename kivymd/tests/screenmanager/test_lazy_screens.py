@@ -0,0 +1,104 @@
+"""
+Test that the screens registered in MDScreenManager are built when they are
+shown, that the least recently shown screens are removed with their heroes
+when there are more than `max_screens` of them and that the removed screens
+restore their state when they are built again.
+"""
+
+from kivy.clock import Clock
+from kivy.lang import Builder
+
+from kivymd.app import MDApp
+from kivymd.uix.screen import MDScreen
+from kivymd.uix.screenmanager import MDScreenManager
+from kivymd.uix.transition import MDSharedAxisTransition
+
+KV = """
+<LazyScreen>
+
+    MDHeroFrom:
+        tag: root.name
+"""
+
+built = []
+
+
+class LazyScreen(MDScreen):
+    value = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        built.append(self)
+
+    def save_state(self):
+        return {"value": self.value}
+
+    def restore_state(self, state):
+        self.value = state["value"]
+
+
+class TestLazyScreens(MDApp):
+    def build(self):
+        Builder.load_string(KV)
+        self.root = MDScreenManager(
+            max_screens=2,
+            transition=MDSharedAxisTransition(duration=0.05),
+        )
+        self.root.add_widget(MDScreen(name="home"))
+
+        for i in range(5):
+            self.root.register_screen(f"screen {i}", LazyScreen)
+
+        return self.root
+
+    def on_start(self):
+        assert not built
+        assert self.root.has_screen("screen 3")
+        assert self.root.screen_names == ["home"]
+        self.steps = ["screen 0", "screen 1", "screen 2", "screen 0"]
+        Clock.schedule_once(self.next_screen, 0.2)
+
+    def next_screen(self, *args):
+        if not self.steps:
+            Clock.schedule_once(self.check_screens, 0.2)
+            return
+
+        if self.root.current.startswith("screen"):
+            self.root.current_screen.value += 1
+
+        self.root.current = self.steps.pop(0)
+        Clock.schedule_once(self.next_screen, 0.2)
+
+    def check_screens(self, *args):
+        # "screen 0" was built again after it was removed.
+        assert [screen.name for screen in built] == [
+            "screen 0",
+            "screen 1",
+            "screen 2",
+            "screen 0",
+        ]
+        assert built[-1].value == 1
+        assert sorted(self.root.screen_names) == [
+            "home",
+            "screen 0",
+            "screen 2",
+        ]
+        # The heroes of the removed screens are not found.
+        self.root.current_heroes = [f"screen {i}" for i in range(5)]
+        assert sorted(
+            hero.tag for hero in self.root.get_hero_from_widget()
+        ) == ["screen 0", "screen 2"]
+
+        # The screen is built when it is requested.
+        assert self.root.get_screen("screen 4").name == "screen 4"
+        assert built[-1].name == "screen 4"
+
+        self.root.remove_widget(self.root.get_screen("screen 2"))
+        assert sorted(
+            hero.tag for hero in self.root.get_hero_from_widget()
+        ) == ["screen 0", "screen 4"]
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestLazyScreens().run()
@@ -0,0 +1,63 @@
+"""
+Test that the color scheme is extracted from the wallpaper in a worker
+thread when `ThemeManager.dynamic_color_async` is enabled.
+
+The test sets two wallpapers in quick succession, verifies that the
+current color scheme is kept until the result arrives and that only the
+scheme of the last wallpaper is applied.
+"""
+
+import os
+import tempfile
+
+from kivy.clock import Clock
+from PIL import Image
+
+from kivymd.app import MDApp
+from kivymd.uix.screen import MDScreen
+
+
+class TestDynamicColorAsync(MDApp):
+    def build(self):
+        self.events = []
+        self.theme_cls.bind(on_colors_changed=self.on_colors_changed)
+        return MDScreen()
+
+    def on_colors_changed(self, instance, changed_names):
+        self.events.append(changed_names)
+
+    def create_wallpaper(self, name, color):
+        path = os.path.join(tempfile.mkdtemp(), name)
+        Image.new("RGB", (1200, 800), color).save(path)
+        return path
+
+    def on_start(self):
+        Clock.schedule_once(self.set_wallpapers, 1)
+
+    def set_wallpapers(self, *args):
+        self.primary_color = self.theme_cls.primaryColor[:]
+        self.theme_cls.dynamic_color_async = True
+        self.theme_cls.dynamic_color_sample_size = 64
+        self.theme_cls.dynamic_color = True
+        self.theme_cls.path_to_wallpaper = self.create_wallpaper(
+            "red.png", (220, 30, 30)
+        )
+        self.theme_cls.path_to_wallpaper = self.create_wallpaper(
+            "green.png", (30, 200, 60)
+        )
+        self.theme_cls.set_colors()
+        assert self.theme_cls.primaryColor == self.primary_color
+        Clock.schedule_once(self.check_colors, 2)
+
+    def check_colors(self, *args):
+        primary_color = self.theme_cls.primaryColor
+        assert primary_color != self.primary_color
+        # The green wallpaper wins.
+        assert primary_color[1] > primary_color[0]
+        assert len(self.events) == 1
+        assert max(self.theme_cls.dynamic_color_stats["sample_size"]) <= 64
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestDynamicColorAsync().run()
@@ -0,0 +1,47 @@
+"""
+Test that the Material Design transitions are evaluated from the easing
+tables, match the analytic curves and are shared by the same curves.
+"""
+
+import random
+
+import kivy.animation
+
+from kivymd.animation import MDAnimationTransition
+from kivymd.utils.cubic_bezier import CubicBezier, EasingTable, get_easing_table
+
+
+def test_easing_tables():
+    # Animations look up the transitions in the patched registry.
+    AnimationTransition = kivy.animation.AnimationTransition
+    assert AnimationTransition is MDAnimationTransition
+    assert get_easing_table(0.4, 0.0, 0.2, 1.0) is (
+        MDAnimationTransition.easing_standard
+    )
+
+    for name in (
+        "easing_standard",
+        "easing_decelerated",
+        "easing_accelerated",
+        "easing_linear",
+        "easing_emphasized",
+    ):
+        table = getattr(AnimationTransition, name)
+        assert isinstance(table, EasingTable)
+        assert table(0) == table.function(0)
+        assert table(1) == table.function(1)
+        for value in [random.random() for _ in range(1000)]:
+            assert abs(table(value) - table.function(value)) < 1e-4
+
+    table = EasingTable(lambda value: value * value, resolution=10)
+    assert abs(table(0.35) - (0.3**2 + 0.4**2) / 2) < 1e-12
+    # Values outside the table are calculated by the function.
+    assert table(1.5) == 2.25
+    assert table(-0.5) == 0.25
+    assert get_easing_table(0.2, 0.0, 0.8, 1.0).function(0.5) == (
+        CubicBezier(0.2, 0.0, 0.8, 1.0).t(0.5)
+    )
+
+
+if __name__ == "__main__":
+    test_easing_tables()
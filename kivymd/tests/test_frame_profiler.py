@@ -0,0 +1,101 @@
+"""
+Test that the frame profiler records the phases of the frames and the time
+of the widgets, exports the frames and restores the patched methods when it
+stops.
+"""
+
+import json
+import os
+import tempfile
+
+from kivy.base import EventLoop
+from kivy.clock import Clock
+from kivy.core.window import Window
+
+from kivymd.app import MDApp
+from kivymd.uix.behaviors.ripple_behavior import M3CommonRipple
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.button import MDButton, MDButtonText
+from kivymd.utils.frame_profiler import (
+    PHASES,
+    FrameProfilerOverlay,
+    frame_profiler,
+)
+
+
+class TestFrameProfiler(MDApp):
+    def build(self):
+        self.root = MDBoxLayout(orientation="vertical")
+        return self.root
+
+    def on_start(self):
+        self.methods = (
+            EventLoop.__dict__.get("idle"),
+            Window.__dict__.get("on_draw"),
+            M3CommonRipple.__dict__["_tick"],
+        )
+        self.overlay = FrameProfilerOverlay()
+        self.overlay.start()
+        Window.add_widget(self.overlay)
+        Clock.schedule_once(self.add_widgets, 0.2)
+        Clock.schedule_once(self.check_frames, 1)
+
+    def add_widgets(self, *args):
+        with frame_profiler.measure("test", "TestFrameProfiler"):
+            for i in range(10):
+                self.root.add_widget(MDButton(MDButtonText(text=f"{i}")))
+
+    def check_frames(self, *args):
+        frames = list(frame_profiler.frames)
+        assert len(frames) > 5
+
+        for frame in frames:
+            assert abs(sum(frame.phases.values()) - frame.duration) < 1e-3
+            assert frame.busy <= frame.duration
+
+        assert sum(frame.phases["draw"] for frame in frames) > 0
+        assert sum(frame.phases["clock"] for frame in frames) > 0
+
+        costs = {
+            (cost["category"], cost["widget"])
+            for cost in frame_profiler.get_costs()
+        }
+        assert ("kv", "MDButton") in costs
+        assert ("test", "TestFrameProfiler") in costs
+
+        percentiles = frame_profiler.get_percentiles()
+        assert set(percentiles) == {"busy", *PHASES}
+        assert percentiles["busy"][50] <= percentiles["busy"][99]
+        histogram = frame_profiler.get_histogram()
+        assert sum(count for _, _, count in histogram) == len(frames)
+
+        self.overlay.update_stats()
+        assert "FPS" in self.overlay.text
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            frame_profiler.export_chrome_trace(path)
+            with open(path) as trace_file:
+                events = json.load(trace_file)["traceEvents"]
+            assert {event["ph"] for event in events} == {"X"}
+            assert any(event["cat"] == "kv" for event in events)
+
+            path = os.path.join(directory, "frames.json")
+            frame_profiler.export_json(path)
+            with open(path) as json_file:
+                data = json.load(json_file)
+            assert len(data["frames"]) == len(frames)
+
+        self.overlay.stop()
+        assert not frame_profiler.running
+        assert (
+            EventLoop.__dict__.get("idle"),
+            Window.__dict__.get("on_draw"),
+            M3CommonRipple.__dict__["_tick"],
+        ) == self.methods
+        frame_profiler.clear()
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestFrameProfiler().run()
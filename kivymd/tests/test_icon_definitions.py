@@ -8,3 +8,30 @@ def test_icons_have_size():
         assert len(icon_value) == 1
         lbl.refresh()
         assert lbl.get_extents(icon_value) is not None
+
+
+def test_icons_lookup():
+    from kivymd.icon_definitions import md_icons
+
+    assert len(md_icons) == len(list(md_icons))
+    assert md_icons["blank"] == " "
+    assert md_icons["language-python"] == "\U000f0320"
+    assert md_icons.get("not-an-icon") is None
+    assert "magnify" in md_icons
+    assert "not-an-icon" not in md_icons.keys()
+
+
+def test_icons_search():
+    from kivymd.icon_definitions import md_icons
+
+    for text in ("a", "ar", "arrow", "e-l", "-outline", "circle", "zzz"):
+        names = md_icons.search(text)
+        assert sorted(names) == [name for name in md_icons if text in name]
+        assert md_icons.search(text, limit=5) == names[:5]
+
+    assert md_icons.search("circle", limit=2) == ["circle", "circle-box"]
+    assert md_icons.search("arrow-left")[0] == "arrow-left"
+    # Names with a word that starts with the text go before the names that
+    # only contain it.
+    names = md_icons.search("line")
+    assert names.index("chart-line") < names.index("account-outline")
@@ -0,0 +1,134 @@
+"""
+Test that the KV rules loaded from the cache are the same as the parsed rules
+and that the cache is not used when the source or the versions change.
+"""
+
+import glob
+import os
+import tempfile
+
+from kivy.lang import Builder
+from kivy.lang.parser import Parser
+from kivy.properties import NumericProperty, StringProperty
+from kivy.uix.widget import Widget
+
+from kivymd import uix_path
+from kivymd.utils.kv_cache import KvCache
+
+KV = """
+#:set cached_prefix "value: "
+
+
+<CachedWidget>
+    text: cached_prefix + str(self.value)
+    on_value: self.changes += 1
+
+    canvas.before:
+        Color:
+            rgba: 1, 0, 0, 1
+        Rectangle:
+            pos: self.pos
+            size: self.size
+
+    Widget:
+        id: child
+        opacity: 0.5
+"""
+
+
+class CachedWidget(Widget):
+    value = NumericProperty(0)
+    changes = NumericProperty(0)
+    text = StringProperty()
+
+
+def test_kv_cache():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = KvCache()
+        cache.enabled = True
+        cache.package_dir = os.path.join(directory, "package")
+        cache.user_dir = os.path.join(directory, "user")
+
+        # The rules are written to the user directory only when enabled.
+        assert not cache.write
+        cache.write = True
+
+        # The first load parses the rules and writes the cache.
+        cache.load_string(KV)
+        assert (cache.hits, cache.misses) == (0, 1)
+        path = os.path.join(cache.user_dir, cache.tag, cache.get_name(KV))
+        assert os.path.isfile(path)
+
+        # The next load restores the same rules.
+        rules = len(Builder.rules)
+        cache.load_string(KV)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(Builder.rules) == rules + 1
+        restored = Builder.rules[-1][1].ctx
+        assert KvCache.dump(restored) == KvCache.dump(Parser(content=KV))
+        # The widget gets the rules once.
+        Builder.rules[-2:-1] = []
+
+        # The rules restored with a file name are unloaded by the name.
+        cache.load_string(KV, "CachedWidget.kv")
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert Builder.rules[-1][1].ctx.filename == "CachedWidget.kv"
+        Builder.unload_file("CachedWidget.kv")
+        assert len(Builder.rules) == rules
+
+        widget = CachedWidget()
+        assert widget.text == "value: 0"
+        widget.value = 2
+        assert widget.text == "value: 2"
+        assert widget.changes == 1
+        assert widget.ids.child.opacity == 0.5
+        assert widget.canvas.before.length() > 0
+
+        # The files of the other versions are not used.
+        cache.tag += "-other"
+        cache.load_string(KV)
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        # The broken files are parsed again.
+        with open(path, "wb") as cache_file:
+            cache_file.write(b"broken")
+        cache.tag = cache.tag[: -len("-other")]
+        cache.write = False
+        cache.load_string(KV)
+        assert (cache.hits, cache.misses) == (2, 3)
+
+        # A directory that is not writable turns the writing off.
+        with open(os.path.join(directory, "file"), "w"):
+            pass
+        cache.user_dir = os.path.join(directory, "file", "user")
+        cache.write = True
+        cache.load_string(KV + "\n")
+        assert (cache.hits, cache.misses) == (2, 4)
+        assert not cache.write
+
+        # The rules of the widgets are restored unchanged.
+        for kv_path in glob.glob(
+            os.path.join(uix_path, "**", "*.kv"), recursive=True
+        ):
+            with open(kv_path, encoding="utf-8") as kv_file:
+                source = kv_file.read()
+            assert cache.save(cache.package_dir, source)
+            assert KvCache.dump(
+                cache.restore(
+                    cache._read(
+                        os.path.join(
+                            cache.package_dir,
+                            cache.tag,
+                            cache.get_name(source),
+                        )
+                    ),
+                    source,
+                )
+            ) == KvCache.dump(Parser(content=source))
+
+        # The rules loaded by the test.
+        Builder.rules[-4:] = []
+
+
+if __name__ == "__main__":
+    test_kv_cache()
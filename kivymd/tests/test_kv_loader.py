@@ -0,0 +1,98 @@
+"""
+Test that the lazy KV loader parses the rules of a class when the first
+widget of the class is created and applies them in the order of the file.
+"""
+
+import os
+import tempfile
+
+from kivy.factory import Factory
+from kivy.lang import Builder
+from kivy.properties import NumericProperty, StringProperty
+from kivy.uix.widget import Widget
+
+from kivymd.utils.kv_loader import KvLoader
+
+KV = """
+#:set base_value 1
+
+
+<LazyBase>
+    value: base_value
+    text: "base"
+
+
+<LazyChild>
+    # The rule of the subclass is applied after the rule of the base class.
+    text: "child"
+
+
+<LazyOther, LazyOtherAlias>
+    value: 3
+"""
+
+
+class LazyBase(Widget):
+    value = NumericProperty(0)
+    text = StringProperty()
+
+
+class LazyChild(LazyBase):
+    pass
+
+
+class LazyOther(Widget):
+    value = NumericProperty(0)
+
+
+def test_kv_loader():
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".kv", delete=False, encoding="utf-8"
+    ) as kv_file:
+        kv_file.write(KV)
+
+    try:
+        loader = KvLoader()
+        loader.lazy = True
+        rules = len(Builder.rules)
+        loader.load(kv_file.name)
+        assert len(Builder.rules) == rules
+        assert loader.get_pending_count() == 4
+
+        child = LazyChild()
+        assert (child.value, child.text) == (1, "child")
+        assert LazyBase().text == "base"
+        assert loader.get_pending_count() == 2
+        assert loader.parse_times[kv_file.name] > 0
+
+        # The rules applied by name are parsed too.
+        other = Widget()
+        Builder.apply_rules(other, "LazyOtherAlias")
+        assert LazyOther().value == 3
+        assert loader.get_pending_count() == 0
+        assert "match" not in vars(Builder)
+
+        # Files that cannot be split are parsed at once.
+        with open(kv_file.name, "w", encoding="utf-8") as kv:
+            kv.write("<LazyDynamic@Widget>\n    opacity: 0.5\n")
+        loader.load(kv_file.name)
+        assert loader.get_pending_count() == 0
+        assert Factory.LazyDynamic().opacity == 0.5
+
+        # The rules loaded with a file name are unloaded by the name.
+        with open(kv_file.name, "w", encoding="utf-8") as kv:
+            kv.write(KV)
+        rules = len(Builder.rules)
+        loader.load(kv_file.name, filename="LazyRules.kv")
+        assert LazyOther().value == 3
+        assert len(Builder.rules) > rules
+        assert Builder.files.count("LazyRules.kv") == 1
+        Builder.unload_file("LazyRules.kv")
+        assert len(Builder.rules) == rules
+        assert "LazyRules.kv" not in Builder.files
+    finally:
+        os.remove(kv_file.name)
+
+
+if __name__ == "__main__":
+    test_kv_loader()
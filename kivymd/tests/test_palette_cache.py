@@ -0,0 +1,67 @@
+"""
+Test that resolved color palettes are cached and restored from disk.
+
+The test switches the theme style back and forth, verifies that the
+second switch to each style is served from the palette cache with the
+same colors, then saves the cache to a file and loads it into a new
+cache instance. With the persistent cache, the palettes resolved in a row
+are written to the data directory of the application once.
+"""
+
+import os
+import tempfile
+
+from kivy.clock import Clock
+
+from kivymd.app import MDApp
+from kivymd.theming import PaletteCache, palette_cache
+from kivymd.uix.screen import MDScreen
+
+
+class TestPaletteCache(MDApp):
+    data_path = tempfile.mkdtemp()
+
+    @property
+    def user_data_dir(self):
+        return self.data_path
+
+    def build(self):
+        return MDScreen()
+
+    def on_start(self):
+        Clock.schedule_once(self.switch_theme, 1)
+
+    def switch_theme(self, *args):
+        light_surface_color = self.theme_cls.surfaceColor[:]
+        self.theme_cls.switch_theme()
+        hits = palette_cache.hits
+        self.theme_cls.switch_theme()
+
+        assert palette_cache.hits == hits + 1
+        assert self.theme_cls.surfaceColor == light_surface_color
+
+        path = os.path.join(tempfile.mkdtemp(), "palette_cache.json")
+        palette_cache.save(path)
+        cache = PaletteCache()
+        assert cache.load(path)
+        assert len(cache) == len(palette_cache)
+
+        self.theme_cls.palette_cache_persistent = True
+        self.cache_path = os.path.join(
+            self.data_path, "kivymd_palette_cache.json"
+        )
+        self.theme_cls.dynamic_scheme_contrast = 0.3
+        self.theme_cls.dynamic_scheme_contrast = 0.6
+        assert not os.path.exists(self.cache_path)
+        Clock.schedule_once(self.check_saved, 1.5)
+
+    def check_saved(self, *args):
+        cache = PaletteCache()
+        assert cache.load(self.cache_path)
+        contrasts = {key[3] for key in cache._palettes}
+        assert {0.3, 0.6} <= contrasts
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestPaletteCache().run()
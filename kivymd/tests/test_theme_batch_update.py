@@ -0,0 +1,95 @@
+"""
+Test that changing several theme properties inside
+`ThemeManager.batch_update` applies the color scheme only once.
+
+The test counts the `on_colors_changed` events dispatched by the theme
+manager and verifies that a single event with the changed color names
+is fired for the whole block, that a changed color notifies its own
+observers once and that unchanged colors notify nobody. It also verifies
+that labels and icons update their colors once per scheme, that a label
+whose KV rule sets its color keeps that rule and that a color assigned
+directly updates the labels.
+"""
+
+from kivy.clock import Clock
+from kivy.lang import Builder
+
+from kivymd.app import MDApp
+from kivymd.uix.label import MDIcon, MDLabel
+from kivymd.uix.screen import MDScreen
+
+Builder.load_string("""
+<RuleColorLabel@MDLabel>
+    color: app.theme_cls.primaryColor
+""")
+
+
+class TestThemeBatchUpdate(MDApp):
+    def build(self):
+        self.events = []
+        self.surface_changes = 0
+        self.theme_cls.bind(
+            on_colors_changed=self.on_colors_changed,
+            surfaceColor=self.on_surface_color,
+        )
+        self.label_changes = 0
+        self.label = MDLabel(text="Label")
+        self.label.bind(color=self.on_label_color)
+        self.md_icon = MDIcon(icon="home")
+        self.rule_label = Builder.load_string("RuleColorLabel:")
+        return MDScreen(self.label, self.md_icon, self.rule_label)
+
+    def on_colors_changed(self, instance, changed_names):
+        self.events.append(changed_names)
+
+    def on_surface_color(self, *args):
+        self.surface_changes += 1
+
+    def on_label_color(self, *args):
+        self.label_changes += 1
+
+    def on_start(self):
+        Clock.schedule_once(self.switch_theme, 1)
+
+    def switch_theme(self, *args):
+        surface_color = self.theme_cls.surfaceColor[:]
+
+        with self.theme_cls.batch_update():
+            self.theme_cls.theme_style = "Dark"
+            self.theme_cls.primary_palette = "Olive"
+            self.theme_cls.dynamic_scheme_contrast = 0.5
+            assert self.events == []
+
+        assert len(self.events) == 1
+        assert "surfaceColor" in self.events[0]
+        assert self.theme_cls.surfaceColor != surface_color
+        assert self.surface_changes == 1
+
+        # The labels are updated once from the event.
+        assert self.label_changes == 1
+        assert self.label.color == self.theme_cls.onSurfaceColor
+        assert self.label.disabled_color == (
+            self.theme_cls.onSurfaceColor[:-1]
+            + [self.label.label_opacity_value_disabled_text]
+        )
+        assert self.md_icon.color == self.theme_cls.onSurfaceVariantColor
+        assert self.rule_label.color == self.theme_cls.primaryColor
+
+        # Applying the same scheme again changes nothing.
+        self.theme_cls.set_colors()
+        assert len(self.events) == 1
+        assert self.surface_changes == 1
+        assert self.label_changes == 1
+
+        # A color assigned directly is published with its own name.
+        self.theme_cls.onSurfaceColor = [1, 0, 0, 1]
+        assert self.events[-1] == ["onSurfaceColor"]
+        assert self.label.color == [1, 0, 0, 1]
+
+        self.label.text_color = [0, 0, 1, 1]
+        assert self.label.color == [0, 0, 1, 1]
+        self.stop()
+
+
+if __name__ == "__main__":
+    TestThemeBatchUpdate().run()
@@ -0,0 +1,77 @@
+"""
+Test that the transitions with `use_transform` do not change the positions
+of the screens during the transition, that they leave no transformations on
+the screens and that each transition creates a frame report.
+"""
+
+from kivy.clock import Clock
+
+from kivymd.app import MDApp
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.screen import MDScreen
+from kivymd.uix.screenmanager import MDScreenManager
+from kivymd.uix.transition import MDFadeSlideTransition, MDSharedAxisTransition
+
+
+class TestTransitionTransform(MDApp):
+    def build(self):
+        self.root = MDScreenManager()
+        for name in ("A", "B"):
+            screen = MDScreen(name=name, md_bg_color="white")
+            screen.add_widget(MDBoxLayout())
+            screen.bind(pos=self.on_screen_pos)
+            self.root.add_widget(screen)
+        self.moves = 0
+        self.transitions = [
+            MDSharedAxisTransition(transition_axis="x", duration=0.2),
+            MDSharedAxisTransition(transition_axis="y", duration=0.2),
+            MDFadeSlideTransition(duration=0.2),
+            MDFadeSlideTransition(duration=0.2),
+        ]
+        return self.root
+
+    def on_screen_pos(self, screen, pos):
+        if self.root.transition.is_active:
+            self.moves += 1
+
+    def on_start(self):
+        Clock.schedule_once(self.next_transition, 0.5)
+
+    def next_transition(self, *args):
+        if not self.transitions:
+            self.stop()
+            return
+
+        transition = self.transitions.pop(0)
+        transition.use_transform = True
+        transition.bind(on_complete=self.check_transition)
+        self.root.transition = transition
+        self.moves = 0
+        self.canvas_sizes = {
+            screen: (
+                screen.canvas.before.length(),
+                screen.canvas.after.length(),
+            )
+            for screen in self.root.screens
+        }
+        self.root.current = "B" if self.root.current == "A" else "A"
+
+    def check_transition(self, transition):
+        assert self.moves == 0
+        assert transition.frame_report["frames"] > 1
+        assert transition.frame_report["max_frame"] > 0
+        Clock.schedule_once(self.check_screens)
+
+    def check_screens(self, *args):
+        assert not self.root.transition._transforms
+        for screen in self.root.screens:
+            assert screen.pos == self.root.pos
+            assert (
+                screen.canvas.before.length(),
+                screen.canvas.after.length(),
+            ) == self.canvas_sizes[screen]
+        Clock.schedule_once(self.next_transition, 0.2)
+
+
+if __name__ == "__main__":
+    TestTransitionTransform().run()
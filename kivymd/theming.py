@@ -21,15 +21,64 @@ Control material properties
 The main application class inherited from the :class:`~kivymd.app.MDApp` class
 has the :attr:`~kivymd.app.MDApp.theme_cls` attribute, with which you control
 the material properties of your application.
+
+Batch color updates
+-------------------
+
+.. versionadded:: 2.0.0
+
+Each change of :attr:`~ThemeManager.theme_style`,
+:attr:`~ThemeManager.primary_palette`,
+:attr:`~ThemeManager.dynamic_scheme_name` or
+:attr:`~ThemeManager.dynamic_scheme_contrast` recalculates the color scheme
+and updates all the widgets of the application. To change several properties
+at once and calculate the color scheme only once, use the
+:meth:`~ThemeManager.batch_update` context manager:
+
+.. code-block:: python
+
+    with self.theme_cls.batch_update():
+        self.theme_cls.theme_style = "Dark"
+        self.theme_cls.primary_palette = "Olive"
+        self.theme_cls.dynamic_scheme_contrast = 0.5
+
+The new palette is calculated completely before it is applied, only the
+colors whose values have changed are assigned, and then the
+:attr:`~ThemeManager.on_colors_changed` event is dispatched once with the
+names of the changed colors. :class:`~kivymd.uix.label.label.MDLabel` and
+:class:`~kivymd.uix.label.label.MDIcon` refresh their colors from this
+event, so each of them is updated once per new scheme, no matter how many
+colors have changed. A color assigned directly, outside of a new scheme,
+dispatches the event with its own name:
+
+.. code-block:: python
+
+    def on_colors_changed(theme_manager, changed_names):
+        print(changed_names)  # ['backgroundColor', 'errorColor', ...]
+
+    self.theme_cls.bind(on_colors_changed=on_colors_changed)
+
+The KV rules and callbacks bound to the individual colors are still notified
+by each changed color.
 """
 
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from timeit import default_timer
+
 from kivy import Logger, platform
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.event import EventDispatcher
 from kivy.properties import (
     AliasProperty,
     BooleanProperty,
+    ColorProperty,
     DictProperty,
     NumericProperty,
     ObjectProperty,
@@ -45,13 +94,17 @@ from materialyoucolor.dynamiccolor.material_dynamic_colors import (
     MaterialDynamicColors,
 )
 from materialyoucolor.hct import Hct
+from materialyoucolor.score.score import Score
 from materialyoucolor.utils.color_utils import argb_from_rgba_01
 from materialyoucolor.utils.platform_utils import SCHEMES, get_dynamic_scheme
 
+from kivymd import __version__
 from kivymd.dynamic_color import DynamicColor
 from kivymd.font_definitions import theme_font_styles
 from kivymd.material_resources import DEVICE_IOS
 
+SPEC_VERSION = "2025"
+
 set_dark_mode_listener = None
 
 if platform == "android":
@@ -61,7 +114,226 @@ if platform == "android":
         pass
 
 
+class PaletteCache:
+    """
+    LRU cache of the resolved color palettes.
+
+    The key is a tuple of the seed color in ARGB format, the name of the
+    scheme, the dark mode flag, the contrast and the version of the color
+    specification. The value is a dictionary returned by
+    :meth:`ThemeManager.get_scheme_colors`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self, max_size: int = 16):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._palettes = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._palettes)
+
+    def get(self, key: tuple):
+        """Returns the cached palette or `None`."""
+
+        colors = self._palettes.get(key)
+        if colors is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._palettes.move_to_end(key)
+        return colors
+
+    def put(self, key: tuple, colors: dict) -> None:
+        """Adds a palette to the cache."""
+
+        self._palettes[key] = colors
+        self._palettes.move_to_end(key)
+        while len(self._palettes) > self.max_size:
+            self._palettes.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached palettes."""
+
+        self._palettes.clear()
+
+    def load(self, path: str) -> bool:
+        """
+        Loads the palettes saved with :meth:`save`. Files saved by other
+        versions of KivyMD or `materialyoucolor` are ignored.
+        """
+
+        try:
+            with open(path, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return False
+
+        if data.get("version") != self._get_version():
+            return False
+
+        for key, colors in data.get("palettes", []):
+            self.put(tuple(key), colors)
+        return True
+
+    def save(self, path: str) -> None:
+        """Saves the cached palettes to a JSON file."""
+
+        data = {
+            "version": self._get_version(),
+            "palettes": [
+                [list(key), colors] for key, colors in self._palettes.items()
+            ],
+        }
+        try:
+            with open(path, "w", encoding="utf-8") as cache_file:
+                json.dump(data, cache_file)
+        except OSError as error:
+            Logger.warning(f"KivyMD: Failed to save palette cache: {error}")
+
+    @staticmethod
+    def _get_version() -> str:
+        import materialyoucolor
+
+        return (
+            f"{__version__}-"
+            f"{getattr(materialyoucolor, '__version__', '')}-{SPEC_VERSION}"
+        )
+
+
+palette_cache = PaletteCache()
+"""
+The application-wide instance of :class:`~PaletteCache`.
+
+.. versionadded:: 2.0.0
+"""
+
+
+class WallpaperQuantizer:
+    """
+    Extracts the seed color from a wallpaper in a worker thread.
+
+    Only the latest request is processed: requests submitted while the
+    worker is busy replace each other, and the results of the outdated
+    requests are discarded. The callback is called on the main thread.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._pending = None
+        self._request = 0
+        self._thread = None
+        # {(path, mtime, file size, sample size): (seed color, stats)}
+        self._seeds = {}
+
+    def submit(self, path: str, sample_size: int, callback) -> None:
+        """
+        Requests the seed color of the wallpaper. The `callback` receives
+        the seed color in ARGB format (or `None` on error) and a dictionary
+        with timing statistics.
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError as error:
+            Logger.warning(f"KivyMD: Wallpaper is not available: {error}")
+            callback(None, {})
+            return
+
+        key = (path, stat.st_mtime, stat.st_size, int(sample_size))
+        with self._condition:
+            self._request += 1
+            if key in self._seeds:
+                self._pending = None
+                seed_color, stats = self._seeds[key]
+                callback(seed_color, dict(stats, cached=True))
+                return
+
+            self._pending = (self._request, key, callback)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self) -> None:
+        """Discards the pending and running requests."""
+
+        with self._condition:
+            self._request += 1
+            self._pending = None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                request, key, callback = self._pending
+                self._pending = None
+
+            try:
+                seed_color, stats = self.quantize(key[0], key[3])
+            except Exception as error:
+                Logger.error(f"KivyMD: Failed to quantize wallpaper: {error}")
+                seed_color, stats = None, {}
+            else:
+                self._seeds[key] = (seed_color, stats)
+
+            Clock.schedule_once(
+                partial(self._done, request, seed_color, stats, callback)
+            )
+
+    def _done(self, request, seed_color, stats, callback, *args) -> None:
+        if request == self._request:
+            callback(seed_color, dict(stats, cached=False))
+
+    @staticmethod
+    def quantize(path: str, sample_size: int) -> tuple:
+        """
+        Downsamples the image so that its larger side does not exceed
+        `sample_size` pixels and returns the seed color and timing
+        statistics.
+        """
+
+        from materialyoucolor.quantize import QuantizeCelebi
+        from PIL import Image
+
+        timer_start = default_timer()
+        with Image.open(path) as image:
+            image.draft("RGB", (sample_size, sample_size))
+            image.thumbnail((sample_size, sample_size))
+            image = image.convert("RGBA")
+            data = image.tobytes()
+            pixels = [list(data[i : i + 4]) for i in range(0, len(data), 4)]
+            width, height = image.size
+        decode_time = default_timer() - timer_start
+
+        timer_start = default_timer()
+        seed_color = Score.score(QuantizeCelebi(pixels, 128))[0]
+        quantize_time = default_timer() - timer_start
+
+        return seed_color, {
+            "sample_size": (width, height),
+            "decode_time": decode_time,
+            "quantize_time": quantize_time,
+        }
+
+
 class ThemeManager(EventDispatcher, DynamicColor):
+    """
+    :Events:
+        :attr:`on_colors_changed`
+            Fired once after a new color scheme has been applied.
+            The names of the changed colors are passed to the handler.
+
+            .. versionadded:: 2.0.0
+    """
+
+    __events__ = ("on_colors_changed",)
+
     primary_palette = Property("Blue")
     """
     The name of the color scheme that the application will use.
@@ -163,6 +435,49 @@ class ThemeManager(EventDispatcher, DynamicColor):
     and defaults to `10` if platform is not Android else `1`.
     """
 
+    dynamic_color_async = BooleanProperty(False)
+    """
+    Extract the color scheme from :attr:`path_to_wallpaper` in a worker
+    thread. The current color scheme is kept until the result is ready.
+    If the wallpaper changes before that, the outdated request is discarded.
+
+    In this mode, the image is downsampled to
+    :attr:`dynamic_color_sample_size` pixels instead of skipping pixels
+    according to :attr:`dynamic_color_quality`.
+    Timing statistics are available in :attr:`dynamic_color_stats`.
+
+    Not used on Android, where the system provides the color scheme.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`dynamic_color_async` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    dynamic_color_sample_size = NumericProperty(128)
+    """
+    The size in pixels of the larger side of the downsampled wallpaper that
+    is used to extract the color scheme when :attr:`dynamic_color_async`
+    is `True`. Smaller values are faster, larger values are more accurate.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`dynamic_color_sample_size` is an
+    :class:`~kivy.properties.NumericProperty` and defaults to `128`.
+    """
+
+    dynamic_color_stats = DictProperty()
+    """
+    Statistics of the last wallpaper processing when
+    :attr:`dynamic_color_async` is `True`: `'sample_size'`, `'decode_time'`,
+    `'quantize_time'` (in seconds) and `'cached'`.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`dynamic_color_stats` is a :class:`~kivy.properties.DictProperty`
+    and defaults to `{}`.
+    """
+
     dynamic_color = BooleanProperty(False)
     """
     If ``True``, generates the application's color scheme from the user's wallpaper instead
@@ -342,6 +657,23 @@ class ThemeManager(EventDispatcher, DynamicColor):
     and defaults to `''`.
     """
 
+    palette_cache_persistent = BooleanProperty(False)
+    """
+    Whether to save the resolved color palettes to the
+    :attr:`~kivy.app.App.user_data_dir` directory of the application.
+    With the same palette settings, the next start of the application skips
+    the calculation of the color scheme. The file is written at most once a
+    second after new palettes have been resolved and when the application
+    stops.
+
+    Resolved palettes are always cached in memory in :data:`palette_cache`.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`palette_cache_persistent` is an
+    :class:`~kivy.properties.BooleanProperty` and defaults to `False`.
+    """
+
     theme_style_switch_animation = BooleanProperty(True)
     """
     Animate app colors when switching app color scheme ('Dark/light').
@@ -860,19 +1192,90 @@ class ThemeManager(EventDispatcher, DynamicColor):
     _size_current_wallpaper = NumericProperty(0)
     _dark_mode = lambda self: False if self.theme_style == "Light" else True
 
+    _batch_depth = 0
+    _batch_pending = False
+    _applying_colors = False
+
     def __init__(self, **kwargs):
+        self._wallpaper_quantizer = WallpaperQuantizer()
+        self._trigger_save_palette_cache = Clock.create_trigger(
+            self._flush_palette_cache, 1
+        )
         super().__init__(**kwargs)
+
+        # The colors assigned outside of `apply_colors` are published as
+        # well.
+        for name, prop in self.properties().items():
+            if isinstance(prop, ColorProperty):
+                self.fbind(name, self._on_color_assigned, name)
         self._determine_device_orientation(None, Window.size)
         Window.bind(size=self._determine_device_orientation)
 
+    def bind(self, **kwargs) -> None:
+        super().bind(**kwargs)
+
+        # The methods of widgets bound directly to the theme style and the
+        # palette are remembered by the widgets, so they are unbound when
+        # the widgets are removed, as with
+        # :meth:`ThemableBehavior.bind_theme`.
+        for property_name, callback in kwargs.items():
+            if property_name in ("theme_style", "primary_palette"):
+                widget = getattr(callback, "__self__", None)
+                if isinstance(widget, ThemableBehavior):
+                    widget._add_theme_binding(property_name, callback)
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Context manager that defers applying the color scheme until the end
+        of the block. The color scheme is calculated and applied at most
+        once, no matter how many theme properties have been changed inside
+        the block.
+
+        .. versionadded:: 2.0.0
+        """
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_pending:
+                self._batch_pending = False
+                self.set_colors()
+
+    def on_colors_changed(self, changed_names: list) -> None:
+        """
+        Fired once after a new color scheme has been applied.
+
+        .. versionadded:: 2.0.0
+
+        :param changed_names: names of the colors whose values have changed.
+        """
+
     def set_colors(self, *args) -> None:
         """Fired methods for setting a new color scheme."""
 
+        if self._batch_depth:
+            self._batch_pending = True
+            return
+
         if not self.dynamic_color:
+            self._wallpaper_quantizer.cancel()
             if not self.primary_palette:
                 self._set_application_scheme()
             else:
                 self._set_palette_color()
+        elif (
+            self.dynamic_color_async
+            and self.path_to_wallpaper
+            and platform != "android"
+        ):
+            self._wallpaper_quantizer.submit(
+                self.path_to_wallpaper,
+                self.dynamic_color_sample_size,
+                self._on_wallpaper_quantized,
+            )
         else:
             system_scheme = get_dynamic_scheme(
                 dark_mode=self._dark_mode(),
@@ -884,7 +1287,7 @@ class ThemeManager(EventDispatcher, DynamicColor):
                 ],
                 fallback_wallpaper_path=self.path_to_wallpaper,
                 fallback_scheme_name=self.dynamic_scheme_name,
-                spec_version="2025",
+                spec_version=SPEC_VERSION,
                 logger=Logger,
             )
             if system_scheme:
@@ -965,25 +1368,133 @@ class ThemeManager(EventDispatcher, DynamicColor):
         else:
             color = self.primary_palette
 
-        color = Hct.from_int(argb_from_rgba_01(self.color_to_rgba(color)))
-        color = DislikeAnalyzer.fix_if_disliked(color).to_int()
+        self._set_seed_color_scheme(
+            argb_from_rgba_01(self.color_to_rgba(color))
+        )
 
-        self._set_color_names(
-            SCHEMES[self.dynamic_scheme_name](
-                Hct.from_int(color),
-                self._dark_mode(),
-                self.dynamic_scheme_contrast,
-                spec_version="2025",
-            )
+    def _set_seed_color_scheme(
+        self, seed_color: int, fix_disliked: bool = True
+    ) -> None:
+        key = (
+            seed_color,
+            self.dynamic_scheme_name,
+            self._dark_mode(),
+            float(self.dynamic_scheme_contrast),
+            SPEC_VERSION,
+            fix_disliked,
         )
+        self._load_palette_cache()
+        colors = palette_cache.get(key)
+
+        if colors is None:
+            color = Hct.from_int(seed_color)
+            if fix_disliked:
+                color = DislikeAnalyzer.fix_if_disliked(color)
+            colors = self.get_scheme_colors(
+                SCHEMES[self.dynamic_scheme_name](
+                    Hct.from_int(color.to_int()),
+                    self._dark_mode(),
+                    self.dynamic_scheme_contrast,
+                    spec_version=SPEC_VERSION,
+                )
+            )
+            palette_cache.put(key, colors)
+            self._save_palette_cache()
 
-    def _set_color_names(self, scheme: DynamicScheme) -> None:
+        self.apply_colors(colors)
+
+    def _on_wallpaper_quantized(self, seed_color, stats: dict) -> None:
+        self.dynamic_color_stats = stats
+        if not self.dynamic_color:
+            return
+        if seed_color is None:
+            self._set_application_scheme()
+        else:
+            self._set_seed_color_scheme(seed_color, fix_disliked=False)
+
+    _palette_cache_loaded = False
+    _palette_cache_dirty = False
+
+    def _get_palette_cache_path(self):
+        app = App.get_running_app()
+        if not self.palette_cache_persistent or app is None:
+            return None
+        return os.path.join(app.user_data_dir, "kivymd_palette_cache.json")
+
+    def _load_palette_cache(self) -> None:
+        if self._palette_cache_loaded:
+            return
+        path = self._get_palette_cache_path()
+        if path:
+            self._palette_cache_loaded = True
+            palette_cache.load(path)
+            App.get_running_app().fbind("on_stop", self._flush_palette_cache)
+
+    def _save_palette_cache(self) -> None:
+        # Palettes resolved in a row are saved with a single write.
+        if self._get_palette_cache_path():
+            self._palette_cache_dirty = True
+            self._trigger_save_palette_cache()
+
+    def _flush_palette_cache(self, *args) -> None:
+        if not self._palette_cache_dirty:
+            return
+
+        self._palette_cache_dirty = False
+        path = self._get_palette_cache_path()
+        if path:
+            palette_cache.save(path)
+
+    def get_scheme_colors(self, scheme: DynamicScheme) -> dict:
+        """
+        Returns the palette of the scheme in the format
+        ``{"primaryColor": [r, g, b, a], ...}`` without applying it.
+
+        .. versionadded:: 2.0.0
+        """
+
+        colors = {}
         for color_name in COLOR_NAMES:
             attr = getattr(MaterialDynamicColors, color_name)
-            setattr(self, f"{color_name}Color", rgba(attr.get_rgba(scheme)))
-        self.disabledTextColor = self._get_disabled_hint_text_color()
+            colors[f"{color_name}Color"] = rgba(attr.get_rgba(scheme))
+        colors["disabledTextColor"] = self._get_disabled_hint_text_color()
+        return colors
+
+    def apply_colors(self, colors: dict) -> list:
+        """
+        Assigns the palette returned by :meth:`get_scheme_colors` and
+        dispatches :attr:`on_colors_changed` once. Only colors whose values
+        differ from the current ones are assigned.
+
+        .. versionadded:: 2.0.0
+
+        :return: names of the changed colors.
+        """
+
+        changed_names = [
+            name
+            for name, value in colors.items()
+            if list(getattr(self, name)) != list(value)
+        ]
+        self._applying_colors = True
+        try:
+            for name in changed_names:
+                setattr(self, name, colors[name])
+        finally:
+            self._applying_colors = False
+
+        if changed_names:
+            self.dispatch("on_colors_changed", changed_names)
         if self.on_colors:
             self.on_colors()
+        return changed_names
+
+    def _on_color_assigned(self, name: str, instance, value) -> None:
+        if not self._applying_colors:
+            self.dispatch("on_colors_changed", [name])
+
+    def _set_color_names(self, scheme: DynamicScheme) -> None:
+        self.apply_colors(self.get_scheme_colors(scheme))
 
     def _set_palette_color(self) -> None:
         if not self.primary_palette:
@@ -1242,36 +1753,82 @@ class ThemableBehavior(EventDispatcher):
         self.md_label = MDLabel
         self.md_textfield = MDTextField
 
+    def bind_theme(self, **kwargs) -> None:
+        """
+        Binds callbacks to the properties of :attr:`theme_cls` and remembers
+        them, so that they are unbound with :meth:`unbind_theme` when the
+        widget is removed from its parent, without scanning all the
+        observers of the theme manager.
+
+        The methods of the widget bound directly with
+        `theme_cls.bind(theme_style=...)` or
+        `theme_cls.bind(primary_palette=...)` are remembered as well.
+
+        .. versionadded:: 2.0.0
+
+        .. code-block:: python
+
+            self.bind_theme(theme_style=self.update_colors)
+        """
+
+        self.theme_cls.bind(**kwargs)
+        for property_name, callback in kwargs.items():
+            # Methods bound to the theme style and the palette are already
+            # remembered by the theme manager.
+            if getattr(callback, "__self__", None) is not self or (
+                property_name not in ("theme_style", "primary_palette")
+            ):
+                self._add_theme_binding(property_name, callback)
+
+    def unbind_theme(self) -> None:
+        """
+        Unbinds the callbacks bound with :meth:`bind_theme`.
+
+        .. versionadded:: 2.0.0
+        """
+
+        if self._theme_bindings:
+            for property_name, callback in self._theme_bindings:
+                self.theme_cls.unbind(**{property_name: callback})
+        self._theme_bindings = None
+
+    _theme_bindings = None
+    _clearing_widgets = False
+
     def remove_widget(self, widget) -> None:
-        if not hasattr(widget, "theme_cls"):
-            super().remove_widget(widget)
-            return
+        if not self._clearing_widgets:
+            self._release_widget(widget)
 
-        callbacks = widget.theme_cls.get_property_observers("theme_style")
+        super().remove_widget(widget)
 
-        for callback in callbacks:
-            try:
-                if hasattr(callback, "proxy") and hasattr(
-                    callback.proxy, "theme_cls"
-                ):
-                    for property_name in ["theme_style", "primary_palette"]:
-                        if widget == callback.proxy:
-                            widget.theme_cls.unbind(
-                                **{
-                                    property_name: getattr(
-                                        callback.proxy, callback.method_name
-                                    )
-                                }
-                            )
-            except ReferenceError:
-                pass
+    def clear_widgets(self, children=None) -> None:
+        if children is None or children is self.children:
+            children = self.children[:]
+
+        # The children are released in one pass, the remove_widget methods
+        # of the layouts still run for each child, but skip the release.
+        release_widget = self._release_widget
+        for widget in children:
+            release_widget(widget)
+
+        self._clearing_widgets = True
+        try:
+            super().clear_widgets(children)
+        finally:
+            self._clearing_widgets = False
+
+    def _add_theme_binding(self, property_name: str, callback) -> None:
+        if self._theme_bindings is None:
+            self._theme_bindings = []
+        self._theme_bindings.append((property_name, callback))
+
+    def _release_widget(self, widget) -> None:
+        if not isinstance(widget, ThemableBehavior):
+            return
+
+        widget.unbind_theme()
 
         # Canceling a scheduled method call on_window_touch for MDLabel
         # objects.
-        if (
-            issubclass(widget.__class__, self.md_label)
-            and self.md_label.allow_selection
-        ):
+        if isinstance(widget, self.md_label) and self.md_label.allow_selection:
             Window.unbind(on_touch_down=widget.on_window_touch)
-
-        super().remove_widget(widget)
@@ -0,0 +1,97 @@
+"""
+Benchmark of the data table model
+=================================
+
+.. versionadded:: 2.0.0
+
+Measures the time of switching the pages of
+:class:`~kivymd.uix.datatables.MDDataTable`, checking all rows, reading
+the checked rows and updating and removing a single row for tables of
+different sizes.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.datatables
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.metrics import dp  # NOQA E402
+
+from kivymd.app import MDApp  # NOQA E402
+
+
+def run(counts=(1000, 10000, 100000), rows_num=50) -> None:
+    MDApp()
+
+    from kivymd.uix.datatables import MDDataTable
+
+    print(
+        f"{'rows':>8} {'load, ms':>9} {'next page, ms':>14} "
+        f"{'select all, ms':>15} {'get checks, ms':>15} "
+        f"{'is checked, us':>15} {'update row, ms':>15} "
+        f"{'remove row, ms':>15} {'key index, ms':>14}"
+    )
+    for count in counts:
+        row_data = [
+            (f"{i}", ("account", f"Name {i}"), f"{i * 2}", f"{i % 7}")
+            for i in range(count)
+        ]
+        table = MDDataTable(
+            use_pagination=True,
+            check=True,
+            rows_num=rows_num,
+            column_data=[
+                ("No.", dp(30)),
+                ("Name", dp(40)),
+                ("Value", dp(30)),
+                ("Group", dp(30)),
+            ],
+        )
+        table_data = table.table_data
+
+        load_time = timeit.timeit(
+            lambda: setattr(table, "row_data", row_data), number=1
+        )
+
+        def next_page():
+            table_data.set_next_row_data_parts("forward")
+
+        page_time = timeit.timeit(next_page, number=10) / 10
+        select_time = timeit.timeit(
+            lambda: table_data.select_all("down"), number=1
+        )
+        checks_time = timeit.timeit(table.get_row_checks, number=1)
+        is_checked_time = (
+            timeit.timeit(lambda: table.is_row_checked(count - 1), number=1000)
+            / 1000
+        )
+
+        def update_row():
+            table.update_row(table.row_data[1], ("1", "Changed", "0", "0"))
+            table_data._refresh_rows()
+
+        def remove_row():
+            table.remove_row(table.row_data[-1])
+            table_data._refresh_rows()
+
+        # Builds the index of the row keys.
+        key_time = timeit.timeit(
+            lambda: table_data.model.index_of(None), number=1
+        )
+        update_time = timeit.timeit(update_row, number=1)
+        remove_time = timeit.timeit(remove_row, number=1)
+        print(
+            f"{count:>8} {load_time * 1000:>9.1f} {page_time * 1000:>14.2f} "
+            f"{select_time * 1000:>15.2f} {checks_time * 1000:>15.2f} "
+            f"{is_checked_time * 1000000:>15.2f} "
+            f"{update_time * 1000:>15.2f} {remove_time * 1000:>15.2f} "
+            f"{key_time * 1000:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,59 @@
+"""
+Benchmark of the easing tables
+==============================
+
+.. versionadded:: 2.0.0
+
+Measures the time of evaluating the Material Design transitions of
+:class:`~kivymd.animation.MDAnimationTransition`, which are
+:class:`~kivymd.utils.cubic_bezier.EasingTable` objects, and of the
+analytic :class:`~kivymd.utils.cubic_bezier.CubicBezier` solver they are
+sampled from, and the maximum difference between them.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.easing
+"""
+
+import os
+import random
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivymd.animation import MDAnimationTransition  # NOQA E402
+
+
+def run(samples=100000) -> None:
+    values = [random.random() for _ in range(samples)]
+    print(
+        f"{'transition':>20} {'analytic, ns':>13} {'table, ns':>10} "
+        f"{'speedup':>8} {'max error':>10}"
+    )
+
+    for name in (
+        "easing_standard",
+        "easing_decelerated",
+        "easing_accelerated",
+        "easing_linear",
+        "easing_emphasized",
+    ):
+        table = getattr(MDAnimationTransition, name)
+        function = table.function
+
+        def evaluate(function):
+            for value in values:
+                function(value)
+
+        analytic_time = timeit.timeit(lambda: evaluate(function), number=1)
+        table_time = timeit.timeit(lambda: evaluate(table), number=1)
+        error = max(abs(table(value) - function(value)) for value in values)
+        print(
+            f"{name:>20} {analytic_time / samples * 1e9:>13.0f} "
+            f"{table_time / samples * 1e9:>10.0f} "
+            f"{analytic_time / table_time:>7.1f}x {error:>10.1e}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,80 @@
+"""
+Benchmark of directory scanning
+===============================
+
+.. versionadded:: 2.0.0
+
+Measures the time of reading a directory and sorting its files by size.
+
+The `legacy` column is the time for the same operation with
+:func:`os.listdir`, :func:`os.path.isdir` and :func:`os.path.getsize` for
+each entry, as :class:`~kivymd.uix.filemanager.MDFileManager` did before
+:class:`~kivymd.uix.filemanager.scanner.DirectoryScanner`.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.filemanager
+"""
+
+import os
+import shutil
+import tempfile
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivymd.uix.filemanager.scanner import DirectoryScanner  # NOQA E402
+
+
+def legacy(path: str) -> list:
+    dirs = []
+    files = []
+
+    for name in os.listdir(path):
+        if os.path.isdir(os.path.join(path, name)):
+            dirs.append(name)
+        else:
+            files.append(name)
+
+    files = [os.path.join(path, name) for name in files]
+    files.sort(key=os.path.getsize, reverse=True)
+
+    return dirs + files
+
+
+def scanner(path: str) -> list:
+    entries = DirectoryScanner().scan(path)
+
+    return sorted(entries, key=lambda entry: entry.size, reverse=True)
+
+
+def run(counts=(1000, 10000, 50000)) -> None:
+    print(
+        f"{'files':>8} {'legacy, ms':>11} {'scandir, ms':>12} "
+        f"{'cached, ms':>11}"
+    )
+    for count in counts:
+        path = tempfile.mkdtemp()
+
+        try:
+            for i in range(count):
+                with open(os.path.join(path, f"file_{i}.txt"), "w") as file:
+                    file.write("x" * (i % 100))
+
+            cached_scanner = DirectoryScanner()
+            cached_scanner.scan(path)
+            legacy_time = timeit.timeit(lambda: legacy(path), number=1)
+            scandir_time = timeit.timeit(lambda: scanner(path), number=1)
+            cached_time = timeit.timeit(
+                lambda: cached_scanner.get_cached(path), number=1
+            )
+            print(
+                f"{count:>8} {legacy_time * 1000:>11.1f} "
+                f"{scandir_time * 1000:>12.1f} {cached_time * 1000:>11.3f}"
+            )
+        finally:
+            shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,78 @@
+"""
+Benchmark of hero lookup
+========================
+
+.. versionadded:: 2.0.0
+
+Measures the time of finding the heroes of a transition depending on the
+number of :class:`~kivymd.uix.hero.MDHeroFrom` tiles on the screens of a
+:class:`~kivymd.uix.screenmanager.MDScreenManager`.
+
+The `scan` column is the time of walking the widget trees of the screens and
+comparing the tags of all heroes, as it was before the
+:data:`~kivymd.uix.hero.hero_registry`. The `registry` column is the time of
+:meth:`~kivymd.uix.screenmanager.MDScreenManager.get_hero_from_widget`.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.hero_lookup
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivymd.app import MDApp  # NOQA E402
+from kivymd.uix.boxlayout import MDBoxLayout  # NOQA E402
+from kivymd.uix.hero import MDHeroFrom  # NOQA E402
+from kivymd.uix.screen import MDScreen  # NOQA E402
+from kivymd.uix.screenmanager import MDScreenManager  # NOQA E402
+
+
+def scan_heroes(manager, tags: list) -> list:
+    heroes = [
+        widget
+        for screen in manager.screens
+        for widget in screen.walk(restrict=True)
+        if isinstance(widget, MDHeroFrom)
+    ]
+    return [hero for tag in tags for hero in heroes if hero.tag == tag]
+
+
+def run(counts=(100, 500, 1000), lookups: int = 100) -> None:
+    MDApp()
+    print(f"{'heroes':>7} {'scan, us':>10} {'registry, us':>13}")
+
+    for count in counts:
+        manager = MDScreenManager()
+        for name in ("grid", "details"):
+            screen = MDScreen(name=name)
+            grid = MDBoxLayout()
+            for index in range(count // 2):
+                tile = MDBoxLayout()
+                tile.add_widget(MDHeroFrom(tag=f"{name} {index}"))
+                grid.add_widget(tile)
+            screen.add_widget(grid)
+            manager.add_widget(screen)
+
+        manager.current_heroes = ["grid 7"]
+        assert scan_heroes(manager, manager.current_heroes) == (
+            manager.get_hero_from_widget()
+        )
+        scan_time = timeit.timeit(
+            lambda: scan_heroes(manager, manager.current_heroes),
+            number=lookups,
+        )
+        registry_time = timeit.timeit(
+            manager.get_hero_from_widget, number=lookups
+        )
+        print(
+            f"{count:>7} {scan_time / lookups * 1e6:>10.1f} "
+            f"{registry_time / lookups * 1e6:>13.1f}"
+        )
+        manager.current_heroes = []
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,87 @@
+"""
+Benchmark of hover behavior
+===========================
+
+.. versionadded:: 2.0.0
+
+Measures the cost of one mouse movement event depending on the number of
+widgets with :class:`~kivymd.uix.behaviors.hover_behavior.HoverBehavior`.
+
+The `legacy` column is the time for calling
+:meth:`~kivymd.uix.behaviors.hover_behavior.HoverBehavior.on_mouse_update`
+on every widget, as it was when each widget was bound to
+:attr:`~kivy.core.window.WindowBase.mouse_pos`. The `manager` column is the
+time spent by :data:`~kivymd.uix.behaviors.hover_behavior.hover_manager`.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.hover
+"""
+
+import os
+import random
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.core.window import Window  # NOQA E402
+from kivy.uix.widget import Widget  # NOQA E402
+
+from kivymd.uix.behaviors.hover_behavior import (  # NOQA E402
+    HoverBehavior,
+    hover_manager,
+)
+
+
+class HoverWidget(HoverBehavior, Widget):
+    pass
+
+
+def create_widgets(count: int) -> Widget:
+    root = Widget(size=Window.size)
+    columns = int(count**0.5) or 1
+    width = Window.width / columns
+    height = Window.height / (count / columns)
+    for index in range(count):
+        root.add_widget(
+            HoverWidget(
+                pos=((index % columns) * width, (index // columns) * height),
+                size=(width, height),
+            )
+        )
+    return root
+
+
+def run(counts=(100, 500, 1000, 5000), events: int = 200) -> None:
+    random.seed(0)
+    positions = [
+        (random.uniform(0, Window.width), random.uniform(0, Window.height))
+        for _ in range(events)
+    ]
+    print(f"{'widgets':>8} {'legacy, us':>12} {'manager, us':>12}")
+
+    for count in counts:
+        root = create_widgets(count)
+        Window.add_widget(root)
+        widgets = root.children[:]
+
+        def legacy():
+            for pos in positions:
+                for widget in widgets:
+                    widget.on_mouse_update(Window, pos)
+
+        def manager():
+            for pos in positions:
+                hover_manager.on_mouse_pos(Window, pos)
+
+        legacy_time = min(timeit.repeat(legacy, number=1, repeat=3))
+        manager_time = min(timeit.repeat(manager, number=1, repeat=3))
+        print(
+            f"{count:>8} {legacy_time / events * 1e6:>12.1f} "
+            f"{manager_time / events * 1e6:>12.1f}"
+        )
+        Window.remove_widget(root)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+"""
+Benchmark of the icon atlas
+===========================
+
+.. versionadded:: 2.0.0
+
+Measures the time of creating and recoloring
+:class:`~kivymd.uix.label.label.MDIcon` widgets with
+:attr:`~kivymd.uix.label.label.MDIcon.use_atlas` enabled and disabled and
+prints the statistics of the
+:class:`~kivymd.uix.label.icon_atlas.IconAtlas`.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.icon_atlas
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivymd.app import MDApp  # NOQA E402
+from kivymd.icon_definitions import md_icons  # NOQA E402
+
+
+def run(counts=(100, 500, 2000), names=50) -> None:
+    MDApp()
+
+    from kivymd.uix.label import MDIcon
+    from kivymd.uix.label.icon_atlas import icon_atlas
+
+    icon_names = list(md_icons)[:names]
+    print(
+        f"{'icons':>6} {'atlas':>6} {'create, ms':>11} {'recolor, ms':>12} "
+        f"{'textures':>9}"
+    )
+    for count in counts:
+        for use_atlas in (False, True):
+
+            def create():
+                icons = [
+                    MDIcon(icon=icon_names[i % names], use_atlas=use_atlas)
+                    for i in range(count)
+                ]
+                for icon in icons:
+                    icon.texture_update()
+                return icons
+
+            def recolor():
+                for icon in icons:
+                    icon.icon_color = (1, 0, 0, 1)
+                    icon.texture_update()
+
+            create_time = timeit.timeit(create, number=1)
+            icons = create()
+            recolor_time = timeit.timeit(recolor, number=1)
+            textures = len(
+                {icon._glyph_texture or icon.texture for icon in icons}
+            )
+            print(
+                f"{count:>6} {str(use_atlas):>6} {create_time * 1000:>11.1f} "
+                f"{recolor_time * 1000:>12.1f} {textures:>9}"
+            )
+            del icons
+
+    stats = icon_atlas.get_stats()
+    print(
+        f"atlas: hit rate {stats['hit_rate']:.1%}, {stats['glyphs']} glyphs, "
+        f"{stats['references']} icons, {stats['pages']} pages, "
+        f"{stats['atlas_bytes'] / 1024:.0f} KiB, "
+        f"saved {stats['saved_bytes'] / 1024:.0f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    run()
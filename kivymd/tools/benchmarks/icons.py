@@ -0,0 +1,90 @@
+"""
+Benchmark of the icon registry
+==============================
+
+.. versionadded:: 2.0.0
+
+Measures the time of loading :data:`~kivymd.icon_definitions.md_icons`,
+looking up an icon and searching icons by a part of the name.
+
+The `dict` columns are the times for the same operations with the literal
+`dict` that `kivymd/icon_definitions.py` contained before
+:class:`~kivymd.icon_definitions.IconRegistry`: loading its compiled code,
+as the import of the module from a `.pyc` file does, and scanning all names
+for each search.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.icons
+"""
+
+import marshal
+import os
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivymd.icon_definitions import IconRegistry, md_icons  # NOQA E402
+
+
+def run(queries=("a", "ar", "arrow", "account-circle", "ircle")) -> None:
+    source = "md_icons = {\n%s}\n" % "".join(
+        f"    {name!r}: {glyph!r},\n" for name, glyph in md_icons.items()
+    )
+    code = marshal.dumps(compile(source, "icon_definitions.py", "exec"))
+
+    def load_dict():
+        namespace = {}
+        exec(marshal.loads(code), namespace)
+        return namespace["md_icons"]
+
+    def load_table():
+        registry = IconRegistry(md_icons.path)
+        len(registry)
+        return registry
+
+    icons = load_dict()
+    registry = load_table()
+    # Builds all indices.
+    index_time = timeit.timeit(lambda: registry.search("xyz"), number=1)
+    dict_time = timeit.timeit(load_dict, number=10) / 10
+    table_time = timeit.timeit(load_table, number=10) / 10
+    print(
+        f"load: dict {dict_time * 1000:.2f} ms, "
+        f"table {table_time * 1000:.2f} ms, "
+        f"search index {index_time * 1000:.2f} ms"
+    )
+
+    number = 100000
+    dict_time = timeit.timeit(lambda: icons["magnify"], number=number)
+    table_time = timeit.timeit(lambda: registry["magnify"], number=number)
+    print(
+        f"lookup: dict {dict_time / number * 1e9:.0f} ns, "
+        f"table {table_time / number * 1e9:.0f} ns"
+    )
+
+    print(
+        f"{'query':>16} {'matches':>8} {'dict, us':>9} "
+        f"{'search, us':>11} {'search 20, us':>14}"
+    )
+    for text in queries:
+        number = 100
+        dict_time = timeit.timeit(
+            lambda: [name for name in icons if text in name], number=number
+        )
+        search_time = timeit.timeit(
+            lambda: registry.search(text), number=number
+        )
+        limit_time = timeit.timeit(
+            lambda: registry.search(text, limit=20), number=number
+        )
+        print(
+            f"{text:>16} {len(registry.search(text)):>8} "
+            f"{dict_time / number * 1e6:>9.1f} "
+            f"{search_time / number * 1e6:>11.1f} "
+            f"{limit_time / number * 1e6:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,67 @@
+"""
+Benchmark of the label texture cache
+====================================
+
+.. versionadded:: 2.0.0
+
+Measures the time of scrolling a list of recycled
+:class:`~kivymd.uix.label.label.MDLabel` views over the same strings with
+:attr:`~kivymd.uix.label.label.MDLabel.use_texture_cache` enabled and
+disabled and prints the statistics of the
+:class:`~kivymd.uix.label.texture_cache.LabelTextureCache`.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.label_texture_cache
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivymd.app import MDApp  # NOQA E402
+
+
+def run(views=20, items=200, steps=2000) -> None:
+    MDApp()
+
+    from kivymd.uix.label import MDLabel
+    from kivymd.uix.label.texture_cache import label_texture_cache
+
+    data = [f"Item {i}: message from contact {i % 37}" for i in range(items)]
+    print(f"{'cache':>6} {'scroll, ms':>11} {'per view, us':>13}")
+
+    for use_texture_cache in (False, True):
+        labels = [
+            MDLabel(use_texture_cache=use_texture_cache, width=300)
+            for _ in range(views)
+        ]
+
+        def scroll():
+            # Each step moves the list by one item, so every view is bound
+            # to the next item as RecycleView does.
+            for step in range(steps):
+                for index, label in enumerate(labels):
+                    label.text = data[(step + index) % items]
+                    label.texture_update()
+                    # The texture is rendered when it is drawn.
+                    if label.texture:
+                        label.texture.bind()
+
+        scroll_time = timeit.timeit(scroll, number=1)
+        print(
+            f"{str(use_texture_cache):>6} {scroll_time * 1000:>11.1f} "
+            f"{scroll_time / (steps * views) * 1e6:>13.1f}"
+        )
+
+    stats = label_texture_cache.get_stats()
+    print(
+        f"cache: hit rate {stats['hit_rate']:.1%}, "
+        f"{stats['textures']} textures, {stats['bytes'] / 1024:.0f} KiB, "
+        f"{stats['evictions']} evictions"
+    )
+
+
+if __name__ == "__main__":
+    run()
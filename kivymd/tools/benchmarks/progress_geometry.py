@@ -0,0 +1,113 @@
+"""
+Benchmark of the progress indicator geometry
+============================================
+
+.. versionadded:: 2.0.0
+
+Measures the time of generating the points of the waves and arcs drawn by
+:class:`~kivymd.uix.exprogressindicator.MDExLinearProgressIndicator` and
+:class:`~kivymd.uix.exprogressindicator.MDExCircularProgressIndicator` for
+one frame with the lookup tables of
+:mod:`~kivymd.uix.exprogressindicator.geometry` and with the per-point
+calculations that the indicators used before.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.progress_geometry
+"""
+
+import math
+import os
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivymd.uix.exprogressindicator import geometry  # NOQA E402
+
+
+def _get_wave_points(start, end, phase, wave_length, amplitude, center):
+    k = 2 * math.pi / wave_length
+    points = []
+    _sin = math.sin
+
+    for x in range(int(start), int(end), 1):
+        points.extend((x, center + amplitude * _sin(k * (x - phase))))
+
+    return points
+
+
+def _get_arc_points(start, end, step, radius, cx, cy, mode_number, amplitude):
+    num_steps = int((end - start) / step) + 1
+    _sin, _cos = math.sin, math.cos
+
+    return [
+        coord
+        for i in range(num_steps)
+        for pt in [start + i * step]
+        for r in [radius + amplitude * _sin(mode_number * pt - 1.0)]
+        for coord in (cx + r * _sin(pt), cy + r * _cos(pt))
+    ]
+
+
+def run(widths=(240, 1080, 2160), number=200) -> None:
+    print(f"numpy: {geometry.numpy is not None}")
+    print(
+        f"{'shape':>8} {'width':>6} {'points':>7} {'old, us':>9} "
+        f"{'table, us':>10} {'speedup':>8}"
+    )
+    wave_length, amplitude = 21.0, 8.0
+
+    for width in widths:
+        table = geometry.get_wave_table(wave_length, amplitude)
+        cases = [
+            (
+                "wave",
+                lambda: _get_wave_points(
+                    0, width, 123.4, wave_length, amplitude, 50
+                ),
+                lambda: table.get_points(0, width, 123.4, offset=50),
+            )
+        ]
+        # Circles with the same number of the points.
+        step = 2 * math.pi / width
+        radius = width / (2 * math.pi)
+        arc = geometry.get_arc_table(radius, step)
+        mode_number = 2 * math.pi * radius / wave_length
+        cases += [
+            (
+                "arc",
+                lambda: _get_arc_points(
+                    0.3, 0.3 + math.pi * 1.5, step, radius, 0, 0, 0, 0
+                ),
+                lambda: arc.get_points(0.3, 0.3 + math.pi * 1.5),
+            ),
+            (
+                "wave arc",
+                lambda: _get_arc_points(
+                    0.3,
+                    0.3 + math.pi * 1.5,
+                    step,
+                    radius,
+                    0,
+                    0,
+                    mode_number,
+                    amplitude,
+                ),
+                lambda: arc.get_wave_points(
+                    0.3, 0.3 + math.pi * 1.5, mode_number, amplitude, 1.0
+                ),
+            ),
+        ]
+
+        for name, old, new in cases:
+            old_time = timeit.timeit(old, number=number) / number
+            new_time = timeit.timeit(new, number=number) / number
+            print(
+                f"{name:>8} {width:>6} {len(new()) // 2:>7} "
+                f"{old_time * 1e6:>9.1f} {new_time * 1e6:>10.1f} "
+                f"{old_time / new_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    run()
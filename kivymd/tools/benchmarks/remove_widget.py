@@ -0,0 +1,94 @@
+"""
+Benchmark of removing themed widgets
+====================================
+
+.. versionadded:: 2.0.0
+
+Measures the time of adding and removing themed widgets to a container.
+
+The `legacy` column is the time for the same operation when each removed
+widget scans all the observers of
+:attr:`~kivymd.theming.ThemeManager.theme_style`, as
+:meth:`~kivymd.theming.ThemableBehavior.remove_widget` did before
+:meth:`~kivymd.theming.ThemableBehavior.bind_theme`.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.remove_widget
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivymd.app import MDApp  # NOQA E402
+
+
+def legacy_unbind(widget) -> None:
+    callbacks = widget.theme_cls.get_property_observers("theme_style")
+    for callback in callbacks:
+        try:
+            if hasattr(callback, "proxy") and hasattr(
+                callback.proxy, "theme_cls"
+            ):
+                for property_name in ["theme_style", "primary_palette"]:
+                    if widget == callback.proxy:
+                        widget.theme_cls.unbind(
+                            **{
+                                property_name: getattr(
+                                    callback.proxy, callback.method_name
+                                )
+                            }
+                        )
+        except ReferenceError:
+            pass
+
+
+def run(counts=(1000, 5000)) -> None:
+    MDApp()
+
+    from kivymd.uix.boxlayout import MDBoxLayout
+    from kivymd.uix.label import MDLabel
+    from kivymd.uix.textfield import MDTextField
+
+    print(
+        f"{'widgets':>8} {'legacy cleanup, ms':>19} "
+        f"{'registry cleanup, ms':>21} {'clear_widgets, ms':>18}"
+    )
+    for count in counts:
+        container = MDBoxLayout()
+        # Every tenth widget binds to the theme manager in Python code.
+        widgets = [
+            MDTextField() if not index % 10 else MDLabel(text=str(index))
+            for index in range(count)
+        ]
+
+        def bind():
+            for widget in widgets:
+                if isinstance(widget, MDTextField):
+                    widget.bind_theme(theme_style=widget.update_colors)
+
+        def legacy():
+            for widget in widgets:
+                legacy_unbind(widget)
+
+        def registry():
+            for widget in widgets:
+                widget.unbind_theme()
+
+        for widget in widgets:
+            container.add_widget(widget)
+        legacy_time = timeit.timeit(legacy, number=1)
+        bind()
+        registry_time = timeit.timeit(registry, number=1)
+        bind()
+        clear_time = timeit.timeit(container.clear_widgets, number=1)
+        print(
+            f"{count:>8} {legacy_time * 1000:>19.1f} "
+            f"{registry_time * 1000:>21.1f} {clear_time * 1000:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,149 @@
+"""
+Benchmark of theme switching
+============================
+
+.. versionadded:: 2.0.0
+
+Measures the time of applying a new color scheme to a tree of
+:class:`~kivymd.uix.label.MDLabel` and :class:`~kivymd.uix.label.MDIcon`
+widgets.
+
+The `kv rules` tree binds the colors of the widgets to the individual colors
+of the scheme in KV rules, as the widgets did before they refreshed their
+colors from :attr:`~kivymd.theming.ThemeManager.on_colors_changed`. The
+`on_colors_changed` tree uses the widgets as they are.
+
+The `apply_colors` row applies a precalculated scheme with
+:meth:`~kivymd.theming.ThemeManager.apply_colors`. The `batch_update` row
+changes the theme style, the palette and the contrast inside
+:meth:`~kivymd.theming.ThemeManager.batch_update`, while the
+`separate changes` row changes the same properties one after another.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.theme
+"""
+
+import gc
+import os
+import timeit
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.lang import Builder  # NOQA E402
+from materialyoucolor.hct import Hct  # NOQA E402
+from materialyoucolor.utils.color_utils import argb_from_rgba_01  # NOQA E402
+from materialyoucolor.utils.platform_utils import SCHEMES  # NOQA E402
+
+from kivymd.app import MDApp  # NOQA E402
+
+# The rules of the labels and icons before they refreshed their colors from
+# the `on_colors_changed` event.
+KV_RULES = """
+<KvRuleLabel@MDLabel>
+    color:
+        self.text_color \
+        if self.text_color else \
+        self.theme_cls.onSurfaceColor
+    disabled_color:
+        app.theme_cls.onSurfaceColor[:-1] + \
+        [self.label_opacity_value_disabled_text]
+
+
+<KvRuleIcon@MDIcon>
+    color:
+        self.icon_color \
+        if self.icon_color else \
+        self.theme_cls.onSurfaceVariantColor
+    disabled_color:
+        ( \
+        app.theme_cls.onSurfaceColor[:-1] + \
+        [self.label_opacity_value_disabled_text] \
+        ) \
+        if not self.icon_color_disabled else \
+        self.icon_color_disabled
+"""
+
+
+def get_scheme(theme_cls, dark_mode: bool):
+    color = Hct.from_int(
+        argb_from_rgba_01(theme_cls.color_to_rgba(theme_cls.primary_palette))
+    )
+    return SCHEMES[theme_cls.dynamic_scheme_name](
+        color, dark_mode, theme_cls.dynamic_scheme_contrast, spec_version="2025"
+    )
+
+
+def run(count: int = 2000, repeat: int = 5) -> None:
+    app = MDApp()
+    theme_cls = app.theme_cls
+    theme_cls.bind(
+        theme_style=theme_cls.update_theme_colors,
+        primary_palette=theme_cls.set_colors,
+    )
+    theme_cls.set_colors()
+    Builder.load_string(KV_RULES)
+
+    from kivy.factory import Factory
+
+    from kivymd.uix.boxlayout import MDBoxLayout
+    from kivymd.uix.label import MDIcon, MDLabel
+
+    schemes = [get_scheme(theme_cls, False), get_scheme(theme_cls, True)]
+    palettes = [theme_cls.get_scheme_colors(scheme) for scheme in schemes]
+    state = {"index": 0}
+
+    def apply_colors():
+        state["index"] ^= 1
+        theme_cls.apply_colors(palettes[state["index"]])
+
+    def separate_changes():
+        theme_cls.switch_theme()
+        theme_cls.primary_palette = (
+            "Olive" if theme_cls.primary_palette == "Blue" else "Blue"
+        )
+        theme_cls.dynamic_scheme_contrast = (
+            0.5 if not theme_cls.dynamic_scheme_contrast else 0.0
+        )
+
+    def batch_update():
+        with theme_cls.batch_update():
+            separate_changes()
+
+    rows = (
+        ("apply_colors", apply_colors),
+        ("separate changes", separate_changes),
+        ("batch_update", batch_update),
+    )
+    results = {}
+    for tree_name, label_class, icon_class in (
+        ("kv rules", Factory.KvRuleLabel, Factory.KvRuleIcon),
+        ("on_colors_changed", MDLabel, MDIcon),
+    ):
+        root = MDBoxLayout(orientation="vertical")
+        for index in range(count):
+            root.add_widget(label_class(text=f"Label {index}"))
+            if not index % 4:
+                root.add_widget(icon_class(icon="home"))
+
+        for row_name, function in rows:
+            results[row_name, tree_name] = (
+                min(timeit.repeat(function, number=2, repeat=repeat)) / 2
+            )
+
+        # The widgets of the tree stop observing the theme when they are
+        # collected.
+        del root
+        gc.collect()
+
+    print(f"{count} labels and {count // 4} icons, ms per switch:")
+    print(f"{'':>18} {'kv rules':>10} {'on_colors_changed':>18}")
+    for row_name, function in rows:
+        print(
+            f"{row_name:>18} {results[row_name, 'kv rules'] * 1000:>10.2f} "
+            f"{results[row_name, 'on_colors_changed'] * 1000:>18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
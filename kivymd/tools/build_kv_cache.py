@@ -0,0 +1,90 @@
+"""
+KV cache builder
+================
+
+.. versionadded:: 2.0.0
+
+Parses the KV files of the KivyMD widgets and writes the parsed rules to the
+cache directory of the package (see :mod:`~kivymd.utils.kv_cache`), so the
+applications load them without parsing:
+
+.. code-block:: bash
+
+    python -m kivymd.tools.build_kv_cache
+
+The rules of each file are cached both as a whole and split by classes for
+the lazy mode of :mod:`~kivymd.utils.kv_loader`. The caches of the other
+versions of Kivy, KivyMD and Python are removed with `--clear`:
+
+.. code-block:: bash
+
+    python -m kivymd.tools.build_kv_cache -- --clear
+"""
+
+import argparse
+import glob
+import os
+import shutil
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivymd import uix_path  # NOQA E402
+from kivymd.utils.kv_cache import kv_cache  # NOQA E402
+from kivymd.utils.kv_loader import KvLoader  # NOQA E402
+
+
+def run(directory=None, clear=False) -> None:
+    directory = directory or kv_cache.package_dir
+
+    if clear and os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if name != kv_cache.tag:
+                shutil.rmtree(os.path.join(directory, name))
+
+    saved = skipped = 0
+
+    for path in sorted(
+        glob.glob(os.path.join(uix_path, "**", "*.kv"), recursive=True)
+    ):
+        with open(path, encoding="utf-8") as kv_file:
+            source = kv_file.read()
+
+        sources = [source]
+        blocks = KvLoader._split(source)
+
+        if blocks is not None:
+            directives, rules = blocks
+            sources += [directives + "".join(lines) for _, lines in rules]
+
+        for source in sources:
+            if kv_cache.save(directory, source):
+                saved += 1
+            else:
+                skipped += 1
+
+    print(
+        f"Cached {saved} KV sources in "
+        f"{os.path.join(directory, kv_cache.tag)}, skipped {skipped}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m kivymd.tools.build_kv_cache",
+        description="Writes the parsed KV rules of the KivyMD widgets to the "
+        "cache directory.",
+    )
+    parser.add_argument(
+        "--output", help="cache directory, by default kivymd/data/kv_cache"
+    )
+    parser.add_argument(
+        "--clear",
+        action="store_true",
+        help="remove the caches of the other versions",
+    )
+    args = parser.parse_args()
+    run(args.output, args.clear)
+
+
+if __name__ == "__main__":
+    main()
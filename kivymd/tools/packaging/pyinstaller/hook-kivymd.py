@@ -40,3 +40,10 @@ for path_to_kv_file in Path(kivymd.uix_path).glob("**/*.kv"):
             ),
         )
     )
+
+# Add the parsed KV rules from the `kivymd/data/kv_cache` directory.
+kv_cache_path = Path(kivymd.path).joinpath("data", "kv_cache")
+if kv_cache_path.is_dir():
+    datas.append(
+        (str(kv_cache_path), str(Path("kivymd").joinpath("data", "kv_cache")))
+    )
@@ -8,7 +8,8 @@ Tool for updating Iconic font
 =============================
 
 Downloads archive from https://github.com/Templarian/MaterialDesign-Webfont and
-updates font file with icon_definitions.
+updates font file with the table of icons read by
+:data:`~kivymd.icon_definitions.md_icons`.
 """
 
 import json
@@ -22,6 +23,7 @@ import requests
 
 os.environ["KIVY_NO_ARGS"] = "1"
 
+from kivymd.icon_definitions import write_icon_table  # NOQA E402
 from kivymd.tools.release.git_commands import git_commit  # NOQA E402
 
 # Paths to files in kivymd repository
@@ -30,6 +32,7 @@ font_path = os.path.join(
     kivymd_path, "fonts", "materialdesignicons-webfont.ttf"
 )
 icon_definitions_path = os.path.join(kivymd_path, "icon_definitions.py")
+icon_table_path = os.path.join(kivymd_path, "fonts", "materialdesignicons.bin")
 
 font_version = "master"
 # URL to download new archive (set None if already downloaded)
@@ -54,8 +57,7 @@ re_icons_json = re.compile(r"(?<=var icons = )[\S ]+(?=;)")
 re_additional_icons = re.compile(r"(?<=icons\.push\()[\S ]+(?=\);)")
 re_version = re.compile(r"(?<=<span class=\"version\">)[\d.]+(?=</span>)")
 re_quote_keys = re.compile(r"([{\s,])(\w+)(:)")
-re_icon_definitions = re.compile(r"md_icons = {\n([ ]{4}[\s\S]*,\n)*}")
-re_version_in_file = re.compile(r"(?<=LAST UPDATED: Version )[\d.]+(?=\n)")
+re_version_in_file = re.compile(r"(?<=\nVersion )[\d.]+(?=\n)")
 
 
 def download_file(url, path):
@@ -91,31 +93,22 @@ def get_icons_list():
 
 
 def make_icon_definitions(icons):
-    # Make python dict ("name": hex)
-    icon_definitions = "md_icons = {\n"
+    # Make python dict {"name": character}
+    icon_definitions = {}
     for i in icons:
-        icon_definitions += " " * 4
-        if len(i["hex"]) != 4:
-            # Some icons has 5-digit unicode
-            i["hex"] = "0" * (8 - len(i["hex"])) + i["hex"]
-            icon_definitions += f'"{i["name"]}": "\\U{i["hex"].upper()}",\n'
-        else:
-            icon_definitions += f'"{i["name"]}": "\\u{i["hex"].upper()}",\n'
-    icon_definitions += " " * 4 + '"blank": " ",\n'  # Add blank icon (space)
-    icon_definitions += "}"
+        icon_definitions[i["name"]] = chr(int(i["hex"], 16))
+    icon_definitions["blank"] = " "  # Add blank icon (space)
     return icon_definitions
 
 
 def export_icon_definitions(icon_definitions, version):
+    # Change table of icons
+    write_icon_table(icon_table_path, icon_definitions)
     with open(icon_definitions_path, "r") as f:
         icon_definitions_file = f.read()
-    # Change md_icons list
-    new_icon_definitions = re_icon_definitions.sub(
-        icon_definitions.replace("\\", "\\\\"), icon_definitions_file, 1
-    )
     # Change version
     new_icon_definitions = re_version_in_file.sub(
-        version, new_icon_definitions, 1
+        version, icon_definitions_file, 1
     )
     with open(icon_definitions_path, "w") as f:
         f.write(new_icon_definitions)
@@ -141,7 +134,7 @@ def update_icons(make_commit: bool = False):
         print(f"Version {version}. {len(icons)} icons loaded")
         icon_definitions = make_icon_definitions(icons)
         export_icon_definitions(icon_definitions, version)
-        print("File icon_definitions.py updated")
+        print("Table of icons updated")
         shutil.rmtree(temp_path, ignore_errors=True)
 
         if make_commit:
@@ -150,6 +143,7 @@ def update_icons(make_commit: bool = False):
                 allow_error=True,
                 add_files=[
                     "kivymd/icon_definitions.py",
+                    "kivymd/fonts/materialdesignicons.bin",
                     "kivymd/fonts/materialdesignicons-webfont.ttf",
                 ],
             )
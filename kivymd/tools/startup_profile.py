@@ -0,0 +1,252 @@
+"""
+Startup profiler
+================
+
+.. versionadded:: 2.0.0
+
+Imports KivyMD and its widgets and reports the time of importing each module
+and of parsing KV rules.
+
+.. code-block:: bash
+
+    python -m kivymd.tools.startup_profile
+    python -m kivymd.tools.startup_profile -- --lazy
+    python -m kivymd.tools.startup_profile -- --modules kivymd.uix.button main
+
+The options are passed after `--`, so that Kivy does not parse them. The
+profiler runs in a new interpreter, because `python -m` imports KivyMD
+before the profiler.
+
+For each module, the profiler reports the time of executing the module
+without the modules it imports (`self`), with them (`total`), and the time
+of parsing KV rules with :meth:`~kivy.lang.Builder.load_string` while the
+module is executed (`kv`). Then it reports the time of parsing each KV file
+of the widgets.
+
+With `--lazy`, the rules of the widgets are parsed when the first widget of
+their class is created (see :mod:`~kivymd.utils.kv_loader`), so the imports
+do not parse the KV files of the widgets.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from importlib.abc import Loader, MetaPathFinder
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+
+class _TimedLoader(Loader):
+    def __init__(self, loader, profiler):
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.profiler.enter(module.__name__)
+
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profiler.exit()
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class ImportProfiler(MetaPathFinder):
+    """
+    Measures the time of importing the modules.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self):
+        self.times = {}  # {module: [self, total, kv]}
+        self._stack = []  # [[module, start, children time], ...]
+        self._finding = set()
+
+    def install(self) -> None:
+        from kivy.lang import Builder
+
+        sys.meta_path.insert(0, self)
+        load_string = Builder.load_string
+
+        def timed_load_string(*args, **kwargs):
+            start = time.perf_counter()
+
+            try:
+                return load_string(*args, **kwargs)
+            finally:
+                if self._stack:
+                    name = self._stack[-1][0]
+                    self.times[name][2] += time.perf_counter() - start
+
+        Builder.load_string = timed_load_string
+
+    def uninstall(self) -> None:
+        from kivy.lang import Builder
+
+        sys.meta_path.remove(self)
+        vars(Builder).pop("load_string", None)
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self._finding:
+            return None
+
+        self._finding.add(fullname)
+
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+
+                spec = finder.find_spec(fullname, path, target)
+
+                if spec is not None:
+                    if spec.loader is not None and hasattr(
+                        spec.loader, "exec_module"
+                    ):
+                        spec.loader = _TimedLoader(spec.loader, self)
+
+                    return spec
+        finally:
+            self._finding.discard(fullname)
+
+        return None
+
+    def enter(self, name: str) -> None:
+        self.times.setdefault(name, [0.0, 0.0, 0.0])
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        name, start, children = self._stack.pop()
+        total = time.perf_counter() - start
+        self.times[name][0] += total - children
+        self.times[name][1] += total
+
+        if self._stack:
+            self._stack[-1][2] += total
+
+
+def get_default_modules() -> list:
+    """Returns `kivymd` and the modules of the widgets of the factory."""
+
+    import importlib.util
+
+    package = os.path.dirname(importlib.util.find_spec("kivymd").origin)
+
+    with open(
+        os.path.join(package, "factory_registers.py"), encoding="utf-8"
+    ) as registers:
+        modules = re.findall(r'module="([\w.]+)"', registers.read())
+
+    return ["kivymd"] + list(dict.fromkeys(modules))
+
+
+def run(modules=None, lazy=False, top=30) -> None:
+    if lazy:
+        os.environ["KIVYMD_LAZY_KV"] = "1"
+
+    start = time.perf_counter()
+    import kivy.lang  # NOQA F401
+
+    kivy_time = time.perf_counter() - start
+    profiler = ImportProfiler()
+    profiler.install()
+    failed = []
+    start = time.perf_counter()
+
+    try:
+        for module in modules or get_default_modules():
+            try:
+                __import__(module)
+            except ImportError as error:
+                failed.append((module, error))
+    finally:
+        total_time = time.perf_counter() - start
+        profiler.uninstall()
+
+    from kivymd import uix_path
+    from kivymd.utils.kv_loader import kv_loader
+
+    print(f"Kivy (imported before profiling): {kivy_time * 1000:.1f} ms")
+    print(f"Imports: {total_time * 1000:.1f} ms")
+    print(f"KV parsing: {sum(kv_loader.parse_times.values()) * 1000:.1f} ms")
+
+    if kv_loader.lazy:
+        print(f"Classes with unparsed rules: {kv_loader.get_pending_count()}")
+
+    print(f"\n{'module':<50} {'self, ms':>9} {'total, ms':>10} {'kv, ms':>7}")
+
+    for name, (self_time, total, kv_time) in sorted(
+        profiler.times.items(), key=lambda item: -item[1][1]
+    )[:top]:
+        print(
+            f"{name:<50} {self_time * 1000:>9.1f} {total * 1000:>10.1f} "
+            f"{kv_time * 1000:>7.1f}"
+        )
+
+    print(f"\n{'KV file':<50} {'parse, ms':>9}")
+
+    for path, parse_time in sorted(
+        kv_loader.parse_times.items(), key=lambda item: -item[1]
+    )[:top]:
+        print(
+            f"{os.path.relpath(path, uix_path):<50} {parse_time * 1000:>9.1f}"
+        )
+
+    for module, error in failed:
+        print(f"\nCould not import {module}: {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m kivymd.tools.startup_profile",
+        description="Reports the import time of KivyMD modules and the time "
+        "of parsing KV rules.",
+    )
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        help="modules to import, by default kivymd and all widgets",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="parse the rules of the widgets when they are created",
+    )
+    parser.add_argument(
+        "--top", type=int, default=30, help="number of the reported modules"
+    )
+    args = parser.parse_args()
+
+    if "kivymd" in sys.modules:
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        env = dict(os.environ, KIVY_NO_ARGS="1")
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [root, os.environ.get("PYTHONPATH")])
+        )
+        sys.exit(
+            subprocess.call(
+                [
+                    sys.executable,
+                    "-c",
+                    "import runpy; "
+                    f"runpy.run_path({__file__!r}, run_name='__main__')",
+                    *sys.argv[1:],
+                ],
+                env=env,
+            )
+        )
+
+    run(args.modules, args.lazy, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -687,7 +687,6 @@ from kivy import Logger
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -715,12 +714,10 @@ from kivymd.uix.behaviors import (
 from kivymd.uix.button import MDFabButton, MDIconButton
 from kivymd.uix.controllers import WindowController
 from kivymd.uix.label import MDLabel
+from kivymd.utils.kv_loader import load_kv
 from kivymd.utils.set_bars_colors import set_bars_colors
 
-with open(
-    os.path.join(uix_path, "appbar", "appbar.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "appbar", "appbar.kv"))
 
 
 class BaseTopAppBarButtonContainer(DeclarativeBehavior, BoxLayout):
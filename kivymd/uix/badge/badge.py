@@ -85,15 +85,11 @@ __all__ = ("MDBadge",)
 
 import os
 
-from kivy.lang import Builder
-
 from kivymd import uix_path
 from kivymd.uix.label import MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "badge", "badge.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "badge", "badge.kv"))
 
 
 class MDBadge(MDLabel):
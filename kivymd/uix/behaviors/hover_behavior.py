@@ -141,9 +141,42 @@ the widget.
 
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/hover-behavior.gif
    :align: center
+
+Hover manager
+-------------
+
+.. versionadded:: 2.0.0
+
+Widgets with :class:`~HoverBehavior` do not bind to
+:attr:`~kivy.core.window.WindowBase.mouse_pos` themselves. Instead, they are
+registered in the application-wide :data:`hover_manager`, which keeps a grid
+index of the widget boundaries in window coordinates. On each mouse movement,
+only the widgets located in the grid cell under the cursor and the widgets
+that are currently hovered are checked, so the cost of a mouse event does not
+depend on the total number of hover widgets.
+
+The index is updated lazily when the geometry of a registered widget (or of
+one of its parents with its own coordinate space, such as
+:class:`~kivy.uix.relativelayout.RelativeLayout` or
+:class:`~kivy.uix.scatter.Scatter`) changes. If you move widgets in a way that
+the manager cannot track, call :meth:`HoverManager.refresh`:
+
+.. code-block:: python
+
+    from kivymd.uix.behaviors.hover_behavior import hover_manager
+
+    hover_manager.refresh()
+
+To measure the cost of a mouse event for a different number of widgets, run:
+
+.. code-block:: bash
+
+    python -m kivymd.tools.benchmarks.hover
 """
 
-__all__ = ("HoverBehavior",)
+__all__ = ("HoverBehavior", "HoverManager", "hover_manager")
+
+import weakref
 
 from kivy.core.window import Window
 from kivy.logger import Logger
@@ -151,6 +184,191 @@ from kivy.properties import BooleanProperty, ObjectProperty
 from kivy.uix.widget import Widget
 
 
+class HoverManager:
+    """
+    Dispatches mouse movements to the registered
+    :class:`~HoverBehavior` widgets.
+
+    The manager keeps a uniform grid of :attr:`cell_size` pixels. Each cell
+    stores the widgets whose boundaries in window coordinates intersect
+    this cell.
+
+    .. versionadded:: 2.0.0
+    """
+
+    cell_size = 128
+    """
+    The size of the grid cell in pixels.
+
+    :attr:`cell_size` is an :class:`int` and defaults to `128`.
+    """
+
+    def __init__(self):
+        # {id(widget): weakref.ref(widget)}
+        self._widgets = {}
+        # {id(widget): [cell, ...]}
+        self._widget_cells = {}
+        # {id(widget): (x, y, right, top)}
+        self._bounds = {}
+        # {(column, row): {id(widget), ...}}
+        self._grid = {}
+        # Identifiers of widgets whose geometry has changed.
+        self._dirty = set()
+        # Parents with their own coordinate space, which are already bound.
+        self._anchors = weakref.WeakSet()
+        self._hovered = weakref.WeakSet()
+        self._rebuild = False
+        self._bound = False
+        self.checked_widgets = 0
+        """The number of widgets checked during the last mouse event."""
+
+    def register(self, widget: Widget) -> None:
+        """Adds a widget to the hover index."""
+
+        if not self._bound:
+            Window.bind(mouse_pos=self.on_mouse_pos, size=self.refresh)
+            self._bound = True
+
+        uid = id(widget)
+        self._widgets[uid] = weakref.ref(
+            widget, lambda ref, uid=uid: self._forget(uid)
+        )
+        on_geometry = lambda *args, uid=uid: self._dirty.add(uid)
+        for name in ("pos", "size", "parent", "allow_hover"):
+            widget.fbind(name, on_geometry)
+        self._dirty.add(uid)
+
+    def unregister(self, widget: Widget) -> None:
+        """Removes a widget from the hover index."""
+
+        self._forget(id(widget))
+        self._hovered.discard(widget)
+
+    def refresh(self, *args) -> None:
+        """Schedules the re-indexing of all registered widgets."""
+
+        self._rebuild = True
+
+    def get_widgets_at(self, pos) -> list:
+        """Returns registered widgets whose boundaries contain `pos`."""
+
+        self._update_index()
+        x, y = pos
+        cell_size = self.cell_size
+        widgets = []
+
+        for uid in self._grid.get(
+            (int(x // cell_size), int(y // cell_size)), ()
+        ):
+            left, bottom, right, top = self._bounds[uid]
+            if left <= x <= right and bottom <= y <= top:
+                widget = self._widgets[uid]()
+                if widget is not None:
+                    widgets.append(widget)
+        return widgets
+
+    def on_mouse_pos(self, window, pos) -> None:
+        """Called when the mouse cursor moves."""
+
+        candidates = self.get_widgets_at(pos)
+        hovered = list(self._hovered)
+        self.checked_widgets = len(candidates) + len(hovered)
+
+        for widget in hovered:
+            if widget not in candidates:
+                self._dispatch(widget, window, pos)
+        for widget in candidates:
+            if not widget.hovering:
+                self._dispatch(widget, window, pos)
+
+    def _dispatch(self, widget, window, pos) -> None:
+        widget.on_mouse_update(window, pos)
+        if widget.hovering:
+            self._hovered.add(widget)
+        else:
+            self._hovered.discard(widget)
+
+    def _forget(self, uid: int) -> None:
+        self._remove_from_grid(uid)
+        self._widgets.pop(uid, None)
+        self._dirty.discard(uid)
+
+    def _remove_from_grid(self, uid: int) -> None:
+        for cell in self._widget_cells.pop(uid, ()):
+            widgets = self._grid.get(cell)
+            if widgets is not None:
+                widgets.discard(uid)
+                if not widgets:
+                    del self._grid[cell]
+        self._bounds.pop(uid, None)
+
+    def _update_index(self) -> None:
+        if self._rebuild:
+            self._rebuild = False
+            self._dirty.update(self._widgets)
+        if not self._dirty:
+            return
+
+        dirty = self._dirty
+        self._dirty = set()
+        for uid in dirty:
+            ref = self._widgets.get(uid)
+            widget = ref() if ref else None
+            self._remove_from_grid(uid)
+            if widget is not None:
+                self._add_to_grid(uid, widget)
+
+    def _add_to_grid(self, uid: int, widget: Widget) -> None:
+        if not widget.allow_hover or not widget.get_root_window():
+            return
+
+        self._bind_anchors(widget)
+        x, y = widget.to_window(*widget.pos)
+        right, top = widget.to_window(widget.right, widget.top)
+        left = min(x, right)
+        bottom = min(y, top)
+        right = max(right, x + widget.width)
+        top = max(top, y + widget.height)
+        self._bounds[uid] = (left, bottom, right, top)
+
+        cell_size = self.cell_size
+        cells = []
+        for column in range(
+            int(left // cell_size), int(right // cell_size) + 1
+        ):
+            for row in range(
+                int(bottom // cell_size), int(top // cell_size) + 1
+            ):
+                cell = (column, row)
+                self._grid.setdefault(cell, set()).add(uid)
+                cells.append(cell)
+        self._widget_cells[uid] = cells
+
+    def _bind_anchors(self, widget: Widget) -> None:
+        # Children of widgets with their own coordinate space do not change
+        # their position when the parent moves, so the parent is watched.
+        parent = widget.parent
+        while parent is not None and parent is not parent.parent:
+            if (
+                type(parent).to_parent is not Widget.to_parent
+                and parent not in self._anchors
+            ):
+                self._anchors.add(parent)
+                properties = parent.properties()
+                for name in ("pos", "size", "transform", "parent"):
+                    if name in properties:
+                        parent.fbind(name, self.refresh)
+            parent = parent.parent
+
+
+hover_manager = HoverManager()
+"""
+The application-wide instance of :class:`~HoverManager`.
+
+.. versionadded:: 2.0.0
+"""
+
+
 class HoverBehavior:
     """
     :Events:
@@ -212,9 +430,9 @@ class HoverBehavior:
     __events__ = ("on_enter", "on_leave")
 
     def __init__(self, *args, **kwargs):
-        # Bind mouse position updates globally.
-        Window.bind(mouse_pos=self.on_mouse_update)
         super().__init__(*args, **kwargs)
+        # Mouse position updates are dispatched by the hover manager.
+        hover_manager.register(self)
 
     def is_mouse_inside_widget(self, pos):
         """
@@ -237,6 +455,9 @@ class HoverBehavior:
         """
         Main handler for mouse movement — determines whether mouse has entered
         or exited.
+
+        Called by :data:`hover_manager` only for widgets that are under the
+        mouse cursor or are currently hovered.
         """
 
         if not self.allow_hover or not self.get_root_window():
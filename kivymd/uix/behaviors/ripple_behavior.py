@@ -95,6 +95,7 @@ __all__ = (
 )
 
 import os
+import weakref
 from math import cos, pi, sin, sqrt
 
 from kivy.animation import Animation
@@ -124,11 +125,129 @@ from kivy.uix.behaviors import ToggleButtonBehavior
 
 from kivymd import glsl_path
 from kivymd.animation import MDAnimationTransition
+from kivymd.utils.frame_ticker import frame_ticker
 
 M3_RIPPLE_FS = os.path.join(glsl_path, "ripple", "ripple.glsl")
 RIPPLE_FS_STRING = None
 
 
+def _get_ripple_fs() -> str:
+    global RIPPLE_FS_STRING
+
+    if RIPPLE_FS_STRING is None:
+        with open(M3_RIPPLE_FS, "r", encoding="utf-8") as shader_file:
+            RIPPLE_FS_STRING = "$HEADER$\n" + shader_file.read()
+    return RIPPLE_FS_STRING
+
+
+class RippleFboPool:
+    """
+    Pool of :class:`~kivy.graphics.Fbo` objects with the compiled ripple
+    shader for the :class:`~M3CommonRipple` widgets.
+
+    A widget borrows an FBO only while its ripple animation is running and
+    returns it when the animation completes, when the widget is removed from
+    its parent or when the widget is deleted. Up to :attr:`max_idle` returned
+    FBOs are kept for reuse, so the number of allocated FBOs and shader
+    programs depends on the number of simultaneously running ripples, not on
+    the number of widgets.
+
+    .. versionadded:: 2.0.0
+    """
+
+    max_idle = 4
+    """
+    The maximum number of idle FBOs kept in the pool.
+
+    :attr:`max_idle` is an :class:`int` and defaults to `4`.
+    """
+
+    def __init__(self):
+        self._idle = []
+        self.in_use = 0
+        """The number of FBOs currently borrowed by widgets."""
+        self.live = 0
+        """The number of currently allocated FBOs (borrowed and idle)."""
+        self.peak = 0
+        """The maximum value of :attr:`live`."""
+        self.allocations = 0
+        """The total number of FBOs created."""
+
+    def acquire(self, size) -> tuple:
+        """
+        Returns an `(fbo, rectangle)` pair with the ripple shader, resized to
+        `size`.
+        """
+
+        size = [int(size[0]), int(size[1])]
+        fbo = rect = None
+
+        for index, (idle_fbo, idle_rect) in enumerate(self._idle):
+            if list(idle_fbo.size) == size:
+                fbo, rect = self._idle.pop(index)
+                break
+        else:
+            if self._idle:
+                fbo, rect = self._idle.pop()
+                fbo.size = size
+                rect.size = size
+
+        if fbo is None:
+            fbo, rect = self._create(size)
+
+        self.in_use += 1
+        return fbo, rect
+
+    def release(self, fbo, rect) -> None:
+        """Returns an FBO borrowed with :meth:`acquire` to the pool."""
+
+        self.in_use -= 1
+        if len(self._idle) < self.max_idle:
+            self._idle.append((fbo, rect))
+        else:
+            self.live -= 1
+
+    def clear(self) -> None:
+        """Releases all idle FBOs."""
+
+        self.live -= len(self._idle)
+        self._idle = []
+
+    def get_stats(self) -> dict:
+        """Returns the pool counters."""
+
+        return {
+            "in_use": self.in_use,
+            "idle": len(self._idle),
+            "live": self.live,
+            "peak": self.peak,
+            "allocations": self.allocations,
+        }
+
+    def _create(self, size) -> tuple:
+        fbo = Fbo(size=size, group="m3_ripple_behavior")
+        fbo.shader.fs = _get_ripple_fs()
+
+        with fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+            Color(1, 1, 1, 1)
+            rect = Rectangle(pos=(0, 0), size=size)
+
+        self.allocations += 1
+        self.live += 1
+        self.peak = max(self.peak, self.live)
+        return fbo, rect
+
+
+ripple_fbo_pool = RippleFboPool()
+"""
+The application-wide instance of :class:`~RippleFboPool`.
+
+.. versionadded:: 2.0.0
+"""
+
+
 class CommonRipple:
     """Base class for ripple effect."""
 
@@ -690,22 +809,55 @@ class M3CommonRipple(CommonRipple):
     _progress = NumericProperty(0.0)
     _anim_state = "off"  # off, hold, start, stop
 
+    fbo = None
+    rect = None
+    _fbo_release = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.init_fbos()
+        self.fbind("parent", self._on_ripple_parent)
 
     def init_fbos(self):
+        """
+        Resets the ripple state. The FBO itself is borrowed from
+        :data:`ripple_fbo_pool` only while the ripple animation is running.
+        """
+
         self._phase = 0.0
         self.ripple_pos = (0, 0)
-        # TODO: Remove group also deallocates it from mem?
-        self.fbo = Fbo(size=[50] * 2, group="m3_ripple_behavior")
-        self.set_shader(self.fbo)
 
-        with self.fbo:
-            ClearColor(0, 0, 0, 0)
-            ClearBuffers()
-            Color(1, 1, 1, 1)
-            self.rect = Rectangle(pos=(0, 0), size=[50] * 2)
+    def acquire_fbo(self) -> None:
+        """Borrows an FBO from :data:`ripple_fbo_pool`."""
+
+        if self.fbo is None:
+            self.fbo, self.rect = ripple_fbo_pool.acquire(
+                self._clamp_size(*self.size)
+            )
+            # The FBO is returned when the widget is deleted during the
+            # ripple animation.
+            self._fbo_release = weakref.finalize(
+                self, ripple_fbo_pool.release, self.fbo, self.rect
+            )
+
+    def release_fbo(self) -> None:
+        """Returns the borrowed FBO to :data:`ripple_fbo_pool`."""
+
+        if self.fbo is not None:
+            self._fbo_release()
+            self._fbo_release = None
+            self.fbo = None
+            self.rect = None
+
+    def _on_ripple_parent(self, instance, parent) -> None:
+        # The ripple of the removed widget is not drawn, so it is completed
+        # at once.
+        if parent is None:
+            if self._start_event is not None:
+                self._start_event.cancel()
+                self._start_event = None
+            if self.fbo is not None:
+                self.anim_complete()
 
     def _get_actual_radius(self):
         if hasattr(self, "radius"):
@@ -719,13 +871,7 @@ class M3CommonRipple(CommonRipple):
         return max(width, 1.0), max(height, 1.0)
 
     def set_shader(self, obj):
-        global RIPPLE_FS_STRING
-
-        if RIPPLE_FS_STRING is None:
-            with open(M3_RIPPLE_FS, "r", encoding="utf-8") as shader_file:
-                RIPPLE_FS_STRING = "$HEADER$\n" + shader_file.read()
-
-        obj.shader.fs = RIPPLE_FS_STRING
+        obj.shader.fs = _get_ripple_fs()
 
     _start_event = None
 
@@ -769,6 +915,8 @@ class M3CommonRipple(CommonRipple):
         if not self.ripple_effect:
             return
 
+        self.acquire_fbo()
+
         with self.active_canvas:
             self.active_canvas.add(self.fbo)
 
@@ -805,7 +953,6 @@ class M3CommonRipple(CommonRipple):
         return 0.0
 
     _anim_time = 0
-    _event = None
 
     def start_ripple(self) -> None:
         self._phase = 0.0
@@ -813,7 +960,9 @@ class M3CommonRipple(CommonRipple):
         self._doing_ripple = True
         self._anim_time = 0
         self._force_exit = False
-        self._event = Clock.schedule_interval(self._tick, 0)
+        # Ripples are short, so they are finished even if the widget is
+        # hidden in the meantime.
+        frame_ticker.add(self, self._tick, skip_hidden=False)
 
         Clock.schedule_once(
             self._force_finish, self.ripple_duration_in_fast / 1000 + 0.1
@@ -951,8 +1100,13 @@ class M3CommonRipple(CommonRipple):
             if hasattr(child, "pos") and child.pos != self.pos:
                 child.pos = self.pos
 
-        if self.fbo.size != self.size:
+        if tuple(self.fbo.size) != (int(self.width), int(self.height)):
             self.fbo.size = self.size
+            # Resizing recreates the texture of the FBO.
+            texture = self.fbo.texture
+            for child in self.active_canvas.get_group("m3_ripple_behavior"):
+                if getattr(child, "texture", None) not in (None, texture):
+                    child.texture = texture
 
         if self.rect.size != self.size:
             self.rect.size = self.size
@@ -977,16 +1131,14 @@ class M3CommonRipple(CommonRipple):
         return anim_func(progress)
 
     def anim_complete(self, *args) -> None:
-        if self._event:
-            self._event.cancel()
-            self._event = None
-
+        frame_ticker.remove(self)
         self._anim_state = "off"
         self._progress = 1.0
         self._update_uniforms()
         self._doing_ripple = False
         self._force_exit = False
         self.active_canvas.remove_group("m3_ripple_behavior")
+        self.release_fbo()
 
     def on_touch_down(self, touch):
         if self.collide_point(*touch.pos) and not self.disabled:
@@ -514,7 +514,6 @@ __all__ = (
 
 import os
 
-from kivy.lang import Builder
 from kivy.properties import ColorProperty, OptionProperty
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.widget import Widget
@@ -524,12 +523,12 @@ from kivymd.uix.behaviors import DeclarativeBehavior
 from kivymd.uix.button import MDIconButton
 from kivymd.uix.label import MDLabel
 from kivymd.uix.navigationdrawer import MDNavigationDrawer
+from kivymd.utils.kv_loader import load_kv
 
-with open(
+load_kv(
     os.path.join(uix_path, "bottomsheet", "bottomsheet.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read(), filename="MDBottomSheet.kv")
+    filename="MDBottomSheet.kv",
+)
 
 
 class BottomSheetDragHandle(Widget):
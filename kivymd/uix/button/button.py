@@ -679,7 +679,6 @@ __all__ = (
 import os
 
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     ColorProperty,
@@ -703,11 +702,9 @@ from kivymd.uix.behaviors import (
 from kivymd.uix.behaviors.motion_behavior import MotionExtendedFabButtonBehavior
 from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
 from kivymd.uix.label import MDIcon, MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "button", "button.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "button", "button.kv"))
 
 
 class BaseFabButton:
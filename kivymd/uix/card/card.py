@@ -603,7 +603,6 @@ import os
 
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -628,11 +627,9 @@ from kivymd.uix.behaviors import (
 from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.relativelayout import MDRelativeLayout
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "card", "card.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read(), filename="MDCard.kv")
+load_kv(os.path.join(uix_path, "card", "card.kv"), filename="MDCard.kv")
 
 
 class MDCard(
@@ -115,36 +115,58 @@ Anatomy
 
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/carousel-anatomy.png
     :align: center
+
+Recycled items
+--------------
+
+.. versionadded:: 2.0.0
+
+With :attr:`~MDCarousel.viewclass` the carousel creates the items from the
+:attr:`~MDCarousel.data` list, like :class:`~kivy.uix.recycleview.RecycleView`
+does. Only the visible items and :attr:`~MDCarousel.overscan` items on each
+side have views, which are reused when the carousel scrolls, and the images
+of the next :attr:`~MDCarousel.prefetch` items are loaded in the background:
+
+.. code-block:: python
+
+    MDCarousel(
+        viewclass="FitImage",
+        data=[{"source": path} for path in image_paths],
+    )
+
+The keys of the dictionaries are set as the properties of the views. A view
+with the `refresh_view_attrs(carousel, index, data)` method sets them itself.
 """
 
 import os
 
 from kivy.animation import Animation
 from kivy.clock import Clock
+from kivy.factory import Factory
 from kivy.graphics import Rectangle
 from kivy.graphics.stencil_instructions import (
     StencilPop,
     StencilPush,
     StencilUse,
 )
-from kivy.lang import Builder
+from kivy.loader import Loader
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
     ListProperty,
     NumericProperty,
+    ObjectProperty,
     OptionProperty,
+    StringProperty,
     VariableListProperty,
 )
 
 from kivymd import uix_path
 from kivymd.uix.card import MDCard
 from kivymd.uix.widget import MDWidget
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "carousel", "carousel.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "carousel", "carousel.kv"))
 
 __all__ = (
     "MDCarouselItem",
@@ -363,6 +385,60 @@ class MDCarousel(MDWidget):
     and defaults to ``0``.
     """
 
+    data = ListProperty()
+    """
+    Data of the items when :attr:`viewclass` is set, a list of dictionaries
+    with the properties of the views.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`data` is an :class:`~kivy.properties.ListProperty`
+    and defaults to `[]`.
+    """
+
+    viewclass = ObjectProperty(None, allownone=True)
+    """
+    Class or name of the class of the views created from :attr:`data`.
+    Views that are not :class:`~MDCarouselItem` widgets are placed into an
+    :class:`~MDCarouselItem`.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`viewclass` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    overscan = NumericProperty(1)
+    """
+    Number of the items on each side of the visible items that have views.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`overscan` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `1`.
+    """
+
+    prefetch = NumericProperty(2)
+    """
+    Number of the items on each side of the items with views whose images
+    are loaded in the background with :data:`~kivy.loader.Loader`.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`prefetch` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `2`.
+    """
+
+    prefetch_key = StringProperty("source")
+    """
+    Key of the image source in the :attr:`data` dictionaries.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`prefetch_key` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `'source'`.
+    """
+
     __events__ = (
         "on_slide_left",
         "on_slide_right",
@@ -375,6 +451,13 @@ class MDCarousel(MDWidget):
         self._touch_start_pos = 0
         self._touch_start_offset = 0
         self._anim = None
+        # Indices of the items laid out by the last layout.
+        self._visible = range(0)
+        # {index: item} of the items created from `data`.
+        self._views = {}
+        # Created items that are not used and are hidden.
+        self._view_pool = []
+        self._prefetched = set()
 
         super().__init__(**kwargs)
 
@@ -391,6 +474,8 @@ class MDCarousel(MDWidget):
             pos=self._update_stencil_and_layout,
             scroll_offset=self._apply_layout,
             layouts=self._apply_layout,
+            data=self._on_data,
+            viewclass=self._on_viewclass,
         )
 
     def _update_stencil_and_layout(self, *args):
@@ -438,10 +523,161 @@ class MDCarousel(MDWidget):
             item = MDCarouselItem()
             item.add_widget(widget)
 
+        # The item is shown when the layout places it in the visible area.
+        item.opacity = 0
         self._items.append(item)
         super().add_widget(item, index, canvas)
         Clock.schedule_once(self._apply_layout, 0)
 
+    def _on_data(self, *args) -> None:
+        for item in self._views.values():
+            self._hide_item(item)
+            self._view_pool.append(item)
+
+        self._views.clear()
+        self._prefetched.clear()
+        self._apply_layout()
+
+    def _on_viewclass(self, *args) -> None:
+        for item in [*self._views.values(), *self._view_pool]:
+            self.remove_widget(item)
+
+        self._views.clear()
+        self._view_pool.clear()
+        self._apply_layout()
+
+    def _get_item_count(self) -> int:
+        if self.viewclass is None:
+            return len(self._items)
+
+        return len(self.data)
+
+    def _get_live_items(self) -> list:
+        if self.viewclass is None:
+            return self._items
+
+        return list(self._views.values())
+
+    def _get_item(self, index: int) -> MDCarouselItem:
+        if self.viewclass is None:
+            return self._items[index]
+
+        item = self._views.get(index)
+
+        if item is None:
+            item = (
+                self._view_pool.pop()
+                if self._view_pool
+                else self._create_item()
+            )
+            self._refresh_item(item, index)
+            self._views[index] = item
+
+        return item
+
+    def _create_item(self) -> MDCarouselItem:
+        item = self._get_viewclass()()
+
+        if not isinstance(item, MDCarouselItem):
+            view = item
+            item = MDCarouselItem()
+            item.add_widget(view)
+
+        super().add_widget(item)
+
+        return item
+
+    def _refresh_item(self, item: MDCarouselItem, index: int) -> None:
+        view = item
+
+        if not isinstance(item, self._get_viewclass()) and item.children:
+            view = item.children[0]
+
+        data = self.data[index]
+
+        if hasattr(view, "refresh_view_attrs"):
+            view.refresh_view_attrs(self, index, data)
+        else:
+            for key, value in data.items():
+                setattr(view, key, value)
+
+    def _get_viewclass(self):
+        viewclass = self.viewclass
+
+        if isinstance(viewclass, str):
+            viewclass = Factory.get(viewclass)
+
+        return viewclass
+
+    def _hide_item(self, item: MDCarouselItem) -> None:
+        Animation.cancel_all(item, "opacity")
+        item.opacity = 0
+
+    def _get_visible_range(self, offset: float, count: int) -> range:
+        """
+        Returns the indices of the items that may be visible at the offset
+        and :attr:`overscan` items on each side of them.
+        """
+
+        step = self._get_step_size()
+
+        if step <= 0:
+            return range(count)
+
+        if self.layouts == "full-screen-vertical":
+            first = int(offset // step)
+            last = int((offset + self.height) // step)
+        elif self.layouts in ("full-screen-horizontal", "uncontained"):
+            first = int(offset // step)
+            last = int((offset + self.width) // step)
+        else:
+            # The items before the current one are collapsed to zero width,
+            # the items after the last slot are to the right of the
+            # carousel.
+            index = int(offset // step)
+            first, last = {
+                "hero": (index, index + 2),
+                "center-aligned": (index - 1, index + 2),
+            }.get(self.layouts, (index, index + 3))
+
+        overscan = int(self.overscan)
+
+        return range(max(0, first - overscan), min(count, last + overscan + 1))
+
+    def _release_items(self, visible: range) -> None:
+        # Hides the items that are not in the visible range any more.
+        if self.viewclass is None:
+            for index in self._visible:
+                if index not in visible and index < len(self._items):
+                    self._hide_item(self._items[index])
+        else:
+            for index in [i for i in self._views if i not in visible]:
+                item = self._views.pop(index)
+                self._hide_item(item)
+                self._view_pool.append(item)
+
+            self._prefetch_images(visible)
+
+        self._visible = visible
+
+    def _prefetch_images(self, visible: range) -> None:
+        count = int(self.prefetch)
+
+        if not count or not self.prefetch_key:
+            return
+
+        for index in (
+            *range(max(0, visible.start - count), visible.start),
+            *range(visible.stop, min(len(self.data), visible.stop + count)),
+        ):
+            source = self.data[index].get(self.prefetch_key)
+
+            if source and source not in self._prefetched:
+                self._prefetched.add(source)
+                # The image is kept in the cache of the loader, which is
+                # used by `AsyncImage` and `FitImage`.
+                Loader.image(source)
+
     def _update_index_from_scroll(self):
         """Updates the active index property based on current scroll offset."""
 
@@ -449,7 +685,7 @@ class MDCarousel(MDWidget):
 
         if step > 0:
             new_index = int(round(self.scroll_offset / step))
-            new_index = max(0, min(len(self._items) - 1, new_index))
+            new_index = max(0, min(self._get_item_count() - 1, new_index))
 
             if self.index != new_index:
                 self.index = new_index
@@ -550,19 +786,20 @@ class MDCarousel(MDWidget):
         items.
         """
 
-        if not self._items or self.width <= 0 or self.height <= 0:
+        count = self._get_item_count()
+
+        if not count or self.width <= 0 or self.height <= 0:
             return 0
 
         if self.layouts == "uncontained":
             total_items_width = (
-                len(self._items) * self.uncontained_item_width
-                + (len(self._items) - 1) * self.spacing
+                count * self.uncontained_item_width + (count - 1) * self.spacing
             )
             max_s = total_items_width - self._get_available_width()
 
             return max(0.0, max_s)
 
-        return max(0.0, (len(self._items) - 1) * self._get_step_size())
+        return max(0.0, (count - 1) * self._get_step_size())
 
     def _apply_layout(self, *args):
         """
@@ -570,12 +807,14 @@ class MDCarousel(MDWidget):
         according to the selected layout mode.
         """
 
-        if not self._items or self.width <= 0 or self.height <= 0:
+        num_items = self._get_item_count()
+
+        if not num_items or self.width <= 0 or self.height <= 0:
+            self._release_items(range(0))
             return
 
         self._update_index_from_scroll()
 
-        num_items = len(self._items)
         pad_v = self.padding[1] + (
             self.padding[3] if len(self.padding) >= 4 else self.padding[1]
         )
@@ -584,6 +823,9 @@ class MDCarousel(MDWidget):
         start_x = self.x + self.padding[0]
         max_scroll = self._get_max_scroll()
         offset = max(0.0, min(float(max_scroll), float(self.scroll_offset)))
+        visible = self._get_visible_range(offset, num_items)
+        # The views of the hidden items are reused for the new visible items.
+        self._release_items(visible)
 
         # Full-Screen Vertical.
         if self.layouts == "full-screen-vertical":
@@ -593,8 +835,8 @@ class MDCarousel(MDWidget):
             start_y = self.y
             start_x = self.x
 
-            for i in range(num_items):
-                item = self._items[i]
+            for i in visible:
+                item = self._get_item(i)
                 y = start_y + i * (avail_h + sp) - offset
                 x = start_x
 
@@ -635,8 +877,8 @@ class MDCarousel(MDWidget):
             start_x = self.x
             start_y = self.y
 
-            for i in range(num_items):
-                item = self._items[i]
+            for i in visible:
+                item = self._get_item(i)
                 x = start_x + i * (avail_w + sp) - offset
                 y = start_y
 
@@ -671,54 +913,13 @@ class MDCarousel(MDWidget):
                     if hasattr(child, "radius"):
                         child.radius = card_radius
 
-        # Full-Screen Horizontal.
-        elif self.layouts == "full-screen-horizontal":
-            avail_w = self.width
-            avail_h = self.height
-            sp = self.spacing
-            start_x = self.x
-            start_y = self.y
-
-            for i in range(num_items):
-                item = self._items[i]
-                x = start_x + i * (avail_w + sp) - offset
-                y = start_y
-
-                if x + avail_w < start_x or x > start_x + avail_w:
-                    item.opacity = 0
-                else:
-                    item.opacity = 1
-
-                left_r = item.full_screen_radius if (x > start_x) else 0
-                right_r = (
-                    item.full_screen_radius
-                    if (x + avail_w < start_x + avail_w)
-                    else 0
-                )
-                card_radius = [left_r, right_r, right_r, left_r]
-
-                item.radius = card_radius
-                item.md_bg_color = (0, 0, 0, 0)
-                item.padding = [0, 0, 0, 0]
-
-                item.size = (avail_w, avail_h)
-                item.pos = (x, y)
-
-                if item.children:
-                    child = item.children[0]
-                    child.size = (avail_w, avail_h)
-                    child.pos = (x, y)
-
-                    if hasattr(child, "radius"):
-                        child.radius = card_radius
-
         # Uncontained.
         elif self.layouts == "uncontained":
             item_w = self.uncontained_item_width
             sp = self.spacing
 
-            for i in range(num_items):
-                item = self._items[i]
+            for i in visible:
+                item = self._get_item(i)
                 x = start_x + i * (item_w + sp) - offset
                 w = item_w
 
@@ -760,8 +961,8 @@ class MDCarousel(MDWidget):
             slot1_x = slot0_x + large_w + sp
             offscreen_right_x = self.x + self.width + dp(100)
 
-            for i in range(num_items):
-                item = self._items[i]
+            for i in visible:
+                item = self._get_item(i)
                 rel_i = i - idx
 
                 if rel_i < 0:
@@ -814,8 +1015,8 @@ class MDCarousel(MDWidget):
             slot_center_x = slot_left_x + small_w + sp
             slot_right_x = slot_center_x + large_w + sp
 
-            for i in range(num_items):
-                item = self._items[i]
+            for i in visible:
+                item = self._get_item(i)
                 rel_i = i - idx
 
                 if rel_i < -1:
@@ -881,8 +1082,8 @@ class MDCarousel(MDWidget):
             slot2_x = slot1_x + medium_w + sp
             offscreen_right_x = self.x + self.width + dp(100)
 
-            for i in range(num_items):
-                item = self._items[i]
+            for i in visible:
+                item = self._get_item(i)
                 rel_i = i - idx
 
                 if rel_i < 0:
@@ -940,7 +1141,7 @@ class MDCarousel(MDWidget):
             start_y = self.y
             avail_h = self.height
 
-            for item in self._items:
+            for item in self._get_live_items():
                 if item.opacity == 0:
                     continue
 
@@ -979,7 +1180,7 @@ class MDCarousel(MDWidget):
             start_x = self.x
             avail_w = self.width
 
-            for item in self._items:
+            for item in self._get_live_items():
                 if item.opacity == 0:
                     continue
 
@@ -1064,7 +1265,7 @@ class MDCarousel(MDWidget):
                 elif delta_x < -threshold:
                     self.dispatch("on_slide_left")
 
-            if self.item_snapping and self._items:
+            if self.item_snapping and self._get_item_count():
                 step = self._get_step_size()
                 max_scroll = self._get_max_scroll()
 
@@ -24,15 +24,16 @@ Components/DataTables
 __all__ = ("MDDataTable",)
 
 import os
+from bisect import bisect_left
 from collections import defaultdict
-from typing import Union
+from typing import Iterable, Union
 
 from kivy.clock import Clock
 from kivy.factory import Factory
-from kivy.lang import Builder
 from kivy.logger import Logger
 from kivy.metrics import dp
 from kivy.properties import (
+    AliasProperty,
     BooleanProperty,
     ColorProperty,
     DictProperty,
@@ -58,14 +59,13 @@ from kivymd.theming import ThemableBehavior
 from kivymd.uix.behaviors import CommonElevationBehavior, HoverBehavior
 from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
 from kivymd.uix.button import MDIconButton
+from kivymd.uix.datatables.tablemodel import TableModel
 from kivymd.uix.menu import MDDropdownMenu
 from kivymd.uix.selectioncontrol import MDCheckbox
 from kivymd.uix.tooltip import MDTooltip
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "datatables", "datatables.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "datatables", "datatables.kv"))
 
 
 class TableRecycleGridLayout(
@@ -191,10 +191,11 @@ class TableRecycleGridLayout(
                 List of selectable node indices.
         """
 
-        row_range = self.table_data.recycle_data[self.selected_row]["range"]
+        columns = self.table_data.total_col_headings
+        first_cell = self.selected_row - self.selected_row % columns
 
         for index in nodes:
-            if row_range[0] <= index <= row_range[1]:
+            if first_cell <= index < first_cell + columns:
                 self.select_node(index)
 
 
@@ -262,20 +263,13 @@ class CellHeader(BoxLayout, HoverBehavior):
             box.add_widget(ib, index=1)
 
     def restore_checks(self, indices: dict) -> None:
-        curr_checks = self.table_data.current_selection_check
-        rows_num = self.table_data.rows_num
-        columns = self.table_data.total_col_headings
-        new_checks = defaultdict(list)
+        """
+        Moves the check state of the rows after sorting.
 
-        for i, x in enumerate(curr_checks):
-            for j, y in enumerate(curr_checks[x]):
-                new_page = (indices[y // columns + x * rows_num]) // rows_num
-                new_indice = (
-                    (indices[y // columns + x * rows_num]) % rows_num
-                ) * columns
-                new_checks[new_page].append(new_indice)
+        :param indices: Mapping of the old row indices to the new ones.
+        """
 
-        self.table_data.current_selection_check = dict(new_checks)
+        self.table_data.model.remap_checked(indices)
 
     def set_sort_btn(self, instance_cell_header) -> None:
         btn = instance_cell_header.ids.box.children[-1]
@@ -326,7 +320,15 @@ class CellHeader(BoxLayout, HoverBehavior):
                 sorted_data = sorted_data[::-1]
                 indices = indices[::-1]
 
+            previous_indices = self.table_data._row_data_indices
             self.table_data.row_data = sorted_data
+            # `MDDataTable.row_data` keeps its order, so the index of each
+            # sorted row in it is remembered.
+            self.table_data._row_data_indices = (
+                list(indices)
+                if previous_indices is None
+                else [previous_indices[index] for index in indices]
+            )
             self.table_data.on_rows_num(self, self.table_data.rows_num)
             self.restore_checks(dict(zip(indices, range(len(indices)))))
             self.table_data.set_next_row_data_parts("reset")
@@ -464,15 +466,40 @@ class TableHeader(ThemableBehavior, ScrollView):
 class TableData(RecycleView):
     """Implements a list of table data."""
 
-    checked_row_indices = ListProperty()
+    model = ObjectProperty()
+    """
+    Column-oriented storage of the table rows and their check state.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`model` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to :class:`~kivymd.uix.datatables.tablemodel.TableModel`.
+    """
+
+    def _get_checked_row_indices(self) -> list:
+        columns = self.total_col_headings
+
+        return [index * columns for index in self.model.get_checked()]
+
+    def _set_checked_row_indices(self, indices: list) -> bool:
+        columns = self.total_col_headings or 1
+        self.model.set_checked_rows(index // columns for index in indices)
+
+        return True
+
+    checked_row_indices = AliasProperty(
+        _get_checked_row_indices, _set_checked_row_indices
+    )
     """
-    Indices of rows with checked checkboxes across all pages of the table.
+    Indices of the first cells of the checked rows across all pages of the
+    table (`row_index * number_of_columns`).
 
-    Unlike `current_selection_check`, this property stores a single flat
+    Unlike `current_selection_check`, this property returns a single flat
     list of selected row indices, allowing you to retrieve all checked rows
     regardless of the current pagination page or scroll position.
+    The value is computed from :attr:`model`.
 
-    :attr:`checked_row_indices` is an :class:`~kivy.properties.ListProperty`
+    :attr:`checked_row_indices` is an :class:`~kivy.properties.AliasProperty`
     and defaults to `[]`.
     """
 
@@ -565,11 +592,37 @@ class TableData(RecycleView):
     and defaults to `False`.
     """
 
-    current_selection_check = DictProperty()
+    def _get_current_selection_check(self) -> dict:
+        columns = self.total_col_headings
+        rows_num = self.rows_num
+        checks = defaultdict(list)
+
+        if rows_num:
+            for index in self.model.get_checked():
+                checks[index // rows_num].append((index % rows_num) * columns)
+
+        return dict(checks)
+
+    def _set_current_selection_check(self, checks: dict) -> bool:
+        columns = self.total_col_headings or 1
+        rows_num = self.rows_num
+        self.model.set_checked_rows(
+            page * rows_num + index // columns
+            for page, indices in checks.items()
+            for index in indices
+        )
+
+        return True
+
+    current_selection_check = AliasProperty(
+        _get_current_selection_check, _set_current_selection_check
+    )
     """
-    List of indexes of marked checkboxes.
+    Indexes of marked checkboxes grouped by page: `{page: [index, ...]}`,
+    where `index` is the index of the first cell of the row on the page.
+    The value is computed from :attr:`model`.
 
-    :attr:`current_selection_check` is an :class:`~kivy.properties.DictProperty`
+    :attr:`current_selection_check` is an :class:`~kivy.properties.AliasProperty`
     and defaults to `{}`.
     """
 
@@ -580,9 +633,17 @@ class TableData(RecycleView):
     _rows_num = NumericProperty()
     _current_value = NumericProperty(1)
     _to_value = NumericProperty()
-    _row_data_parts = ListProperty()
+
+    _applying_changes = False
+    # Indices in `MDDataTable.row_data` of the rows of the model after the
+    # rows have been sorted, `None` if both lists have the same order.
+    _row_data_indices = None
 
     def __init__(self, table_header, **kwargs):
+        self.model = TableModel()
+        self._changed_rows = set()
+        self._rows_shifted_from = None
+        self._trigger_refresh_rows = Clock.create_trigger(self._refresh_rows)
         super().__init__(**kwargs)
         self.table_header = table_header
         self.total_col_headings = len(table_header._col_headings)
@@ -595,12 +656,10 @@ class TableData(RecycleView):
     def get_select_row(self, index: int) -> None:
         """Returns the current row with all elements."""
 
-        row = []
-
-        for data in self.recycle_data:
-            if index in data["range"]:
-                row.append(data["text"])
-
+        row = [
+            self._get_cell_data(value)["text"]
+            for value in self.model.get_row(self._get_row_index(index))
+        ]
         self._parent.dispatch("on_check_press", row)
         self._get_row_checks()  # update the dict
 
@@ -610,94 +669,49 @@ class TableData(RecycleView):
         self.ids.row_controller.select_next(self)
 
     def set_row_data(self) -> None:
-        data = []
-        low = 0
-        high = self.total_col_headings - 1
-        self.recycle_data = []
-        self.data_first_cells = []
-
-        if self._row_data_parts:
-            for row in self._row_data_parts[self._rows_number]:
-                for i in range(len(row)):
-                    data.append([row[i], row[0], [low, high]])
-
-                low += self.total_col_headings
-                high += self.total_col_headings
-
-            for j, x in enumerate(data):
-                r_data = {
-                    "Index": str(j),
-                    "range": x[2],
-                    "selectable": True,
-                    "viewclass": "CellRow",
-                    "table": self,
-                    "background_color_cell": self._parent.background_color_cell,
-                    "background_color_selected_cell": self._parent.background_color_selected_cell,
-                }
-
-                # We check whether the value is a dictionary with a viewclass
-                # (widget).
-                if isinstance(x[0], dict) and "viewclass" in x[0]:
-                    r_data["cell_widget"] = x[0]
-                    r_data["text"] = ""  # no text, only a widget
-                    r_data["icon"] = ""
-                # We check for the icon with text (existing format).
-                elif (
-                    isinstance(x[0], tuple) or isinstance(x[0], list)
-                ) and len(x[0]) == 3:
-                    r_data["icon"] = x[0][0]
-                    r_data["icon_color"] = x[0][1]
-                    r_data["text"] = str(x[0][2])
-                elif (
-                    isinstance(x[0], tuple) or isinstance(x[0], list)
-                ) and len(x[0]) == 2:
-                    r_data["icon"] = x[0][0]
-                    r_data["text"] = str(x[0][1])
-                else:
-                    # If x[0] == x[1] (the first cell of the row), etc.
-                    if j % self.total_col_headings == 0:
-                        r_data["text"] = str(x[0])
-                        self.data_first_cells.append(x[2][0])
-                    else:
-                        r_data["text"] = str(x[0])
+        """
+        Creates the data of the cells displayed on the current page.
 
-                self.recycle_data.append(r_data)
+        Only the rows of the current page are taken from :attr:`model`, and
+        the values shared by all cells (the table and the colors of the cells)
+        are set in :meth:`CellRow.refresh_view_attrs`.
+        """
 
-            if not self.table_header.column_data:
-                raise ValueError("Set value for column_data in class TableData")
+        rows = self.model.page_range(self._rows_number, self.rows_num)
+        columns = [
+            column[rows.start : rows.stop] for column in self.model.columns
+        ]
+        get_cell_data = self._get_cell_data
+        self.recycle_data = [
+            get_cell_data(value) for row in zip(*columns) for value in row
+        ]
+        self.data_first_cells = list(
+            range(0, len(self.recycle_data), self.total_col_headings or 1)
+        )
 
-            if not self.data_first_cells:
-                self.data_first_cells.append(
-                    self.table_header.column_data[0][0]
-                )
+        if rows and not self.table_header.column_data:
+            raise ValueError("Set value for column_data in class TableData")
 
     def set_text_from_of(self, direction: str) -> None:
         """Sets the text of the numbers of displayed pages in table."""
 
         if self.pagination:
+            page_size = self._get_page_size(self._rows_number)
+
             if direction == "reset":
                 self._current_value = 1
-                self._to_value = len(self._row_data_parts[self._rows_number])
+                self._to_value = page_size
             elif direction == "forward":
-                if (
-                    len(self._row_data_parts[self._rows_number])
-                    < self._to_value
-                ):
+                if page_size < self._to_value:
                     self._current_value = self._current_value + self.rows_num
                 else:
-                    self._current_value = self._current_value + len(
-                        self._row_data_parts[self._rows_number]
-                    )
-                self._to_value = self._to_value + len(
-                    self._row_data_parts[self._rows_number]
-                )
+                    self._current_value = self._current_value + page_size
+                self._to_value = self._to_value + page_size
 
             if direction == "back":
-                self._current_value = self._current_value - len(
-                    self._row_data_parts[self._rows_number]
-                )
-                self._to_value = self._to_value - len(
-                    self._row_data_parts[self._rows_number + 1]
+                self._current_value = self._current_value - page_size
+                self._to_value = self._to_value - self._get_page_size(
+                    self._rows_number + 1
                 )
             if direction == "increment":
                 self._current_value = 1
@@ -715,33 +729,11 @@ class TableData(RecycleView):
 
         if state == "down":
             # Select all checks on all pages.
-            rows_num = self.rows_num
-            columns = self.total_col_headings
-            full_pages = len(self.row_data) // self.rows_num
-            left_over_rows = len(self.row_data) % self.rows_num
-            new_checks = {}
-            all_indices = []
-
-            for page in range(full_pages):
-                page_indices = list(range(0, rows_num * columns, columns))
-                new_checks[page] = page_indices
-                all_indices.extend(page_indices)
-
-            if left_over_rows:
-                page_indices = list(range(0, left_over_rows * columns, columns))
-                new_checks[full_pages] = page_indices
-                all_indices.extend(page_indices)
-
-            self.current_selection_check = new_checks
-            self.checked_row_indices = (
-                all_indices  # updated checked_row_indices
-            )
-            self._update_cell_selection_state()
-
-            return
+            self.model.check_all()
+        else:
+            # Resets all checks on all pages.
+            self.model.clear_checks()
 
-        self.current_selection_check = {}  # esets all checks on all pages
-        self.checked_row_indices = []
         self._update_cell_selection_state()
 
     def check_all(self, state: str) -> bool:
@@ -821,9 +813,40 @@ class TableData(RecycleView):
             self._to_value = value_rows_num
 
         self._rows_number = 0
-        self._row_data_parts = list(
-            self._split_list_into_equal_parts(self.row_data, value_rows_num)
-        )
+
+    def on_row_data(self, instance_table_data, row_data: list) -> None:
+        # The model has already been changed by `MDDataTable.apply_changes`.
+        if not self._applying_changes:
+            self.model.set_rows(row_data)
+            self._row_data_indices = None
+
+    def refresh_rows(
+        self, rows: Iterable[int] = (), shifted_from: Union[int, None] = None
+    ) -> None:
+        """
+        Schedules the update of the cells of the changed rows.
+
+        All calls made during a frame are applied in a single refresh of the
+        current page on the next frame.
+
+        .. versionadded:: 2.0.0
+
+        :param rows: Indices of the rows whose cell values have changed.
+        :param shifted_from:
+            Index of the first row moved by the insertion or removal of rows.
+        """
+
+        self._changed_rows.update(rows)
+
+        if shifted_from is not None:
+            if self._rows_shifted_from is None:
+                self._rows_shifted_from = shifted_from
+            else:
+                self._rows_shifted_from = min(
+                    self._rows_shifted_from, shifted_from
+                )
+
+        self._trigger_refresh_rows()
 
     def on_pagination(
         self, instance_table_date, instance_table_pagination
@@ -861,10 +884,6 @@ class TableData(RecycleView):
                 self.cell_row_obj_dict[i] = cell_row_obj
                 self.on_mouse_select(cell_row_obj)
 
-    def _split_list_into_equal_parts(self, lst, parts):
-        for i in range(0, len(lst), parts):
-            yield lst[i : i + parts]
-
     def _restore_check_states(self):
         """Restores the state of checkboxes on the current page."""
 
@@ -872,11 +891,7 @@ class TableData(RecycleView):
             cell_row_obj = self.view_adapter.get_visible_view(i)
 
             if cell_row_obj:
-                # We check whether this index is selected in
-                # `checked_row_indices`.
-                is_checked = i in self.checked_row_indices
-
-                if is_checked:
+                if self.model.is_checked(self._get_row_index(i)):
                     cell_row_obj.change_check_state_no_notify("down")
                 else:
                     cell_row_obj.change_check_state_no_notify("normal")
@@ -884,28 +899,116 @@ class TableData(RecycleView):
     def _get_row_checks(self):
         """Returns all rows that are checked."""
 
-        checked_rows = []
+        # We return the full rows from row_data
+        # (including the tuples with icons).
+        return [
+            self.row_data[row_index]
+            for row_index in self.model.get_checked()
+            if row_index < len(self.row_data)
+        ]
 
-        for idx in self.checked_row_indices:
-            # Calculate the row index in row_data.
-            row_index = idx // self.total_col_headings
+    def _refresh_rows(self, *args) -> None:
+        """
+        Updates the cells of the rows changed since the last refresh.
 
-            if self.row_data and row_index < len(self.row_data):
-                # We return the full row from row_data
-                # (including the tuples with icons).
-                checked_rows.append(self.row_data[row_index])
-            else:
-                # Fallback: assembling from recycle_data
-                row_data = []
+        Only the current page is updated: the whole page if rows were moved
+        on it, otherwise only the cells of the changed rows.
+        """
 
-                for data in self.recycle_data:
-                    if idx in data["range"]:
-                        row_data.append(data["text"])
+        changed_rows = self._changed_rows
+        shifted_from = self._rows_shifted_from
+        self._changed_rows = set()
+        self._rows_shifted_from = None
+        page_count = self.model.page_count(self.rows_num)
 
-                if row_data:
-                    checked_rows.append(row_data)
+        if self._rows_number >= page_count:
+            self._rows_number = max(page_count - 1, 0)
+            shifted_from = 0
 
-        return checked_rows
+        rows = self.model.page_range(self._rows_number, self.rows_num)
+
+        if (
+            shifted_from is not None
+            and shifted_from < rows.start + self.rows_num
+        ):
+            self.set_row_data()
+        elif changed_rows:
+            columns = self.total_col_headings
+            recycle_data = list(self.recycle_data)
+
+            for index in changed_rows:
+                if index in rows:
+                    start = (index - rows.start) * columns
+                    recycle_data[start : start + columns] = [
+                        self._get_cell_data(value)
+                        for value in self.model.get_row(index)[:columns]
+                    ]
+
+            self.recycle_data = recycle_data
+
+        self._update_pagination()
+        self._restore_check_states()
+
+    def _update_pagination(self) -> None:
+        """Sets the range of the displayed rows and the page buttons."""
+
+        if not self.pagination:
+            return
+
+        rows = self.model.page_range(self._rows_number, self.rows_num)
+        self._current_value = rows.start + 1
+        self._to_value = rows.stop
+        self.pagination.ids.label_rows_per_page.text = (
+            f"{self._current_value}-{self._to_value} of {len(self.row_data)}"
+        )
+        self.pagination.ids.button_back.disabled = self._rows_number == 0
+        self.pagination.ids.button_forward.disabled = rows.stop >= len(
+            self.model
+        )
+
+    def _get_row_index(self, index: int) -> int:
+        """Returns the index in :attr:`row_data` of the cell on the page."""
+
+        return (
+            self._rows_number * self.rows_num + index // self.total_col_headings
+        )
+
+    def _get_page_size(self, page: int) -> int:
+        """Returns the number of rows displayed on the page."""
+
+        return len(self.model.page_range(page, self.rows_num))
+
+    @staticmethod
+    def _get_cell_data(value) -> dict:
+        """Returns the data of the :class:`CellRow` view for a cell value."""
+
+        # We check whether the value is a dictionary with a viewclass
+        # (widget).
+        if isinstance(value, dict) and "viewclass" in value:
+            # No text, only a widget.
+            return {
+                "selectable": True,
+                "cell_widget": value,
+                "text": "",
+                "icon": "",
+            }
+        # We check for the icon with text.
+        if isinstance(value, (tuple, list)):
+            if len(value) == 3:
+                return {
+                    "selectable": True,
+                    "icon": value[0],
+                    "icon_color": value[1],
+                    "text": str(value[2]),
+                }
+            if len(value) == 2:
+                return {
+                    "selectable": True,
+                    "icon": value[0],
+                    "text": str(value[1]),
+                }
+
+        return {"selectable": True, "text": str(value)}
 
 
 class TablePagination(BoxLayout):
@@ -1723,6 +1826,29 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
     and defaults to `[]`.
     """
 
+    row_key = ObjectProperty(None, allownone=True)
+    """
+    Function that takes a row from :attr:`row_data` and returns the key of
+    the row. Keys must be unique and hashable, and are used to find rows in
+    :meth:`add_row`, :meth:`remove_row`, :meth:`update_row` and
+    :meth:`apply_changes`.
+
+    If not set, the text of the first cell of the row is used as the key.
+
+    .. code-block:: python
+
+        MDDataTable(
+            column_data=[("Order", dp(30)), ("Price", dp(30))],
+            row_data=[("A-1", "10.5"), ("A-2", "11.0")],
+            row_key=lambda row: row[0],
+        )
+
+    .. versionadded:: 2.0.0
+
+    :attr:`row_key` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
     sorted_on = StringProperty()
     """
     Column name upon which the data is already sorted.
@@ -2021,6 +2147,7 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
             self.ids.container.add_widget(self.pagination)
             Clock.schedule_once(self.create_pagination_menu, 0.5)
 
+        self.table_data.model.set_key(self.row_key)
         self.bind(row_data=self.update_row_data)
 
     def set_row_checked(self, row_index: int, checked: bool) -> None:
@@ -2165,38 +2292,7 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
         if row_index < 0 or row_index >= len(self.row_data):
             raise IndexError(f"Row index {row_index} is out of range")
 
-        first_cell_index = row_index * self.table_data.total_col_headings
-
-        if checked:
-            if first_cell_index not in self.table_data.checked_row_indices:
-                self.table_data.checked_row_indices.append(first_cell_index)
-
-            page = row_index // self.table_data.rows_num
-
-            if page not in self.table_data.current_selection_check:
-                self.table_data.current_selection_check[page] = []
-            if (
-                first_cell_index
-                not in self.table_data.current_selection_check[page]
-            ):
-                self.table_data.current_selection_check[page].append(
-                    first_cell_index
-                )
-        else:
-            if first_cell_index in self.table_data.checked_row_indices:
-                self.table_data.checked_row_indices.remove(first_cell_index)
-
-            page = row_index // self.table_data.rows_num
-
-            if page in self.table_data.current_selection_check:
-                if (
-                    first_cell_index
-                    in self.table_data.current_selection_check[page]
-                ):
-                    self.table_data.current_selection_check[page].remove(
-                        first_cell_index
-                    )
-
+        self.table_data.model.set_checked(row_index, checked)
         self.table_data._update_content_cells_rows()
         self.table_data._update_cell_selection_state()
 
@@ -2239,9 +2335,9 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
         if row_index < 0 or row_index >= len(self.row_data):
             raise IndexError(f"Row index {row_index} is out of range")
 
-        first_cell_index = row_index * self.table_data.total_col_headings
-        is_checked = first_cell_index in self.table_data.checked_row_indices
-        self.set_row_checked(row_index, not is_checked)
+        self.set_row_checked(
+            row_index, not self.table_data.model.is_checked(row_index)
+        )
 
     def is_row_checked(self, row_index: int) -> bool:
         """
@@ -2256,9 +2352,7 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
         if row_index < 0 or row_index >= len(self.row_data):
             raise IndexError(f"Row index {row_index} is out of range")
 
-        first_cell_index = row_index * self.table_data.total_col_headings
-
-        return first_cell_index in self.table_data.checked_row_indices
+        return self.table_data.model.is_checked(row_index)
 
     def get_checked_row_indices(self) -> list:
         """
@@ -2267,15 +2361,7 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
         :return: List of checked row indices
         """
 
-        checked_indices = []
-
-        for idx in sorted(self.table_data.checked_row_indices):
-            row_index = idx // self.table_data.total_col_headings
-
-            if row_index not in checked_indices:
-                checked_indices.append(row_index)
-
-        return checked_indices
+        return self.table_data.model.get_checked()
 
     def clear_all_checks(self) -> None:
         """Unchecks all rows in the table."""
@@ -2293,9 +2379,12 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
 
         Remember that this is a heavy function. since the whole data set must
         be updated. you can get better results calling this metod with in a
-        coroutine.
+        coroutine. To change individual rows, use :meth:`apply_changes`.
         """
 
+        if self.table_data._applying_changes:
+            return
+
         self.table_data.row_data = data
         self.row_data = data
         self.table_data.on_rows_num(self, self.table_data.rows_num)
@@ -2479,10 +2568,12 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
             :align: center
 
         .. versionadded:: 1.0.0
+
+        .. versionchanged:: 2.0.0
+            Only the current page of the table is refreshed.
         """
 
-        self.row_data.append(data)
-        Clock.schedule_once(self.table_data._update_content_cells_rows)
+        self.apply_changes(inserts=[data])
 
     def remove_row(self, data: Union[list, tuple]) -> None:
         """
@@ -2493,48 +2584,18 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
         information.
 
         .. versionadded:: 1.0.0
-        """
-
-        # Direct comparison of data.
-        for i, row in enumerate(self.row_data):
-            if list(row) == list(data):
-                self.row_data.pop(i)
-                self.update_row_data(None, self.row_data)
-                # Clear checkboxes.
-                self.table_data.checked_row_indices = []
-                self.table_data.current_selection_check = {}
-                self.table_data.table_header.ids.check.state = "normal"
 
-                return
-
-        # If a direct comparison didn't work, we try to find a partial match.
-        for i, row in enumerate(self.row_data):
-            match = True
-            for j, val in enumerate(data):
-                if j >= len(row):
-                    match = False
-                    break
-
-                # If the cell contains a tuple with an icon, compare the text.
-                if isinstance(row[j], (tuple, list)) and len(row[j]) > 1:
-                    if str(row[j][-1]) != str(val):
-                        match = False
-                        break
-                else:
-                    if str(row[j]) != str(val):
-                        match = False
-                        break
+        .. versionchanged:: 2.0.0
+            The row is found by :attr:`row_key`. Only the current page of the
+            table is refreshed and the checks of the other rows are kept.
+        """
 
-            if match:
-                self.row_data.pop(i)
-                self.update_row_data(None, self.row_data)
-                self.table_data.checked_row_indices = []
-                self.table_data.current_selection_check = {}
-                self.table_data.table_header.ids.check.state = "normal"
+        index = self._find_row(data)
 
-                return
+        if index is None:
+            raise ValueError(f"Row data {data} not found in table")
 
-        raise ValueError(f"Row data {data} not found in table")
+        self._change_rows(deletes=[index])
 
     def update_row(
         self, old_data: Union[list, tuple], new_data: Union[list, tuple]
@@ -2602,13 +2663,66 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
             :align: center
 
         .. versionadded:: 1.0.0
+
+        .. versionchanged:: 2.0.0
+            The row is found by :attr:`row_key`. Only the cells of the row are
+            refreshed.
         """
 
-        for data in self.row_data:
-            if data == old_data:
-                index_data = self.row_data.index(data)
-                self.row_data[index_data] = new_data
-                break
+        index = self._find_row(old_data)
+
+        if index is not None:
+            self._change_rows(updates={index: new_data})
+
+    def apply_changes(
+        self,
+        inserts: Iterable[Union[list, tuple]] = (),
+        updates: Union[dict, Iterable[Union[list, tuple]]] = (),
+        deletes: Iterable = (),
+    ) -> None:
+        """
+        Changes several rows of the table at once.
+
+        The changes are applied to :attr:`row_data` immediately, and the
+        displayed page is refreshed once on the next frame, no matter how many
+        changes were made during the frame. The checks of the rows and the
+        scroll position are kept.
+
+        .. code-block:: python
+
+            data_table = MDDataTable(
+                column_data=[("Order", dp(30)), ("Price", dp(30))],
+                row_data=[("A-1", "10.5"), ("A-2", "11.0"), ("A-3", "9.8")],
+            )
+            data_table.apply_changes(
+                inserts=[("A-4", "12.1")],
+                updates=[("A-1", "10.6")],
+                deletes=["A-3"],
+            )
+
+        .. versionadded:: 2.0.0
+
+        :param inserts: Rows added to the end of the table.
+        :param updates:
+            New rows, the rows with the same keys are replaced.
+            Can also be a dictionary `{key: new row}`.
+        :param deletes: Keys of the removed rows.
+        :raises KeyError: if there is no row with an updated or removed key.
+        """
+
+        model = self.table_data.model
+
+        if not isinstance(updates, dict):
+            updates = {model.key(row): row for row in updates}
+
+        self._change_rows(
+            inserts,
+            {
+                self._get_row_index_by_key(key): row
+                for key, row in updates.items()
+            },
+            [self._get_row_index_by_key(key) for key in deletes],
+        )
 
     def on_row_press(self, instance_cell_row) -> None:
         """Called when a table row is clicked."""
@@ -2647,9 +2761,148 @@ class MDDataTable(ThemableBehavior, CommonElevationBehavior, AnchorLayout):
         )
         self.table_data.pagination_menu = pagination_menu
 
+    def on_row_key(self, instance_data_table, row_key) -> None:
+        # The key is passed to the table model in `__init__`.
+        if hasattr(self, "table_data"):
+            self.table_data.model.set_key(row_key)
+
     def _scroll_with_header(self, instance, value):
         self.header.scroll_x = value
 
+    def _get_row_index_by_key(self, key) -> int:
+        index = self.table_data.model.index_of(key)
+
+        if index is None:
+            raise KeyError(f"Row with key {key!r} not found in table")
+
+        return index
+
+    def _find_row(self, data: Union[list, tuple]) -> Union[int, None]:
+        """
+        Returns the index of the row in the table model or `None`. The rows
+        of the model are sorted by the header, unlike :attr:`row_data`.
+        """
+
+        model = self.table_data.model
+        rows = self.table_data.row_data
+        index = model.index_of(model.key(data))
+
+        # Rows with the same key share one index, so the row found by the
+        # key is only used when its cells match the data.
+        if index is not None:
+            if model.get_row(index)[: len(data)] == list(data):
+                return index
+
+        # Direct comparison of data.
+        for i, row in enumerate(rows):
+            if list(row) == list(data):
+                return i
+
+        # If a direct comparison didn't work, we try to find a partial match.
+        for i, row in enumerate(rows):
+            match = True
+            for j, val in enumerate(data):
+                if j >= len(row):
+                    match = False
+                    break
+
+                # If the cell contains a tuple with an icon, compare the text.
+                if isinstance(row[j], (tuple, list)) and len(row[j]) > 1:
+                    if str(row[j][-1]) != str(val):
+                        match = False
+                        break
+                else:
+                    if str(row[j]) != str(val):
+                        match = False
+                        break
+
+            if match:
+                return i
+
+        return None
+
+    def _change_rows(
+        self,
+        inserts: Iterable[Union[list, tuple]] = (),
+        updates: Union[dict, None] = None,
+        deletes: Iterable[int] = (),
+    ) -> None:
+        """
+        Applies the changes to the table model and to :attr:`row_data`
+        without rebuilding the table.
+
+        :param inserts: Rows added to the end of the table.
+        :param updates: New rows by the indices of the replaced rows.
+        :param deletes: Indices of the removed rows.
+
+        The indices are the indices of the rows in the table model, which
+        differ from the indices in :attr:`row_data` after sorting.
+        """
+
+        table_data = self.table_data
+        model = table_data.model
+        # Both lists are changed with the methods of `list` so that their
+        # observers are notified once, after all the changes.
+        row_data = self.row_data
+        model_rows = table_data.row_data
+        order = table_data._row_data_indices
+        changed_rows = set()
+        shifted_from = None
+
+        for index, row in (updates or {}).items():
+            model.update_row(index, row)
+            list.__setitem__(model_rows, index, row)
+            list.__setitem__(
+                row_data, index if order is None else order[index], row
+            )
+            changed_rows.add(index)
+
+        deletes = sorted(set(deletes))
+
+        if deletes:
+            model.remove_rows(deletes)
+            for index in reversed(deletes):
+                list.__delitem__(model_rows, index)
+            removed = set(deletes)
+
+            if order is None:
+                for index in reversed(deletes):
+                    list.__delitem__(row_data, index)
+            else:
+                positions = sorted(order[index] for index in deletes)
+                for position in reversed(positions):
+                    list.__delitem__(row_data, position)
+                table_data._row_data_indices = order = [
+                    position - bisect_left(positions, position)
+                    for index, position in enumerate(order)
+                    if index not in removed
+                ]
+
+            changed_rows = {
+                index - bisect_left(deletes, index)
+                for index in changed_rows
+                if index not in removed
+            }
+            shifted_from = deletes[0]
+
+        for row in inserts:
+            index = model.append_row(row)
+            list.append(model_rows, row)
+            list.append(row_data, row)
+            if order is not None:
+                order.append(len(row_data) - 1)
+            if shifted_from is None:
+                shifted_from = index
+
+        table_data._applying_changes = True
+        try:
+            table_data.property("row_data").dispatch(table_data)
+            self.property("row_data").dispatch(self)
+        finally:
+            table_data._applying_changes = False
+
+        table_data.refresh_rows(changed_rows, shifted_from)
+
 
 class CellRow(
     ThemableBehavior,
@@ -2750,6 +3003,13 @@ class CellRow(
         """
 
         self.index = index
+        self.table = instance_table_data
+        self.background_color_cell = (
+            instance_table_data._parent.background_color_cell
+        )
+        self.background_color_selected_cell = (
+            instance_table_data._parent.background_color_selected_cell
+        )
         container = self.ids.widget_container
 
         if container:
@@ -2782,7 +3042,7 @@ class CellRow(
 
         # Set checkboxes.
         if instance_table_data.check:
-            if self.index in instance_table_data.data_first_cells:
+            if self.index % instance_table_data.total_col_headings == 0:
                 self.ids.check.size = (dp(32), dp(32))
                 self.ids.check.opacity = 1
                 self.ids.box.spacing = dp(16)
@@ -2794,22 +3054,10 @@ class CellRow(
                 self.ids.box.padding[0] = 0
 
         # Set checkboxes state.
-        if (
-            instance_table_data._rows_number
-            in instance_table_data.current_selection_check
+        if instance_table_data.model.is_checked(
+            instance_table_data._get_row_index(self.index)
         ):
-            for index in instance_table_data.current_selection_check[
-                instance_table_data._rows_number
-            ]:
-                if (
-                    self.index
-                    in instance_table_data.current_selection_check[
-                        instance_table_data._rows_number
-                    ]
-                ):
-                    self.change_check_state_no_notify("down")
-                else:
-                    self.change_check_state_no_notify("normal")
+            self.change_check_state_no_notify("down")
         else:
             self.change_check_state_no_notify("normal")
 
@@ -2824,40 +3072,9 @@ class CellRow(
     ) -> None:
         """Called upon activation/deactivation of the checkbox."""
 
-        if active:
-            if self.index not in self.table.checked_row_indices:
-                self.table.checked_row_indices.append(self.index)
-        else:
-            if self.index in self.table.checked_row_indices:
-                self.table.checked_row_indices.remove(self.index)
-
-        if active:
-            if (
-                self.table._rows_number
-                not in self.table.current_selection_check
-            ):
-                self.table.current_selection_check[self.table._rows_number] = []
-            if (
-                self.index
-                not in self.table.current_selection_check[
-                    self.table._rows_number
-                ]
-            ):
-                self.table.current_selection_check[
-                    self.table._rows_number
-                ].append(self.index)
-        else:
-            if self.table._rows_number in self.table.current_selection_check:
-                if (
-                    self.index
-                    in self.table.current_selection_check[
-                        self.table._rows_number
-                    ]
-                    and not active
-                ):
-                    self.table.current_selection_check[
-                        self.table._rows_number
-                    ].remove(self.index)
+        self.table.model.set_checked(
+            self.table._get_row_index(self.index), active
+        )
 
     def on_touch_down(self, touch):
         if super().on_touch_down(touch):
@@ -2978,7 +3195,7 @@ class CellRow(
         container.clear_widgets()
 
         row_index = (
-            self.index // self.table.total_col_headings
+            self.table._get_row_index(self.index)
             if self.table and self.table.total_col_headings > 0
             else 0
         )
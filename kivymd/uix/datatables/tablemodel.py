@@ -0,0 +1,254 @@
+"""
+Column-oriented data model for :class:`~kivymd.uix.datatables.MDDataTable`.
+
+The model keeps the cells of the table in one list per column and the check
+state of the rows in a set of row indices. Row lookups, check state changes
+and page ranges are computed from the row index directly, so they do not
+depend on the number of rows in the table.
+
+.. versionadded:: 2.0.0
+"""
+
+__all__ = ("TableModel", "default_row_key")
+
+from bisect import bisect_left
+from itertools import zip_longest
+from typing import Callable, Iterable, Optional, Union
+
+
+def default_row_key(row: Union[list, tuple]) -> Optional[str]:
+    """Returns the text of the first cell of the row."""
+
+    if not row:
+        return None
+
+    cell = row[0]
+
+    if isinstance(cell, (tuple, list)):
+        cell = cell[-1]
+
+    return str(cell)
+
+
+class TableModel:
+    """
+    Storage of the table rows.
+
+    Cell values are stored per column: ``columns[column][row]``. The indices
+    of the checked rows are stored in the :attr:`checked` set.
+
+    Rows can also be found by a key returned by the :attr:`key` function.
+    The keys are computed on the first lookup and then maintained by
+    :meth:`append_row`, :meth:`update_row` and :meth:`remove_rows`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(
+        self,
+        rows: Union[list, tuple, None] = None,
+        key: Optional[Callable] = None,
+    ):
+        self.columns = []
+        """Lists of cell values, one list per column."""
+
+        self.checked = set()
+        """Indices of the checked rows."""
+
+        self.key = key or default_row_key
+        """Function that returns the key of a row."""
+
+        self._count = 0
+        self._keys = None  # row keys, in the order of the rows
+        self._index = None  # row key -> row index
+
+        if rows:
+            self.set_rows(rows)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def set_rows(self, rows: Union[list, tuple]) -> None:
+        """
+        Replaces the stored rows.
+
+        Rows shorter than the widest row are padded with empty strings.
+        Checked indices that are out of range of the new rows are discarded.
+        """
+
+        self.columns = [
+            list(column) for column in zip_longest(*rows, fillvalue="")
+        ]
+        self._count = len(rows)
+        self._keys = None
+        self._index = None
+
+        if self.checked:
+            self.checked = {i for i in self.checked if i < self._count}
+
+    def set_key(self, key: Optional[Callable]) -> None:
+        """Sets the function that returns the key of a row."""
+
+        self.key = key or default_row_key
+        self._keys = None
+        self._index = None
+
+    def index_of(self, key) -> Optional[int]:
+        """Returns the index of the row with the given key or `None`."""
+
+        if self._index is None:
+            self._index = dict(zip(self._get_keys(), range(self._count)))
+
+        return self._index.get(key)
+
+    def append_row(self, row: Union[list, tuple]) -> int:
+        """Adds a row to the end of the table and returns its index."""
+
+        index = self._count
+
+        for _ in range(len(self.columns), len(row)):
+            self.columns.append([""] * index)
+        for column_index, column in enumerate(self.columns):
+            column.append(row[column_index] if column_index < len(row) else "")
+
+        self._count += 1
+
+        if self._keys is not None:
+            key = self.key(row)
+            self._keys.append(key)
+
+            if self._index is not None:
+                self._index[key] = index
+
+        return index
+
+    def update_row(self, index: int, row: Union[list, tuple]) -> None:
+        """Replaces the cell values of the row with the given index."""
+
+        for _ in range(len(self.columns), len(row)):
+            self.columns.append([""] * self._count)
+        for column_index, column in enumerate(self.columns):
+            column[index] = row[column_index] if column_index < len(row) else ""
+
+        if self._keys is not None:
+            key = self.key(row)
+
+            if self._index is not None:
+                if self._index.get(self._keys[index]) == index:
+                    del self._index[self._keys[index]]
+                self._index[key] = index
+
+            self._keys[index] = key
+
+    def remove_rows(self, indices: Iterable[int]) -> None:
+        """
+        Removes the rows with the given indices.
+
+        The rows that follow the removed ones are moved up, and their check
+        state is moved with them.
+        """
+
+        indices = sorted(set(indices))
+
+        for index in reversed(indices):
+            for column in self.columns:
+                del column[index]
+            if self._keys is not None:
+                del self._keys[index]
+
+        self._count -= len(indices)
+        # The indices of the following rows have changed, the index is
+        # rebuilt from the keys on the next lookup.
+        self._index = None
+
+        if self.checked:
+            removed = set(indices)
+            self.checked = {
+                i - bisect_left(indices, i)
+                for i in self.checked
+                if i not in removed
+            }
+
+    def get_row(self, index: int) -> list:
+        """Returns the cell values of the row with the given index."""
+
+        return [column[index] for column in self.columns]
+
+    def get_cell(self, index: int, column: int):
+        """Returns the value of a single cell."""
+
+        return self.columns[column][index]
+
+    def get_column(self, column: int) -> list:
+        """Returns the values of a column."""
+
+        return self.columns[column]
+
+    def page_range(self, page: int, rows_num: int) -> range:
+        """Returns the range of row indices displayed on the page."""
+
+        if rows_num <= 0:
+            return range(0)
+
+        start = min(page * rows_num, self._count)
+
+        return range(start, min(start + rows_num, self._count))
+
+    def page_count(self, rows_num: int) -> int:
+        """Returns the number of pages with `rows_num` rows per page."""
+
+        if rows_num <= 0:
+            return 0
+
+        return -(-self._count // rows_num)
+
+    def is_checked(self, index: int) -> bool:
+        """Returns `True` if the row is checked."""
+
+        return index in self.checked
+
+    def set_checked(self, index: int, checked: bool) -> None:
+        """Sets the check state of a row."""
+
+        if checked:
+            self.checked.add(index)
+        else:
+            self.checked.discard(index)
+
+    def set_checked_rows(self, indices: Iterable[int]) -> None:
+        """Replaces the checked rows."""
+
+        self.checked = {i for i in indices if 0 <= i < self._count}
+
+    def check_all(self) -> None:
+        """Checks all rows."""
+
+        self.checked = set(range(self._count))
+
+    def clear_checks(self) -> None:
+        """Unchecks all rows."""
+
+        self.checked = set()
+
+    def get_checked(self) -> list:
+        """Returns the sorted indices of the checked rows."""
+
+        return sorted(self.checked)
+
+    def remap_checked(self, indices: dict) -> None:
+        """
+        Moves the check state after the rows have been reordered.
+
+        :param indices: Mapping of the old row indices to the new ones.
+        """
+
+        self.checked = {
+            indices[i] for i in self.checked if indices.get(i) is not None
+        }
+
+    def _get_keys(self) -> list:
+        if self._keys is None:
+            key = self.key
+            self._keys = [key(row) for row in zip(*self.columns)]
+
+        return self._keys
@@ -519,7 +519,6 @@ __all__ = [
 import os
 
 from kivy.core.window import Window
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -536,11 +535,9 @@ from kivymd.material_resources import DEVICE_TYPE
 from kivymd.uix.behaviors import DeclarativeBehavior, MotionDialogBehavior
 from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDIcon, MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "dialog", "dialog.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "dialog", "dialog.kv"))
 
 
 class MDDialog(MDCard, MotionDialogBehavior):
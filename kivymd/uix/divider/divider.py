@@ -151,18 +151,15 @@ __all__ = ("MDDivider",)
 import os
 
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import ColorProperty, NumericProperty
 from kivy.uix.boxlayout import BoxLayout
 
 from kivymd import uix_path
 from kivymd.theming import ThemableBehavior
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "divider", "divider.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "divider", "divider.kv"))
 
 
 class MDDivider(ThemableBehavior, BoxLayout):
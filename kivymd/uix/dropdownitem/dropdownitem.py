@@ -126,7 +126,6 @@ __all__ = ("MDDropDownItem", "MDDropDownItemText")
 import os
 
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import ListProperty, ObjectProperty
 from kivy.uix.behaviors import ButtonBehavior
@@ -136,11 +135,9 @@ from kivymd import uix_path
 from kivymd.theming import ThemableBehavior
 from kivymd.uix.behaviors import DeclarativeBehavior
 from kivymd.uix.label import MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "dropdownitem", "dropdownitem.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "dropdownitem", "dropdownitem.kv"))
 
 
 # FIXME: When resizing the texture of the `MDDropDownItemText` widget,
@@ -22,7 +22,7 @@ Ported from the Android Material Components library.
 
 import math
 
-from kivymd.utils.cubic_bezier import CubicBezier
+from kivymd.utils.cubic_bezier import get_easing_table
 
 
 class LinearIndeterminateDisjointAnimator:
@@ -38,10 +38,10 @@ class LinearIndeterminateDisjointAnimator:
     """
 
     INTERPOLATORS = [
-        CubicBezier(0.2, 0.0, 0.8, 1.0).t,  # line1_head
-        CubicBezier(0.4, 0.0, 1.0, 1.0).t,  # line1_tail
-        CubicBezier(0.0, 0.0, 0.65, 1.0).t,  # line2_head
-        CubicBezier(0.1, 0.0, 0.45, 1.0).t,  # line2_tail
+        get_easing_table(0.2, 0.0, 0.8, 1.0),  # line1_head
+        get_easing_table(0.4, 0.0, 1.0, 1.0),  # line1_tail
+        get_easing_table(0.0, 0.0, 0.65, 1.0),  # line2_head
+        get_easing_table(0.1, 0.0, 0.45, 1.0),  # line2_tail
     ]
     DURATION_TO_MOVE_SEGMENT_ENDS = [533, 567, 850, 750]
     DELAY_TO_MOVE_SEGMENT_ENDS = [1267, 1000, 333, 0]
@@ -142,7 +142,7 @@ class LinearIndeterminateContiguousAnimator:
     (`LinearIndeterminateContiguousAnimatorDelegate`).
     """
 
-    INTERPOLATOR = CubicBezier(0.4, 0.0, 0.2, 1.0).t
+    INTERPOLATOR = get_easing_table(0.4, 0.0, 0.2, 1.0)
 
     TOTAL_DURATION_IN_MS = 667
     DURATION_PER_CYCLE_IN_MS = 333
@@ -228,7 +228,7 @@ class CircularIndeterminateRetreatAnimator:
     (`CircularIndeterminateRetreatAnimatorDelegate`).
     """
 
-    INTERPOLATOR = CubicBezier(0.4, 0.0, 0.2, 1.0).t
+    INTERPOLATOR = get_easing_table(0.4, 0.0, 0.2, 1.0)
 
     TOTAL_DURATION_MS = 6000
     DURATION_SPIN_MS = 500
@@ -349,7 +349,7 @@ class CircularIndeterminateAdvancedAnimator:
     (`CircularIndeterminateAdvanceAnimatorDelegate`).
     """
 
-    INTERPOLATOR = CubicBezier(0.4, 0.0, 0.2, 1.0).t
+    INTERPOLATOR = get_easing_table(0.4, 0.0, 0.2, 1.0)
 
     TOTAL_DURATION_MS = 5400
     TOTAL_CYCLES = 4
@@ -565,7 +565,6 @@ import math
 import os
 
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     AliasProperty,
@@ -581,6 +580,8 @@ from kivy.uix.widget import Widget
 from kivymd import uix_path
 from kivymd.theming import ThemableBehavior
 from kivymd.uix.behaviors import DeclarativeBehavior
+from kivymd.utils.frame_ticker import frame_ticker
+from kivymd.utils.kv_loader import load_kv
 
 from .animators import (
     CircularIndeterminateAdvancedAnimator,
@@ -588,12 +589,9 @@ from .animators import (
     LinearIndeterminateContiguousAnimator,
     LinearIndeterminateDisjointAnimator,
 )
+from .geometry import get_arc_table, get_wave_table
 
-with open(
-    os.path.join(uix_path, "exprogressindicator", "exprogressindicator.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "exprogressindicator", "exprogressindicator.kv"))
 
 
 class MDExBaseProgressBar(Widget, DeclarativeBehavior, ThemableBehavior):
@@ -745,6 +743,20 @@ class MDExBaseProgressBar(Widget, DeclarativeBehavior, ThemableBehavior):
     _time = 0
     _ctx_deps = ["center", "spacing", "thickness"]
 
+    # Properties that change the rendered wave.
+    _render_deps = [
+        "value",
+        "max",
+        "pos",
+        "size",
+        "determinate",
+        "amplitude",
+        "wave_length",
+        "wave_speed",
+        "thickness",
+        "spacing",
+    ]
+
     _active_line_objs = []
     _inactive_line_objs = []
     _active_names = ["active_track"]
@@ -754,6 +766,9 @@ class MDExBaseProgressBar(Widget, DeclarativeBehavior, ThemableBehavior):
         super().__init__(**kwargs)
         self._fctx = {}
         self._time = 0
+        self._trigger_render = Clock.create_trigger(
+            lambda dt: self._render_wave(0)
+        )
         self._start()
 
     _init = False
@@ -769,8 +784,36 @@ class MDExBaseProgressBar(Widget, DeclarativeBehavior, ThemableBehavior):
         self.on_determinate(self, self.determinate)
         self.save_frame_context()
 
-        Clock.schedule_interval(self._render_wave, 0)
         self.bind(**dict.fromkeys(self._ctx_deps, self.save_frame_context))
+        self.bind(**dict.fromkeys(self._render_deps, self._update_ticker))
+        self._update_ticker()
+
+    def is_animated(self) -> bool:
+        """
+        Returns `True` if the indicator changes from frame to frame: the
+        indicator is indeterminate or the wave of the determinate indicator
+        moves.
+
+        .. versionadded:: 2.0.0
+        """
+
+        if not self.determinate:
+            return True
+
+        return bool(
+            self.wave_speed
+            and self.get_amplitude(self.amplitude, self.value_normalized)
+        )
+
+    def _update_ticker(self, *args):
+        # The animated indicators are rendered by the shared frame ticker
+        # while they are visible, the static ones are rendered once after
+        # their properties change.
+        if self.is_animated():
+            frame_ticker.add(self, self._render_wave)
+        else:
+            frame_ticker.remove(self)
+            self._trigger_render()
 
     def color_obj(self, line_name):
         """Get color object from line."""
@@ -882,6 +925,7 @@ class MDExLinearProgressIndicator(MDExBaseProgressBar):
     _inactive_line_objs = []
     _active_names = ["active_track", "active_track_1"]
     _inactive_names = ["inactive_track", "inactive_track_1"]
+    _render_deps = MDExBaseProgressBar._render_deps + ["orientation"]
 
     def _start(self, *args):
         super()._start(*args)
@@ -958,26 +1002,23 @@ class MDExLinearProgressIndicator(MDExBaseProgressBar):
 
         fctx = self._fctx
         amplitude = self.amplitude
+        scale = 1.0
 
-        if self.determinate:
-            amplitude = self.get_amplitude(amplitude, self.value_normalized)
-
-        k = 2 * math.pi / max(0.01, self.wave_length)
-        phase = self.wave_speed * self._time
-
-        points = []
-        _sin = math.sin
-
-        if fctx["inv"] is None:  # horizontal
-            cy = fctx["center"]
-            for x in range(int(start), int(end), 1):
-                points.extend((x, cy + amplitude * _sin(k * (x - phase))))
-        else:
-            cx = fctx["center"]
-            for y in range(int(start), int(end), 1):
-                points.extend((cx + amplitude * _sin(k * (y - phase)), y))
+        if self.determinate and amplitude:
+            scale = (
+                self.get_amplitude(amplitude, self.value_normalized) / amplitude
+            )
 
-        return points
+        return get_wave_table(
+            max(0.01, self.wave_length), amplitude
+        ).get_points(
+            start,
+            end,
+            self.wave_speed * self._time,
+            vertical=fctx["inv"] is not None,
+            scale=scale,
+            offset=fctx["center"],
+        )
 
     def cleanup_lines(self, line_groups):
         for group in line_groups:
@@ -1196,11 +1237,11 @@ class MDExCircularProgressIndicator(MDExBaseProgressBar):
             "step": step,
             "cx": self.center_x,
             "cy": self.center_y,
+            "arc": get_arc_table(radius, step),
         }
 
     def w_seg(self, start, end) -> list:
         ctx = self._fctx
-        _sin, _cos = math.sin, math.cos
 
         if self.determinate:
             amplitude = self.get_amplitude(
@@ -1211,32 +1252,19 @@ class MDExCircularProgressIndicator(MDExBaseProgressBar):
             amplitude = self.amplitude
             ang_wave_speed = 0
 
-        num_steps = int((end - start) / ctx["step"]) + 1
-
-        return [
-            coord
-            for i in range(num_steps)
-            for pt in [start + i * ctx["step"]]
-            for r in [
-                ctx["radius"]
-                + amplitude
-                * _sin(ctx["mode_number"] * pt - ang_wave_speed * self._time)
-            ]
-            for coord in (ctx["cx"] + r * _sin(pt), ctx["cy"] + r * _cos(pt))
-        ]
+        return ctx["arc"].get_wave_points(
+            start,
+            end,
+            ctx["mode_number"],
+            amplitude,
+            ang_wave_speed * self._time,
+            (ctx["cx"], ctx["cy"]),
+        )
 
     def get_arc_points(self, start_rad, end_rad) -> list:
         ctx = self._fctx
-        num_steps = int((end_rad - start_rad) / ctx["step"]) + 1
-        cx, cy, r = ctx["cx"], ctx["cy"], ctx["radius"]
-        _sin, _cos = math.sin, math.cos
-
-        return [
-            coord
-            for i in range(num_steps)
-            for pt in [start_rad + i * ctx["step"]]
-            for coord in (cx + r * _sin(pt), cy + r * _cos(pt))
-        ]
+
+        return ctx["arc"].get_points(start_rad, end_rad, (ctx["cx"], ctx["cy"]))
 
     def get_start_and_end(self, init_rad, s_f, e_f):
         full_angle = 2 * math.pi
@@ -0,0 +1,321 @@
+"""
+Geometry of the expressive progress indicators.
+
+The points of the waves and arcs drawn by the indicators are taken from
+lookup tables instead of being calculated point by point every frame:
+
+- :class:`WaveTable` samples a sine wave of the given length and amplitude
+  over one period plus the length of the track, so the points of a wave
+  shifted by any phase are a slice of the table;
+- :class:`ArcTable` samples a circle of the given radius, so the points of
+  an arc are a slice of the table, and the wave along the arc is calculated
+  from the table with a few multiplications per point.
+
+The tables do not depend on the position of the indicator: the offset of
+the wave and the center of the arc are added to the points when they are
+taken from the table, so the tables are shared by all the indicators with
+the same wave length, amplitude and radius. NumPy is
+used to calculate the points if it is installed, otherwise the tables are
+:class:`array.array` objects sliced by Python.
+
+.. versionadded:: 2.0.0
+"""
+
+__all__ = ("ArcTable", "WaveTable", "get_arc_table", "get_wave_table")
+
+import math
+from array import array
+from collections import OrderedDict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+WAVE_RESOLUTION = 8
+"""Samples of :class:`WaveTable` per pixel."""
+
+MAX_TABLES = 32
+"""Maximum number of the cached tables."""
+
+_tables = OrderedDict()
+
+
+def _sample(function, count: int):
+    if numpy is not None:
+        return function(numpy.arange(count, dtype=float))
+
+    return array("d", map(function, range(count)))
+
+
+def _interleave(xs, ys, count: int) -> list:
+    if numpy is not None:
+        points = numpy.empty(count * 2)
+        points[0::2] = xs
+        points[1::2] = ys
+
+        return points.tolist()
+
+    points = [0.0] * (count * 2)
+    points[0::2] = xs
+    points[1::2] = ys
+
+    return points
+
+
+class WaveTable:
+    """
+    Samples of `amplitude * sin(2 * pi * x / wave_length)` taken
+    :data:`WAVE_RESOLUTION` times per pixel.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self, wave_length: float, amplitude: float):
+        self.wave_length = wave_length
+        self.amplitude = amplitude
+        self.samples = _sample(self._get_sample, 0)
+
+    def get_points(
+        self,
+        start: float,
+        end: float,
+        phase: float,
+        vertical: bool = False,
+        scale: float = 1.0,
+        offset: float = 0.0,
+    ) -> list:
+        """
+        Returns the points of the wave shifted by `phase` pixels at each
+        pixel from `start` to `end` along the track as a flat list of
+        coordinates for :attr:`~kivy.graphics.Line.points`.
+
+        :param vertical:
+            If `True`, the track is vertical and the wave is along the
+            `x` axis.
+
+        :param scale:
+            Multiplier of the amplitude of the wave.
+
+        :param offset:
+            Coordinate of the axis of the wave.
+        """
+
+        start = int(start)
+        count = int(end) - start
+
+        if count <= 0:
+            return []
+
+        # The wave repeats every wave length, so the first point is taken
+        # from the first period of the table.
+        first = round((start - phase) % self.wave_length * WAVE_RESOLUTION)
+        last = first + (count - 1) * WAVE_RESOLUTION
+
+        if last >= len(self.samples):
+            self._extend(last + 1)
+
+        values = self.samples[first : last + 1 : WAVE_RESOLUTION]
+
+        if numpy is not None:
+            values = values * scale + offset if scale != 1 else values + offset
+        else:
+            values = [offset + value * scale for value in values]
+
+        if numpy is not None:
+            positions = numpy.arange(start, start + count)
+        else:
+            positions = range(start, start + count)
+
+        if vertical:
+            return _interleave(values, positions, count)
+
+        return _interleave(positions, values, count)
+
+    def _extend(self, count: int) -> None:
+        # Grows the table by at least a half to extend it rarely.
+        count = max(
+            count,
+            len(self.samples) * 3 // 2,
+            int((self.wave_length + 1) * WAVE_RESOLUTION),
+        )
+        self.samples = _sample(self._get_sample, count)
+
+    def _get_sample(self, index):
+        k = 2 * math.pi / (self.wave_length * WAVE_RESOLUTION)
+
+        if numpy is not None:
+            return self.amplitude * numpy.sin(k * index)
+
+        return self.amplitude * math.sin(k * index)
+
+
+class ArcTable:
+    """
+    Samples of the circle with the center at `(0, 0)` and the given radius
+    taken every `step` radians.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self, radius: float, step: float):
+        self.radius = radius
+        # The step is shortened to fit a whole number of the steps into the
+        # circle, so the table is periodic.
+        self.count = max(1, math.ceil(2 * math.pi / step))
+        self.step = 2 * math.pi / self.count
+        # Two turns, so that any arc is a slice of the table.
+        size = self.count * 2 + 1
+        step = self.step
+        self.sin = _sample(lambda i: self._sin(i * step), size)
+        self.cos = _sample(lambda i: self._cos(i * step), size)
+        self.xs = _sample(lambda i: radius * self._sin(i * step), size)
+        self.ys = _sample(lambda i: radius * self._cos(i * step), size)
+        self._waves = {}  # {mode_number: (sin, cos)}
+
+    def get_points(
+        self, start: float, end: float, center: tuple = (0, 0)
+    ) -> list:
+        """
+        Returns the points of the arc from `start` to `end` radians clockwise
+        from the top of the circle with the center at `center`.
+        """
+
+        first, count = self._get_range(start, end)
+
+        if count <= 0:
+            return []
+
+        cx, cy = center
+        arc = slice(first, first + count)
+
+        if numpy is not None:
+            return _interleave(self.xs[arc] + cx, self.ys[arc] + cy, count)
+
+        return _interleave(
+            [x + cx for x in self.xs[arc]],
+            [y + cy for y in self.ys[arc]],
+            count,
+        )
+
+    def get_wave_points(
+        self,
+        start: float,
+        end: float,
+        mode_number: float,
+        amplitude: float,
+        phase: float,
+        center: tuple = (0, 0),
+    ) -> list:
+        """
+        Returns the points of the arc from `start` to `end` radians with the
+        center at `center` whose radius changes as
+        `radius + amplitude * sin(mode_number * angle - phase)`.
+        """
+
+        first, count = self._get_range(start, end)
+
+        if count <= 0:
+            return []
+
+        wave_sin, wave_cos = self._get_wave(mode_number)
+        # The wave along the arc starts with the phase of the first point.
+        theta = mode_number * round(start / self.step) * self.step - phase
+        sin_theta = amplitude * math.sin(theta)
+        cos_theta = amplitude * math.cos(theta)
+        arc = slice(first, first + count)
+        cx, cy = center
+
+        if numpy is not None:
+            offsets = (
+                wave_sin[:count] * cos_theta + wave_cos[:count] * sin_theta
+            )
+
+            return _interleave(
+                self.xs[arc] + (offsets * self.sin[arc] + cx),
+                self.ys[arc] + (offsets * self.cos[arc] + cy),
+                count,
+            )
+
+        points = []
+        append = points.append
+
+        for x, y, sin, cos, wave_s, wave_c in zip(
+            self.xs[arc],
+            self.ys[arc],
+            self.sin[arc],
+            self.cos[arc],
+            wave_sin,
+            wave_cos,
+        ):
+            offset = wave_s * cos_theta + wave_c * sin_theta
+            append(cx + x + offset * sin)
+            append(cy + y + offset * cos)
+
+        return points
+
+    def _get_range(self, start: float, end: float) -> tuple:
+        count = min(self.count + 1, int((end - start) / self.step) + 1)
+        first = round(start / self.step) % self.count
+
+        return first, count
+
+    def _get_wave(self, mode_number: float) -> tuple:
+        wave = self._waves.get(mode_number)
+
+        if wave is None:
+            if len(self._waves) > 4:
+                self._waves.clear()
+
+            k = mode_number * self.step
+            wave = self._waves[mode_number] = (
+                _sample(lambda i: self._sin(k * i), self.count + 1),
+                _sample(lambda i: self._cos(k * i), self.count + 1),
+            )
+
+        return wave
+
+    @staticmethod
+    def _sin(value):
+        return numpy.sin(value) if numpy is not None else math.sin(value)
+
+    @staticmethod
+    def _cos(value):
+        return numpy.cos(value) if numpy is not None else math.cos(value)
+
+
+def _get_table(key: tuple, factory):
+    table = _tables.get(key)
+
+    if table is None:
+        table = _tables[key] = factory()
+
+        if len(_tables) > MAX_TABLES:
+            _tables.popitem(last=False)
+    else:
+        _tables.move_to_end(key)
+
+    return table
+
+
+def get_wave_table(wave_length: float, amplitude: float) -> WaveTable:
+    """
+    Returns the shared :class:`WaveTable` with the given parameters.
+
+    .. versionadded:: 2.0.0
+    """
+
+    return _get_table(
+        ("wave", wave_length, amplitude),
+        lambda: WaveTable(wave_length, amplitude),
+    )
+
+
+def get_arc_table(radius: float, step: float) -> ArcTable:
+    """
+    Returns the shared :class:`ArcTable` with the given parameters.
+
+    .. versionadded:: 2.0.0
+    """
+
+    return _get_table(("arc", radius, step), lambda: ArcTable(radius, step))
@@ -225,16 +225,17 @@ __all__ = ("MDFileManager",)
 import locale
 import os
 import re
+from functools import partial
 from typing import List, Tuple, Union
 
 from kivy import platform
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
     ColorProperty,
     ListProperty,
+    NumericProperty,
     ObjectProperty,
     OptionProperty,
     StringProperty,
@@ -248,13 +249,17 @@ from kivymd import images_path, uix_path
 from kivymd.theming import ThemableBehavior
 from kivymd.uix.behaviors import CircularRippleBehavior
 from kivymd.uix.button import MDFabButton
+from kivymd.uix.filemanager.scanner import (
+    DirectoryEntry,
+    directory_scanner,
+    get_access_string,
+)
+from kivymd.uix.filemanager.thumbnails import thumbnail_cache
 from kivymd.uix.fitimage import FitImage
 from kivymd.uix.list import MDListItem
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "filemanager", "filemanager.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "filemanager", "filemanager.kv"))
 
 
 class MDFileManagerItem(MDListItem):
@@ -299,6 +304,60 @@ class MDFileManagerThumbnail(CircularRippleBehavior, ButtonBehavior, FitImage):
     classes documentation.
     """
 
+    thumbnail_path = StringProperty()
+    """
+    Path to the image. The image is decoded at the :attr:`thumbnail_size`
+    resolution in a worker thread and cached by
+    :class:`~kivymd.uix.filemanager.thumbnails.ThumbnailCache`. Images that
+    cannot be decoded are loaded from :attr:`source`.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`thumbnail_path` is a :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    thumbnail_size = NumericProperty("150dp")
+    """
+    Size of the larger side of the thumbnail.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`thumbnail_size` is a :class:`~kivy.properties.NumericProperty`
+    and defaults to `'150dp'`.
+    """
+
+    _thumbnail_request = None
+
+    def on_thumbnail_path(self, instance, path: str) -> None:
+        """Fired when the :attr:`thumbnail_path` value changes."""
+
+        # The views of the RecycleView are reused for the visible rows only,
+        # so the thumbnail of a row that has been scrolled out of view is
+        # not needed anymore.
+        thumbnail_cache.cancel(
+            self._thumbnail_request, self._on_thumbnail_loaded
+        )
+        self._thumbnail_request = None
+        self.source = ""
+        self.texture = None
+
+        if path:
+            self._thumbnail_request = thumbnail_cache.request(
+                path, self.thumbnail_size, self._on_thumbnail_loaded
+            )
+
+    def _on_thumbnail_loaded(self, path: str, texture) -> None:
+        if path != self.thumbnail_path:
+            return
+
+        self._thumbnail_request = None
+
+        if texture is None:
+            self.source = path
+        else:
+            self.texture = texture
+
 
 class MDFileManager(ThemableBehavior, RelativeLayout):
     """
@@ -551,6 +610,8 @@ class MDFileManager(ThemableBehavior, RelativeLayout):
 
     _window_manager = None
     _window_manager_open = False
+    # Number of the items added to the list of the directory per frame.
+    _items_per_frame = 200
 
     __events__ = ("on_pre_open", "on_open", "on_pre_dismiss", "on_dismiss")
 
@@ -561,6 +622,8 @@ class MDFileManager(ThemableBehavior, RelativeLayout):
         if self.preview:
             self.ext = [".png", ".jpg", ".jpeg"]
         self.disks = []
+        self._pending_items = []
+        self._trigger_add_items = Clock.create_trigger(self._add_items)
 
     def show_disks(self) -> None:
         if platform == "win":
@@ -588,6 +651,8 @@ class MDFileManager(ThemableBehavior, RelativeLayout):
         else:
             return
 
+        directory_scanner.cancel()
+        self._pending_items = []
         self.current_path = ""
         manager_list = []
 
@@ -615,106 +680,27 @@ class MDFileManager(ThemableBehavior, RelativeLayout):
         """
         Forms the body of a directory tree.
 
+        .. versionchanged:: 2.0.0
+            The directory is read in a worker thread and the items are added
+            to the list in chunks, one chunk per frame. Listings of the
+            directories opened earlier are reused while the directories do
+            not change.
+
         :param path:
             The path to the directory that will be opened in the file manager.
         """
 
         self.current_path = path
         self.selection = []
-        dirs, files = self.get_content()
-        manager_list = []
-
-        if dirs == [] and files == []:  # selected directory
-            pass
-        elif not dirs and not files:  # directory is unavailable
-            return
-
-        if self.preview:
-            for name_dir in self.__sort_files(dirs):
-                manager_list.append(
-                    {
-                        "viewclass": "MDFileManagerItemPreview",
-                        "path": self.icon_folder,
-                        "realpath": os.path.join(path),
-                        "type": "folder",
-                        "name": name_dir,
-                        "events_callback": self.select_dir_or_file,
-                        "height": dp(150),
-                        "_selected": False,
-                    }
-                )
-            for name_file in self.__sort_files(files):
-                if (
-                    os.path.splitext(os.path.join(path, name_file))[1]
-                    in self.ext
-                ):
-                    manager_list.append(
-                        {
-                            "viewclass": "MDFileManagerItemPreview",
-                            "path": os.path.join(path, name_file),
-                            "name": name_file,
-                            "type": "files",
-                            "events_callback": self.select_dir_or_file,
-                            "height": dp(150),
-                            "_selected": False,
-                        }
-                    )
-        else:
-            for name in self.__sort_files(dirs):
-                _path = os.path.join(path, name)
-                access_string = self.get_access_string(_path)
-                if "r" not in access_string:
-                    icon = "folder-lock"
-                else:
-                    icon = "folder"
-
-                manager_list.append(
-                    {
-                        "viewclass": "MDFileManagerItem",
-                        "path": _path,
-                        "icon": icon,
-                        "dir_or_file_name": name,
-                        "events_callback": self.select_dir_or_file,
-                        "icon_color": (
-                            self.theme_cls.primaryColor
-                            if not self.icon_color
-                            else self.icon_color
-                        ),
-                        "_selected": False,
-                    }
-                )
-            for name in self.__sort_files(files):
-                if self.ext and os.path.splitext(name)[1] not in self.ext:
-                    continue
-
-                manager_list.append(
-                    {
-                        "viewclass": "MDFileManagerItem",
-                        "path": name,
-                        "icon": "file-outline",
-                        "dir_or_file_name": os.path.split(name)[1],
-                        "events_callback": self.select_dir_or_file,
-                        "icon_color": (
-                            self.theme_cls.primaryColor
-                            if not self.icon_color
-                            else self.icon_color
-                        ),
-                        "_selected": False,
-                    }
-                )
-
-        self.ids.rv.data = manager_list
-        self._show()
+        directory_scanner.submit(
+            path, partial(self._on_directory_scanned, path)
+        )
 
     def get_access_string(self, path: str) -> str:
-        access_string = ""
         if self.use_access:
-            access_data = {"r": os.R_OK, "w": os.W_OK, "x": os.X_OK}
-            for access in access_data.keys():
-                access_string += (
-                    access if os.access(path, access_data[access]) else "-"
-                )
-        return access_string
+            return get_access_string(path)
+
+        return ""
 
     def get_content(
         self,
@@ -722,42 +708,20 @@ class MDFileManager(ThemableBehavior, RelativeLayout):
         """Returns a list of the type [[Folder List], [file list]]."""
 
         try:
-            files = []
-            dirs = []
-
-            for content in os.listdir(self.current_path):
-                if os.path.isdir(os.path.join(self.current_path, content)):
-                    if self.search == "all" or self.search == "dirs":
-                        if (not self.show_hidden_files) and (
-                            content.startswith(".")
-                        ):
-                            continue
-                        else:
-                            dirs.append(content)
-
-                else:
-                    if self.search == "all" or self.search == "files":
-                        if len(self.ext) != 0:
-                            try:
-                                files.append(
-                                    os.path.join(self.current_path, content)
-                                )
-                            except IndexError:
-                                pass
-                        else:
-                            if (
-                                not self.show_hidden_files
-                                and content.startswith(".")
-                            ):
-                                continue
-                            else:
-                                files.append(content)
-
-            return dirs, files
+            entries = directory_scanner.get_cached(self.current_path)
 
+            if entries is None:
+                entries = directory_scanner.scan(self.current_path)
         except OSError:
             return None, None
 
+        dirs, files = self._filter_entries(entries)
+
+        return (
+            [entry.name for entry in dirs],
+            [self._get_file_name(entry) for entry in files],
+        )
+
     def close(self) -> None:
         """Closes the file manager window."""
 
@@ -875,6 +839,140 @@ class MDFileManager(ThemableBehavior, RelativeLayout):
         self.dispatch("on_pre_open")
         self.dispatch("on_open")
 
+    def _on_directory_scanned(self, path: str, entries: list | None) -> None:
+        if entries is None or path != self.current_path:
+            # Directory is unavailable or another directory has been opened.
+            return
+
+        dirs, files = self._filter_entries(entries)
+        manager_list = []
+        icon_color = (
+            self.theme_cls.primaryColor
+            if not self.icon_color
+            else self.icon_color
+        )
+
+        if self.preview:
+            for entry in self._sort_entries(dirs):
+                manager_list.append(
+                    {
+                        "viewclass": "MDFileManagerItemPreview",
+                        "path": self.icon_folder,
+                        "realpath": os.path.join(path),
+                        "type": "folder",
+                        "name": entry.name,
+                        "events_callback": self.select_dir_or_file,
+                        "height": dp(150),
+                        "_selected": False,
+                    }
+                )
+            for entry in self._sort_entries(files):
+                name_file = self._get_file_name(entry)
+                if os.path.splitext(entry.name)[1] in self.ext:
+                    manager_list.append(
+                        {
+                            "viewclass": "MDFileManagerItemPreview",
+                            "path": os.path.join(path, name_file),
+                            "name": name_file,
+                            "type": "files",
+                            "events_callback": self.select_dir_or_file,
+                            "height": dp(150),
+                            "_selected": False,
+                        }
+                    )
+        else:
+            for entry in self._sort_entries(dirs):
+                access_string = entry.access if self.use_access else ""
+                if "r" not in access_string:
+                    icon = "folder-lock"
+                else:
+                    icon = "folder"
+
+                manager_list.append(
+                    {
+                        "viewclass": "MDFileManagerItem",
+                        "path": os.path.join(path, entry.name),
+                        "icon": icon,
+                        "dir_or_file_name": entry.name,
+                        "events_callback": self.select_dir_or_file,
+                        "icon_color": icon_color,
+                        "_selected": False,
+                    }
+                )
+            for entry in self._sort_entries(files):
+                if self.ext and os.path.splitext(entry.name)[1] not in self.ext:
+                    continue
+
+                manager_list.append(
+                    {
+                        "viewclass": "MDFileManagerItem",
+                        "path": self._get_file_name(entry),
+                        "icon": "file-outline",
+                        "dir_or_file_name": entry.name,
+                        "events_callback": self.select_dir_or_file,
+                        "icon_color": icon_color,
+                        "_selected": False,
+                    }
+                )
+
+        self.ids.rv.data = manager_list[: self._items_per_frame]
+        self._pending_items = manager_list[self._items_per_frame :]
+
+        if self._pending_items:
+            self._trigger_add_items()
+
+        self._show()
+
+    def _add_items(self, *args) -> None:
+        """Adds the next chunk of the items to the list of the directory."""
+
+        items = self._pending_items[: self._items_per_frame]
+        self._pending_items = self._pending_items[self._items_per_frame :]
+        self.ids.rv.data.extend(items)
+
+        if self._pending_items:
+            self._trigger_add_items()
+
+    def _filter_entries(self, entries: list) -> tuple:
+        """
+        Returns the lists of the directories and files to be displayed.
+        """
+
+        dirs = []
+        files = []
+
+        for entry in entries:
+            if entry.is_dir:
+                if self.search == "all" or self.search == "dirs":
+                    if (not self.show_hidden_files) and (
+                        entry.name.startswith(".")
+                    ):
+                        continue
+                    else:
+                        dirs.append(entry)
+
+            else:
+                if self.search == "all" or self.search == "files":
+                    if len(self.ext) != 0:
+                        files.append(entry)
+                    else:
+                        if (
+                            not self.show_hidden_files
+                            and entry.name.startswith(".")
+                        ):
+                            continue
+                        else:
+                            files.append(entry)
+
+        return dirs, files
+
+    def _get_file_name(self, entry: DirectoryEntry) -> str:
+        # When files are filtered by extension, full paths are used.
+        if len(self.ext) != 0:
+            return os.path.join(self.current_path, entry.name)
+
+        return entry.name
+
     def _create_selection_button(self, *args):
         if (
             self.selector == "any"
@@ -895,34 +993,32 @@ class MDFileManager(ThemableBehavior, RelativeLayout):
             )
             self.add_widget(self.selection_button)
 
-    def __sort_files(self, files):
-        def sort_by_name(files):
-            files.sort(key=locale.strxfrm)
-            files.sort(key=str.casefold)
-            return files
+    def _sort_entries(self, entries: list) -> list:
+        def sort_by_name(entries):
+            entries.sort(key=lambda entry: locale.strxfrm(entry.name))
+            entries.sort(key=lambda entry: entry.name.casefold())
+            return entries
 
         if self.sort_by == "name":
-            sorted_files = sort_by_name(files)
+            sorted_entries = sort_by_name(entries)
         elif self.sort_by == "date":
-            _files = sort_by_name(files)
-            _sorted_files = [os.path.join(self.current_path, f) for f in _files]
-            _sorted_files.sort(key=os.path.getmtime, reverse=True)
-            sorted_files = [os.path.basename(f) for f in _sorted_files]
+            sorted_entries = sort_by_name(entries)
+            sorted_entries.sort(key=lambda entry: entry.mtime, reverse=True)
         elif self.sort_by == "size":
-            _files = sort_by_name(files)
-            _sorted_files = [os.path.join(self.current_path, f) for f in _files]
-            _sorted_files.sort(key=os.path.getsize, reverse=True)
-            sorted_files = [os.path.basename(f) for f in _sorted_files]
+            sorted_entries = sort_by_name(entries)
+            sorted_entries.sort(key=lambda entry: entry.size, reverse=True)
         elif self.sort_by == "type":
-            _files = sort_by_name(files)
-            sorted_files = sorted(
-                _files,
-                key=lambda f: (os.path.splitext(f)[1], os.path.splitext(f)[0]),
+            sorted_entries = sorted(
+                sort_by_name(entries),
+                key=lambda entry: (
+                    os.path.splitext(entry.name)[1],
+                    os.path.splitext(entry.name)[0],
+                ),
             )
         else:
-            sorted_files = files
+            sorted_entries = entries
 
         if self.sort_by_desc:
-            sorted_files.reverse()
+            sorted_entries.reverse()
 
-        return sorted_files
+        return sorted_entries
@@ -0,0 +1,214 @@
+"""
+Directory scanning for :class:`~kivymd.uix.filemanager.MDFileManager`.
+
+Directories are read with :func:`os.scandir` in a worker thread. The stat
+results of the entries are taken once from the :class:`os.DirEntry`
+objects and kept in the listing, so sorting by date or size does not access
+the file system again. Listings are cached per directory and reused while
+the modification time of the directory does not change, that is, until
+entries are added to, removed from or renamed in the directory.
+
+.. versionadded:: 2.0.0
+"""
+
+__all__ = ("DirectoryEntry", "DirectoryScanner", "directory_scanner")
+
+import os
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, NamedTuple, Union
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+
+class DirectoryEntry(NamedTuple):
+    """
+    Entry of a directory listing.
+
+    .. versionadded:: 2.0.0
+    """
+
+    name: str
+    is_dir: bool
+    mtime: float
+    size: int
+    access: str
+    """Access string (for example, `'rwx'` or `'r-x'`) for directories."""
+
+
+def get_access_string(path: str) -> str:
+    """Returns the access string of the path, for example, `'rw-'`."""
+
+    return "".join(
+        access if os.access(path, mode) else "-"
+        for access, mode in (("r", os.R_OK), ("w", os.W_OK), ("x", os.X_OK))
+    )
+
+
+class DirectoryScanner:
+    """
+    Reads directories in a worker thread and caches the listings.
+
+    Only the latest request is processed: requests submitted while the
+    worker is busy replace each other, a running scan is stopped when a new
+    request is submitted, and the results of the outdated requests are
+    discarded. The callback is called on the main thread.
+
+    .. versionadded:: 2.0.0
+    """
+
+    max_listings = 32
+    """Maximum number of cached directory listings."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._pending = None
+        self._request = 0
+        self._thread = None
+        # {path: (modification time of the directory, entries)}
+        self._listings = OrderedDict()
+
+    def submit(self, path: str, callback: Callable) -> None:
+        """
+        Requests the listing of the directory. The `callback` receives the
+        list of :class:`DirectoryEntry` or `None` if the directory is
+        unavailable.
+
+        Cached listings that are still valid are passed to the callback
+        immediately.
+        """
+
+        entries = self.get_cached(path)
+
+        with self._condition:
+            self._request += 1
+
+            if entries is None:
+                self._pending = (self._request, path, callback)
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, daemon=True
+                    )
+                    self._thread.start()
+                self._condition.notify()
+                return
+
+            self._pending = None
+
+        callback(entries)
+
+    def cancel(self) -> None:
+        """Discards the pending and running requests."""
+
+        with self._condition:
+            self._request += 1
+            self._pending = None
+
+    def get_cached(self, path: str) -> Union[list, None]:
+        """
+        Returns the cached listing of the directory or `None` if the
+        directory is not cached or has been changed.
+        """
+
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        with self._condition:
+            listing = self._listings.get(path)
+
+            if listing is None or listing[0] != mtime:
+                return None
+
+            self._listings.move_to_end(path)
+
+            return listing[1]
+
+    def invalidate(self, path: Union[str, None] = None) -> None:
+        """Removes the listing of the directory or all listings."""
+
+        with self._condition:
+            if path is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(path, None)
+
+    def scan(self, path: str, request: Union[int, None] = None) -> list:
+        """
+        Reads the directory and caches the listing.
+
+        :param request:
+            Number of the request that started the scan. The scan returns
+            an incomplete listing, which is not cached, as soon as a newer
+            request is submitted.
+        :raises OSError: if the directory is unavailable.
+        """
+
+        mtime = os.stat(path).st_mtime_ns
+        entries = []
+
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                if request is not None and request != self._request:
+                    return entries
+
+                try:
+                    is_dir = entry.is_dir()
+                    stat = entry.stat()
+                    mtime_entry = stat.st_mtime
+                    size = stat.st_size
+                except OSError:
+                    # Broken symbolic links.
+                    is_dir = False
+                    mtime_entry = 0
+                    size = 0
+
+                entries.append(
+                    DirectoryEntry(
+                        entry.name,
+                        is_dir,
+                        mtime_entry,
+                        size,
+                        get_access_string(entry.path) if is_dir else "",
+                    )
+                )
+
+        with self._condition:
+            self._listings[path] = (mtime, entries)
+            self._listings.move_to_end(path)
+
+            while len(self._listings) > self.max_listings:
+                self._listings.popitem(last=False)
+
+        return entries
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                request, path, callback = self._pending
+                self._pending = None
+
+            try:
+                entries = self.scan(path, request)
+            except OSError as error:
+                Logger.warning(f"KivyMD: Directory is not available: {error}")
+                entries = None
+
+            Clock.schedule_once(partial(self._done, request, entries, callback))
+
+    def _done(self, request, entries, callback, *args) -> None:
+        if request == self._request:
+            callback(entries)
+
+
+directory_scanner = DirectoryScanner()
+"""
+Scanner shared by all file managers.
+
+.. versionadded:: 2.0.0
+"""
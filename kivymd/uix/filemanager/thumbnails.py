@@ -0,0 +1,197 @@
+"""
+Thumbnails for :class:`~kivymd.uix.filemanager.MDFileManager` in `preview`
+mode.
+
+Images are decoded at the resolution of the tile in a pool of worker
+threads. Decoded thumbnails are saved to a cache on disk, keyed by the path,
+modification time and size of the image file, and their textures are kept
+in a bounded in-memory LRU cache.
+
+.. versionadded:: 2.0.0
+"""
+
+__all__ = ("ThumbnailCache", "thumbnail_cache")
+
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Union
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.graphics.texture import Texture
+from kivy.logger import Logger
+
+
+class ThumbnailCache:
+    """
+    Decodes thumbnails of images in worker threads and caches them.
+
+    Requests for the same thumbnail made while it is being decoded share
+    one decode. A request that is canceled before its decode has started is
+    removed from the queue.
+
+    .. versionadded:: 2.0.0
+    """
+
+    max_textures = 128
+    """Maximum number of thumbnail textures kept in memory."""
+
+    max_workers = 2
+    """Number of worker threads decoding images."""
+
+    def __init__(self, cache_dir: Union[str, None] = None):
+        self.cache_dir = cache_dir
+        """
+        Directory of the disk cache. If `None`, the `kivymd_thumbnails`
+        directory in :attr:`~kivy.app.App.user_data_dir` is used.
+        """
+
+        self.decoded = 0
+        """Number of images decoded from the source files."""
+
+        self._textures = OrderedDict()  # {key: texture}
+        self._callbacks = {}  # {key: [callback, ...]}
+        self._futures = {}  # {key: future}
+        self._executor = None
+
+    def request(
+        self, path: str, size: int, callback: Callable
+    ) -> Union[tuple, None]:
+        """
+        Requests the thumbnail of the image with the larger side of `size`
+        pixels. The `callback` receives the path and the texture (or `None`
+        on error) on the main thread.
+
+        Textures cached in memory are passed to the callback immediately.
+        Returns the key of the request for :meth:`cancel`.
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            callback(path, None)
+            return None
+
+        key = (path, stat.st_mtime_ns, stat.st_size, int(size))
+        texture = self._textures.get(key)
+
+        if texture is not None:
+            self._textures.move_to_end(key)
+            callback(path, texture)
+            return key
+
+        self._callbacks.setdefault(key, []).append(callback)
+
+        if key not in self._futures:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="kivymd-thumbnails",
+                )
+            future = self._executor.submit(
+                self._load, key, self._get_cache_dir()
+            )
+            self._futures[key] = future
+            future.add_done_callback(
+                lambda future: Clock.schedule_once(
+                    partial(self._done, key, future)
+                )
+            )
+
+        return key
+
+    def cancel(self, key: Union[tuple, None], callback: Callable) -> None:
+        """Cancels the request made by :meth:`request`."""
+
+        callbacks = self._callbacks.get(key)
+
+        if not callbacks or callback not in callbacks:
+            return
+
+        callbacks.remove(callback)
+
+        if not callbacks and self._futures[key].cancel():
+            del self._callbacks[key]
+            del self._futures[key]
+
+    def clear(self) -> None:
+        """Releases the textures cached in memory."""
+
+        self._textures.clear()
+
+    def _get_cache_dir(self) -> Union[str, None]:
+        if self.cache_dir:
+            return self.cache_dir
+
+        app = App.get_running_app()
+
+        if app is None:
+            return None
+
+        return os.path.join(app.user_data_dir, "kivymd_thumbnails")
+
+    def _load(self, key: tuple, cache_dir: Union[str, None]) -> tuple:
+        from PIL import Image
+
+        path, mtime, file_size, size = key
+        cache_path = None
+
+        if cache_dir:
+            name = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+            cache_path = os.path.join(cache_dir, f"{name}.png")
+
+            if os.path.exists(cache_path):
+                with Image.open(cache_path) as image:
+                    image = image.convert("RGBA")
+                    return image.size, image.tobytes()
+
+        with Image.open(path) as image:
+            image.draft("RGB", (size, size))
+            image.thumbnail((size, size))
+            image = image.convert("RGBA")
+
+        self.decoded += 1
+
+        if cache_path:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                image.save(cache_path)
+            except OSError as error:
+                Logger.warning(f"KivyMD: Failed to cache thumbnail: {error}")
+
+        return image.size, image.tobytes()
+
+    def _done(self, key, future, *args) -> None:
+        if future.cancelled():
+            return
+
+        callbacks = self._callbacks.pop(key, [])
+        self._futures.pop(key, None)
+
+        try:
+            size, data = future.result()
+        except Exception as error:
+            Logger.warning(f"KivyMD: Failed to load thumbnail: {error}")
+            texture = None
+        else:
+            texture = Texture.create(size=size, colorfmt="rgba")
+            texture.blit_buffer(data, colorfmt="rgba", bufferfmt="ubyte")
+            texture.flip_vertical()
+            self._textures[key] = texture
+
+            while len(self._textures) > self.max_textures:
+                self._textures.popitem(last=False)
+
+        for callback in callbacks:
+            callback(key[0], texture)
+
+
+thumbnail_cache = ThumbnailCache()
+"""
+Thumbnail cache shared by all file managers.
+
+.. versionadded:: 2.0.0
+"""
@@ -1283,13 +1283,97 @@ Using multiple heroes at the same time
 
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/hero-multiple-heroes.gif
     :align: center
+
+Hero registry
+-------------
+
+.. versionadded:: 2.0.0
+
+:class:`~MDHeroFrom` widgets add themselves to the :data:`~hero_registry`
+by their tags when they are added to a parent widget and remove themselves
+when they are removed from it, so the
+:class:`~kivymd.uix.screenmanager.MDScreenManager` finds the heroes of the
+:attr:`~kivymd.uix.screenmanager.MDScreenManager.current_heroes` tags
+without walking the widget trees of its screens.
 """
 
+__all__ = ("HeroRegistry", "MDHeroFrom", "MDHeroTo", "hero_registry")
+
+import weakref
+
 from kivy.properties import StringProperty
 
 from kivymd.uix.boxlayout import MDBoxLayout
 
 
+class HeroRegistry:
+    """
+    Index of the :class:`~MDHeroFrom` widgets by their tags.
+
+    The registry keeps weak references to the widgets.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self):
+        # {tag: {id(widget): weakref.ref(widget)}}
+        self._heroes = {}
+        # {id(widget): tag}
+        self._tags = {}
+
+    def register(self, widget, tag: str) -> None:
+        """Adds the widget to the heroes of the tag."""
+
+        uid = id(widget)
+
+        if self._tags.get(uid) == tag:
+            return
+
+        self.unregister(widget)
+        self._tags[uid] = tag
+        self._heroes.setdefault(tag, {})[uid] = weakref.ref(
+            widget, lambda ref, uid=uid: self._forget(uid)
+        )
+
+    def unregister(self, widget) -> None:
+        """Removes the widget from the registry."""
+
+        self._forget(id(widget))
+
+    def get_heroes(self, tag: str) -> list:
+        """Returns the registered widgets with the tag."""
+
+        heroes = []
+
+        for ref in self._heroes.get(tag, {}).values():
+            widget = ref()
+
+            if widget is not None:
+                heroes.append(widget)
+
+        return heroes
+
+    def _forget(self, uid: int) -> None:
+        tag = self._tags.pop(uid, None)
+
+        if tag is None:
+            return
+
+        heroes = self._heroes[tag]
+        del heroes[uid]
+
+        if not heroes:
+            del self._heroes[tag]
+
+
+hero_registry = HeroRegistry()
+"""
+Registry of the heroes of all screen managers.
+
+.. versionadded:: 2.0.0
+"""
+
+
 class MDHeroFrom(MDBoxLayout):
     """
     The container from which the hero begins his flight.
@@ -1316,6 +1400,9 @@ class MDHeroFrom(MDBoxLayout):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.fbind("parent", self._update_registry)
+        self.fbind("tag", self._update_registry)
+        self._update_registry()
 
     def on_transform_in(self, *args):
         """Fired when the hero flies from screen **A** to screen **B**."""
@@ -1323,6 +1410,12 @@ class MDHeroFrom(MDBoxLayout):
     def on_transform_out(self, *args):
         """Fired when the hero back from screen **B** to screen **A**."""
 
+    def _update_registry(self, *args) -> None:
+        if self.parent is not None and self.tag:
+            hero_registry.register(self, self.tag)
+        else:
+            hero_registry.unregister(self)
+
 
 class MDHeroTo(MDBoxLayout):
     """
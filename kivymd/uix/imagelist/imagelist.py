@@ -220,7 +220,6 @@ __all__ = ["MDSmartTile", "MDSmartTileOverlayContainer", "MDSmartTileImage"]
 import os
 
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.properties import BooleanProperty, ObjectProperty, OptionProperty
 from kivy.uix.behaviors import ButtonBehavior
 
@@ -229,11 +228,9 @@ from kivymd.uix.behaviors import RectangularRippleBehavior
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.fitimage import FitImage
 from kivymd.uix.relativelayout import MDRelativeLayout
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "imagelist", "imagelist.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "imagelist", "imagelist.kv"))
 
 
 class MDSmartTileImage(RectangularRippleBehavior, ButtonBehavior, FitImage):
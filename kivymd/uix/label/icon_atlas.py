@@ -0,0 +1,285 @@
+"""
+Glyph atlas for :class:`~kivymd.uix.label.label.MDIcon`.
+
+The glyphs of the icon font are rendered once per font size in white into
+shared atlas textures. Icons draw the regions of the atlas tinted with their
+color, so icons do not render text and do not create textures of their own,
+and changing the color of an icon does not render anything.
+
+The glyphs that are not used by any icon are kept in the atlas and their
+cells are reused, least recently used first, when a page of the atlas is
+full.
+
+.. versionadded:: 2.0.0
+"""
+
+__all__ = ("IconAtlas", "icon_atlas")
+
+from collections import OrderedDict
+from typing import Union
+
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics.texture import Texture, TextureRegion
+
+
+class _Glyph:
+    __slots__ = ("group", "slot", "texture", "pixels", "references")
+
+    def __init__(self, group, slot, texture, pixels):
+        self.group = group
+        self.slot = slot
+        self.texture = texture
+        self.pixels = pixels
+        self.references = 0
+
+
+class _GlyphGroup:
+    """Pages of the glyphs of the same font and size."""
+
+    def __init__(self, cell: tuple, page_size: int):
+        self.cell = cell
+        self.page_size = page_size
+        self.columns = page_size // (cell[0] + 1)
+        self.rows = page_size // (cell[1] + 1)
+        self.pages = []
+        self.glyphs = {}  # {slot: glyph}
+        self.next_slot = 0
+
+    def add_page(self) -> Texture:
+        size = self.page_size
+        page = Texture.create(size=(size, size), colorfmt="rgba")
+        page.blit_buffer(bytes(size * size * 4), colorfmt="rgba")
+        page.add_reload_observer(self._reload_page)
+        self.pages.append(page)
+
+        return page
+
+    def get_position(self, slot: int) -> tuple:
+        page, cell = divmod(slot, self.columns * self.rows)
+        row, column = divmod(cell, self.columns)
+
+        return (
+            self.pages[page],
+            column * (self.cell[0] + 1),
+            row * (self.cell[1] + 1),
+        )
+
+    def blit(self, glyph: _Glyph) -> None:
+        page, x, y = self.get_position(glyph.slot)
+        page.blit_buffer(
+            glyph.pixels, pos=(x, y), size=glyph.texture.size, colorfmt="rgba"
+        )
+
+    def _reload_page(self, page: Texture) -> None:
+        page.blit_buffer(bytes(self.page_size**2 * 4), colorfmt="rgba")
+
+        for glyph in self.glyphs.values():
+            if self.get_position(glyph.slot)[0] is page:
+                self.blit(glyph)
+
+
+class IconAtlas:
+    """
+    Shared atlas of the rendered glyphs.
+
+    .. versionadded:: 2.0.0
+    """
+
+    page_size = 512
+    """Width and height of the pages of the atlas."""
+
+    max_pages = 4
+    """Maximum number of the pages for each font size."""
+
+    def __init__(self):
+        self.hits = 0
+        """Number of the glyphs taken from the atlas."""
+
+        self.misses = 0
+        """Number of the glyphs rendered into the atlas."""
+
+        self.evictions = 0
+        """Number of the glyphs removed from the atlas."""
+
+        self._groups = {}  # {(font_name, font_size, line_height): group}
+        self._glyphs = {}  # {key: glyph}
+        # Glyphs that are not used by any icon in the order of use.
+        self._unused = OrderedDict()
+        self._blank_texture = None
+
+    @property
+    def blank_texture(self) -> Texture:
+        """Transparent texture of one pixel."""
+
+        if self._blank_texture is None:
+            self._blank_texture = Texture.create(size=(1, 1), colorfmt="rgba")
+            self._blank_texture.blit_buffer(bytes(4), colorfmt="rgba")
+
+        return self._blank_texture
+
+    @staticmethod
+    def make_key(
+        text: str, font_name: str, font_size: float, line_height: float
+    ) -> tuple:
+        """Returns the key of the glyph of `text` for :meth:`acquire`."""
+
+        return font_name, round(font_size), line_height, text
+
+    def acquire(self, key: tuple) -> Union[TextureRegion, None]:
+        """
+        Returns the region of the atlas with the glyph and adds the glyph to
+        the atlas if necessary. The glyph stays in the atlas until
+        :meth:`release` is called with the key.
+
+        Returns `None` if the glyph does not fit into the atlas.
+        """
+
+        glyph = self._glyphs.get(key)
+
+        if glyph is None:
+            glyph = self._add_glyph(key)
+
+            if glyph is None:
+                return None
+
+            self.misses += 1
+        else:
+            self.hits += 1
+
+            if not glyph.references:
+                del self._unused[key]
+
+        glyph.references += 1
+
+        return glyph.texture
+
+    def release(self, key: tuple) -> None:
+        """Releases the glyph acquired with :meth:`acquire`."""
+
+        glyph = self._glyphs.get(key)
+
+        if glyph is None or not glyph.references:
+            return
+
+        glyph.references -= 1
+
+        if not glyph.references:
+            self._unused[key] = glyph
+
+    def get_stats(self) -> dict:
+        """
+        Returns the statistics of the atlas:
+
+        - `hit_rate`: share of the glyphs taken from the atlas;
+        - `glyphs`: number of the glyphs in the atlas;
+        - `references`: number of the icons that use the atlas;
+        - `pages`: number of the textures of the atlas;
+        - `atlas_bytes`: memory of the textures of the atlas;
+        - `saved_bytes`: memory of the textures that the icons would
+          create without the atlas minus `atlas_bytes`.
+        """
+
+        requests = self.hits + self.misses
+        references = 0
+        icon_bytes = 0
+
+        for glyph in self._glyphs.values():
+            width, height = glyph.texture.size
+            references += glyph.references
+            icon_bytes += glyph.references * width * height * 4
+
+        pages = sum(len(group.pages) for group in self._groups.values())
+        atlas_bytes = pages * self.page_size**2 * 4
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / requests if requests else 0,
+            "glyphs": len(self._glyphs),
+            "references": references,
+            "pages": pages,
+            "atlas_bytes": atlas_bytes,
+            "saved_bytes": icon_bytes - atlas_bytes,
+        }
+
+    def _add_glyph(self, key: tuple) -> Union[_Glyph, None]:
+        font_name, font_size, line_height, text = key
+        label = CoreLabel(
+            text=text,
+            font_name=font_name,
+            font_size=font_size,
+            line_height=line_height,
+            color=(1, 1, 1, 1),
+        )
+        label.refresh()
+        texture = label.texture
+
+        if texture is None:
+            return None
+
+        group_key = key[:3]
+        group = self._groups.get(group_key)
+
+        if group is None:
+            # Some glyphs of the font are a few pixels larger than the font
+            # size.
+            side = int(max(font_size, texture.height) * 1.125) + 1
+            group = _GlyphGroup((side, side), self.page_size)
+
+            if not group.columns or not group.rows:
+                return None
+
+            self._groups[group_key] = group
+
+        if texture.width > group.cell[0] or texture.height > group.cell[1]:
+            return None
+
+        slot = self._allocate_slot(group)
+
+        if slot is None:
+            return None
+
+        page, x, y = group.get_position(slot)
+        region = page.get_region(x, y, texture.width, texture.height)
+
+        # The rendered text is flipped with the texture coordinates.
+        if texture.uvsize[1] < 0:
+            region.flip_vertical()
+
+        glyph = _Glyph(group, slot, region, texture.pixels)
+        group.glyphs[slot] = glyph
+        group.blit(glyph)
+        self._glyphs[key] = glyph
+
+        return glyph
+
+    def _allocate_slot(self, group: _GlyphGroup) -> Union[int, None]:
+        capacity = group.columns * group.rows
+
+        if group.next_slot < capacity * self.max_pages:
+            if group.next_slot == capacity * len(group.pages):
+                group.add_page()
+            group.next_slot += 1
+
+            return group.next_slot - 1
+
+        # Reuses the cell of the least recently used glyph.
+        for key, glyph in self._unused.items():
+            if glyph.group is group:
+                del self._unused[key]
+                del self._glyphs[key]
+                del group.glyphs[glyph.slot]
+                self.evictions += 1
+
+                return glyph.slot
+
+        return None
+
+
+icon_atlas = IconAtlas()
+"""
+Atlas shared by all icons.
+
+.. versionadded:: 2.0.0
+"""
@@ -880,6 +880,7 @@ from __future__ import annotations
 __all__ = ("MDLabel", "MDIcon")
 
 import os
+import weakref
 
 from kivy.animation import Animation
 from kivy.clock import Clock
@@ -906,11 +907,11 @@ from kivymd.uix.behaviors import (
     TouchBehavior,
 )
 from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
+from kivymd.uix.label.icon_atlas import icon_atlas
+from kivymd.uix.label.texture_cache import label_texture_cache
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "label", "label.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "label", "label.kv"))
 
 
 class MDLabel(
@@ -1048,13 +1049,89 @@ class MDLabel(
     and defaults to `[0, 0, 0, 0]`.
     """
 
+    use_texture_cache = BooleanProperty(False)
+    """
+    Whether to take the texture of the text from the shared
+    :class:`~kivymd.uix.label.texture_cache.LabelTextureCache` if another
+    label has rendered the same text with the same style and to add the
+    rendered texture to the cache.
+
+    Useful for the labels of the views of
+    :class:`~kivy.uix.recycleview.RecycleView`, which show the same strings
+    again when the list is scrolled:
+
+    .. code-block:: kv
+
+        <MDListItemHeadlineText>
+            use_texture_cache: True
+
+    .. versionadded:: 2.0.0
+
+    :attr:`use_texture_cache` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
     _canvas_bg = ObjectProperty(allownone=True)
+    # kivymd.uix.label.texture_cache._CachedTexture object.
+    _cached_texture = None
+    # Properties of the label that the theme colors of the label depend on.
+    _theme_color_dependencies = (
+        "text_color",
+        "label_opacity_value_disabled_text",
+    )
 
     __events__ = ("on_copy", "on_selection", "on_cancel_selection")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # The colors that are not set by the KV rules of the label follow
+        # the color scheme. They are refreshed once per new scheme from
+        # `on_colors_changed`, not from the observers of each color.
+        self._theme_color_names = {"color", "disabled_color"}.difference(
+            *(rule.properties for rule in Builder.match(self))
+        )
+        if self._theme_color_names:
+            for name in self._theme_color_dependencies:
+                self.fbind(name, self._update_theme_colors)
+            self.theme_cls.bind(on_colors_changed=self._update_theme_colors)
+            self._update_theme_colors()
+
+    def texture_update(self, *args) -> None:
+        """
+        Updates the texture of the text, from the texture cache if
+        :attr:`use_texture_cache` is `True`.
+
+        .. versionadded:: 2.0.0
+        """
+
+        self._cached_texture = None
+
+        if not self.use_texture_cache or not self.text:
+            super().texture_update(*args)
+            return
+
+        key = label_texture_cache.make_key(self._label, self.text)
+        cached = label_texture_cache.get(key)
+
+        if cached is None:
+            super().texture_update(*args)
+            self._cached_texture = label_texture_cache.add(
+                key, self._label, self.is_shortened, self.refs, self.anchors
+            )
+            return
+
+        # The label keeps the cached texture to render it again when the
+        # OpenGL context is lost after the texture is removed from the cache.
+        self._cached_texture = cached
+        self.texture = cached.texture
+        self.texture_size = list(cached.texture.size)
+        self.is_shortened = cached.is_shortened
+
+        if self.markup:
+            self.refs = cached.refs
+            self.anchors = cached.anchors
+
     def do_selection(self) -> None:
         if not self.is_selected:
             self.md_bg_color = (
@@ -1178,6 +1255,23 @@ class MDLabel(
         if self._canvas_bg:
             self._canvas_bg.pos = pos
 
+    def _get_theme_colors(self) -> tuple:
+        # The text color and the disabled text color in the current scheme.
+        theme_cls = self.theme_cls
+        return (
+            self.text_color if self.text_color else theme_cls.onSurfaceColor,
+            theme_cls.onSurfaceColor[:-1]
+            + [self.label_opacity_value_disabled_text],
+        )
+
+    def _update_theme_colors(self, *args) -> None:
+        color, disabled_color = self._get_theme_colors()
+
+        if "color" in self._theme_color_names:
+            self.color = color
+        if "disabled_color" in self._theme_color_names:
+            self.disabled_color = disabled_color
+
 
 class MDIcon(MDLabel):
     """
@@ -1224,8 +1318,113 @@ class MDIcon(MDLabel):
     and defaults to `None`.
     """
 
+    use_atlas = BooleanProperty(False)
+    """
+    Whether to draw the glyph of the icon from the shared
+    :class:`~kivymd.uix.label.icon_atlas.IconAtlas` instead of rendering
+    the icon into a texture of its own.
+
+    The atlas is used for the icons of the `Icons` font without markup,
+    outline, padding and :attr:`~kivy.uix.label.Label.text_size`. The icon
+    is rendered as a label if the glyph does not fit into the atlas.
+
+    The atlas pays off for screens with many icons, such as long lists and
+    grids, and is opt-in, so the icons of existing applications keep their
+    own textures.
+
+    .. code-block:: kv
+
+        MDIcon:
+            icon: "home"
+            use_atlas: True
+
+    .. versionadded:: 2.0.0
+
+    :attr:`use_atlas` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    _theme_color_dependencies = (
+        "icon_color",
+        "icon_color_disabled",
+        "label_opacity_value_disabled_text",
+    )
+
     # kivymd.uix.badge.badge.MDBadge object.
     _badge = ObjectProperty()
+    # Region of the icon atlas with the glyph of the icon.
+    _glyph_texture = ObjectProperty(None, allownone=True)
+    _glyph_key = None
+    _glyph_release = None
+
+    def _get_theme_colors(self) -> tuple:
+        theme_cls = self.theme_cls
+        return (
+            (
+                self.icon_color
+                if self.icon_color
+                else theme_cls.onSurfaceVariantColor
+            ),
+            (
+                self.icon_color_disabled
+                if self.icon_color_disabled
+                else theme_cls.onSurfaceColor[:-1]
+                + [self.label_opacity_value_disabled_text]
+            ),
+        )
+
+    def on_use_atlas(self, instance, value: bool) -> None:
+        """Fired when the :attr:`use_atlas` value changes."""
+
+        self._trigger_texture()
+
+    def texture_update(self, *args) -> None:
+        """
+        Updates the texture of the icon from the icon atlas or renders the
+        icon as a label.
+
+        .. versionadded:: 2.0.0
+        """
+
+        key = None
+
+        if (
+            self.use_atlas
+            and self.font_name == "Icons"
+            and len(self.text) == 1
+            and not self.markup
+            and not self.outline_width
+            and not any(self.padding)
+            and self.text_size[0] is None
+            and self.text_size[1] is None
+        ):
+            key = icon_atlas.make_key(
+                self.text, self.font_name, self.font_size, self.line_height
+            )
+
+            # The color of the glyph is set by the canvas of the icon.
+            if key == self._glyph_key:
+                return
+
+        texture = icon_atlas.acquire(key) if key else None
+
+        # The glyph is released when the icon is changed or deleted.
+        if self._glyph_release:
+            self._glyph_release()
+            self._glyph_release = None
+
+        if texture is None:
+            self._glyph_key = None
+            self._glyph_texture = None
+            super().texture_update(*args)
+            return
+
+        self._glyph_key = key
+        self._glyph_release = weakref.finalize(self, icon_atlas.release, key)
+        self._glyph_texture = texture
+        self.texture = icon_atlas.blank_texture
+        self.texture_size = list(texture.size)
+        self.is_shortened = False
 
     def add_widget(self, widget, index=0, canvas=None):
         from kivymd.uix.badge import MDBadge
@@ -0,0 +1,231 @@
+"""
+Texture cache for :class:`~kivymd.uix.label.label.MDLabel`.
+
+Labels with :attr:`~kivymd.uix.label.label.MDLabel.use_texture_cache` take
+the texture of their text from the cache when another label has already
+rendered the same text with the same style, so the views of a
+:class:`~kivy.uix.recycleview.RecycleView` that are bound to the strings
+shown before do not render them again.
+
+The key of a texture is the text, the text size and all the options of the
+core label that affect rendering: the font name and size, alignment, color,
+markup, padding and so on. The cache keeps the textures up to the
+:attr:`LabelTextureCache.max_bytes` budget and removes the least recently
+used ones first.
+
+.. versionadded:: 2.0.0
+"""
+
+__all__ = ("LabelTextureCache", "label_texture_cache")
+
+from collections import OrderedDict
+from typing import Union
+
+from kivy.core.text import LabelBase
+from kivy.graphics.texture import Texture
+
+# Options of the core label that do not affect the texture or are passed
+# separately.
+_ignored_options = ("text", "text_size", "font_name_r")
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze(item)) for key, item in value.items())
+        )
+
+    return value
+
+
+def _copy(value):
+    # Copies the observable lists and dicts of the widget properties.
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+
+    return value
+
+
+class _CachedTexture:
+    __slots__ = (
+        "texture",
+        "is_shortened",
+        "refs",
+        "anchors",
+        "size",
+        "label_class",
+        "text",
+        "usersize",
+        "options",
+        "__weakref__",
+    )
+
+    def __init__(self, texture, label: LabelBase, is_shortened, refs, anchors):
+        self.texture = texture
+        self.is_shortened = is_shortened
+        self.refs = refs
+        self.anchors = anchors
+        self.size = texture.width * texture.height * 4
+        # The text and options to render the texture again when the OpenGL
+        # context is lost.
+        self.label_class = label.__class__
+        self.text = label.text
+        self.usersize = _copy(label.usersize)
+        self.options = _copy(
+            {
+                name: value
+                for name, value in label.options.items()
+                if name not in _ignored_options
+            }
+        )
+
+    def reload(self, texture: Texture) -> None:
+        label = self.label_class(**self.options)
+        label.text = self.text
+        label.usersize = self.usersize
+        # The label renders into the texture of the same size.
+        label.texture = texture
+        label.refresh()
+
+
+class LabelTextureCache:
+    """
+    Shared cache of the rendered label textures.
+
+    .. versionadded:: 2.0.0
+    """
+
+    max_bytes = 32 * 1024 * 1024
+    """Maximum memory of the cached textures in bytes."""
+
+    def __init__(self):
+        self.hits = 0
+        """Number of the textures taken from the cache."""
+
+        self.misses = 0
+        """Number of the textures that are not in the cache."""
+
+        self.evictions = 0
+        """Number of the textures removed from the cache."""
+
+        self.bytes = 0
+        """Memory of the cached textures in bytes."""
+
+        self._textures = OrderedDict()  # {key: cached texture}
+
+    @staticmethod
+    def make_key(label: LabelBase, text: str) -> tuple:
+        """
+        Returns the key of the texture of `text` rendered by the core label
+        with its current options.
+        """
+
+        return (
+            label.__class__,
+            text,
+            _freeze(label.usersize),
+            tuple(
+                (name, _freeze(value))
+                for name, value in sorted(label.options.items())
+                if name not in _ignored_options
+            ),
+        )
+
+    def get(self, key: tuple) -> Union[_CachedTexture, None]:
+        """Returns the cached texture of the key or `None`."""
+
+        cached = self._textures.get(key)
+
+        if cached is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._textures.move_to_end(key)
+
+        return cached
+
+    def add(
+        self,
+        key: tuple,
+        label: LabelBase,
+        is_shortened: bool = False,
+        refs: dict = None,
+        anchors: dict = None,
+    ) -> Union[_CachedTexture, None]:
+        """
+        Adds the texture that the core label has rendered to the cache and
+        returns the cached texture or `None` if the texture is not cached.
+
+        The core label stops using the texture, so it renders the next text
+        into a new texture. The texture is rendered again when the OpenGL
+        context is lost while the returned object is referenced by the cache
+        or by the labels showing the texture.
+        """
+
+        texture = label.texture
+
+        if (
+            texture is None
+            or texture is label.texture_1px
+            or key in self._textures
+            or texture.width * texture.height * 4 > self.max_bytes
+        ):
+            return None
+
+        # The texture is filled when it is drawn, the text of the label may
+        # change before that.
+        texture.bind()
+        texture.remove_reload_observer(label._texture_refresh)
+        label.texture = None
+        cached = _CachedTexture(texture, label, is_shortened, refs, anchors)
+        texture.add_reload_observer(cached.reload)
+        self._textures[key] = cached
+        self.bytes += cached.size
+
+        while self.bytes > self.max_bytes:
+            _, evicted = self._textures.popitem(last=False)
+            self.bytes -= evicted.size
+            self.evictions += 1
+
+        return cached
+
+    def clear(self) -> None:
+        """Removes all textures from the cache."""
+
+        self._textures.clear()
+        self.bytes = 0
+
+    def get_stats(self) -> dict:
+        """
+        Returns the statistics of the cache:
+
+        - `hit_rate`: share of the textures taken from the cache;
+        - `textures`: number of the cached textures;
+        - `bytes`: memory of the cached textures.
+        """
+
+        requests = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / requests if requests else 0,
+            "textures": len(self._textures),
+            "bytes": self.bytes,
+        }
+
+
+label_texture_cache = LabelTextureCache()
+"""
+Cache shared by all labels.
+
+.. versionadded:: 2.0.0
+"""
@@ -13,4 +13,7 @@ from .list import (
     MDListItemTrailingCheckbox,
     MDListItemTrailingIcon,
     MDListItemTrailingSupportingText,
+    MDRecycleList,
+    MDRecycleListItem,
+    MDRecycleListLayout,
 )
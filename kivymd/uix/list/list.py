@@ -353,6 +353,58 @@ List item with trailing check
 
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/headline-supporting-tertiary-leading-trailing-check-list.png
     :align: center
+
+Recycled list
+-------------
+
+.. versionadded:: 2.0.0
+
+Every :class:`~MDListItem` is a tree of widgets, so a list with thousands of
+items is slow to build and takes a lot of memory. :class:`~MDRecycleList`
+takes the items as dictionaries and creates views only for the visible items.
+The views are reused when the list scrolls:
+
+.. tabs::
+
+    .. tab:: Declarative KV style
+
+        .. code-block:: kv
+
+            MDRecycleList:
+                id: contacts
+
+        .. code-block:: python
+
+            self.root.ids.contacts.data = [
+                {
+                    "headline_text": f"Contact {i}",
+                    "supporting_text": f"+1 555 {i:04d}",
+                    "leading_icon": "account",
+                    "trailing_checkbox": True,
+                }
+                for i in range(5000)
+            ]
+
+    .. tab:: Declarative Python style
+
+        .. code-block:: python
+
+            MDRecycleList(
+                data=[
+                    {
+                        "headline_text": f"Contact {i}",
+                        "supporting_text": f"+1 555 {i:04d}",
+                        "leading_icon": "account",
+                        "trailing_checkbox": True,
+                    }
+                    for i in range(5000)
+                ],
+            )
+
+The keys of the dictionaries are the properties of
+:class:`~MDRecycleListItem`. The height of an item is computed from the
+number of its lines and is cached, the `height` key sets the height of an
+item explicitly.
 """
 
 from __future__ import annotations
@@ -371,21 +423,27 @@ __all__ = (
     "MDListItemTrailingCheckbox",
     "MDListItemLeadingAvatar",
     "MDListItemTertiaryText",
+    "MDRecycleList",
+    "MDRecycleListItem",
+    "MDRecycleListLayout",
 )
 
 import os
 
 from kivy import Logger
 from kivy.clock import Clock
-from kivy.lang import Builder
+from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
     ColorProperty,
     NumericProperty,
     ObjectProperty,
+    StringProperty,
 )
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.recyclelayout import RecycleLayoutManagerBehavior
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 
 from kivymd import uix_path
 from kivymd.theming import ThemableBehavior
@@ -399,12 +457,12 @@ from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
 from kivymd.uix.fitimage import FitImage
 from kivymd.uix.gridlayout import MDGridLayout
 from kivymd.uix.label import MDIcon, MDLabel
+from kivymd.uix.recycleboxlayout import MDRecycleBoxLayout
+from kivymd.uix.recycleview import MDRecycleView
 from kivymd.uix.selectioncontrol import MDCheckbox
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "list", "list.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "list", "list.kv"))
 
 
 class MDList(MDGridLayout):
@@ -655,3 +713,333 @@ class MDListItem(BaseListItem, BoxLayout):
 
     def _set_with_container(self, container, widget):
         container.width = widget.width
+
+
+class MDRecycleListItem(RecycleDataViewBehavior, MDListItem):
+    """
+    Implements a list item view of :class:`~MDRecycleList`.
+
+    The item creates its headline, supporting, tertiary text, leading and
+    trailing widgets once and shows the ones that are set in the data of the
+    current item.
+
+    .. versionadded:: 2.0.0
+
+    For more information, see in the
+    :class:`~kivy.uix.recycleview.views.RecycleDataViewBehavior` and
+    :class:`~MDListItem`
+    classes documentation.
+    """
+
+    headline_text = StringProperty()
+    """
+    Headline text of the list item.
+
+    :attr:`headline_text` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    supporting_text = StringProperty()
+    """
+    Supporting text of the list item.
+
+    :attr:`supporting_text` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    tertiary_text = StringProperty()
+    """
+    Tertiary text of the list item.
+
+    :attr:`tertiary_text` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    leading_icon = StringProperty()
+    """
+    Leading icon of the list item.
+
+    :attr:`leading_icon` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    leading_avatar = StringProperty()
+    """
+    Path to the leading avatar image of the list item.
+
+    :attr:`leading_avatar` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    leading_checkbox = BooleanProperty(False)
+    """
+    Whether to show a leading checkbox.
+
+    :attr:`leading_checkbox` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    trailing_text = StringProperty()
+    """
+    Trailing supporting text of the list item.
+
+    :attr:`trailing_text` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    trailing_icon = StringProperty()
+    """
+    Trailing icon of the list item.
+
+    :attr:`trailing_icon` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    trailing_checkbox = BooleanProperty(False)
+    """
+    Whether to show a trailing checkbox.
+
+    :attr:`trailing_checkbox` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    active = BooleanProperty(False)
+    """
+    State of the checkbox of the list item. The state is written back to the
+    data of the item, so it is kept when the view is reused.
+
+    :attr:`active` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    index = None
+    """The index of the data item shown by the view."""
+
+    # The values of the keys that the data of an item may leave out, so that
+    # a reused view does not show the values of the previous item.
+    _data_defaults = {
+        "headline_text": "",
+        "supporting_text": "",
+        "tertiary_text": "",
+        "leading_icon": "",
+        "leading_avatar": "",
+        "leading_checkbox": False,
+        "trailing_text": "",
+        "trailing_icon": "",
+        "trailing_checkbox": False,
+        "active": False,
+    }
+    _part_classes = {
+        "headline": MDListItemHeadlineText,
+        "supporting": MDListItemSupportingText,
+        "tertiary": MDListItemTertiaryText,
+        "leading_icon": MDListItemLeadingIcon,
+        "leading_avatar": MDListItemLeadingAvatar,
+        "leading_checkbox": MDListItemTrailingCheckbox,
+        "trailing_text": MDListItemTrailingSupportingText,
+        "trailing_icon": MDListItemTrailingIcon,
+        "trailing_checkbox": MDListItemTrailingCheckbox,
+    }
+
+    def __init__(self, *args, **kwargs):
+        self._parts = {}
+        self._recycleview = None
+        super().__init__(*args, **kwargs)
+
+    def refresh_view_attrs(self, rv, index, data) -> None:
+        self.index = index
+        self._recycleview = rv
+        attrs = dict(self._data_defaults)
+        attrs.update(data)
+        super().refresh_view_attrs(rv, index, attrs)
+        self._update_parts()
+
+    def on_active(self, instance, value: bool) -> None:
+        if self.index is None or self._recycleview is None:
+            return
+        data = self._recycleview.data
+        if self.index < len(data) and data[self.index].get("active") != value:
+            # The data dictionary is changed in place, so the list is not
+            # refreshed.
+            data[self.index]["active"] = value
+
+    def _update_parts(self) -> None:
+        text_parts = [
+            self._get_part(name, text=text)
+            for name, text in (
+                ("headline", self.headline_text),
+                ("supporting", self.supporting_text),
+                ("tertiary", self.tertiary_text),
+            )
+            if text
+        ]
+        if self.leading_avatar:
+            leading = self._get_part(
+                "leading_avatar", source=self.leading_avatar
+            )
+        elif self.leading_icon:
+            leading = self._get_part("leading_icon", icon=self.leading_icon)
+        elif self.leading_checkbox:
+            leading = self._get_part("leading_checkbox", active=self.active)
+        else:
+            leading = None
+        if self.trailing_checkbox:
+            trailing = self._get_part("trailing_checkbox", active=self.active)
+        elif self.trailing_icon:
+            trailing = self._get_part("trailing_icon", icon=self.trailing_icon)
+        elif self.trailing_text:
+            trailing = self._get_part("trailing_text", text=self.trailing_text)
+        else:
+            trailing = None
+
+        pos_hint = {"top": 1} if len(text_parts) == 3 else {"center_y": 0.5}
+        self._set_parts(self.ids.text_container, text_parts)
+        for container, part in (
+            (self.ids.leading_container, leading),
+            (self.ids.trailing_container, trailing),
+        ):
+            if part is None:
+                self._set_parts(container, [])
+                container.width = 0
+            else:
+                part.pos_hint = pos_hint
+                self._set_parts(container, [part])
+                container.width = part.width
+
+    def _get_part(self, name: str, **attrs):
+        part = self._parts.get(name)
+        if part is None:
+            part = self._parts[name] = self._part_classes[name]()
+            if name == "leading_avatar":
+                part._list_item = self
+            elif name.endswith("checkbox"):
+                part.bind(active=self.setter("active"))
+            if name.startswith(("leading", "trailing")):
+                part.bind(width=self._on_part_width)
+        for key, value in attrs.items():
+            setattr(part, key, value)
+        return part
+
+    def _set_parts(self, container, parts: list) -> None:
+        if container.children[::-1] != parts:
+            container.clear_widgets()
+            for part in parts:
+                container.add_widget(part)
+
+    def _on_part_width(self, part, width: float) -> None:
+        if part.parent:
+            part.parent.width = width
+
+
+class MDRecycleListLayout(MDRecycleBoxLayout):
+    """
+    Layout of the items of :class:`~MDRecycleList`.
+
+    The layout caches the height of each item, so the height of the whole
+    list is known without creating the views. An item without the `height`
+    key gets the height of the :class:`~MDListItem` with the same number of
+    lines, after the item was shown it gets the height of its view.
+
+    .. versionadded:: 2.0.0
+
+    For more information, see in the
+    :class:`~kivymd.uix.recycleboxlayout.MDRecycleBoxLayout`
+    class documentation.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._height_cache = {}
+        super().__init__(*args, **kwargs)
+
+    def get_item_height(self, index: int, data: dict) -> float:
+        """Returns the cached height of the item with the given index."""
+
+        height = self._height_cache.get(index)
+        if height is None:
+            lines = sum(
+                1
+                for key in ("headline_text", "supporting_text", "tertiary_text")
+                if data.get(key)
+            )
+            height = self._height_cache[index] = dp(
+                {0: 100, 1: 56, 2: 72, 3: 88}[lines]
+            )
+        return height
+
+    def compute_sizes_from_data(self, data, flags) -> None:
+        self._update_height_cache(flags)
+        super().compute_sizes_from_data(data, flags)
+        get_item_height = self.get_item_height
+        for index, opt in enumerate(self.view_opts):
+            if opt["height_none"]:
+                opt["size"][1] = get_item_height(index, data[index])
+
+    def compute_layout(self, data, flags) -> None:
+        super().compute_layout(data, flags)
+        # The views of the items with a different height keep their
+        # height in the cache.
+        view_opts = self.view_opts
+        for view, index in self.view_indices.items():
+            if view_opts[index]["height_none"]:
+                self._height_cache[index] = view.height
+
+    def _update_height_cache(self, flags) -> None:
+        cache = self._height_cache
+        if [flag for flag in flags if not flag]:
+            cache.clear()
+            return
+        for flag in flags:
+            for key, value in flag.items():
+                if key == "modified":
+                    for index in range(*value.indices(len(self.view_opts))):
+                        cache.pop(index, None)
+                elif key in ("removed", "inserted"):
+                    # The indices of the next items change.
+                    start = value.start if isinstance(value, slice) else value
+                    for index in [index for index in cache if index >= start]:
+                        del cache[index]
+
+
+class MDRecycleList(MDRecycleView):
+    """
+    Implements a list that creates views only for the visible items.
+
+    The items are set in :attr:`~kivy.uix.recycleview.RecycleView.data` as
+    dictionaries with the properties of :class:`~MDRecycleListItem`.
+    The list creates :class:`~MDRecycleListLayout` as its layout, a layout
+    that is added to the list replaces it.
+
+    .. versionadded:: 2.0.0
+
+    For more information, see in the
+    :class:`~kivymd.uix.recycleview.MDRecycleView`
+    class documentation.
+    """
+
+    _default_layout = None
+
+    def __init__(self, *args, **kwargs):
+        # RecycleView loses the data and the view class that are passed
+        # before its data model and its layout exist.
+        data = kwargs.pop("data", None)
+        viewclass = kwargs.pop("viewclass", MDRecycleListItem)
+        super().__init__(*args, **kwargs)
+        if self.layout_manager is None:
+            self._default_layout = MDRecycleListLayout()
+            self.add_widget(self._default_layout)
+        self.viewclass = viewclass
+        if data is not None:
+            self.data = data
+
+    def add_widget(self, widget, *args, **kwargs):
+        default_layout = self._default_layout
+        if (
+            isinstance(widget, RecycleLayoutManagerBehavior)
+            and default_layout is not None
+            and default_layout is not widget
+        ):
+            self._default_layout = None
+            self.remove_widget(default_layout)
+            if not widget.viewclass:
+                widget.viewclass = default_layout.viewclass
+        return super().add_widget(widget, *args, **kwargs)
@@ -94,8 +94,6 @@ Usage
 import os
 
 from kivy.animation import Animation
-from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     ColorProperty,
@@ -108,12 +106,10 @@ from materialshapes.kivy_widget import MaterialShape  # NOQA
 
 from kivymd import uix_path
 from kivymd.uix.behaviors import DeclarativeBehavior, RotateBehavior
+from kivymd.utils.frame_ticker import frame_ticker
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "loadingindicator", "loadingindicator.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "loadingindicator", "loadingindicator.kv"))
 
 
 class MDLoadingIndicator(DeclarativeBehavior, AnchorLayout, RotateBehavior):
@@ -215,7 +211,7 @@ class MDLoadingIndicator(DeclarativeBehavior, AnchorLayout, RotateBehavior):
     and defaults to `0`.
     """
 
-    _intrvl = None
+    _elapsed = 0
 
     def start(self, *args):
         """
@@ -229,16 +225,21 @@ class MDLoadingIndicator(DeclarativeBehavior, AnchorLayout, RotateBehavior):
         """
 
         self._run_cycle()
-        self.stop()
-        self._intrvl = Clock.schedule_interval(self._run_cycle, self.duration)
+        self._elapsed = 0
+        # The cycles are paused while the indicator is not visible.
+        frame_ticker.add(self, self._tick)
 
     def stop(self, *args):
         """Stop the loading animation."""
 
-        if self._intrvl is not None:
-            self._intrvl.cancel()
+        frame_ticker.remove(self)
 
-        self._intrvl = None
+    def _tick(self, dt):
+        self._elapsed += dt
+
+        if self._elapsed >= self.duration:
+            self._elapsed = 0
+            self._run_cycle()
 
     def _run_cycle(self, *args):
         """
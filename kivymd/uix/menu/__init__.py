@@ -1 +1,5 @@
-from .menu import MDDropdownMenu  # NOQA F401
+from .menu import (  # NOQA F401
+    MDDropdownMenu,
+    MDDropdownMenuPool,
+    dropdown_menu_pool,
+)
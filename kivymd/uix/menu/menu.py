@@ -789,6 +789,35 @@ Center position
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/menu-position-center.gif
     :align: center
 
+Menu pool
+=========
+
+.. versionadded:: 2.0.0
+
+Creating a menu takes tens of milliseconds. Instead of creating a new menu
+every time the caller is pressed, take the menu from
+:data:`dropdown_menu_pool`: dismissed menus return to the pool and are
+reused with new :attr:`~MDDropdownMenu.items` and
+:attr:`~MDDropdownMenu.caller`, together with their item widgets.
+
+.. code-block:: python
+
+    from kivymd.uix.menu import dropdown_menu_pool
+
+
+    class Example(MDApp):
+        def on_start(self):
+            # Creates a menu and the widgets of the items in the idle frames.
+            dropdown_menu_pool.prewarm()
+
+        def menu_open(self, caller):
+            dropdown_menu_pool.acquire(caller=caller, items=menu_items).open()
+
+The properties that are not passed to
+:meth:`~MDDropdownMenuPool.acquire` get their default values. Callbacks bound
+to the events of a pooled menu stay bound when it is reused, so pass the
+callbacks in the :attr:`~MDDropdownMenu.items`.
+
 API break
 =========
 
@@ -1039,6 +1068,8 @@ from __future__ import annotations
 __all__ = (
     "BaseDropdownItem",
     "MDDropdownMenu",
+    "MDDropdownMenuPool",
+    "dropdown_menu_pool",
     "MDDropdownTextItem",
     "MDDropdownLeadingIconItem",
     "MDDropdownTrailingIconItem",
@@ -1049,10 +1080,13 @@ __all__ = (
 )
 
 import os
+import time
+from functools import partial
 
+from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.lang import Builder
+from kivy.factory import Factory
 from kivy.metrics import dp
 from kivy.properties import (
     ColorProperty,
@@ -1065,6 +1099,7 @@ from kivy.properties import (
 )
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataAdapter
 
 from kivymd import uix_path
 from kivymd.uix.behaviors import RectangularRippleBehavior, StencilBehavior
@@ -1072,13 +1107,11 @@ from kivymd.uix.behaviors.motion_behavior import MotionDropDownMenuBehavior
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDLabel
+from kivymd.utils.kv_loader import load_kv
 
 # from kivymd.uix.list import IRightBody
 
-with open(
-    os.path.join(uix_path, "menu", "menu.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "menu", "menu.kv"))
 
 
 class MDMenu(RecycleView):
@@ -1495,13 +1528,11 @@ class MDDropdownMenu(MotionDropDownMenuBehavior, StencilBehavior, MDCard):
 
     __events__ = ("on_dismiss",)
 
+    _pool = None
+    _pool_properties = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        Window.bind(
-            on_resize=self._remove_menu,
-            on_maximize=self._remove_menu,
-            on_restore=self._remove_menu,
-        )
         self.menu = self.ids.md_menu
         self.target_height = 0
 
@@ -1799,7 +1830,8 @@ class MDDropdownMenu(MotionDropDownMenuBehavior, StencilBehavior, MDCard):
 
         def add_content_header_cls(interval):
             self.ids.content_header.clear_widgets()
-            self.ids.content_header.add_widget(instance_user_menu_header)
+            if instance_user_menu_header:
+                self.ids.content_header.add_widget(instance_user_menu_header)
 
         Clock.schedule_once(add_content_header_cls, 1)
 
@@ -1823,11 +1855,196 @@ class MDDropdownMenu(MotionDropDownMenuBehavior, StencilBehavior, MDCard):
 
         self.on_dismiss()
 
+    def on_parent(self, instance, parent) -> None:
+        # The window is observed only while the menu is open.
+        if parent is Window:
+            Window.bind(
+                on_resize=self._remove_menu,
+                on_maximize=self._remove_menu,
+                on_restore=self._remove_menu,
+            )
+        elif parent is None:
+            Window.unbind(
+                on_resize=self._remove_menu,
+                on_maximize=self._remove_menu,
+                on_restore=self._remove_menu,
+            )
+
+            if self._pool is not None:
+                self._pool.release(self)
+
     def _remove_menu(self, *args):
         Window.remove_widget(self)
         self.set_scale()
 
 
+class MDDropdownMenuPool:
+    """
+    Pool of the dismissed :class:`MDDropdownMenu` objects.
+
+    Menus taken from the pool with :meth:`acquire` return to the pool when
+    they are dismissed. Up to :attr:`max_idle` returned menus are kept for
+    reuse with their item widgets.
+
+    .. versionadded:: 2.0.0
+    """
+
+    max_idle = 4
+    """
+    The maximum number of idle menus kept in the pool.
+
+    :attr:`max_idle` is an :class:`int` and defaults to `4`.
+    """
+
+    # Properties that the menu changes when it is opened.
+    _reset_properties = ("width", "position", "ver_growth", "hor_growth")
+
+    def __init__(self):
+        self._idle = []
+        self._prewarm_tasks = []
+        self._prewarm_event = None
+        self.hits = 0
+        """The number of the menus taken from the pool."""
+        self.misses = 0
+        """The number of the menus created by :meth:`acquire`."""
+        self.created = 0
+        """The total number of the menus created by the pool."""
+        self.construction_time = 0.0
+        """The total time in seconds spent creating the menus."""
+
+    def acquire(self, **kwargs) -> MDDropdownMenu:
+        """
+        Returns an idle menu with the given properties or a new menu if the
+        pool is empty.
+        """
+
+        if self._idle:
+            menu = self._idle.pop()
+            self.hits += 1
+
+            for name in self._reset_properties + menu._pool_properties:
+                # The caller does not allow `None`.
+                if name not in kwargs and name != "caller":
+                    setattr(menu, name, menu.property(name).defaultvalue)
+
+            for name, value in kwargs.items():
+                setattr(menu, name, value)
+
+            menu._initial_width = menu.width
+        else:
+            menu = self._create(**kwargs)
+            self.misses += 1
+
+        menu._pool_properties = tuple(kwargs)
+
+        return menu
+
+    def release(self, menu: MDDropdownMenu) -> None:
+        """
+        Returns the menu to the pool. Dismissed menus are returned
+        automatically.
+        """
+
+        if menu.parent is not None or menu in self._idle:
+            return
+
+        Animation.cancel_all(menu)
+        menu.set_scale()
+
+        if len(self._idle) < self.max_idle:
+            self._idle.append(menu)
+
+    def prewarm(
+        self,
+        count: int = 1,
+        viewclasses: tuple = ("MDDropdownTextItem",),
+        views: int = 8,
+    ) -> None:
+        """
+        Creates `count` menus and `views` widgets of each of the
+        `viewclasses` of the items, one per frame, so the menus opened later
+        are taken from the pool and do not create their item widgets.
+
+        The widgets of the items are put into the cache shared by the
+        recycle views, which keeps at least `views` widgets of each class.
+        """
+
+        count = min(count, self.max_idle - len(self._idle))
+        self._prewarm_tasks.extend([self._prewarm_menu] * max(0, count))
+
+        for viewclass in viewclasses:
+            task = partial(
+                self._prewarm_view, RecycleDataAdapter(), viewclass, views
+            )
+            self._prewarm_tasks.extend([task] * views)
+
+        if self._prewarm_tasks and self._prewarm_event is None:
+            self._prewarm_event = Clock.schedule_interval(
+                self._run_prewarm_task, 0
+            )
+
+    def get_stats(self) -> dict:
+        """
+        Returns the counters of the pool: `hits`, `misses`, `created`,
+        `idle`, `hit_rate` and `construction_time`.
+        """
+
+        requests = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "created": self.created,
+            "idle": len(self._idle),
+            "hit_rate": self.hits / requests if requests else 0,
+            "construction_time": self.construction_time,
+        }
+
+    def _create(self, **kwargs) -> MDDropdownMenu:
+        start = time.perf_counter()
+        menu = MDDropdownMenu(**kwargs)
+        self.construction_time += time.perf_counter() - start
+        self.created += 1
+        menu._pool = self
+
+        return menu
+
+    def _run_prewarm_task(self, *args):
+        self._prewarm_tasks.pop(0)()
+
+        if not self._prewarm_tasks:
+            self._prewarm_event.cancel()
+            self._prewarm_event = None
+
+    def _prewarm_menu(self) -> None:
+        if len(self._idle) < self.max_idle:
+            self._idle.append(self._create())
+
+    def _prewarm_view(
+        self, adapter: RecycleDataAdapter, viewclass: str, views: int
+    ) -> None:
+        # The adapter keeps its views and gets one more view each frame.
+        # Invalidating the adapter moves the views to the cache that recycle
+        # views take the widgets of their items from.
+        count = len(adapter.views) + 1
+        adapter.set_visible_views(
+            range(count),
+            [{}] * count,
+            [{"viewclass": Factory.get(viewclass)}] * count,
+        )
+
+        if count >= views:
+            adapter.invalidate()
+
+
+dropdown_menu_pool = MDDropdownMenuPool()
+"""
+Pool of the menus shared by the application.
+
+.. versionadded:: 2.0.0
+"""
+
+
 if __name__ == "__main__":
     # To test the correct menu position.
     from kivy.lang import Builder
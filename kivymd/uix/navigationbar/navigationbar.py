@@ -501,7 +501,6 @@ import os
 
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -521,13 +520,10 @@ from kivymd.uix.behaviors import (
 )
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.label import MDIcon, MDLabel
+from kivymd.utils.kv_loader import load_kv
 from kivymd.utils.set_bars_colors import set_bars_colors
 
-with open(
-    os.path.join(uix_path, "navigationbar", "navigationbar.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "navigationbar", "navigationbar.kv"))
 
 
 class MDNavigationItemLabel(MDLabel):
@@ -732,7 +732,6 @@ from kivy.animation import Animation, AnimationTransition
 from kivy.core.window import Window
 from kivy.graphics.context_instructions import Color
 from kivy.graphics.vertex_instructions import Rectangle
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     AliasProperty,
@@ -763,12 +762,9 @@ from kivymd.uix.list import (
     MDListItemTrailingSupportingText,
 )
 from kivymd.uix.scrollview import MDScrollView
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "navigationdrawer", "navigationdrawer.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "navigationdrawer", "navigationdrawer.kv"))
 
 
 class NavigationDrawerContentError(Exception):
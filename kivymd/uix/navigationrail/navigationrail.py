@@ -411,7 +411,6 @@ from kivy.graphics import (
     StencilUnUse,
     StencilUse,
 )
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -436,12 +435,9 @@ from kivymd.uix.behaviors import (
 from kivymd.uix.behaviors.focus_behavior import StateFocusBehavior
 from kivymd.uix.button import MDFabButton, MDIconButton
 from kivymd.uix.label import MDIcon, MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "navigationrail", "navigationrail.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "navigationrail", "navigationrail.kv"))
 
 
 class MDNavigationRailFabButton(MDFabButton):
@@ -842,7 +842,6 @@ from itertools import zip_longest
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -878,12 +877,9 @@ from kivymd.uix.textfield import (
     MDTextFieldHelperText,
     MDTextFieldHintText,
 )
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "pickers", "datepicker", "datepicker.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "pickers", "datepicker", "datepicker.kv"))
 
 
 class MDDatePickerTypeDateError(Exception):
@@ -685,7 +685,6 @@ from typing import List
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -712,12 +711,9 @@ from kivymd.uix.behaviors.motion_behavior import MotionTimePickerBehavior
 from kivymd.uix.circularlayout import MDCircularLayout
 from kivymd.uix.label import MDLabel
 from kivymd.uix.textfield import MDTextField
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "pickers", "timepicker", "timepicker.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "pickers", "timepicker", "timepicker.kv"))
 
 
 class MDBaseTimePicker(ThemableBehavior, MotionTimePickerBehavior, BoxLayout):
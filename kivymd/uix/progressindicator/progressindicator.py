@@ -337,7 +337,6 @@ import os
 
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -354,12 +353,9 @@ from kivy.uix.widget import Widget
 from kivymd import uix_path
 from kivymd.theming import ThemableBehavior
 from kivymd.uix.behaviors import DeclarativeBehavior
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "progressindicator", "progressindicator.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "progressindicator", "progressindicator.kv"))
 
 
 class MDLinearProgressIndicator(
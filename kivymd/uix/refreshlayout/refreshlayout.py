@@ -220,7 +220,6 @@ from typing import Union
 from kivy.animation import Animation
 from kivy.core.window import Window
 from kivy.effects.dampedscroll import DampedScrollEffect
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     ColorProperty,
@@ -233,12 +232,9 @@ from kivy.uix.floatlayout import FloatLayout
 from kivymd import uix_path
 from kivymd.theming import ThemableBehavior
 from kivymd.uix.scrollview import MDScrollView
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "refreshlayout", "refreshlayout.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "refreshlayout", "refreshlayout.kv"))
 
 
 class _RefreshScrollEffect(DampedScrollEffect):
@@ -127,6 +127,8 @@ Equivalent
 
 __all__ = ("MDScreen",)
 
+from typing import Union
+
 from kivy.properties import ListProperty, ObjectProperty
 from kivy.uix.screenmanager import Screen
 
@@ -192,3 +194,21 @@ class MDScreen(
                 f"class or inherited from this class"
             )
         self.heroes_to = [widget]
+
+    def save_state(self) -> Union[dict, None]:
+        """
+        Returns the state of the screen that is passed to the
+        :meth:`restore_state` method of the new screen when the
+        :class:`~kivymd.uix.screenmanager.MDScreenManager` removes the screen
+        built by a factory and builds it again.
+
+        .. versionadded:: 2.0.0
+        """
+
+    def restore_state(self, state: dict) -> None:
+        """
+        Restores the state returned by the :meth:`save_state` method of the
+        removed screen.
+
+        .. versionadded:: 2.0.0
+        """
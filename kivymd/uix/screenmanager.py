@@ -144,19 +144,71 @@ Equivalent
 
     size_hint: None, None
     size: self.minimum_size
+
+Lazy screens
+------------
+
+.. versionadded:: 2.0.0
+
+Screens can be registered by name with a factory that builds them when they
+are shown for the first time, so the application does not build all screens
+at startup:
+
+.. code-block:: python
+
+    from kivymd.app import MDApp
+    from kivymd.uix.screen import MDScreen
+    from kivymd.uix.screenmanager import MDScreenManager
+
+
+    class SettingsScreen(MDScreen):
+        ...
+
+
+    class MyApp(MDApp):
+        def build(self):
+            screen_manager = MDScreenManager(max_screens=5)
+            screen_manager.add_widget(MDScreen(name="home"))
+            screen_manager.register_screen("settings", SettingsScreen)
+            return screen_manager
+
+
+    MyApp().run()
+
+The screen is built when it becomes current, e.g.
+`screen_manager.current = "settings"`, or when it is requested with the
+:meth:`~MDScreenManager.get_screen` method.
+
+When more than :attr:`~MDScreenManager.max_screens` screens built by the
+factories are in the screen manager, the least recently shown of them are
+removed and built again when they are shown. The screens keep their state
+with the :meth:`~kivymd.uix.screen.MDScreen.save_state` and
+:meth:`~kivymd.uix.screen.MDScreen.restore_state` methods:
+
+.. code-block:: python
+
+    class SettingsScreen(MDScreen):
+        def save_state(self) -> dict:
+            return {"scroll_y": self.ids.scroll.scroll_y}
+
+        def restore_state(self, state: dict) -> None:
+            self.ids.scroll.scroll_y = state["scroll_y"]
 """
 
 __all__ = ("MDScreenManager",)
 
+from collections import OrderedDict
+from typing import Callable
+
 from kivy import Logger
 from kivy.clock import Clock
-from kivy.properties import ListProperty, StringProperty
-from kivy.uix.screenmanager import ScreenManager
+from kivy.properties import ListProperty, NumericProperty, StringProperty
+from kivy.uix.screenmanager import Screen, ScreenManager
 
 from kivymd.theming import ThemableBehavior
 from kivymd.uix import MDAdaptiveWidget
 from kivymd.uix.behaviors import BackgroundColorBehavior, DeclarativeBehavior
-from kivymd.uix.hero import MDHeroFrom
+from kivymd.uix.hero import MDHeroFrom, hero_registry
 
 
 class MDScreenManager(
@@ -207,14 +259,87 @@ class MDScreenManager(
     and defaults to `[]`.
     """
 
-    # Collection of `MDHeroFrom` objects on all screens of the current
-    # screen manager.
-    _heroes_data = ListProperty()
+    max_screens = NumericProperty(0)
+    """
+    Maximum number of the screens built by the factories of the
+    :meth:`register_screen` method that are kept in the screen manager.
+    The least recently shown screens are removed when there are more screens
+    and built again when they are shown. `0` means no limit.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`max_screens` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
+    """
 
     def __init__(self, *args, **kwargs):
+        # {screen name: factory}
+        self._screen_factories = {}
+        # The names of the screens built by the factories, the least
+        # recently shown first.
+        self._built_screens = OrderedDict()
+        # {screen name: state saved by the removed screen}
+        self._screen_states = {}
         super().__init__(*args, **kwargs)
         Clock.schedule_once(self.check_transition)
 
+    def register_screen(self, name: str, factory: Callable[[], Screen]) -> None:
+        """
+        Registers the factory that builds the screen with the name when it is
+        requested for the first time.
+
+        .. versionadded:: 2.0.0
+
+        :type name: str;
+        :param name: name of the screen;
+        :type factory: callable;
+        :param factory: callable without arguments, e.g. a screen class, that
+            returns a new screen;
+        """
+
+        self._screen_factories[name] = factory
+
+    def unregister_screen(self, name: str) -> None:
+        """
+        Removes the factory of the screen and its saved state.
+        The built screen stays in the screen manager.
+
+        .. versionadded:: 2.0.0
+        """
+
+        self._screen_factories.pop(name, None)
+        self._built_screens.pop(name, None)
+        self._screen_states.pop(name, None)
+
+    def get_screen(self, name: str) -> Screen:
+        """
+        Returns the screen with the name. Builds the screen registered with
+        the :meth:`register_screen` method if it is not built.
+        """
+
+        if name in self._screen_factories and not super().has_screen(name):
+            self._build_screen(name)
+
+        return super().get_screen(name)
+
+    def has_screen(self, name: str) -> bool:
+        """
+        Returns `True` if the screen with the name is in the screen manager
+        or is registered with the :meth:`register_screen` method.
+        """
+
+        return name in self._screen_factories or super().has_screen(name)
+
+    def on_current(self, instance, value: str) -> None:
+        super().on_current(instance, value)
+
+        if value in self._built_screens:
+            self._built_screens.move_to_end(value)
+            self._remove_unused_screens()
+
+    def on_max_screens(self, instance, value: int) -> None:
+        self._remove_unused_screens()
+
     def check_transition(self, *args) -> None:
         """Sets the default type transition."""
 
@@ -229,17 +354,18 @@ class MDScreenManager(
         """
         Get a list of :class:`~kivymd.uix.hero.MDHeroFrom` objects according
         to the tag names specified in the :attr:`~current_heroes` list.
+
+        .. versionchanged:: 2.0.0
+            The heroes are taken from the
+            :data:`~kivymd.uix.hero.hero_registry`.
         """
 
         hero_from_widget = []
 
         for name_hero in self.current_heroes:
-            for hero_widget in self._heroes_data:
-                if isinstance(hero_widget, MDHeroFrom) or issubclass(
-                    hero_widget.__class__, MDHeroFrom
-                ):
-                    if hero_widget.tag == name_hero:
-                        hero_from_widget.append(hero_widget)
+            for hero_widget in hero_registry.get_heroes(name_hero):
+                if self._get_hero_manager(hero_widget) is self:
+                    hero_from_widget.append(hero_widget)
 
         return hero_from_widget
 
@@ -260,30 +386,63 @@ class MDScreenManager(
         else:
             self.current_heroes = []
 
-    def add_widget(self, widget, *args, **kwargs):
-        super().add_widget(widget, *args, **kwargs)
-        Clock.schedule_once(lambda x: self._create_heroes_data(widget))
-
-    # TODO: Add a method to delete an object from the attr:`_heroes_data`
-    #  collection when deleting an object using the `remove_widget` method.
-
-    def _create_heroes_data(self, widget):
-        def find_hero_widget(child_widget):
-            widget_hero = None
-
-            for w in child_widget.children:
-                if isinstance(w, MDHeroFrom) or issubclass(
-                    w.__class__, MDHeroFrom
-                ):
-                    self._heroes_data.append(w)
-                find_hero_widget(w)
-
-            return widget_hero
-
-        for child in widget.children:
-            if isinstance(child, MDHeroFrom) or issubclass(
-                child.__class__, MDHeroFrom
-            ):
-                self._heroes_data.append(child)
-            else:
-                find_hero_widget(child)
+    def remove_widget(self, widget, *args, **kwargs):
+        super().remove_widget(widget, *args, **kwargs)
+
+        if isinstance(widget, Screen) and widget.manager is None:
+            self._built_screens.pop(widget.name, None)
+
+    def _build_screen(self, name: str) -> None:
+        screen = self._screen_factories[name]()
+        screen.name = name
+        state = self._screen_states.pop(name, None)
+
+        if state is not None and hasattr(screen, "restore_state"):
+            screen.restore_state(state)
+
+        self._built_screens[name] = True
+        self.add_widget(screen)
+
+    def _remove_unused_screens(self, *args) -> None:
+        if not self.max_screens or len(self._built_screens) <= self.max_screens:
+            return
+
+        transition = self.transition
+        # The screens of the current transition are removed when it
+        # completes.
+        used_screens = {self.current_screen}
+
+        transition.unbind(on_complete=self._remove_unused_screens)
+
+        if transition.is_active:
+            used_screens.add(transition.screen_out)
+            transition.bind(on_complete=self._remove_unused_screens)
+
+        for name in list(self._built_screens):
+            if len(self._built_screens) <= self.max_screens:
+                break
+
+            screen = super().get_screen(name)
+
+            if screen in used_screens:
+                continue
+
+            if hasattr(screen, "save_state"):
+                state = screen.save_state()
+
+                if state is not None:
+                    self._screen_states[name] = state
+
+            self.remove_widget(screen)
+
+    @staticmethod
+    def _get_hero_manager(hero: MDHeroFrom):
+        # Returns the manager of the screen of the hero.
+        widget = hero.parent
+
+        while widget is not None:
+            if isinstance(widget, Screen):
+                return widget.manager
+            widget = widget.parent
+
+        return None
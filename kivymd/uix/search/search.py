@@ -407,7 +407,6 @@ import os
 
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -426,11 +425,9 @@ from kivymd.font_definitions import theme_font_styles
 from kivymd.uix.behaviors import DeclarativeBehavior
 from kivymd.uix.label import MDIcon
 from kivymd.utils import next_frame
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "search", "search.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "search", "search.kv"))
 
 
 class MDSearchTrailingAvatar(ButtonBehavior, Image):
@@ -645,7 +645,6 @@ import os
 
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp, sp
 from kivy.properties import (
     BooleanProperty,
@@ -670,12 +669,12 @@ from kivymd.uix.behaviors import (
 from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.label import MDIcon, MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
+load_kv(
     os.path.join(uix_path, "segmentedbutton", "segmentedbutton.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read(), filename="MDSegmentedButton")
+    filename="MDSegmentedButton",
+)
 
 
 class MDSegmentedButtonItem(
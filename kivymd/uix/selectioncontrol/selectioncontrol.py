@@ -474,7 +474,6 @@ import os
 
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -490,12 +489,9 @@ from kivymd.uix.behaviors import CircularRippleBehavior, ScaleBehavior
 from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
 from kivymd.uix.floatlayout import MDFloatLayout
 from kivymd.uix.label import MDIcon
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "selectioncontrol", "selectioncontrol.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "selectioncontrol", "selectioncontrol.kv"))
 
 
 class ActiveBehavior:
@@ -68,7 +68,6 @@ import os
 
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     ColorProperty,
@@ -90,11 +89,9 @@ from kivymd.uix.behaviors import (
 )
 from kivymd.uix.behaviors.focus_behavior import StateFocusBehavior
 from kivymd.uix.label import MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "slider", "slider.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "slider", "slider.kv"))
 
 
 class MDSlider(DeclarativeBehavior, ThemableBehavior, Slider):
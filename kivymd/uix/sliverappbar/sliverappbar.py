@@ -320,11 +320,9 @@ from kivymd.theming import ThemableBehavior
 from kivymd.uix.appbar import MDTopAppBar
 from kivymd.uix.behaviors import DeclarativeBehavior
 from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "sliverappbar", "sliverappbar.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "sliverappbar", "sliverappbar.kv"))
 
 
 class MDSliverAppbarException(Exception):
@@ -270,7 +270,6 @@ import os
 
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -286,11 +285,9 @@ from kivymd.uix.behaviors import DeclarativeBehavior, MotionShackBehavior
 from kivymd.uix.button import MDButton, MDButtonText, MDIconButton
 from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "snackbar", "snackbar.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "snackbar", "snackbar.kv"))
 
 
 class MDSnackbarButtonContainer(DeclarativeBehavior, BoxLayout):
@@ -186,11 +186,9 @@ from kivy.utils import platform
 from kivymd import uix_path
 from kivymd.uix.behaviors import DeclarativeBehavior
 from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "swiper", "swiper.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "swiper", "swiper.kv"))
 
 
 # TODO: Redesign this module according to the specification -
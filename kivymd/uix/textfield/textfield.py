@@ -322,7 +322,6 @@ from datetime import date
 
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -342,11 +341,9 @@ from kivymd.theming import ThemableBehavior, ThemeManager
 from kivymd.uix.behaviors import BackgroundColorBehavior, DeclarativeBehavior
 from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
 from kivymd.uix.label import MDIcon, MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "textfield", "textfield.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "textfield", "textfield.kv"))
 
 
 # TODO: Add a class to work with the phone number mask.
@@ -1766,7 +1763,7 @@ class MDTextField(
         super().__init__(*args, **kwargs)
         self.bind(text=self.set_text)
         self.bind(_lines=self.adjust_height)
-        self.theme_cls.bind(
+        self.bind_theme(
             primary_palette=self.update_colors,
             theme_style=self.update_colors,
         )
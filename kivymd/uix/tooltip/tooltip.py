@@ -337,7 +337,6 @@ import os
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -359,11 +358,9 @@ from kivymd.uix.behaviors import (
 from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
 from kivymd.uix.button import MDButton
 from kivymd.uix.label import MDLabel
+from kivymd.utils.kv_loader import load_kv
 
-with open(
-    os.path.join(uix_path, "tooltip", "tooltip.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+load_kv(os.path.join(uix_path, "tooltip", "tooltip.kv"))
 
 
 class MDTooltip(TouchBehavior):
@@ -26,6 +26,32 @@ You have multiple transitions available by default, such as:
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/transition-md-fade-slide-transition.gif
     :align: center
 
+Transform mode
+--------------
+
+.. versionadded:: 2.0.0
+
+By default :class:`MDFadeSlideTransition` and :class:`MDSharedAxisTransition`
+move the screens by changing their positions on every frame, which updates
+the layout of the screens and of the screen manager. With
+:attr:`~MDTransitionBase.use_transform` the screens stay in place and are
+moved by a :class:`~kivy.graphics.context_instructions.Translate` instruction
+of their canvas, so only the drawing of the screens changes during the
+transition:
+
+.. code-block:: python
+
+    MDScreenManager(transition=MDSharedAxisTransition(use_transform=True))
+
+Each transition stores the frame times in the
+:attr:`~MDTransitionBase.frame_report` dictionary and writes them to the
+debug log:
+
+.. code-block:: python
+
+    screen_manager.transition.bind(
+        on_complete=lambda transition: print(transition.frame_report)
+    )
 """
 
 __all__ = (
@@ -36,9 +62,11 @@ __all__ = (
     "MDSharedAxisTransition",
 )
 
+import time
+
 from kivy import Logger
 from kivy.animation import Animation, AnimationTransition
-from kivy.graphics import PopMatrix, PushMatrix, Scale
+from kivy.graphics import PopMatrix, PushMatrix, Scale, Translate
 from kivy.metrics import dp
 from kivy.properties import (
     BooleanProperty,
@@ -90,7 +118,42 @@ class MDTransitionBase(TransitionBase):
     # }
     _hero_from_widget_children = DictProperty()
 
+    use_transform = BooleanProperty(False)
+    """
+    Move the screens with a canvas transformation instead of changing their
+    positions during the transition.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`use_transform` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    frame_report = DictProperty()
+    """
+    Frame times of the last transition:
+
+    - `frames`: number of the animated frames;
+    - `duration`: duration of the transition in seconds;
+    - `fps`: average frame rate;
+    - `mean_frame`: average frame time in milliseconds;
+    - `max_frame`: the longest frame time in milliseconds.
+
+    .. versionadded:: 2.0.0
+
+    :attr:`frame_report` is a :class:`~kivy.properties.DictProperty`
+    and defaults to `{}`.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # {screen: (PushMatrix, Translate, PopMatrix)}
+        self._transforms = {}
+        self._frame_times = []
+        self.fbind("on_progress", self._add_frame_time)
+
     def start(self, instance_screen_manager: MDScreenManager) -> None:
+        self._frame_times = [time.perf_counter()]
         super().start(instance_screen_manager)
 
         {"in": self.animated_hero_in, "out": self.animated_hero_out}[
@@ -100,7 +163,7 @@ class MDTransitionBase(TransitionBase):
     def animated_hero_in(self) -> None:
         """Animates the flight of heroes from screen **A** to screen **B**."""
 
-        if self.manager._heroes_data and self.manager.current_heroes:
+        if self.manager.current_heroes:
             for hero_from_widget in self.manager.get_hero_from_widget():
                 for heroes_tag in self.manager.current_heroes:
                     if heroes_tag == hero_from_widget.tag:
@@ -146,11 +209,9 @@ class MDTransitionBase(TransitionBase):
     def animated_hero_out(self) -> None:
         """Animates the flight of heroes from screen **B** to screen **A**."""
 
-        if (
-            self.manager._heroes_data
-            and self.manager.current_heroes
-            and self.screen_out.heroes_to
-        ):
+        if self.manager.current_heroes and self.screen_out.heroes_to:
+            hero_from_widgets = self.manager.get_hero_from_widget()
+
             for heroes_tag in self.manager.current_heroes:
                 for hero_to_widget in self.screen_out.heroes_to:
                     if hero_to_widget.tag == heroes_tag:
@@ -162,9 +223,7 @@ class MDTransitionBase(TransitionBase):
                             hero_from_children
                         )
 
-                        for (
-                            hero_from_widget
-                        ) in self.manager.get_hero_from_widget():
+                        for hero_from_widget in hero_from_widgets:
                             hero_from_widget.dispatch(
                                 "on_transform_out",
                                 self._hero_from_widget_children[
@@ -194,7 +253,7 @@ class MDTransitionBase(TransitionBase):
 
         super().on_complete()
 
-        if self.manager._heroes_data and self.manager.current_heroes:
+        if self.manager.current_heroes:
             for hero_from_widget in self.manager.get_hero_from_widget():
                 for heroes_tag in self.manager.current_heroes:
                     if heroes_tag == hero_from_widget.tag:
@@ -223,6 +282,73 @@ class MDTransitionBase(TransitionBase):
         else:
             self._direction = "out"
 
+        self._remove_transforms()
+
+    def move_screen(self, screen, x: float, y: float) -> None:
+        """
+        Moves the screen to the position in the coordinates of the screen
+        manager. With :attr:`use_transform` the screen is moved by its canvas
+        transformation and keeps the position of the screen manager.
+
+        .. versionadded:: 2.0.0
+        """
+
+        if not self.use_transform:
+            screen.pos = (x, y)
+            return
+
+        transform = self._transforms.get(screen)
+
+        if transform is None:
+            screen.pos = self.manager.pos
+            transform = (PushMatrix(), Translate(), PopMatrix())
+            # The transformation moves the background of the screen as well.
+            screen.canvas.before.insert(0, transform[1])
+            screen.canvas.before.insert(0, transform[0])
+            screen.canvas.after.add(transform[2])
+            self._transforms[screen] = transform
+
+        transform[1].xy = (x - self.manager.x, y - self.manager.y)
+
+    def _remove_transforms(self) -> None:
+        for screen, (push, translate, pop) in self._transforms.items():
+            screen.canvas.before.remove(push)
+            screen.canvas.before.remove(translate)
+            screen.canvas.after.remove(pop)
+
+        self._transforms.clear()
+
+    def _on_complete(self, *args) -> None:
+        # The report is created before the `on_complete` event is dispatched
+        # to the callbacks.
+        self._create_frame_report()
+        super()._on_complete(*args)
+
+    def _add_frame_time(self, *args) -> None:
+        self._frame_times.append(time.perf_counter())
+
+    def _create_frame_report(self) -> None:
+        times = self._frame_times
+
+        if len(times) < 2:
+            return
+
+        frame_times = [end - start for start, end in zip(times, times[1:])]
+        duration = times[-1] - times[0]
+        self.frame_report = {
+            "frames": len(frame_times),
+            "duration": duration,
+            "fps": len(frame_times) / duration if duration else 0,
+            "mean_frame": duration / len(frame_times) * 1000,
+            "max_frame": max(frame_times) * 1000,
+        }
+        Logger.debug(
+            f"KivyMD: {self.__class__.__name__}: "
+            f"{self.frame_report['frames']} frames in {duration:.3f} s, "
+            f"{self.frame_report['fps']:.0f} fps, "
+            f"max frame {self.frame_report['max_frame']:.1f} ms"
+        )
+
     # Checks the attributes for the 'self.screen_in' screen.
     # Called from the animated_hero_in method.
     def _check_widget_properties(self, hero_from_widget: MDHeroFrom):
@@ -266,6 +392,7 @@ class MDFadeSlideTransition(MDSlideTransition):
             raise ScreenManagerException("start() is called twice!")
 
         self.manager = instance_screen_manager
+        self._frame_times = [time.perf_counter()]
         self._anim = Animation(d=self.duration, s=0)
         self._anim.bind(
             on_progress=self._on_progress, on_complete=self._on_complete
@@ -291,20 +418,26 @@ class MDFadeSlideTransition(MDSlideTransition):
         self.dispatch("on_progress", 0)
 
         if self._direction == "in":
-            self.screen_in.y = 0
+            if not self.use_transform:
+                self.screen_in.y = 0
             self.screen_in.opacity = 0
 
     def on_progress(self, progression: float) -> None:
         progression = AnimationTransition.out_quad(progression)
 
         if self._direction == "in":
-            self.screen_in.y = (
-                self.manager.y + self.manager.height * progression
-            ) - self.screen_in.height
+            self.move_screen(
+                self.screen_in,
+                self.screen_in.x,
+                (self.manager.y + self.manager.height * progression)
+                - self.screen_in.height,
+            )
             self.screen_in.opacity = progression
         if self._direction == "out":
-            self.screen_out.y = (
-                self.manager.y - self.manager.height * progression
+            self.move_screen(
+                self.screen_out,
+                self.screen_out.x,
+                self.manager.y - self.manager.height * progression,
             )
             self.screen_out.opacity = 1 - progression
 
@@ -456,15 +589,17 @@ class MDSharedAxisTransition(MDTransitionBase):
                     1,
                 )
             elif self.transition_axis == "x":
-                self.screen_out.pos = [
+                self.move_screen(
+                    self.screen_out,
                     self.manager.pos[0] + self._slide_diff * progress,
                     self.manager.pos[1],
-                ]
+                )
             else:
-                self.screen_out.pos = [
+                self.move_screen(
+                    self.screen_out,
                     self.manager.pos[0],
                     self.manager.pos[1] - self._slide_diff * progress,
-                ]
+                )
             self.screen_out.opacity = 1 - progress_d
             self.screen_in.opacity = 0
         # Second half.
@@ -475,15 +610,17 @@ class MDSharedAxisTransition(MDTransitionBase):
                     1,
                 )
             elif self.transition_axis == "x":
-                self.screen_in.pos = [
+                self.move_screen(
+                    self.screen_in,
                     self.manager.pos[0] + self._slide_diff * progress_i,
                     self.manager.pos[1],
-                ]
+                )
             else:
-                self.screen_in.pos = [
+                self.move_screen(
+                    self.screen_in,
                     self.manager.pos[0],
                     self.manager.pos[1] - self._slide_diff * progress_i,
-                ]
+                )
             self.screen_in.opacity = progress_d - 1
             self.screen_out.opacity = 0
 
@@ -14,6 +14,8 @@ The module includes:
       versions older than 3.11.
     - Numerical helpers for solving cubic equations.
     - The CubicBezier class for evaluating cubic Bézier easing curves.
+    - The EasingTable class and the get_easing_table function for sampling
+      easing curves into lookup tables evaluated by interpolation.
 
 The implementation follows the algorithm used in Android's Material Design
 motion system to achieve accurate interpolation behavior.
@@ -21,9 +23,16 @@ motion system to achieve accurate interpolation behavior.
 
 import math
 import sys
+from typing import Callable
 
 float_epsilon = 8.3446500e-7
 
+EASING_RESOLUTION = 1000
+"""
+Number of the intervals of the tables of :class:`EasingTable`. The joints of
+the piecewise curves at multiples of 0.001 are samples of the tables.
+"""
+
 if sys.version_info < (3, 11):
     cbrt = lambda number: (abs(number) ** (1 / 3)) * (-1 if number < 0 else 1)
 else:
@@ -249,3 +258,68 @@ class CubicBezier:
                 1.0 - value,
             ),
         )
+
+
+class EasingTable:
+    """
+    Easing function sampled into a lookup table.
+
+    The function is sampled at :data:`EASING_RESOLUTION` + 1 evenly spaced
+    points of the range [0, 1] once, and the values are linearly
+    interpolated between the samples, so evaluating the easing costs a few
+    arithmetic operations instead of solving the curve. Values outside the
+    range [0, 1] are passed to the function.
+
+    The table is a callable and can be used wherever an easing function is
+    expected, e.g. as a transition of :class:`~kivy.animation.Animation`.
+
+    .. versionadded:: 2.0.0
+
+    Args:
+        function (Callable): Easing function of the progress in [0, 1].
+        resolution (int): Number of the intervals of the table.
+    """
+
+    __slots__ = ("function", "resolution", "values")
+
+    def __init__(self, function: Callable, resolution: int = EASING_RESOLUTION):
+        self.function = function
+        self.resolution = resolution
+        self.values = [function(i / resolution) for i in range(resolution)]
+        # The exact end value.
+        self.values.append(function(1.0))
+
+    def __call__(self, value: float) -> float:
+        position = value * self.resolution
+        index = int(position)
+
+        if 0 <= position < self.resolution:
+            values = self.values
+            start = values[index]
+
+            return start + (values[index + 1] - start) * (position - index)
+
+        if position == self.resolution:
+            return self.values[-1]
+
+        return self.function(value)
+
+
+_easing_tables = {}
+
+
+def get_easing_table(p0: float, p1: float, p2: float, p3: float) -> EasingTable:
+    """
+    Returns the shared :class:`EasingTable` of the
+    `CubicBezier(p0, p1, p2, p3)` curve.
+
+    .. versionadded:: 2.0.0
+    """
+
+    key = (p0, p1, p2, p3)
+    table = _easing_tables.get(key)
+
+    if table is None:
+        table = _easing_tables[key] = EasingTable(CubicBezier(*key).t)
+
+    return table
@@ -0,0 +1,614 @@
+"""
+Frame profiler
+==============
+
+.. versionadded:: 2.0.0
+
+Records the time of each frame of the application split into phases and the
+time spent by KivyMD widgets, and shows the statistics in an overlay.
+
+The phases of a frame are:
+
+- `idle`: waiting for the next frame;
+- `clock`: the callbacks of the clock, including animations;
+- `input`: dispatching of the touch and keyboard events;
+- `layout`: the triggers processed before drawing, such as layouts, label
+  textures and canvas updates;
+- `draw`: drawing the window and uploading the canvas to the GPU;
+- `other`: the rest of the frame.
+
+The time of the following KivyMD code is attributed to the widget classes:
+
+- `ripple`: the frames of ripple animations;
+- `hover`: checking of the hover state of widgets;
+- `theme`: applying of a new color scheme to the widgets;
+- `progress`: the frames of progress and loading indicators;
+- `kv`: applying of the KV rules to new widgets.
+
+The times of the widgets include the code they call, so they may overlap.
+The methods of the widgets are measured when their modules are imported
+before the profiler starts and they are scheduled or bound after that, e.g.
+the ripples started and the widgets created after the profiler starts. More
+methods are added with :attr:`~FrameProfiler.instruments`.
+
+The profiler keeps the last :attr:`~FrameProfiler.max_frames` frames, which
+can be exported to JSON or to the Chrome trace format, which is opened with
+`chrome://tracing` or `https://ui.perfetto.dev`.
+
+.. code-block:: python
+
+    from kivymd.app import MDApp
+    from kivymd.utils.frame_profiler import frame_profiler
+
+
+    class MainApp(MDApp):
+        def on_start(self):
+            self.frame_profiler_start()
+
+        def on_stop(self):
+            frame_profiler.export_chrome_trace("trace.json")
+
+Custom code is measured with :meth:`~FrameProfiler.measure`:
+
+.. code-block:: python
+
+    with frame_profiler.measure("search", "SearchScreen"):
+        self.filter_items()
+"""
+
+__all__ = ("FrameProfiler", "FrameProfilerOverlay", "frame_profiler")
+
+import json
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from kivy.base import EventLoop
+from kivy.clock import Clock
+from kivy.graphics import Color, Line
+from kivy.lang import Builder
+from kivy.metrics import dp
+from kivy.properties import NumericProperty, OptionProperty, StringProperty
+from kivy.uix.label import Label
+
+Builder.load_string("""
+<FrameProfilerOverlay>:
+    size_hint_y: None
+    height: self.texture_size[1] + dp(48)
+    text_size: self.width, None
+    padding: dp(8), dp(4), dp(8), dp(48)
+    text: root._summary
+    font_size: "12sp"
+    pos_hint: {root.anchor: 1}
+    color: app.theme_cls.surfaceColor
+
+    canvas.before:
+        Color:
+            rgba: app.theme_cls.onBackgroundColor[:3] + [0.85]
+        Rectangle:
+            pos: self.pos
+            size: self.size
+""")
+
+PHASES = ("idle", "clock", "input", "layout", "draw", "other")
+"""Phases of a frame."""
+
+
+class FrameRecord:
+    """
+    Times of a frame in seconds.
+
+    .. versionadded:: 2.0.0
+    """
+
+    __slots__ = ("index", "start", "duration", "phases", "costs", "spans")
+
+    def __init__(self, index: int, start: float):
+        self.index = index
+        self.start = start
+        self.duration = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        # {(category, widget class): [time, calls]}
+        self.costs = {}
+        # [(name, category, start, duration), ...]
+        self.spans = []
+
+    @property
+    def busy(self) -> float:
+        """Time of the frame without waiting for the next frame."""
+
+        return self.duration - self.phases["idle"]
+
+    def to_dict(self) -> dict:
+        """Returns the frame with the times in milliseconds."""
+
+        return {
+            "index": self.index,
+            "start": self.start * 1000,
+            "duration": self.duration * 1000,
+            "busy": self.busy * 1000,
+            "phases": {
+                name: value * 1000 for name, value in self.phases.items()
+            },
+            "costs": [
+                {
+                    "category": category,
+                    "widget": widget,
+                    "time": value * 1000,
+                    "calls": calls,
+                }
+                for (category, widget), (value, calls) in self.costs.items()
+            ],
+        }
+
+
+class FrameProfiler:
+    """
+    Records the times of the frames of the application.
+
+    .. versionadded:: 2.0.0
+    """
+
+    max_frames = 300
+    """Number of the last frames kept by the profiler."""
+
+    max_spans = 256
+    """
+    Maximum number of the measured calls of a frame kept for the Chrome
+    trace. The times of the other calls are still added to the costs of the
+    frame.
+    """
+
+    def __init__(self):
+        self.frames = deque(maxlen=self.max_frames)
+        """The last recorded frames, :class:`FrameRecord` objects."""
+
+        self.running = False
+        """Whether the profiler records the frames."""
+
+        self.instruments = [
+            (
+                "kivymd.uix.behaviors.ripple_behavior",
+                "M3CommonRipple",
+                "_tick",
+                "ripple",
+            ),
+            (
+                "kivymd.uix.behaviors.hover_behavior",
+                "HoverBehavior",
+                "on_mouse_update",
+                "hover",
+            ),
+            ("kivymd.theming", "ThemeManager", "set_colors", "theme"),
+            (
+                "kivymd.uix.exprogressindicator.exprogressindicator",
+                "MDExBaseProgressBar",
+                "_render_wave",
+                "progress",
+            ),
+            (
+                "kivymd.uix.loadingindicator.loadingindicator",
+                "MDLoadingIndicator",
+                "_tick",
+                "progress",
+            ),
+        ]
+        """
+        Methods measured by the profiler,
+        `[(module, class name, method name, category), ...]`.
+        """
+
+        self._frame = None
+        self._index = 0
+        self._patches = []  # [(object, name, original or None), ...]
+
+    def start(self, max_frames: int = None) -> None:
+        """Starts recording the frames."""
+
+        if self.running:
+            return
+
+        if max_frames:
+            self.max_frames = max_frames
+
+        self.frames = deque(self.frames, maxlen=self.max_frames)
+        self.running = True
+        self._patch(EventLoop, "idle", self._run_frame)
+        self._patch_phase(Clock, "idle", "idle")
+        self._patch_phase(Clock, "_process_events", "clock")
+        self._patch_phase(EventLoop, "dispatch_input", "input")
+        self._patch_phase(Clock, "_process_events_before_frame", "layout")
+
+        if EventLoop.window:
+            self._patch_phase(EventLoop.window, "on_draw", "draw")
+            self._patch_phase(EventLoop.window, "on_flip", "draw")
+
+        self._patch_method(Builder, "apply", "kv", widget_arg=True)
+
+        for module_name, class_name, method_name, category in self.instruments:
+            cls = getattr(sys.modules.get(module_name), class_name, None)
+
+            if cls is not None:
+                self._patch_method(cls, method_name, category)
+
+    def stop(self) -> None:
+        """Stops recording the frames. The recorded frames are kept."""
+
+        while self._patches:
+            target, name, original = self._patches.pop()
+
+            if original is None:
+                delattr(target, name)
+            else:
+                setattr(target, name, original)
+
+        self.running = False
+        self._frame = None
+
+    def clear(self) -> None:
+        """Removes the recorded frames."""
+
+        self.frames.clear()
+
+    @contextmanager
+    def measure(self, category: str, name: str):
+        """Measures the code of the block as a call of `name`."""
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self._add_cost(category, name, start)
+
+    def get_percentiles(self, percentiles=(50, 90, 95, 99)) -> dict:
+        """
+        Returns the percentiles of the busy time of the frames and of each
+        phase in milliseconds, `{"busy": {50: 2.1, ...}, "clock": ...}`.
+        """
+
+        series = {"busy": [frame.busy for frame in self.frames]}
+
+        for phase in PHASES:
+            series[phase] = [frame.phases[phase] for frame in self.frames]
+
+        return {
+            name: {
+                percentile: self._get_percentile(sorted(values), percentile)
+                * 1000
+                for percentile in percentiles
+            }
+            for name, values in series.items()
+        }
+
+    def get_histogram(self, edges=(4, 8, 16.7, 33.3, 50)) -> list:
+        """
+        Returns the number of frames whose busy time in milliseconds is in
+        each range between the edges,
+        `[(0, 4, count), (4, 8, count), ..., (50, inf, count)]`.
+        """
+
+        bounds = [0, *edges, float("inf")]
+        histogram = [[low, high, 0] for low, high in zip(bounds, bounds[1:])]
+
+        for frame in self.frames:
+            busy = frame.busy * 1000
+
+            for bucket in histogram:
+                if busy < bucket[1]:
+                    bucket[2] += 1
+                    break
+
+        return [tuple(bucket) for bucket in histogram]
+
+    def get_costs(self) -> list:
+        """
+        Returns the time of the widgets over the recorded frames, the most
+        expensive first,
+        `[{"category", "widget", "time", "calls", "per_frame"}, ...]`
+        with the times in milliseconds.
+        """
+
+        costs = {}
+
+        for frame in self.frames:
+            for key, (value, calls) in frame.costs.items():
+                total = costs.setdefault(key, [0.0, 0])
+                total[0] += value
+                total[1] += calls
+
+        frames = len(self.frames) or 1
+
+        return [
+            {
+                "category": category,
+                "widget": widget,
+                "time": value * 1000,
+                "calls": calls,
+                "per_frame": value * 1000 / frames,
+            }
+            for (category, widget), (value, calls) in sorted(
+                costs.items(), key=lambda item: -item[1][0]
+            )
+        ]
+
+    def get_stats(self) -> dict:
+        """Returns the summary of the recorded frames."""
+
+        durations = sum(frame.duration for frame in self.frames)
+
+        return {
+            "frames": len(self.frames),
+            "fps": len(self.frames) / durations if durations else 0,
+            "percentiles": self.get_percentiles(),
+            "histogram": self.get_histogram(),
+            "costs": self.get_costs(),
+        }
+
+    def to_dict(self) -> dict:
+        """Returns the recorded frames and the summary."""
+
+        return {
+            "frames": [frame.to_dict() for frame in self.frames],
+            "stats": self.get_stats(),
+        }
+
+    def export_json(self, path: str) -> None:
+        """Writes :meth:`to_dict` to a JSON file."""
+
+        with open(path, "w", encoding="utf-8") as json_file:
+            json.dump(self.to_dict(), json_file, indent=1)
+
+    def to_chrome_trace(self) -> dict:
+        """Returns the recorded frames in the Chrome trace event format."""
+
+        events = []
+
+        for frame in self.frames:
+            events.append(
+                {
+                    "name": f"frame {frame.index}",
+                    "cat": "frame",
+                    "ph": "X",
+                    "ts": frame.start * 1e6,
+                    "dur": frame.duration * 1e6,
+                    "pid": 1,
+                    "tid": 1,
+                    "args": {
+                        name: round(value * 1000, 3)
+                        for name, value in frame.phases.items()
+                    },
+                }
+            )
+            events.extend(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": 1,
+                    "tid": 1,
+                }
+                for name, category, start, duration in frame.spans
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+        """Writes :meth:`to_chrome_trace` to a JSON file."""
+
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+
+    def _run_frame(self, original):
+        start = time.perf_counter()
+        frame = self._frame = FrameRecord(self._index, start)
+        self._index += 1
+
+        try:
+            return original()
+        finally:
+            frame.duration = time.perf_counter() - start
+            frame.phases["other"] = max(
+                0.0, frame.duration - sum(frame.phases.values())
+            )
+            self._frame = None
+            self.frames.append(frame)
+
+    def _patch(self, target, name: str, wrapper) -> None:
+        # Replaces the method of the object or class with
+        # `wrapper(original, *args, **kwargs)`.
+        if isinstance(target, type):
+            defined = name in vars(target)
+            original = getattr(target, name)
+
+            def patched(*args, **kwargs):
+                return wrapper(original.__get__(args[0]), *args[1:], **kwargs)
+
+            self._patches.append(
+                (target, name, vars(target)[name] if defined else None)
+            )
+        else:
+            defined = name in target.__dict__
+            original = getattr(target, name)
+
+            def patched(*args, **kwargs):
+                return wrapper(original, *args, **kwargs)
+
+            self._patches.append((target, name, original if defined else None))
+
+        setattr(target, name, patched)
+
+    def _patch_phase(self, target, name: str, phase: str) -> None:
+        def timed(original, *args, **kwargs):
+            start = time.perf_counter()
+
+            try:
+                return original(*args, **kwargs)
+            finally:
+                frame = self._frame
+
+                if frame is not None:
+                    duration = time.perf_counter() - start
+                    frame.phases[phase] += duration
+
+                    if phase != "idle" and len(frame.spans) < self.max_spans:
+                        frame.spans.append((phase, "phase", start, duration))
+
+        self._patch(target, name, timed)
+
+    def _patch_method(
+        self, target, name: str, category: str, widget_arg: bool = False
+    ) -> None:
+        def timed(original, *args, **kwargs):
+            start = time.perf_counter()
+
+            try:
+                return original(*args, **kwargs)
+            finally:
+                widget = args[0] if widget_arg else original.__self__
+                self._add_cost(category, type(widget).__name__, start)
+
+        self._patch(target, name, timed)
+
+    def _add_cost(self, category: str, name: str, start: float) -> None:
+        frame = self._frame
+
+        if frame is None:
+            return
+
+        duration = time.perf_counter() - start
+        cost = frame.costs.setdefault((category, name), [0.0, 0])
+        cost[0] += duration
+        cost[1] += 1
+
+        if len(frame.spans) < self.max_spans:
+            frame.spans.append((name, category, start, duration))
+
+    @staticmethod
+    def _get_percentile(values: list, percentile: float) -> float:
+        if not values:
+            return 0.0
+
+        index = round(percentile / 100 * (len(values) - 1))
+
+        return values[index]
+
+
+class FrameProfilerOverlay(Label):
+    """
+    Overlay that shows the statistics of :data:`frame_profiler` and the
+    graph of the busy time of the last frames.
+
+    For more information, see in the
+    :class:`~kivy.uix.label.Label` class documentation.
+
+    .. versionadded:: 2.0.0
+    """
+
+    updated_interval = NumericProperty(0.5)
+    """
+    Refresh rate of the overlay.
+
+    :attr:`updated_interval` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0.5`.
+    """
+
+    anchor = OptionProperty("top", options=["top", "bottom"])
+    """
+    Overlay position.
+    Available option are: 'top', 'bottom'.
+
+    :attr:`anchor` is an :class:`~kivy.properties.OptionProperty`
+    and defaults to `'top'`.
+    """
+
+    frame_budget = NumericProperty(16.7)
+    """
+    Time of a frame in milliseconds at the target frame rate, which is drawn
+    on the graph.
+
+    :attr:`frame_budget` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `16.7`.
+    """
+
+    _summary = StringProperty()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        with self.canvas.after:
+            Color(0.3, 0.8, 0.4, 1)
+            self._graph = Line(width=1)
+            Color(0.9, 0.3, 0.3, 1)
+            self._budget = Line(width=1)
+
+        self._event = None
+
+    def start(self) -> None:
+        """Starts the profiler and the overlay."""
+
+        frame_profiler.start()
+        self._event = Clock.schedule_interval(
+            self.update_stats, self.updated_interval
+        )
+
+    def stop(self) -> None:
+        """Stops the overlay and the profiler."""
+
+        if self._event:
+            self._event.cancel()
+            self._event = None
+
+        frame_profiler.stop()
+
+    def update_stats(self, *args) -> None:
+        frames = list(frame_profiler.frames)
+
+        if not frames:
+            return
+
+        percentiles = frame_profiler.get_percentiles((50, 95, 99))
+        busy = percentiles["busy"]
+        phases = " ".join(
+            f"{phase} {percentiles[phase][50]:.1f}"
+            for phase in PHASES
+            if phase != "idle"
+        )
+        costs = ", ".join(
+            f"{cost['category']} {cost['widget']} {cost['per_frame']:.2f}"
+            for cost in frame_profiler.get_costs()[:3]
+        )
+        self._summary = (
+            f"FPS: {Clock.get_fps():.0f}  frame, ms: p50 {busy[50]:.1f} "
+            f"p95 {busy[95]:.1f} p99 {busy[99]:.1f}\n"
+            f"p50, ms: {phases}"
+            + (f"\nper frame, ms: {costs}" if costs else "")
+        )
+        self._update_graph(frames)
+
+    def _update_graph(self, frames: list) -> None:
+        height = dp(40)
+        scale = height / (self.frame_budget * 2)
+        step = self.width / max(1, frame_profiler.max_frames - 1)
+        x, y = self.x, self.y + dp(4)
+        self._graph.points = [
+            coordinate
+            for index, frame in enumerate(frames)
+            for coordinate in (
+                x + index * step,
+                y + min(height, frame.busy * 1000 * scale),
+            )
+        ]
+        budget_y = y + self.frame_budget * scale
+        self._budget.points = [x, budget_y, self.right, budget_y]
+
+
+frame_profiler = FrameProfiler()
+"""
+Profiler shared by the application.
+
+.. versionadded:: 2.0.0
+"""
@@ -0,0 +1,234 @@
+"""
+Frame ticker
+============
+
+.. versionadded:: 2.0.0
+
+Calls the animation callbacks of widgets every frame from one clock event.
+
+Widgets that are not visible, that is, not in the window (for example, in an
+inactive :class:`~kivymd.uix.screen.MDScreen`), transparent or outside the
+window, are skipped. When none of the registered widgets are visible, the
+ticker cancels its clock event and waits for the next redraw of the window,
+since a widget cannot become visible without the window being redrawn. When
+no widgets are registered, the ticker does not schedule anything.
+
+.. code-block:: python
+
+    from kivymd.utils.frame_ticker import frame_ticker
+
+    class Indicator(Widget):
+        def start(self):
+            frame_ticker.add(self, self.render)
+
+        def stop(self):
+            frame_ticker.remove(self)
+
+        def render(self, dt):
+            ...
+"""
+
+__all__ = ("FrameTicker", "frame_ticker")
+
+import weakref
+from typing import Callable
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+from kivy.weakmethod import WeakMethod
+
+
+class FrameTicker:
+    """
+    Calls the callbacks of the visible widgets every frame.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self):
+        # {id(widget): (weakref.ref(widget),
+        #  {callback key: (WeakMethod(callback), skip_hidden)})}
+        self._callbacks = {}
+        self._event = None
+        self._waiting = False
+        self.ticks = 0
+        """Number of the clock events processed by the ticker."""
+
+    def add(
+        self, widget: Widget, callback: Callable, skip_hidden: bool = True
+    ) -> None:
+        """
+        Calls `callback(dt)` every frame while `widget` is visible until
+        the callback returns `False` or :meth:`remove` is called. A widget
+        can have several callbacks, adding the same callback again replaces
+        its `skip_hidden` value.
+
+        :param skip_hidden:
+            If `False`, the callback is called even if the widget is not
+            visible.
+        """
+
+        uid = id(widget)
+        entry = self._callbacks.get(uid)
+
+        if entry is None:
+            entry = self._callbacks[uid] = (
+                weakref.ref(widget, lambda ref, uid=uid: self._forget(uid)),
+                {},
+            )
+
+        entry[1][self._get_key(callback)] = (WeakMethod(callback), skip_hidden)
+        self._schedule(idle=False)
+
+    def remove(self, widget: Widget, callback: Callable = None) -> None:
+        """
+        Removes the callback of the widget or all its callbacks if `callback`
+        is `None`.
+        """
+
+        uid = id(widget)
+
+        if callback is None:
+            self._forget(uid)
+            return
+
+        entry = self._callbacks.get(uid)
+
+        if entry is not None:
+            entry[1].pop(self._get_key(callback), None)
+
+            if not entry[1]:
+                self._forget(uid)
+
+    def is_ticking(self, widget: Widget, callback: Callable = None) -> bool:
+        """
+        Returns `True` if the widget has the callback or any callback if
+        `callback` is `None`.
+        """
+
+        entry = self._callbacks.get(id(widget))
+
+        if entry is None:
+            return False
+
+        return callback is None or self._get_key(callback) in entry[1]
+
+    @staticmethod
+    def is_visible(widget: Widget) -> bool:
+        """
+        Returns `True` if the widget is in the window, is not transparent and
+        is not outside the window.
+        """
+
+        parent = widget
+
+        while True:
+            if not getattr(parent, "opacity", 1):
+                return False
+
+            if parent.parent is None:
+                return False
+
+            if parent.parent is parent:
+                break
+
+            parent = parent.parent
+
+        x, y = widget.to_window(widget.x, widget.y)
+        right, top = widget.to_window(widget.right, widget.top)
+
+        return (
+            max(x, right) >= 0
+            and max(y, top) >= 0
+            and min(x, right) <= Window.width
+            and min(y, top) <= Window.height
+        )
+
+    @staticmethod
+    def _get_key(callback: Callable) -> tuple:
+        # Bound methods are created on every attribute access, so they are
+        # compared by their function and object.
+        return (
+            getattr(callback, "__func__", callback),
+            id(getattr(callback, "__self__", None)),
+        )
+
+    def _forget(self, uid: int) -> None:
+        if self._callbacks.pop(uid, None) is not None and not self._callbacks:
+            self._schedule(idle=False)
+
+    def _schedule(self, idle: bool) -> None:
+        if idle or not self._callbacks:
+            if self._event is not None:
+                self._event.cancel()
+                self._event = None
+
+            # The hidden widgets are checked again when the window is
+            # redrawn.
+            if idle != self._waiting:
+                self._waiting = idle
+
+                if idle:
+                    Window.fbind("on_draw", self._wake)
+                else:
+                    Window.funbind("on_draw", self._wake)
+            return
+
+        if self._waiting:
+            self._waiting = False
+            Window.funbind("on_draw", self._wake)
+
+        if self._event is None:
+            self._event = Clock.schedule_interval(self._tick, 0)
+
+    def _wake(self, *args) -> None:
+        self._schedule(idle=False)
+
+    def _tick(self, dt: float) -> None:
+        self.ticks += 1
+        visible = False
+
+        for uid, (widget_ref, callbacks) in list(self._callbacks.items()):
+            widget = widget_ref()
+
+            if widget is None:
+                self._callbacks.pop(uid, None)
+                continue
+
+            widget_visible = None
+
+            for key, (callback_ref, skip_hidden) in list(callbacks.items()):
+                callback = callback_ref()
+
+                if callback is None:
+                    callbacks.pop(key, None)
+                    continue
+
+                if skip_hidden:
+                    if widget_visible is None:
+                        widget_visible = self.is_visible(widget)
+
+                    if not widget_visible:
+                        continue
+
+                visible = True
+
+                if callback(dt) is False:
+                    callbacks.pop(key, None)
+
+            # The callbacks may have registered the widget again.
+            entry = self._callbacks.get(uid)
+
+            if not callbacks and entry is not None and entry[1] is callbacks:
+                del self._callbacks[uid]
+
+        self._schedule(idle=not visible)
+
+
+frame_ticker = FrameTicker()
+"""
+Ticker shared by all widgets.
+
+.. versionadded:: 2.0.0
+"""
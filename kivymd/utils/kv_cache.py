@@ -0,0 +1,356 @@
+"""
+KV cache
+========
+
+.. versionadded:: 2.0.0
+
+Cache of the parsed KV rules of the KivyMD widgets.
+
+Parsing a KV file means splitting it into rules and compiling the Python
+expressions of the properties. The cache stores the parsed rules and the
+compiled code objects with :mod:`marshal`, so the next launches of the
+application only execute the directives of the file and restore the rules.
+
+The cache files are looked up in the `kivymd/data/kv_cache` directory of the
+package, which is filled when the package is built by `setup.py` or with:
+
+.. code-block:: bash
+
+    python -m kivymd.tools.build_kv_cache
+
+and in the user cache directory (`$XDG_CACHE_HOME/kivymd/kv_cache` or
+`~/.cache/kivymd/kv_cache`, or the directory from the `KIVYMD_KV_CACHE_DIR`
+environment variable). The parsed rules are written to the user cache
+directory only if it is enabled with the `KIVYMD_KV_CACHE_WRITE=1`
+environment variable or :attr:`KvCache.write`, for example, when the package
+cache was not built for the installed versions. If the directory is not
+writable, the rules are not written. The name
+of a cache file is the hash of the KV source, and the files are kept in
+separate directories for each version of Kivy, KivyMD and the Python
+bytecode, so changing any of them makes the old files unused.
+
+The cache is disabled with the `KIVYMD_KV_CACHE=0` environment variable.
+
+Only the files of the rules of classes are cached. The files with root
+widgets, templates or dynamic classes are parsed as usual.
+"""
+
+__all__ = ("KvCache", "kv_cache")
+
+import hashlib
+import importlib.util
+import marshal
+import os
+from collections import OrderedDict
+
+import kivy
+from kivy.lang import Builder
+from kivy.lang.parser import (
+    Parser,
+    ParserRule,
+    ParserRuleProperty,
+    ParserSelectorClass,
+    ParserSelectorName,
+)
+from kivy.logger import Logger
+
+import kivymd
+
+CACHE_FORMAT = 1
+"""Version of the format of the cache files."""
+
+
+class KvCache:
+    """
+    Cache of the parsed KV rules.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self):
+        self.enabled = os.environ.get("KIVYMD_KV_CACHE", "1") not in ("", "0")
+        """If `False`, the rules are always parsed."""
+
+        self.package_dir = os.path.join(kivymd.path, "data", "kv_cache")
+        """Directory of the cache built with the package."""
+
+        self.user_dir = os.environ.get("KIVYMD_KV_CACHE_DIR") or os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "kivymd",
+            "kv_cache",
+        )
+        """Directory of the cache written when the rules are parsed."""
+
+        write = os.environ.get("KIVYMD_KV_CACHE_WRITE", "0")
+        self.write = write not in ("", "0")
+        """
+        If `True`, the parsed rules are written to :attr:`user_dir`.
+        It is reset to `False` when the directory is not writable.
+        """
+
+        self.hits = 0
+        """Number of the sources loaded from the cache."""
+
+        self.misses = 0
+        """Number of the parsed sources."""
+
+        self.tag = "kivy-{}-kivymd-{}-py-{}-{}".format(
+            kivy.__version__,
+            kivymd.__version__,
+            importlib.util.MAGIC_NUMBER.hex(),
+            CACHE_FORMAT,
+        )
+        """Name of the directories of the cache files of these versions."""
+
+    def load_string(self, source: str, filename: str = None) -> None:
+        """
+        Loads the rules of the KV source with :data:`~kivy.lang.Builder`,
+        from the cache if possible.
+
+        :param filename:
+            The name used to index the rules, as in
+            :meth:`~kivy.lang.builder.BuilderBase.load_string`, so that they
+            can be unloaded with
+            :meth:`~kivy.lang.builder.BuilderBase.unload_file`.
+        """
+
+        if not self.enabled:
+            Builder.load_string(source, filename=filename)
+            return
+
+        name = self.get_name(source)
+
+        for directory in (self.package_dir, self.user_dir):
+            data = self._read(os.path.join(directory, self.tag, name))
+
+            if data is not None:
+                self.hits += 1
+                self._apply(self.restore(data, source, filename))
+                return
+
+        self.misses += 1
+        parser = Parser(content=source, filename=filename)
+        data = self.dump(parser)
+
+        if data is None:
+            Builder.load_string(source, filename=filename)
+            return
+
+        self._apply(parser)
+
+        if self.write and not self.save(self.user_dir, source, data):
+            self.write = False
+
+    def save(self, directory: str, source: str, data=None) -> bool:
+        """
+        Writes the parsed rules of the source to the cache directory.
+        Returns `False` if the source cannot be cached.
+        """
+
+        if data is None:
+            data = self.dump(Parser(content=source))
+
+            if data is None:
+                return False
+
+        path = os.path.join(directory, self.tag, self.get_name(source))
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Another process may read the file while it is being written.
+            temp_path = f"{path}.{os.getpid()}.tmp"
+
+            with open(temp_path, "wb") as cache_file:
+                cache_file.write(marshal.dumps(data))
+
+            os.replace(temp_path, path)
+        except (OSError, ValueError) as error:
+            Logger.debug(f"KivyMD: Cannot write the KV cache {path}: {error}")
+            return False
+
+        return True
+
+    @staticmethod
+    def get_name(source: str) -> str:
+        """Returns the name of the cache file of the source."""
+
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()[:32] + ".kvc"
+
+    @staticmethod
+    def dump(parser: Parser):
+        """
+        Returns the parsed rules as a value for :func:`marshal.dumps` or
+        `None` if they cannot be cached.
+        """
+
+        if parser.root or parser.templates or parser.dynamic_classes:
+            return None
+
+        rules = []
+        indices = {}
+        selectors = []
+
+        for selector, rule in parser.rules:
+            if id(rule) not in indices:
+                indices[id(rule)] = len(rules)
+                rules.append(_dump_rule(rule))
+
+            selectors.append(
+                (
+                    isinstance(selector, ParserSelectorClass),
+                    selector.key,
+                    indices[id(rule)],
+                )
+            )
+
+        return (CACHE_FORMAT, parser.directives, rules, selectors)
+
+    @staticmethod
+    def restore(data, source: str, filename: str = None) -> Parser:
+        """Returns the parser with the rules restored from the cache data."""
+
+        _, directives, rules, selectors = data
+        parser = Parser.__new__(Parser)
+        parser.rules = []
+        parser.templates = []
+        parser.root = None
+        parser.sourcecode = list(enumerate(source.splitlines()))
+        parser.directives = [tuple(directive) for directive in directives]
+        parser.dynamic_classes = {}
+        parser.filename = filename
+        # Directives import the modules used by the rules.
+        parser.execute_directives()
+        rules = [_restore_rule(parser, rule) for rule in rules]
+
+        for is_class, key, index in selectors:
+            selector_cls = (
+                ParserSelectorClass if is_class else ParserSelectorName
+            )
+            parser.rules.append((selector_cls(key), rules[index]))
+
+        return parser
+
+    def _read(self, path: str):
+        try:
+            with open(path, "rb") as cache_file:
+                data = marshal.loads(cache_file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as error:
+            Logger.debug(f"KivyMD: Cannot read the KV cache {path}: {error}")
+            return None
+
+        if type(data) is not tuple or not data or data[0] != CACHE_FORMAT:
+            return None
+
+        return data
+
+    @staticmethod
+    def _apply(parser: Parser) -> None:
+        # Adds the rules as `Builder.load_string` does.
+        Builder.rules.extend(parser.rules)
+        Builder._clear_matchcache()
+
+        # The rules of a file may be applied in several parts by the lazy
+        # KV loader.
+        if parser.filename and parser.filename not in Builder.files:
+            Builder.files.append(parser.filename)
+
+
+def _dump_property(prop: ParserRuleProperty) -> tuple:
+    return (
+        prop.line,
+        prop.name,
+        prop.value,
+        prop.co_value,
+        prop.mode,
+        prop.watched_keys,
+        prop.ignore_prev,
+    )
+
+
+def _restore_property(parser: Parser, data) -> ParserRuleProperty:
+    prop = ParserRuleProperty.__new__(ParserRuleProperty)
+    prop.ctx = parser
+    (
+        prop.line,
+        prop.name,
+        prop.value,
+        prop.co_value,
+        prop.mode,
+        prop.watched_keys,
+        prop.ignore_prev,
+    ) = data
+    prop.count = 0
+
+    return prop
+
+
+def _dump_rule(rule: ParserRule):
+    if rule is None:
+        return None
+
+    return (
+        rule.line,
+        rule.name,
+        rule.level,
+        rule.id,
+        rule.avoid_previous_rules,
+        [_dump_property(prop) for prop in rule.properties.values()],
+        [_dump_property(handler) for handler in rule.handlers],
+        [_dump_rule(child) for child in rule.children],
+        _dump_rule(rule.canvas_before),
+        _dump_rule(rule.canvas_root),
+        _dump_rule(rule.canvas_after),
+    )
+
+
+def _restore_rule(parser: Parser, data) -> ParserRule:
+    if data is None:
+        return None
+
+    (
+        line,
+        name,
+        level,
+        rule_id,
+        avoid_previous_rules,
+        properties,
+        handlers,
+        children,
+        canvas_before,
+        canvas_root,
+        canvas_after,
+    ) = data
+    # `ParserRule.__init__` registers the selectors of the rule in the
+    # parser, they are restored by `KvCache.restore`.
+    rule = ParserRule.__new__(ParserRule)
+    rule.ctx = parser
+    rule.line = line
+    rule.name = name
+    rule.level = level
+    rule.id = rule_id
+    rule.avoid_previous_rules = avoid_previous_rules
+    rule.properties = OrderedDict()
+
+    for prop in properties:
+        prop = _restore_property(parser, prop)
+        rule.properties[prop.name] = prop
+
+    rule.handlers = [_restore_property(parser, handler) for handler in handlers]
+    rule.children = [_restore_rule(parser, child) for child in children]
+    rule.canvas_before = _restore_rule(parser, canvas_before)
+    rule.canvas_root = _restore_rule(parser, canvas_root)
+    rule.canvas_after = _restore_rule(parser, canvas_after)
+    rule.cache_marked = []
+
+    return rule
+
+
+kv_cache = KvCache()
+"""
+Cache of the KV rules of the KivyMD widgets.
+
+.. versionadded:: 2.0.0
+"""
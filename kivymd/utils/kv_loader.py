@@ -0,0 +1,212 @@
+"""
+KV loader
+=========
+
+.. versionadded:: 2.0.0
+
+Loads the KV rules of the KivyMD widgets.
+
+By default, the rules of a widget are parsed when the module of the widget is
+imported. In the lazy mode, the rules of each class are parsed when the first
+widget of the class or of its subclass is created, so the rules of the
+widgets that the application does not create are never parsed, which makes
+the start of the application faster.
+
+The lazy mode is enabled with the `KIVYMD_LAZY_KV` environment variable:
+
+.. code-block:: bash
+
+    KIVYMD_LAZY_KV=1 python main.py
+
+or before importing the widgets:
+
+.. code-block:: python
+
+    from kivymd.utils.kv_loader import kv_loader
+
+    kv_loader.lazy = True
+
+The rules of the classes that are used by name in `Builder.apply_rules` are
+parsed when they are applied. The files with root widgets, templates,
+dynamic classes or selectors other than class names are parsed at once.
+"""
+
+__all__ = ("KvLoader", "kv_loader", "load_kv")
+
+import os
+import re
+import time
+from collections import defaultdict
+
+from kivy.lang import Builder
+from kivy.lang.builder import BuilderBase
+from kivy.logger import Logger
+
+from kivymd.utils.kv_cache import kv_cache
+
+_rule_header = re.compile(r"-?<([^>]+)>:?\s*$")
+_class_name = re.compile(r"[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class _KvBlock:
+    __slots__ = ("sequence", "path", "source", "filename", "loaded")
+
+    def __init__(self, sequence: int, path: str, source: str, filename: str):
+        self.sequence = sequence
+        self.path = path
+        self.source = source
+        self.filename = filename
+        self.loaded = False
+
+
+class KvLoader:
+    """
+    Loader of the KV files of the widgets.
+
+    .. versionadded:: 2.0.0
+    """
+
+    def __init__(self):
+        self.lazy = os.environ.get("KIVYMD_LAZY_KV", "0") not in ("", "0")
+        """
+        If `True`, the rules are parsed when the first widget of their class
+        is created.
+        """
+
+        self.parse_times = defaultdict(float)
+        """The time in seconds spent parsing each file, `{path: seconds}`."""
+
+        self._pending = {}  # {lowercase class name: [block, ...]}
+        self._sequence = 0
+        # Classes whose rules are parsed.
+        self._checked = set()
+
+    def load(self, path: str, filename: str = None) -> None:
+        """
+        Parses the KV file or, in the lazy mode, splits it into the rules of
+        the classes to parse later.
+
+        :param filename:
+            The name used to index the rules, so that they can be unloaded
+            with :meth:`~kivy.lang.builder.BuilderBase.unload_file`.
+        """
+
+        with open(path, encoding="utf-8") as kv_file:
+            source = kv_file.read()
+
+        if filename and filename in Builder.files:
+            Logger.warning(
+                f"Lang: The file {filename} is loaded multiples times, "
+                f"you might have unwanted behaviors."
+            )
+
+        blocks = self._split(source) if self.lazy else None
+
+        if blocks is None:
+            self._parse(path, source, filename)
+            return
+
+        directives, rules = blocks
+
+        for names, lines in rules:
+            self._sequence += 1
+            block = _KvBlock(
+                self._sequence, path, directives + "".join(lines), filename
+            )
+
+            for name in names:
+                self._pending.setdefault(name.lower(), []).append(block)
+
+        # The classes may have new rules.
+        self._checked.clear()
+
+        if self._pending and "match" not in vars(Builder):
+            Builder.match = self._match
+            Builder.match_rule_name = self._match_rule_name
+
+    def get_pending_count(self) -> int:
+        """Returns the number of the class names with unparsed rules."""
+
+        return len(self._pending)
+
+    def _match(self, widget) -> list:
+        cls = widget.__class__
+
+        if cls not in self._checked:
+            self._load_pending([base.__name__ for base in cls.__mro__])
+            self._checked.add(cls)
+
+        return BuilderBase.match(Builder, widget)
+
+    def _match_rule_name(self, rule_name) -> list:
+        self._load_pending([str(rule_name)])
+
+        return BuilderBase.match_rule_name(Builder, rule_name)
+
+    def _load_pending(self, names: list) -> None:
+        blocks = []
+
+        for name in names:
+            blocks.extend(self._pending.pop(name.lower(), ()))
+
+        # The rules are parsed in the order of the files and the rules in the
+        # files as if they were parsed at once.
+        for block in sorted(blocks, key=lambda block: block.sequence):
+            if not block.loaded:
+                block.loaded = True
+                self._parse(block.path, block.source, block.filename)
+
+        if not self._pending and "match" in vars(Builder):
+            del Builder.match
+            del Builder.match_rule_name
+
+    def _parse(self, path: str, source: str, filename: str = None) -> None:
+        start = time.perf_counter()
+        kv_cache.load_string(source, filename)
+        self.parse_times[path] += time.perf_counter() - start
+
+    @staticmethod
+    def _split(source: str):
+        # Returns the directives and the `(class names, lines)` of the rules
+        # or `None` if the file cannot be split.
+        directives = []
+        rules = []
+
+        for line in source.splitlines(keepends=True):
+            if line.startswith("#:"):
+                directives.append(line)
+            elif not line.strip() or line[0] in " \t#":
+                if rules:
+                    rules[-1][1].append(line)
+            else:
+                match = _rule_header.match(line)
+
+                if match is None:
+                    return None
+
+                names = [name.strip() for name in match.group(1).split(",")]
+
+                if not all(_class_name.match(name) for name in names):
+                    return None
+
+                rules.append((names, [line]))
+
+        return "".join(directives) + "\n", rules
+
+
+kv_loader = KvLoader()
+"""
+Loader of the KV files of the KivyMD widgets.
+
+.. versionadded:: 2.0.0
+"""
+
+
+def load_kv(path: str, filename: str = None) -> None:
+    """
+    Loads the KV file with :data:`kv_loader`.
+
+    .. versionadded:: 2.0.0
+    """
+
+    kv_loader.load(path, filename)
@@ -68,6 +68,26 @@ def update_version_info():
     open(filename, "wt", encoding="utf-8").write(version_info)
 
 
+def build_kv_cache():
+    """Write the parsed KV rules of the widgets to kivymd/data/kv_cache."""
+
+    try:
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "kivymd.tools.build_kv_cache",
+                "--",
+                "--clear",
+            ],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (subprocess.CalledProcessError, OSError) as error:
+        # Kivy may not be installed in the build environment, the rules are
+        # parsed at runtime then.
+        print(f"The KV cache is not built: {error}", file=sys.stderr)
+
+
 def glob_paths(pattern):
     out_files = []
     src_path = os.path.join(os.path.dirname(__file__), "kivymd")
@@ -88,6 +108,7 @@ def glob_paths(pattern):
 if __name__ == "__main__":
     # Static strings are in setup.cfg
     update_version_info()
+    build_kv_cache()
     setup(
         version=__version__,
         packages=find_packages(
@@ -99,7 +120,9 @@ if __name__ == "__main__":
                 "images/*.png",
                 "images/logo/*.png",
                 "fonts/*.ttf",
+                "fonts/*.bin",
                 *glob_paths(".kv"),
+                *glob_paths(".kvc"),
                 *glob_paths(".glsl"),
                 *glob_paths(".pot"),
                 *glob_paths(".po"),